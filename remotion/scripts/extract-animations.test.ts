@@ -11,7 +11,7 @@
 import { describe, it, expect, beforeAll, afterAll } from 'vitest';
 import * as fs from 'fs';
 import * as path from 'path';
-import { execSync } from 'child_process';
+import { execSync, spawnSync } from 'child_process';
 
 // Path to the extraction script
 const SCRIPT_PATH = path.join(__dirname, 'extract-animations.ts');
@@ -373,4 +373,40 @@ describe('extract-animations', () => {
       expect(result.animations.length).toBe(2);
     });
   });
+
+  describe('server mode', () => {
+    it('should answer line-delimited requests from one process', () => {
+      const tempFile = path.join(__dirname, `test-scene-${Date.now()}.tsx`);
+
+      try {
+        fs.writeFileSync(tempFile, 'const opacity = interpolate(frame, [0, 30], [0, 1]);');
+
+        const requests = [
+          { id: 1, scenePath: tempFile, durationFrames: 300 },
+          { id: 2, scenePath: '/nonexistent/scene.tsx', durationFrames: 300 },
+          { id: 3, scenePath: tempFile, durationFrames: 0 },
+        ];
+        const proc = spawnSync(
+          'npx',
+          ['ts-node', '--transpile-only', SCRIPT_PATH, '--server'],
+          {
+            cwd: path.join(__dirname, '..'),
+            encoding: 'utf-8',
+            input: requests.map((r) => JSON.stringify(r)).join('\n') + '\n',
+          }
+        );
+
+        const responses = proc.stdout.trim().split('\n').map((line) => JSON.parse(line));
+
+        expect(responses.map((r) => r.id)).toEqual([1, 2, 3]);
+        expect(responses[0].result.animations).toHaveLength(1);
+        expect(responses[1].error).toContain('not found');
+        expect(responses[2].error).toContain('durationFrames');
+      } finally {
+        if (fs.existsSync(tempFile)) {
+          fs.unlinkSync(tempFile);
+        }
+      }
+    });
+  });
 });
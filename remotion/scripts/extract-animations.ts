@@ -12,6 +12,14 @@
  *
  * Usage: npx ts-node extract-animations.ts <scene-path> <duration-frames>
  * Output: JSON with resolved animations and frame timings
+ *
+ * Server mode: npx ts-node extract-animations.ts --server
+ * Reads one JSON request per line from stdin
+ *   {"id": 1, "scenePath": "...", "durationFrames": 300}
+ * and writes one JSON response per line to stdout
+ *   {"id": 1, "result": {...}} or {"id": 1, "error": "..."}
+ * so a single process can analyze many scenes without re-paying Node
+ * startup and ts-node compilation for each one.
  */
 
 import * as parser from '@babel/parser';
@@ -22,6 +30,7 @@ import * as t from '@babel/types';
 const traverse = ((_traverse as any).default || _traverse) as typeof _traverse;
 import * as fs from 'fs';
 import * as path from 'path';
+import * as readline from 'readline';
 
 // Types for our output
 interface AnimationContext {
@@ -550,4 +559,54 @@ function main() {
   console.log(JSON.stringify(result, null, 2));
 }
 
-main();
+interface ServerRequest {
+  id: number | string | null;
+  scenePath: string;
+  durationFrames: number;
+}
+
+// Handle a single server request, returning the response object
+function handleRequest(request: ServerRequest): object {
+  const id = request.id ?? null;
+
+  if (typeof request.scenePath !== 'string' || !request.scenePath) {
+    return { id, error: 'Missing scenePath' };
+  }
+  if (!Number.isInteger(request.durationFrames) || request.durationFrames <= 0) {
+    return { id, error: 'Invalid durationFrames: must be a positive integer' };
+  }
+  if (!fs.existsSync(request.scenePath)) {
+    return { id, error: `Scene file not found: ${request.scenePath}` };
+  }
+
+  try {
+    return { id, result: extractAnimations(request.scenePath, request.durationFrames) };
+  } catch (e) {
+    return { id, error: e instanceof Error ? e.message : String(e) };
+  }
+}
+
+// Server interface: line-delimited JSON requests on stdin, responses on stdout
+function serve() {
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+  rl.on('line', (line) => {
+    if (!line.trim()) {
+      return;
+    }
+
+    let response: object;
+    try {
+      response = handleRequest(JSON.parse(line) as ServerRequest);
+    } catch (e) {
+      response = { id: null, error: `Invalid request: ${e instanceof Error ? e.message : String(e)}` };
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+  });
+}
+
+if (process.argv[2] === '--server') {
+  serve();
+} else {
+  main();
+}
@@ -0,0 +1,113 @@
+#!/usr/bin/env node
+/**
+ * Render individual frames of a project as PNG stills.
+ *
+ * Usage:
+ *   node scripts/render-stills.mjs --project ../projects/llm-inference --frames ./frames.json
+ *   node scripts/render-stills.mjs --project ../projects/llm-inference --frames ./frames.json --concurrency 4
+ *
+ * frames.json is a list of {"frame": <number>, "output": "<path.png>"}.
+ *
+ * Used by visual refinement instead of seeking Remotion Studio frame by frame:
+ * the project is bundled once, one browser is opened, and every still is
+ * rendered in it, --concurrency (default 4) at a time.
+ */
+
+import { bundle } from "@remotion/bundler";
+import { openBrowser, renderStill, selectComposition } from "@remotion/renderer";
+import { fileURLToPath } from "url";
+import { dirname, resolve } from "path";
+import { readFileSync, existsSync } from "fs";
+
+import { parseArgs, buildProps } from "./render-utils.mjs";
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+async function main() {
+  const config = parseArgs(process.argv.slice(2));
+
+  if (!config.projectDir || !config.framesPath) {
+    console.error("Usage:");
+    console.error("  node scripts/render-stills.mjs --project <project-dir> --frames <frames.json> [--composition <id>]");
+    process.exit(1);
+  }
+
+  const projectDir = resolve(config.projectDir);
+  const storyboardPath = resolve(projectDir, "storyboard/storyboard.json");
+  if (!existsSync(storyboardPath)) {
+    console.error(`Storyboard file not found: ${storyboardPath}`);
+    process.exit(1);
+  }
+
+  const storyboard = JSON.parse(readFileSync(storyboardPath, "utf-8"));
+  const props = buildProps(storyboard, config.voiceoverBasePath);
+  const jobs = JSON.parse(readFileSync(config.framesPath, "utf-8"));
+  const projectScenesDir = resolve(projectDir, "scenes");
+
+  console.log(`Bundling Remotion project for ${jobs.length} stills...`);
+  const bundleLocation = await bundle({
+    entryPoint: resolve(__dirname, "../src/index.ts"),
+    publicDir: projectDir,
+    // Same aliases as render.mjs so project scenes resolve
+    webpackOverride: (webpackConfig) => ({
+      ...webpackConfig,
+      resolve: {
+        ...webpackConfig.resolve,
+        alias: {
+          ...webpackConfig.resolve?.alias,
+          "@project-scenes": projectScenesDir,
+          "@project-short-scenes": resolve(__dirname, "../src/shorts"),
+          "@remotion-components": resolve(__dirname, "../src/components"),
+        },
+        modules: [
+          ...(webpackConfig.resolve?.modules || []),
+          resolve(__dirname, "../node_modules"),
+          "node_modules",
+        ],
+      },
+    }),
+  });
+
+  // One browser for the composition lookup and every still
+  const browser = await openBrowser("chrome", {
+    chromiumOptions: config.gl ? { gl: config.gl } : {},
+  });
+
+  try {
+    const composition = await selectComposition({
+      serveUrl: bundleLocation,
+      id: config.compositionId,
+      inputProps: props,
+      puppeteerInstance: browser,
+    });
+
+    const concurrency = Math.max(1, config.concurrency || 4);
+    let next = 0;
+    const worker = async () => {
+      while (next < jobs.length) {
+        const job = jobs[next++];
+        await renderStill({
+          composition,
+          serveUrl: bundleLocation,
+          output: job.output,
+          frame: Math.min(job.frame, composition.durationInFrames - 1),
+          inputProps: props,
+          imageFormat: "png",
+          puppeteerInstance: browser,
+        });
+        console.log(`  Rendered frame ${job.frame} -> ${job.output}`);
+      }
+    };
+    await Promise.all(Array.from({ length: Math.min(concurrency, jobs.length) }, worker));
+  } finally {
+    await browser.close({ silent: true });
+  }
+
+  console.log(`Rendered ${jobs.length} stills`);
+}
+
+main().catch((err) => {
+  console.error("Still render failed:", err);
+  process.exit(1);
+});
@@ -24,6 +24,8 @@ export function parseArgs(args) {
     fast: false,
     // 3D rendering options
     gl: null, // "angle", "egl", "swiftshader", "swangle", "vulkan", or null for auto
+    // Still rendering (render-stills.mjs) - JSON list of {frame, output}
+    framesPath: null,
   };
 
   for (let i = 0; i < args.length; i++) {
@@ -63,6 +65,9 @@ export function parseArgs(args) {
     } else if (args[i] === "--gl" && args[i + 1]) {
       config.gl = args[i + 1];
       i++;
+    } else if (args[i] === "--frames" && args[i + 1]) {
+      config.framesPath = args[i + 1];
+      i++;
     }
   }
 
@@ -82,6 +82,8 @@ vi.mock("./index", () => ({
 import {
   SceneStoryboardPlayer,
   calculateStoryboardDuration,
+  duckingGain,
+  voiceoverSpans,
   type SceneStoryboard,
 } from "./SceneStoryboardPlayer";
 
@@ -669,3 +671,42 @@ describe("Audio layer separation", () => {
     expect(() => SceneStoryboardPlayer({ storyboard })).not.toThrow();
   });
 });
+
+describe("Music ducking without a mixdown", () => {
+  const rule = { depth_db: -12, attack_seconds: 0.1, release_seconds: 0.5, hold_seconds: 0.3 };
+  const floor = Math.pow(10, -12 / 20);
+
+  it("follows the voiceover timing of overlapping scenes", () => {
+    const spans = voiceoverSpans(
+      [
+        { audio_duration_seconds: 4, durationInFrames: 195 },
+        { audio_duration_seconds: 2, durationInFrames: 90 },
+      ],
+      30
+    );
+
+    // The second voiceover starts where the transition into it begins
+    expect(spans).toEqual([
+      [0, 4],
+      [5, 7],
+    ]);
+  });
+
+  it("ducks under speech and recovers after the release", () => {
+    const spans: Array<[number, number]> = [[1, 2]];
+
+    expect(duckingGain(0.5, spans, rule)).toBe(1);
+    expect(duckingGain(1.5, spans, rule)).toBeCloseTo(floor);
+    expect(duckingGain(2.25, spans, rule)).toBeCloseTo(1 - (1 - floor) * 0.5);
+    expect(duckingGain(3, spans, rule)).toBe(1);
+  });
+
+  it("stays ducked through pauses shorter than the hold", () => {
+    const spans: Array<[number, number]> = [
+      [1, 2],
+      [2.2, 3],
+    ];
+
+    expect(duckingGain(2.1, spans, rule)).toBeCloseTo(floor);
+  });
+});
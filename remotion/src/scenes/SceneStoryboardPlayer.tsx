@@ -81,6 +81,20 @@ export interface StyleConfig {
   font_family: string;
 }
 
+/**
+ * How far and how fast music ducks under the narration (see src/audio/ducking.py)
+ */
+export interface DuckingRule {
+  /** Gain while the narration plays (negative dB), defaults to -12 */
+  depth_db?: number;
+  /** Ramp down before speech (seconds), defaults to 0.08 */
+  attack_seconds?: number;
+  /** Ramp back up after speech (seconds), defaults to 0.4 */
+  release_seconds?: number;
+  /** Pauses shorter than this stay ducked (seconds), defaults to 0.3 */
+  hold_seconds?: number;
+}
+
 /**
  * Background music configuration
  */
@@ -89,6 +103,19 @@ export interface BackgroundMusicConfig {
   path: string;
   /** Volume level (0-1), defaults to 0.1 */
   volume?: number;
+  /** Duck the music under the narration (written by `music generate`) */
+  ducking?: DuckingRule;
+}
+
+/**
+ * Pre-mixed soundtrack (written by `sound mixdown`)
+ */
+export interface MixdownConfig {
+  /** Path to the stereo stem (relative to public directory) */
+  path: string;
+  /** Hash of the mix inputs, used to detect a stale stem */
+  signature?: string;
+  duration_seconds?: number;
 }
 
 /**
@@ -99,6 +126,8 @@ export interface AudioConfig {
   buffer_between_scenes_seconds: number;
   /** Optional background music configuration */
   background_music?: BackgroundMusicConfig;
+  /** Optional pre-mixed soundtrack; replaces voiceover, SFX and music elements */
+  mixdown?: MixdownConfig;
 }
 
 /**
@@ -212,9 +241,66 @@ const SceneContent: React.FC<{
   );
 };
 
+/**
+ * When each scene's voiceover plays, in seconds on the video timeline.
+ * Follows the audio layer: scenes overlap by the transition.
+ */
+export function voiceoverSpans(
+  scenes: Array<{ audio_duration_seconds: number; durationInFrames: number }>,
+  fps: number
+): Array<[number, number]> {
+  const spans: Array<[number, number]> = [];
+  let startFrame = 0;
+  scenes.forEach((scene, index) => {
+    spans.push([startFrame / fps, startFrame / fps + scene.audio_duration_seconds]);
+    const isLastScene = index === scenes.length - 1;
+    startFrame += scene.durationInFrames - (isLastScene ? 0 : TRANSITION_DURATION_FRAMES);
+  });
+  return spans;
+}
+
+/**
+ * Music gain at a point in time under the narration spans.
+ * Same curve as DuckingEnvelope in src/audio/ducking.py, which the mixdown uses.
+ */
+export function duckingGain(
+  seconds: number,
+  spans: Array<[number, number]>,
+  rule: DuckingRule
+): number {
+  const attack = Math.max(rule.attack_seconds ?? 0.08, 1e-3);
+  const release = Math.max(rule.release_seconds ?? 0.4, 1e-3);
+  const hold = rule.hold_seconds ?? 0.3;
+  const floor = Math.pow(10, (rule.depth_db ?? -12) / 20);
+
+  // Pauses shorter than the hold stay ducked
+  const merged: Array<[number, number]> = [];
+  for (const [start, end] of [...spans].sort((a, b) => a[0] - b[0])) {
+    const last = merged[merged.length - 1];
+    if (last && start - last[1] <= hold) {
+      last[1] = Math.max(last[1], end);
+    } else if (end > start) {
+      merged.push([start, end]);
+    }
+  }
+
+  let depth = 0;
+  for (const [start, end] of merged) {
+    if (seconds < start) {
+      depth = Math.max(depth, 1 - (start - seconds) / attack);
+    } else if (seconds > end) {
+      depth = Math.max(depth, 1 - (seconds - end) / release);
+    } else {
+      depth = 1;
+    }
+  }
+  return 1 - (1 - floor) * Math.min(Math.max(depth, 0), 1);
+}
+
 /**
  * Background music component with fade-in and fade-out effects
- * Plays throughout the entire video with looping support
+ * Plays throughout the entire video with looping support, ducked under the
+ * narration when a ducking rule is given
  *
  * Wrapped in a Sequence to ensure proper timing across the full composition.
  */
@@ -222,7 +308,9 @@ const BackgroundMusic: React.FC<{
   musicPath: string;
   volume: number;
   totalDurationInFrames: number;
-}> = ({ musicPath, volume, totalDurationInFrames }) => {
+  ducking?: DuckingRule;
+  speechSpans?: Array<[number, number]>;
+}> = ({ musicPath, volume, totalDurationInFrames, ducking, speechSpans = [] }) => {
   const frame = useCurrentFrame();
   const { fps } = useVideoConfig();
 
@@ -256,7 +344,10 @@ const BackgroundMusic: React.FC<{
   );
 
   // Combined volume: use fade-in at start, fade-out at end, full volume in between
-  const currentVolume = Math.min(fadeInVolume, fadeOutVolume);
+  const fadedVolume = Math.min(fadeInVolume, fadeOutVolume);
+  const currentVolume = ducking
+    ? fadedVolume * duckingGain(frame / fps, speechSpans, ducking)
+    : fadedVolume;
 
   return (
     <Sequence from={0} durationInFrames={totalDurationInFrames} name="Background Music">
@@ -366,6 +457,9 @@ export const SceneStoryboardPlayer: React.FC<SceneStoryboardPlayerProps> = ({
   const backgroundMusic = storyboard.audio?.background_music;
   const musicVolume = backgroundMusic?.volume ?? 0.1;
 
+  // A pre-mixed stem already contains voiceover, SFX and music
+  const mixdown = storyboard.audio?.mixdown;
+
   // Get accent color from style config
   const accentColor = storyboard.style?.primary_color || "#00d9ff";
 
@@ -376,11 +470,13 @@ export const SceneStoryboardPlayer: React.FC<SceneStoryboardPlayerProps> = ({
       }}
     >
       {/* Background music - plays throughout entire video with fade-in/fade-out */}
-      {backgroundMusic?.path && (
+      {!mixdown?.path && backgroundMusic?.path && (
         <BackgroundMusic
           musicPath={backgroundMusic.path}
           volume={musicVolume}
           totalDurationInFrames={totalDurationInFrames}
+          ducking={backgroundMusic.ducking}
+          speechSpans={voiceoverSpans(sceneData, fps)}
         />
       )}
 
@@ -415,8 +511,15 @@ export const SceneStoryboardPlayer: React.FC<SceneStoryboardPlayerProps> = ({
         })}
       </TransitionSeries>
 
+      {/* Pre-mixed soundtrack - one audio element for the whole video */}
+      {mixdown?.path && (
+        <Sequence from={0} durationInFrames={totalDurationInFrames} name="Mixdown">
+          <Audio src={staticFile(mixdown.path)} volume={1} />
+        </Sequence>
+      )}
+
       {/* Audio layer - sequential voiceovers that DON'T overlap during transitions */}
-      {(() => {
+      {!mixdown?.path && (() => {
         let audioStartFrame = 0;
         return sceneData.map((scene, index) => {
           const currentStart = audioStartFrame;
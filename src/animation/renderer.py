@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from ..config import Config, load_config
+from ..media_info import get_media_duration
 from ..models import Script
 
 
@@ -268,24 +269,8 @@ class RemotionRenderer(AnimationRenderer):
             )
 
     def _get_video_duration(self, video_path: Path) -> float:
-        """Get the duration of a video file using ffprobe."""
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path),
-        ]
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return float(result.stdout.strip())
-        except (ValueError, subprocess.SubprocessError):
-            pass
-
-        return 0.0
-
+        """Get the duration of a video file."""
+        return get_media_duration(video_path)
 
 class MockRenderer(AnimationRenderer):
     """Mock renderer that generates test pattern videos.
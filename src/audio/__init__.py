@@ -6,6 +6,7 @@ from .tts import (
     EdgeTTS,
     MockTTS,
     ManualVoiceoverProvider,
+    TTSRequest,
     TTSResult,
     WordTimestamp,
     get_tts_provider,
@@ -14,11 +15,40 @@ from .tts import (
 from .transcribe import (
     WhisperTranscriber,
     FasterWhisperTranscriber,
+    TranscriptionCache,
     TranscriptionResult,
     get_transcriber,
     get_audio_duration,
 )
 
+from .ducking import (
+    DuckingEnvelope,
+    DuckingRule,
+    speech_spans_from_rms,
+    speech_spans_from_words,
+)
+
+from .loudness import (
+    LoudnessAnalyzer,
+    LoudnessMeasurement,
+    LoudnessMeter,
+    LoudnessReport,
+    LoudnessTargets,
+    measure_file,
+    measure_loudness,
+    normalize_loudness,
+)
+
+from .mixdown import (
+    MixClip,
+    MixdownEngine,
+    MixdownError,
+    MixdownPlan,
+    MixdownResult,
+    mix_storyboard,
+    storyboard_speech_spans,
+)
+
 __all__ = [
     # TTS providers
     "TTSProvider",
@@ -26,13 +56,37 @@ __all__ = [
     "EdgeTTS",
     "MockTTS",
     "ManualVoiceoverProvider",
+    "TTSRequest",
     "TTSResult",
     "WordTimestamp",
     "get_tts_provider",
     # Transcription
     "WhisperTranscriber",
     "FasterWhisperTranscriber",
+    "TranscriptionCache",
     "TranscriptionResult",
     "get_transcriber",
     "get_audio_duration",
+    # Music ducking
+    "DuckingEnvelope",
+    "DuckingRule",
+    "speech_spans_from_rms",
+    "speech_spans_from_words",
+    # Loudness
+    "LoudnessAnalyzer",
+    "LoudnessMeasurement",
+    "LoudnessMeter",
+    "LoudnessReport",
+    "LoudnessTargets",
+    "measure_file",
+    "measure_loudness",
+    "normalize_loudness",
+    # Mixdown
+    "MixClip",
+    "MixdownEngine",
+    "MixdownError",
+    "MixdownPlan",
+    "MixdownResult",
+    "mix_storyboard",
+    "storyboard_speech_spans",
 ]
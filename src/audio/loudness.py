@@ -0,0 +1,526 @@
+"""
+EBU R128 loudness measurement and normalization.
+
+Implements ITU-R BS.1770-4 as used by EBU R128:
+
+- K-weighting: a high-shelf and a high-pass biquad, with coefficients derived
+  for the file's own sample rate
+- integrated loudness: mean square over 400ms blocks with 75% overlap, gated
+  at -70 LUFS (absolute) and 10 LU below the ungated loudness (relative)
+- true peak: the largest sample after 4x polyphase oversampling
+
+`LoudnessMeter` consumes audio in blocks and keeps only 100ms segment
+energies and filter state, so files of any length are measured in bounded
+memory. Measurements are cached by file content hash, so a project's
+loudness report only decodes files that changed.
+
+Assets are normalized to per-kind targets (voiceover, SFX, music), limited
+so the true peak stays under the ceiling. In-memory audio (generated SFX
+and music) is normalized before it is written; the project's voiceovers,
+SFX and music get their correction as a gain in the mixdown, so nothing is
+re-encoded.
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# Bump when the measurement changes, so cached measurements are not reused
+LOUDNESS_ANALYSIS_VERSION = 1
+
+# Per-kind loudness targets (LUFS) and the true-peak ceiling (dBTP). Music is
+# a bed under the narration: with the storyboard's 0.3 music volume on top it
+# plays around -37 LUFS, where peak-normalized music scaled by 0.3 in the file
+# and again in the player used to sit
+VOICEOVER_TARGET_LUFS = -16.0
+SFX_TARGET_LUFS = -18.0
+MUSIC_TARGET_LUFS = -27.0
+TRUE_PEAK_CEILING_DBTP = -1.0
+
+DEFAULT_BLOCK_SIZE = 65536
+
+# BS.1770 gating
+_BLOCK_SECONDS = 0.4
+_SEGMENTS_PER_BLOCK = 4  # 75% overlap: blocks advance by 100ms segments
+_ABSOLUTE_GATE_LUFS = -70.0
+_RELATIVE_GATE_LU = -10.0
+
+# True-peak oversampling
+_OVERSAMPLE = 4
+_TAPS_PER_PHASE = 12
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg")
+
+
+def k_weighting_sos(sample_rate: int) -> np.ndarray:
+    """K-weighting filter as second-order sections for a sample rate.
+
+    At 48 kHz these are exactly the BS.1770 reference coefficients.
+    """
+    # Stage 1: high shelf (head acoustics)
+    gain_db, q, fc = 3.999843853973347, 0.7071752369554196, 1681.974450955533
+    k = math.tan(math.pi * fc / sample_rate)
+    vh = 10 ** (gain_db / 20)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf = [
+        (vh + vb * k / q + k * k) / a0,
+        2 * (k * k - vh) / a0,
+        (vh - vb * k / q + k * k) / a0,
+        1.0,
+        2 * (k * k - 1) / a0,
+        (1 - k / q + k * k) / a0,
+    ]
+
+    # Stage 2: high pass (RLB weighting)
+    q, fc = 0.5003270373238773, 38.13547087602444
+    k = math.tan(math.pi * fc / sample_rate)
+    a0 = 1 + k / q + k * k
+    highpass = [1.0, -2.0, 1.0, 1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]
+
+    return np.array([shelf, highpass])
+
+
+def _oversampling_filter() -> np.ndarray:
+    """4x interpolation FIR as a (taps_per_phase, phases) matrix."""
+    taps = _OVERSAMPLE * _TAPS_PER_PHASE
+    n = np.arange(taps) - (taps - 1) / 2
+    h = np.sinc(n / _OVERSAMPLE) * np.kaiser(taps, 8.0)
+    # Each phase sums to 1 so DC passes at unity gain
+    phases = h.reshape(_TAPS_PER_PHASE, _OVERSAMPLE)
+    phases = phases / phases.sum(axis=0)
+    return phases[::-1].astype(np.float32)  # Reversed for a sliding dot product
+
+
+_PHASES = _oversampling_filter()
+
+
+def _db(value: float, scale: float = 20) -> Optional[float]:
+    return scale * math.log10(value) if value > 0 else None
+
+
+@dataclass
+class LoudnessMeasurement:
+    """Loudness of one file or signal.
+
+    Attributes:
+        integrated_lufs: Gated integrated loudness (None for silence)
+        true_peak_dbtp: Oversampled peak level (None for silence)
+        duration_seconds: Length of the audio
+        sample_rate: Sample rate it was measured at
+        channels: Channel count
+    """
+
+    integrated_lufs: Optional[float]
+    true_peak_dbtp: Optional[float]
+    duration_seconds: float = 0.0
+    sample_rate: int = 0
+    channels: int = 0
+
+    def gain_db(self, target_lufs: float, ceiling_dbtp: float = TRUE_PEAK_CEILING_DBTP) -> float:
+        """Gain that brings this audio to target_lufs without exceeding the ceiling."""
+        if self.integrated_lufs is None:
+            return 0.0
+        gain = target_lufs - self.integrated_lufs
+        if self.true_peak_dbtp is not None:
+            gain = min(gain, ceiling_dbtp - self.true_peak_dbtp)
+        return gain
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "integrated_lufs": self.integrated_lufs,
+            "true_peak_dbtp": self.true_peak_dbtp,
+            "duration_seconds": self.duration_seconds,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoudnessMeasurement":
+        """Create from dictionary."""
+        return cls(
+            integrated_lufs=data.get("integrated_lufs"),
+            true_peak_dbtp=data.get("true_peak_dbtp"),
+            duration_seconds=data.get("duration_seconds", 0.0),
+            sample_rate=data.get("sample_rate", 0),
+            channels=data.get("channels", 0),
+        )
+
+
+class LoudnessMeter:
+    """Streaming BS.1770 meter: feed blocks with process(), then call result()."""
+
+    def __init__(self, sample_rate: int, channels: int = 1):
+        """Initialize the meter.
+
+        Args:
+            sample_rate: Sample rate of the audio
+            channels: Channel count
+        """
+        from scipy.signal import sosfilt
+
+        self._sosfilt = sosfilt
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._sos = k_weighting_sos(sample_rate)
+        self._zi = np.zeros((len(self._sos), 2, channels))
+        # Surround channels (4th and 5th) are weighted +1.5 dB
+        self._weights = np.array([1.41 if c in (3, 4) else 1.0 for c in range(channels)])
+
+        self._segment = max(1, round(_BLOCK_SECONDS / _SEGMENTS_PER_BLOCK * sample_rate))
+        self._partial = np.zeros(channels)  # Sum of squares of the unfinished segment
+        self._partial_count = 0
+        self._segments: list[np.ndarray] = []  # Mean square per channel per segment
+
+        self._history = np.zeros((_TAPS_PER_PHASE - 1, channels), dtype=np.float32)
+        self._peak = 0.0
+        self._samples = 0
+
+    def process(self, block: np.ndarray) -> None:
+        """Measure the next block of samples, (n,) or (n, channels)."""
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim == 1:
+            block = block[:, None]
+        if not len(block):
+            return
+        self._samples += len(block)
+
+        weighted, self._zi = self._sosfilt(self._sos, block, axis=0, zi=self._zi)
+        squares = weighted ** 2
+
+        # Complete the unfinished segment, then whole segments, then keep the rest
+        position = 0
+        if self._partial_count:
+            take = min(self._segment - self._partial_count, len(squares))
+            self._partial += squares[:take].sum(axis=0)
+            self._partial_count += take
+            position = take
+            if self._partial_count == self._segment:
+                self._segments.append(self._partial / self._segment)
+                self._partial = np.zeros(self.channels)
+                self._partial_count = 0
+
+        whole = (len(squares) - position) // self._segment
+        if whole:
+            end = position + whole * self._segment
+            means = squares[position:end].reshape(whole, self._segment, self.channels).mean(axis=1)
+            self._segments.extend(means)
+            position = end
+        if position < len(squares):
+            self._partial += squares[position:].sum(axis=0)
+            self._partial_count += len(squares) - position
+
+        # Oversampling quadruples the data, so bound its working memory
+        for offset in range(0, len(block), DEFAULT_BLOCK_SIZE):
+            self._peak = max(self._peak, self._true_peak(block[offset:offset + DEFAULT_BLOCK_SIZE]))
+
+    def _true_peak(self, block: np.ndarray) -> float:
+        """Largest absolute value of the 4x oversampled block."""
+        # float32 is ample for a peak reading and twice as fast
+        extended = np.concatenate([self._history, block.astype(np.float32)])
+        self._history = extended[-(_TAPS_PER_PHASE - 1):]
+        windows = np.lib.stride_tricks.sliding_window_view(extended, _TAPS_PER_PHASE, axis=0)
+        # windows: (n, channels, taps) @ (taps, phases) -> every phase of every sample
+        oversampled = windows @ _PHASES
+        return float(max(np.abs(oversampled).max(initial=0.0), np.abs(block).max(initial=0.0)))
+
+    def result(self) -> LoudnessMeasurement:
+        """Loudness of everything processed so far."""
+        if len(self._segments) >= _SEGMENTS_PER_BLOCK:
+            segments = np.array(self._segments)
+            # Overlapping 400ms blocks are means of 4 consecutive segments
+            cumulative = np.concatenate([np.zeros((1, self.channels)), np.cumsum(segments, axis=0)])
+            blocks = (cumulative[_SEGMENTS_PER_BLOCK:] - cumulative[:-_SEGMENTS_PER_BLOCK]) / _SEGMENTS_PER_BLOCK
+        elif self._segments or self._partial_count:
+            # Shorter than one gating block: measure it as a single block
+            total = sum(s * self._segment for s in self._segments) + self._partial
+            blocks = (total / (len(self._segments) * self._segment + self._partial_count))[None, :]
+        else:
+            blocks = np.zeros((0, self.channels))
+
+        power = blocks @ self._weights
+        with np.errstate(divide="ignore"):
+            block_loudness = -0.691 + 10 * np.log10(power)
+
+        integrated = None
+        gated = block_loudness > _ABSOLUTE_GATE_LUFS
+        if gated.any():
+            relative_gate = -0.691 + 10 * math.log10(power[gated].mean()) + _RELATIVE_GATE_LU
+            gated &= block_loudness > relative_gate
+            integrated = -0.691 + 10 * math.log10(power[gated].mean())
+
+        return LoudnessMeasurement(
+            integrated_lufs=integrated,
+            true_peak_dbtp=_db(self._peak),
+            duration_seconds=self._samples / self.sample_rate,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+        )
+
+
+def measure_loudness(samples: np.ndarray, sample_rate: int) -> LoudnessMeasurement:
+    """Measure in-memory audio, (n,) or (n, channels)."""
+    samples = np.asarray(samples, dtype=np.float64)
+    meter = LoudnessMeter(sample_rate, 1 if samples.ndim == 1 else samples.shape[1])
+    meter.process(samples)
+    return meter.result()
+
+
+def normalize_loudness(
+    samples: np.ndarray,
+    sample_rate: int,
+    target_lufs: float,
+    ceiling_dbtp: float = TRUE_PEAK_CEILING_DBTP,
+) -> np.ndarray:
+    """Scale audio to a loudness target, limited by a true-peak ceiling.
+
+    Replaces peak normalization: the result has the target loudness unless
+    that would push its true peak over the ceiling.
+    """
+    gain_db = measure_loudness(samples, sample_rate).gain_db(target_lufs, ceiling_dbtp)
+    return samples * 10 ** (gain_db / 20)
+
+
+def measure_file(path: Path, block_size: int = DEFAULT_BLOCK_SIZE) -> LoudnessMeasurement:
+    """Measure an audio file, streaming it in blocks.
+
+    Raises:
+        MixdownError: If the file cannot be decoded
+    """
+    from .mixdown import open_source
+
+    source = open_source(Path(path), sample_rate=None, channels=None)
+    try:
+        meter = LoudnessMeter(source.sample_rate, source.channels)
+        while True:
+            block = source.read(block_size)
+            if not len(block):
+                break
+            meter.process(block)
+    finally:
+        source.close()
+    return meter.result()
+
+
+# =============================================================================
+# Cache and project report
+# =============================================================================
+
+
+def default_loudness_cache_dir() -> Path:
+    """Return the user-level cache directory for loudness measurements."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "video-explainer" / "loudness"
+
+
+def file_hash(path: Path) -> str:
+    """sha256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LoudnessCache:
+    """Loudness measurements keyed by file content, one JSON file per entry."""
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: user cache dir)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_loudness_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content_hash: str) -> str:
+        """Compute the cache key for a file's content hash."""
+        payload = json.dumps({"version": LOUDNESS_ANALYSIS_VERSION, "content": content_hash})
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Path of the cache entry for a key (may not exist yet)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[LoudnessMeasurement]:
+        """Return the cached measurement for a key, or None on a miss."""
+        try:
+            measurement = LoudnessMeasurement.from_dict(json.loads(self.path_for(key).read_text()))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return measurement
+
+    def put(self, key: str, measurement: LoudnessMeasurement) -> None:
+        """Store a measurement under a key."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(measurement.to_dict()))
+        os.replace(tmp_path, path)
+
+
+@dataclass
+class LoudnessTargets:
+    """Per-kind loudness targets and the true-peak ceiling."""
+
+    voiceover_lufs: float = VOICEOVER_TARGET_LUFS
+    sfx_lufs: float = SFX_TARGET_LUFS
+    music_lufs: float = MUSIC_TARGET_LUFS
+    ceiling_dbtp: float = TRUE_PEAK_CEILING_DBTP
+
+    def for_kind(self, kind: str) -> float:
+        """Target for "voiceover", "sfx" or "music"."""
+        return {"voiceover": self.voiceover_lufs, "sfx": self.sfx_lufs, "music": self.music_lufs}[kind]
+
+
+@dataclass
+class LoudnessEntry:
+    """One asset in a loudness report."""
+
+    path: str  # Relative to the project
+    kind: str  # "voiceover", "sfx" or "music"
+    measurement: Optional[LoudnessMeasurement] = None
+    gain_db: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "path": self.path,
+            "kind": self.kind,
+            "measurement": self.measurement.to_dict() if self.measurement else None,
+            "gain_db": self.gain_db,
+            "error": self.error,
+        }
+
+
+@dataclass
+class LoudnessReport:
+    """Loudness of a project's assets and the gain that corrects each."""
+
+    project_dir: Path
+    targets: LoudnessTargets = field(default_factory=LoudnessTargets)
+    entries: list[LoudnessEntry] = field(default_factory=list)
+
+    def gain_for(self, path: Path) -> float:
+        """Linear correction gain for an asset (1.0 if it wasn't measured)."""
+        try:
+            relative = str(Path(path).relative_to(self.project_dir))
+        except ValueError:
+            return 1.0
+        for entry in self.entries:
+            if entry.path == relative:
+                return 10 ** (entry.gain_db / 20)
+        return 1.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "targets": {
+                "voiceover_lufs": self.targets.voiceover_lufs,
+                "sfx_lufs": self.targets.sfx_lufs,
+                "music_lufs": self.targets.music_lufs,
+                "ceiling_dbtp": self.targets.ceiling_dbtp,
+            },
+            "entries": [entry.to_dict() for entry in self.entries],
+        }
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """Write the report (default: <project>/audio/loudness_report.json)."""
+        path = Path(path or self.project_dir / "audio" / "loudness_report.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+
+def project_audio_assets(project_dir: Path) -> list[tuple[Path, str]]:
+    """A project's voiceover, SFX and music files with their kinds."""
+    assets = []
+    for directory, kind in (("voiceover", "voiceover"), ("sfx", "sfx"), ("music", "music")):
+        folder = Path(project_dir) / directory
+        if folder.is_dir():
+            assets.extend(
+                (path, kind)
+                for path in sorted(folder.iterdir())
+                if path.suffix.lower() in AUDIO_EXTENSIONS and not path.name.startswith(".")
+            )
+    return assets
+
+
+class LoudnessAnalyzer:
+    """Measures a project's audio assets concurrently, with a content-hash cache."""
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        targets: Optional[LoudnessTargets] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        cache_dir: Path | str | None = None,
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            targets: Loudness targets (default LoudnessTargets())
+            max_workers: Files measured concurrently
+            use_cache: Reuse measurements of files whose content is unchanged
+            cache_dir: Cache directory (default: user cache dir)
+        """
+        self.targets = targets or LoudnessTargets()
+        self.max_workers = max(1, max_workers or self.DEFAULT_MAX_WORKERS)
+        self.cache = LoudnessCache(cache_dir) if use_cache else None
+
+    def _measure(self, path: Path) -> LoudnessMeasurement:
+        if self.cache is None:
+            return measure_file(path)
+        key = LoudnessCache.make_key(file_hash(path))
+        measurement = self.cache.get(key)
+        if measurement is None:
+            measurement = measure_file(path)
+            self.cache.put(key, measurement)
+        return measurement
+
+    def analyze_project(self, project_dir: Path) -> LoudnessReport:
+        """Measure every voiceover, SFX and music file in a project."""
+        from .mixdown import MixdownError
+
+        project_dir = Path(project_dir)
+        assets = project_audio_assets(project_dir)
+        entries = [
+            LoudnessEntry(path=str(path.relative_to(project_dir)), kind=kind)
+            for path, kind in assets
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._measure, path): i for i, (path, _) in enumerate(assets)
+            }
+            for future in as_completed(futures):
+                entry = entries[futures[future]]
+                try:
+                    entry.measurement = future.result()
+                except (MixdownError, OSError, EOFError) as e:
+                    entry.error = str(e)
+                    continue
+                entry.gain_db = round(
+                    entry.measurement.gain_db(self.targets.for_kind(entry.kind), self.targets.ceiling_dbtp),
+                    2,
+                )
+
+        return LoudnessReport(project_dir=project_dir, targets=self.targets, entries=entries)
@@ -0,0 +1,732 @@
+"""
+Streaming audio mixdown of a storyboard's voiceover, SFX cues and music.
+
+By default Remotion assembles the soundtrack at render time: every voiceover
+segment, every SFX cue and the background music is a separate <Audio>
+element. `MixdownEngine` renders the same mix in Python into one stereo WAV
+stem, which the player then plays as its only audio element. Re-mixing (new
+SFX cues, a different music volume) only re-renders the stem, not the video.
+
+The mix is rendered in fixed-size blocks. Only the clips overlapping the
+current block are open, and each is read incrementally, so memory stays
+bounded by the block size however long the video is.
+
+Timing mirrors SceneStoryboardPlayer.tsx exactly:
+
+- scene N's voiceover starts at the sum of the previous scenes'
+  ceil((audio_duration + buffer + visual_padding) * fps) frames and plays for
+  ceil(audio_duration * fps) + ceil(buffer * fps) frames
+- SFX cues start `cue.frame` frames after their scene's voiceover and play
+  for `duration_frames` (default 60) frames at `cue.volume`
+- music loops for the whole video at its volume, with a 2s ease-out-cubic
+  fade-in and a 3s ease-in-cubic fade-out; with
+  `audio.background_music.ducking` set it also ducks under the narration
+
+WAV sources at the mix rate are read directly; anything else (the MP3
+voiceovers and music) is decoded by an ffmpeg subprocess streaming raw
+samples.
+"""
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import subprocess
+import wave
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Protocol
+
+import numpy as np
+
+from ..media_info import MediaInfoError, probe_media
+from .ducking import DuckingEnvelope, DuckingRule, speech_spans_from_rms, speech_spans_from_words
+
+if TYPE_CHECKING:
+    from .loudness import LoudnessReport
+
+# Matches the SFX library, so SFX cues never need resampling
+MIX_SAMPLE_RATE = 44100
+DEFAULT_BLOCK_SIZE = 8192
+
+# Storyboard-relative path of the rendered stem
+MIXDOWN_PATH = "audio/mixdown.wav"
+
+# Must match SceneStoryboardPlayer.tsx
+DEFAULT_SFX_DURATION_FRAMES = 60
+DEFAULT_MUSIC_VOLUME = 0.1
+MUSIC_FADE_IN_SECONDS = 2.0
+MUSIC_FADE_OUT_SECONDS = 3.0
+
+
+class MixdownError(Exception):
+    """Raised when a mix cannot be rendered."""
+
+
+# =============================================================================
+# Sources
+# =============================================================================
+
+
+class _WavSource:
+    """Streams a WAV file as float32, upmixed to stereo unless channels is None."""
+
+    def __init__(self, wav: wave.Wave_read, channels: Optional[int] = 2):
+        self._wav = wav
+        self._channels = wav.getnchannels()
+        self._width = wav.getsampwidth()
+        self.sample_rate = wav.getframerate()
+        self.channels = channels or self._channels
+
+    def read(self, count: int) -> np.ndarray:
+        raw = self._wav.readframes(count)
+        if self._width == 1:
+            data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+        elif self._width == 2:
+            data = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+        elif self._width == 3:
+            # Sign-extend 24-bit samples into the top of an int32
+            triples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            packed = (triples[:, 0] << 8) | (triples[:, 1] << 16) | (triples[:, 2] << 24)
+            data = packed.astype(np.float32) / 2147483648.0
+        else:
+            data = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+
+        data = data.reshape(-1, self._channels)
+        if self.channels == self._channels:
+            return data
+        if self._channels == 1:
+            return np.repeat(data, self.channels, axis=1)
+        return data[:, : self.channels]
+
+    def close(self) -> None:
+        self._wav.close()
+
+
+class _FfmpegSource:
+    """Decodes any ffmpeg-readable file to float32 at a given rate and channel count."""
+
+    def __init__(self, path: Path, sample_rate: int, channels: int = 2):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._process = subprocess.Popen(
+            [
+                "ffmpeg", "-v", "error", "-nostdin",
+                "-i", str(path),
+                "-f", "f32le", "-ac", str(channels), "-ar", str(sample_rate),
+                "-",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def read(self, count: int) -> np.ndarray:
+        frame = 4 * self.channels  # float32 per channel
+        wanted = count * frame
+        chunks = []
+        while wanted > 0:
+            chunk = self._process.stdout.read(wanted)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            wanted -= len(chunk)
+        raw = b"".join(chunks)
+        raw = raw[: len(raw) - len(raw) % frame]
+        return np.frombuffer(raw, dtype="<f4").reshape(-1, self.channels)
+
+    def close(self) -> None:
+        self._process.stdout.close()
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+
+
+def _probe_channels(path: Path) -> int:
+    """Channel count of a file's first audio stream (2 if unknown)."""
+    try:
+        channels = probe_media(path).channels
+    except MediaInfoError:
+        channels = None
+    if channels:
+        return channels
+
+    if shutil.which("ffprobe") is None:
+        return 2
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "a:0",
+            "-show_entries", "stream=channels", "-of", "csv=p=0",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    try:
+        return int(result.stdout.strip().splitlines()[0])
+    except (ValueError, IndexError):
+        return 2
+
+
+def open_source(
+    path: Path,
+    sample_rate: Optional[int] = MIX_SAMPLE_RATE,
+    channels: Optional[int] = 2,
+):
+    """Open an audio file for streaming reads of float32 samples.
+
+    Args:
+        path: Audio file path
+        sample_rate: Rate the samples must be delivered at (None: the file's
+            own rate for WAVs, 48 kHz for anything decoded by ffmpeg)
+        channels: Channel count to deliver (None: the file's own)
+
+    Returns:
+        A source with `sample_rate`, `channels`,
+        `read(count) -> ndarray[(n, channels)]` and `close()`
+
+    Raises:
+        MixdownError: If the file cannot be decoded
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".wav":
+        try:
+            wav = wave.open(str(path), "rb")
+        except (wave.Error, EOFError):
+            wav = None
+        if wav is not None:
+            if sample_rate in (None, wav.getframerate()) and wav.getsampwidth() in (1, 2, 3, 4):
+                return _WavSource(wav, channels)
+            wav.close()
+
+    if shutil.which("ffmpeg") is None:
+        raise MixdownError(f"Cannot decode {path}: ffmpeg not found")
+    return _FfmpegSource(path, sample_rate or 48000, channels or _probe_channels(path))
+
+
+# =============================================================================
+# Gain envelopes
+# =============================================================================
+
+
+class GainEnvelope(Protocol):
+    """Time-varying gain, evaluated per block."""
+
+    def gain(self, start: int, count: int) -> np.ndarray:
+        """Gain for the `count` mix samples starting at sample `start`."""
+
+    def describe(self) -> dict[str, Any]:
+        """Parameters that determine the envelope (for plan signatures)."""
+
+
+class MusicEnvelope:
+    """Background music gain: volume, fade in/out and optional ducking."""
+
+    def __init__(
+        self,
+        volume: float,
+        total_samples: int,
+        sample_rate: int = MIX_SAMPLE_RATE,
+        fade_in_seconds: float = MUSIC_FADE_IN_SECONDS,
+        fade_out_seconds: float = MUSIC_FADE_OUT_SECONDS,
+        ducking: Optional[DuckingEnvelope] = None,
+    ):
+        """Initialize the envelope.
+
+        Args:
+            volume: Music volume (0-1)
+            total_samples: Length of the mix (the fade-out ends here)
+            sample_rate: Mix sample rate
+            fade_in_seconds: Fade-in length
+            fade_out_seconds: Fade-out length
+            ducking: Ducking under speech (at sample_rate), or None
+        """
+        self.volume = volume
+        self.total_samples = total_samples
+        self.sample_rate = sample_rate
+        self.fade_in_samples = max(1, round(fade_in_seconds * sample_rate))
+        self.fade_out_samples = max(1, round(fade_out_seconds * sample_rate))
+        self.ducking = ducking
+
+    def gain(self, start: int, count: int) -> np.ndarray:
+        positions = np.arange(start, start + count, dtype=np.float64)
+
+        fade_in = np.clip(positions / self.fade_in_samples, 0.0, 1.0)
+        fade_out = np.clip(
+            (positions - (self.total_samples - self.fade_out_samples)) / self.fade_out_samples,
+            0.0,
+            1.0,
+        )
+        gain = self.volume * np.minimum(1 - (1 - fade_in) ** 3, 1 - fade_out ** 3)
+
+        if self.ducking is not None:
+            gain *= self.ducking.gain(start, count)
+        return gain.astype(np.float32)
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "volume": self.volume,
+            "total_samples": self.total_samples,
+            "fade_in_samples": self.fade_in_samples,
+            "fade_out_samples": self.fade_out_samples,
+            "ducking": self.ducking.describe() if self.ducking else None,
+        }
+
+
+# =============================================================================
+# Mix plan
+# =============================================================================
+
+
+def _buffer_seconds(storyboard: dict) -> float:
+    buffer = (storyboard.get("audio") or {}).get("buffer_between_scenes_seconds")
+    return 1.0 if buffer is None else buffer
+
+
+def scene_start_frames(storyboard: dict) -> list[int]:
+    """Frame at which each scene's voiceover starts, followed by the total length.
+
+    Each scene advances the timeline by
+    ceil((audio_duration + buffer + visual_padding) * fps) frames.
+    """
+    fps = storyboard.get("video", {}).get("fps", 30)
+    buffer = _buffer_seconds(storyboard)
+    starts = [0]
+    for scene in storyboard.get("scenes", []):
+        duration = scene.get("audio_duration_seconds", 0)
+        padding = scene.get("visual_padding_seconds") or 0
+        starts.append(starts[-1] + math.ceil((duration + buffer + padding) * fps))
+    return starts
+
+
+def storyboard_speech_spans(
+    storyboard: dict,
+    project_dir: Optional[Path] = None,
+    manifest: Optional[dict] = None,
+    voiceover_dir: str = "voiceover",
+) -> list[tuple[float, float]]:
+    """When the narration speaks, in seconds on the video timeline.
+
+    Each scene's spans come from its word timestamps in the voiceover
+    manifest. Scenes without them fall back to the RMS envelope of the
+    voiceover file, and failing that to the whole voiceover.
+
+    Args:
+        storyboard: Storyboard data (storyboard.json)
+        project_dir: Project directory, for reading voiceovers
+        manifest: Voiceover manifest (voiceover/manifest.json)
+        voiceover_dir: Voiceover directory, relative to the project
+    """
+    fps = storyboard.get("video", {}).get("fps", 30)
+    words_by_scene = {
+        scene.get("scene_id"): scene.get("word_timestamps") or []
+        for scene in (manifest or {}).get("scenes", [])
+    }
+
+    spans: list[tuple[float, float]] = []
+    for scene, start_frame in zip(storyboard.get("scenes", []), scene_start_frames(storyboard)):
+        offset = start_frame / fps
+        duration = scene.get("audio_duration_seconds", 0)
+
+        words = words_by_scene.get(scene.get("id"))
+        if words:
+            spans.extend(speech_spans_from_words(words, offset))
+            continue
+
+        path = Path(project_dir or ".") / voiceover_dir / scene.get("audio_file", "")
+        if project_dir is not None and path.is_file():
+            try:
+                source = open_source(path, MIX_SAMPLE_RATE)
+                try:
+                    voiceover = source.read(round(duration * MIX_SAMPLE_RATE))
+                finally:
+                    source.close()
+                spans.extend(speech_spans_from_rms(voiceover, MIX_SAMPLE_RATE, offset))
+                continue
+            except MixdownError:
+                pass
+        spans.append((offset, offset + duration))
+
+    return spans
+
+
+
+@dataclass
+class MixClip:
+    """One source placed on the mix timeline.
+
+    Attributes:
+        path: Audio file
+        start: First mix sample the clip plays at
+        length: Samples to play (None = until the file or the mix ends)
+        gain: Constant gain
+        loop: Restart the file when it ends (until `length` is reached)
+        envelope: Optional time-varying gain, multiplied with `gain`
+    """
+
+    path: Path
+    start: int
+    length: Optional[int] = None
+    gain: float = 1.0
+    loop: bool = False
+    envelope: Optional[GainEnvelope] = None
+
+
+@dataclass
+class MixdownPlan:
+    """Everything placed on the mix timeline."""
+
+    total_samples: int
+    sample_rate: int = MIX_SAMPLE_RATE
+    clips: list[MixClip] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_storyboard(
+        cls,
+        storyboard: dict,
+        project_dir: Path,
+        voiceover_dir: str = "voiceover",
+        sample_rate: int = MIX_SAMPLE_RATE,
+        manifest: Optional[dict] = None,
+        loudness: Optional["LoudnessReport"] = None,
+    ) -> "MixdownPlan":
+        """Lay out a storyboard's soundtrack the way the Remotion player does.
+
+        Args:
+            storyboard: Storyboard data (storyboard.json)
+            project_dir: Project directory (audio paths are relative to it)
+            voiceover_dir: Voiceover directory, relative to the project
+            sample_rate: Mix sample rate
+            manifest: Voiceover manifest, for word-level music ducking
+            loudness: Loudness report whose correction gains are applied to
+                each clip, bringing every asset to its loudness target
+
+        Returns:
+            The plan. Clips whose files are missing are left out and listed
+            in `missing`.
+        """
+        # Imported here: the sound package pulls in scipy.signal
+        from ..sound.models import SFXCue
+
+        project_dir = Path(project_dir)
+        fps = storyboard.get("video", {}).get("fps", 30)
+        buffer = _buffer_seconds(storyboard)
+        scenes = storyboard.get("scenes", [])
+        starts = scene_start_frames(storyboard)
+
+        def samples(frames: int) -> int:
+            return round(frames * sample_rate / fps)
+
+        plan = cls(total_samples=samples(starts[-1]), sample_rate=sample_rate)
+
+        for scene, scene_start in zip(scenes, starts):
+            audio_frames = math.ceil(scene.get("audio_duration_seconds", 0) * fps)
+            plan._add(
+                project_dir / voiceover_dir / scene.get("audio_file", ""),
+                start=samples(scene_start),
+                length=samples(audio_frames + math.ceil(buffer * fps)),
+            )
+
+            for cue_data in scene.get("sfx_cues") or []:
+                cue = SFXCue.from_dict(cue_data)
+                plan._add(
+                    project_dir / "sfx" / f"{cue.sound}.wav",
+                    start=samples(scene_start + cue.frame),
+                    length=samples(cue.duration_frames or DEFAULT_SFX_DURATION_FRAMES),
+                    gain=cue.volume,
+                )
+
+        music = (storyboard.get("audio") or {}).get("background_music") or {}
+        if music.get("path"):
+            volume = music.get("volume")
+            ducking = None
+            if music.get("ducking"):
+                ducking = DuckingEnvelope(
+                    storyboard_speech_spans(storyboard, project_dir, manifest, voiceover_dir),
+                    DuckingRule.from_dict(music["ducking"]),
+                    sample_rate,
+                )
+            plan._add(
+                project_dir / music["path"],
+                start=0,
+                length=plan.total_samples,
+                loop=True,
+                envelope=MusicEnvelope(
+                    DEFAULT_MUSIC_VOLUME if volume is None else volume,
+                    plan.total_samples,
+                    sample_rate,
+                    ducking=ducking,
+                ),
+            )
+
+        if loudness is not None:
+            for clip in plan.clips:
+                clip.gain *= loudness.gain_for(clip.path)
+
+        return plan
+
+    def _add(self, path: Path, **kwargs) -> None:
+        if path.is_file():
+            self.clips.append(MixClip(path=path, **kwargs))
+        else:
+            self.missing.append(str(path))
+
+    @property
+    def duration_seconds(self) -> float:
+        """Length of the mix in seconds."""
+        return self.total_samples / self.sample_rate
+
+    def signature(self) -> str:
+        """Hash of the plan and its source files (size and mtime).
+
+        Two plans with the same signature render identical stems.
+        """
+        clips = []
+        for clip in self.clips:
+            stat = clip.path.stat()
+            clips.append({
+                "path": str(clip.path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "start": clip.start,
+                "length": clip.length,
+                "gain": clip.gain,
+                "loop": clip.loop,
+                "envelope": clip.envelope.describe() if clip.envelope else None,
+            })
+        payload = {"sample_rate": self.sample_rate, "total_samples": self.total_samples, "clips": clips}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+# =============================================================================
+# Rendering
+# =============================================================================
+
+
+@dataclass
+class MixdownResult:
+    """Result of rendering a mix.
+
+    Attributes:
+        output_path: The rendered stereo WAV
+        duration_seconds: Length of the mix
+        clips_mixed: Number of clips on the timeline
+        peak: Highest absolute sample value before clipping
+        clipped_samples: Samples that exceeded full scale
+        missing: Source files that were not found (and left out)
+        up_to_date: True if an existing stem was reused without rendering
+    """
+
+    output_path: Path
+    duration_seconds: float
+    clips_mixed: int
+    peak: float = 0.0
+    clipped_samples: int = 0
+    missing: list[str] = field(default_factory=list)
+    up_to_date: bool = False
+
+
+class _ActiveClip:
+    """A clip with an open source, positioned on the mix timeline."""
+
+    def __init__(self, clip: MixClip, end: int, sample_rate: int):
+        self.clip = clip
+        self.end = end
+        self.sample_rate = sample_rate
+        self.source = open_source(clip.path, sample_rate)
+        self.done = False
+
+    def mix_into(self, mix: np.ndarray, block_start: int) -> None:
+        """Add this clip's samples for the block starting at block_start."""
+        position = max(self.clip.start, block_start)
+        stop = min(self.end, block_start + len(mix))
+        fresh = False  # True right after a loop restart
+
+        while position < stop:
+            data = self.source.read(stop - position)
+            if not len(data):
+                if self.clip.loop and not fresh:
+                    self.source.close()
+                    self.source = open_source(self.clip.path, self.sample_rate)
+                    fresh = True
+                    continue
+                self.done = True
+                return
+            fresh = False
+
+            gain = self.clip.gain
+            if self.clip.envelope is not None:
+                gain = gain * self.clip.envelope.gain(position, len(data))[:, None]
+            offset = position - block_start
+            mix[offset:offset + len(data)] += data * gain
+            position += len(data)
+
+        if position >= self.end:
+            self.done = True
+
+    def close(self) -> None:
+        self.source.close()
+
+
+class MixdownEngine:
+    """Renders a MixdownPlan to a 16-bit stereo WAV in fixed-size blocks."""
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        """Initialize the engine.
+
+        Args:
+            block_size: Samples rendered per block (bounds memory use)
+        """
+        self.block_size = max(1, block_size)
+
+    def render(self, plan: MixdownPlan, output_path: Path) -> MixdownResult:
+        """Render a plan.
+
+        Args:
+            plan: Clips to mix
+            output_path: WAV file to write (replaced atomically)
+
+        Returns:
+            MixdownResult with peak and clipping statistics
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+
+        pending = deque(sorted(plan.clips, key=lambda clip: clip.start))
+        active: list[_ActiveClip] = []
+        peak = 0.0
+        clipped = 0
+
+        try:
+            with wave.open(str(tmp_path), "wb") as out:
+                out.setnchannels(2)
+                out.setsampwidth(2)
+                out.setframerate(plan.sample_rate)
+
+                for block_start in range(0, plan.total_samples, self.block_size):
+                    count = min(self.block_size, plan.total_samples - block_start)
+
+                    while pending and pending[0].start < block_start + count:
+                        clip = pending.popleft()
+                        end = plan.total_samples if clip.length is None else clip.start + clip.length
+                        end = min(end, plan.total_samples)
+                        if end > max(clip.start, block_start):
+                            active.append(_ActiveClip(clip, end, plan.sample_rate))
+
+                    mix = np.zeros((count, 2), dtype=np.float32)
+                    for clip in active:
+                        clip.mix_into(mix, block_start)
+                    for clip in active:
+                        if clip.done:
+                            clip.close()
+                    active = [clip for clip in active if not clip.done]
+
+                    magnitude = np.abs(mix)
+                    peak = max(peak, float(magnitude.max(initial=0.0)))
+                    clipped += int(np.count_nonzero(magnitude > 1.0))
+                    out.writeframes((np.clip(mix, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+
+            os.replace(tmp_path, output_path)
+        finally:
+            for clip in active:
+                clip.close()
+            tmp_path.unlink(missing_ok=True)
+
+        return MixdownResult(
+            output_path=output_path,
+            duration_seconds=plan.duration_seconds,
+            clips_mixed=len(plan.clips),
+            peak=peak,
+            clipped_samples=clipped,
+            missing=list(plan.missing),
+        )
+
+
+def mix_storyboard(
+    project_dir: Path,
+    storyboard_path: Optional[Path] = None,
+    update_storyboard: bool = True,
+    force: bool = False,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    normalize: Optional[bool] = None,
+) -> MixdownResult:
+    """Render a project's soundtrack to one stem and point the storyboard at it.
+
+    The stem is written to `<project>/audio/mixdown.wav` and recorded as
+    `audio.mixdown` in the storyboard, together with the plan signature and
+    the normalize setting. If the recorded signature still matches, the
+    existing stem is reused.
+
+    Args:
+        project_dir: Project directory
+        storyboard_path: Storyboard file (default: storyboard/storyboard.json)
+        update_storyboard: Record the stem in the storyboard
+        force: Re-render even if the stem is up to date
+        block_size: Samples rendered per block
+        normalize: Bring every asset to its EBU R128 loudness target (see
+            src.audio.loudness); the report is saved alongside the stem.
+            None keeps the setting recorded by the previous mixdown (on by
+            default). Volumes (cue volume, music volume and ducking) are
+            applied on top of the correction, so they still set the balance
+
+    Returns:
+        MixdownResult
+
+    Raises:
+        FileNotFoundError: If the storyboard doesn't exist
+        MixdownError: If a source cannot be decoded
+    """
+    project_dir = Path(project_dir)
+    storyboard_path = Path(storyboard_path or project_dir / "storyboard" / "storyboard.json")
+    if not storyboard_path.exists():
+        raise FileNotFoundError(f"Storyboard not found: {storyboard_path}")
+
+    with open(storyboard_path) as f:
+        storyboard = json.load(f)
+
+    manifest = None
+    manifest_path = project_dir / "voiceover" / "manifest.json"
+    if manifest_path.exists():
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    recorded = (storyboard.get("audio") or {}).get("mixdown") or {}
+    if normalize is None:
+        normalize = recorded.get("normalize", True)
+
+    loudness = None
+    if normalize:
+        from .loudness import LoudnessAnalyzer
+
+        loudness = LoudnessAnalyzer().analyze_project(project_dir)
+        loudness.save()
+
+    plan = MixdownPlan.from_storyboard(storyboard, project_dir, manifest=manifest, loudness=loudness)
+    signature = plan.signature()
+    output_path = project_dir / MIXDOWN_PATH
+
+    if not force and recorded.get("signature") == signature and output_path.exists():
+        return MixdownResult(
+            output_path=output_path,
+            duration_seconds=plan.duration_seconds,
+            clips_mixed=len(plan.clips),
+            missing=list(plan.missing),
+            up_to_date=True,
+        )
+
+    result = MixdownEngine(block_size).render(plan, output_path)
+
+    if update_storyboard:
+        storyboard.setdefault("audio", {})["mixdown"] = {
+            "path": MIXDOWN_PATH,
+            "signature": signature,
+            "duration_seconds": round(plan.duration_seconds, 3),
+            "normalize": normalize,
+        }
+        with open(storyboard_path, "w") as f:
+            json.dump(storyboard, f, indent=2)
+
+    return result
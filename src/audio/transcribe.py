@@ -1,11 +1,32 @@
-"""Audio transcription with word-level timestamps using Whisper."""
-
-import subprocess
-from dataclasses import dataclass
+"""Audio transcription with word-level timestamps using Whisper.
+
+Models are loaded once per process and shared by every transcriber that
+asks for the same model and device (`shared_model`), so re-creating a
+transcriber - or a provider that owns one - doesn't reload weights.
+
+`transcribe_many` transcribes a list of files in one go: faster-whisper
+runs them through its VAD-chunked batched pipeline on a worker pool. With a
+`TranscriptionCache`, files whose content, model and language were
+transcribed before are not transcribed again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any, Callable, Optional
 
+from ..media_info import probe_media
+from .loudness import file_hash
 from .tts import WordTimestamp
 
+# Bump when transcription output changes, so cached transcripts are not reused
+TRANSCRIPTION_CACHE_VERSION = 1
+
 
 @dataclass
 class TranscriptionResult:
@@ -16,11 +37,250 @@ class TranscriptionResult:
     duration_seconds: float
     language: str = "en"
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "text": self.text,
+            "word_timestamps": [asdict(ts) for ts in self.word_timestamps],
+            "duration_seconds": self.duration_seconds,
+            "language": self.language,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TranscriptionResult":
+        """Create from dictionary."""
+        return cls(
+            text=data.get("text", ""),
+            word_timestamps=[WordTimestamp(**ts) for ts in data.get("word_timestamps", [])],
+            duration_seconds=data.get("duration_seconds", 0.0),
+            language=data.get("language", "en"),
+        )
+
+
+# =============================================================================
+# Shared models and transcript cache
+# =============================================================================
+
+_MODELS: dict[tuple, Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def shared_model(key: tuple, load: Callable[[], Any]) -> Any:
+    """Return the process-wide model for key, loading it on first use.
+
+    Args:
+        key: Identifies the model (backend, name, device, ...)
+        load: Loads the model; called at most once per key
+    """
+    with _MODELS_LOCK:
+        if key not in _MODELS:
+            _MODELS[key] = load()
+        return _MODELS[key]
+
+
+def clear_models() -> None:
+    """Release all shared models."""
+    with _MODELS_LOCK:
+        _MODELS.clear()
+
+
+def default_transcription_cache_dir() -> Path:
+    """Return the user-level cache directory for transcripts."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "video-explainer" / "transcripts"
+
+
+class TranscriptionCache:
+    """Transcripts keyed by audio content, model and language, one JSON file per entry."""
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: user cache dir)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_transcription_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content_hash: str, model: str, language: str) -> str:
+        """Compute the cache key for an audio file's content hash."""
+        payload = json.dumps({
+            "version": TRANSCRIPTION_CACHE_VERSION,
+            "content": content_hash,
+            "model": model,
+            "language": language,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Path of the cache entry for a key (may not exist yet)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[TranscriptionResult]:
+        """Return the cached transcript for a key, or None on a miss."""
+        try:
+            result = TranscriptionResult.from_dict(json.loads(self.path_for(key).read_text()))
+        except (OSError, ValueError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: TranscriptionResult) -> None:
+        """Store a transcript under a key."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(result.to_dict()))
+        os.replace(tmp_path, path)
+
+
+# =============================================================================
+# Transcribers
+# =============================================================================
+
+
+class BaseTranscriber(ABC):
+    """Shared caching and batching for the Whisper backends.
+
+    Subclasses implement `_transcribe_file` and may override
+    `_transcribe_files` to transcribe several files more efficiently.
+    """
+
+    backend = ""
+
+    def __init__(
+        self,
+        model: str = "base",
+        device: str = "auto",
+        language: str = "en",
+        cache: Optional[TranscriptionCache] = None,
+    ):
+        self.model_name = model
+        self.device = device
+        self.language = language
+        self.cache = cache
+        self._model = None
+
+    def _cache_key(self, audio_path: Path) -> str:
+        return TranscriptionCache.make_key(
+            file_hash(audio_path), f"{self.backend}:{self.model_name}", self.language
+        )
+
+    @abstractmethod
+    def _transcribe_file(self, audio_path: Path) -> TranscriptionResult:
+        """Transcribe one existing audio file (no caching).
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            TranscriptionResult with text, word timestamps, and duration
+        """
+        pass
+
+    def _transcribe_files(
+        self,
+        audio_paths: list[Path],
+        max_workers: Optional[int],
+        on_result: Callable[[int, TranscriptionResult | Exception], None],
+    ) -> None:
+        """Transcribe files one after another, reporting each outcome."""
+        for idx, audio_path in enumerate(audio_paths):
+            try:
+                outcome = self._transcribe_file(audio_path)
+            except Exception as e:
+                outcome = e
+            on_result(idx, outcome)
+
+    def transcribe(self, audio_path: Path | str) -> TranscriptionResult:
+        """Transcribe audio file and extract word-level timestamps.
+
+        Args:
+            audio_path: Path to the audio file (mp3, wav, etc.)
+
+        Returns:
+            TranscriptionResult with text, word timestamps, and duration
+        """
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        if self.cache is None:
+            return self._transcribe_file(audio_path)
+
+        key = self._cache_key(audio_path)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._transcribe_file(audio_path)
+            self.cache.put(key, result)
+        return result
+
+    def transcribe_many(
+        self,
+        audio_paths: list[Path | str],
+        max_workers: Optional[int] = None,
+        on_result: Optional[Callable[[int, TranscriptionResult | Exception], None]] = None,
+    ) -> list[TranscriptionResult | Exception]:
+        """Transcribe many files, reusing cached transcripts.
 
-class WhisperTranscriber:
+        A failing file does not affect the others.
+
+        Args:
+            audio_paths: Audio files to transcribe
+            max_workers: Files transcribed concurrently (backend default if None)
+            on_result: Optional callback(index, outcome) invoked as each
+                file finishes, for progress reporting
+
+        Returns:
+            One TranscriptionResult or the raised Exception per file, in order
+        """
+        audio_paths = [Path(p) for p in audio_paths]
+        outcomes: list[TranscriptionResult | Exception] = [None] * len(audio_paths)  # type: ignore[list-item]
+        keys: dict[int, str] = {}
+        pending: list[int] = []
+
+        def finish(idx: int, outcome: TranscriptionResult | Exception) -> None:
+            outcomes[idx] = outcome
+            if on_result:
+                on_result(idx, outcome)
+
+        for idx, audio_path in enumerate(audio_paths):
+            if not audio_path.exists():
+                finish(idx, FileNotFoundError(f"Audio file not found: {audio_path}"))
+                continue
+            if self.cache is not None:
+                keys[idx] = self._cache_key(audio_path)
+                cached = self.cache.get(keys[idx])
+                if cached is not None:
+                    finish(idx, cached)
+                    continue
+            pending.append(idx)
+
+        def transcribed(position: int, outcome: TranscriptionResult | Exception) -> None:
+            idx = pending[position]
+            if self.cache is not None and isinstance(outcome, TranscriptionResult):
+                self.cache.put(keys[idx], outcome)
+            finish(idx, outcome)
+
+        if pending:
+            self._transcribe_files([audio_paths[idx] for idx in pending], max_workers, transcribed)
+        return outcomes
+
+
+class WhisperTranscriber(BaseTranscriber):
     """Transcribe audio using OpenAI Whisper for word-level timestamps."""
 
-    def __init__(self, model: str = "base", device: str = "auto"):
+    backend = "whisper"
+
+    def __init__(
+        self,
+        model: str = "base",
+        device: str = "auto",
+        cache: Optional[TranscriptionCache] = None,
+    ):
         """Initialize Whisper transcriber.
 
         Args:
@@ -32,13 +292,12 @@ class WhisperTranscriber:
                    - medium: ~5GB VRAM, high accuracy
                    - large: ~10GB VRAM, best accuracy
             device: Device to run on. "auto", "cpu", "cuda", or "mps"
+            cache: Optional transcript cache
         """
-        self.model_name = model
-        self.device = device
-        self._model = None
+        super().__init__(model, device, cache=cache)
 
     def _load_model(self):
-        """Lazy load the Whisper model."""
+        """Lazy load the Whisper model (shared across instances)."""
         if self._model is not None:
             return self._model
 
@@ -61,29 +320,20 @@ class WhisperTranscriber:
                 # MPS has dtype issues with Whisper, use CPU instead
                 device = "cpu"
 
-        self._model = whisper.load_model(self.model_name, device=device)
+        self._model = shared_model(
+            (self.backend, self.model_name, device),
+            lambda: whisper.load_model(self.model_name, device=device),
+        )
         return self._model
 
-    def transcribe(self, audio_path: Path | str) -> TranscriptionResult:
-        """Transcribe audio file and extract word-level timestamps.
-
-        Args:
-            audio_path: Path to the audio file (mp3, wav, etc.)
-
-        Returns:
-            TranscriptionResult with text, word timestamps, and duration
-        """
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
+    def _transcribe_file(self, audio_path: Path) -> TranscriptionResult:
         model = self._load_model()
 
         # Transcribe with word-level timestamps
         result = model.transcribe(
             str(audio_path),
             word_timestamps=True,
-            language="en",
+            language=self.language,
         )
 
         # Extract word timestamps from segments
@@ -109,26 +359,43 @@ class WhisperTranscriber:
             text=result.get("text", "").strip(),
             word_timestamps=word_timestamps,
             duration_seconds=duration,
-            language=result.get("language", "en"),
+            language=result.get("language", self.language),
         )
 
 
-class FasterWhisperTranscriber:
+class FasterWhisperTranscriber(BaseTranscriber):
     """Transcribe audio using faster-whisper for improved performance."""
 
-    def __init__(self, model: str = "base", device: str = "auto"):
+    backend = "faster-whisper"
+
+    # Files transcribed in parallel by transcribe_many (CTranslate2 workers)
+    DEFAULT_NUM_WORKERS = 2
+    # VAD chunks decoded together by the batched pipeline
+    DEFAULT_BATCH_SIZE = 8
+
+    def __init__(
+        self,
+        model: str = "base",
+        device: str = "auto",
+        cache: Optional[TranscriptionCache] = None,
+        num_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
         """Initialize faster-whisper transcriber.
 
         Args:
             model: Model size. Options: tiny, base, small, medium, large-v2
             device: Device to run on. "auto", "cpu", or "cuda"
+            cache: Optional transcript cache
+            num_workers: Files transcribe_many runs in parallel
+            batch_size: VAD chunks per batch in transcribe_many
         """
-        self.model_name = model
-        self.device = device
-        self._model = None
+        super().__init__(model, device, cache=cache)
+        self.num_workers = max(1, num_workers or self.DEFAULT_NUM_WORKERS)
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
 
     def _load_model(self):
-        """Lazy load the faster-whisper model."""
+        """Lazy load the faster-whisper model (shared across instances)."""
         if self._model is not None:
             return self._model
 
@@ -159,34 +426,47 @@ class FasterWhisperTranscriber:
         if device == "cpu":
             compute_type = "int8"
 
-        self._model = WhisperModel(
-            self.model_name,
-            device=device,
-            compute_type=compute_type,
+        self._model = shared_model(
+            (self.backend, self.model_name, device, compute_type, self.num_workers),
+            lambda: WhisperModel(
+                self.model_name,
+                device=device,
+                compute_type=compute_type,
+                num_workers=self.num_workers,
+            ),
         )
         return self._model
 
-    def transcribe(self, audio_path: Path | str) -> TranscriptionResult:
-        """Transcribe audio file and extract word-level timestamps.
+    def _batched_pipeline(self):
+        """New VAD-chunked batched pipeline around the model (None if unsupported).
 
-        Args:
-            audio_path: Path to the audio file
-
-        Returns:
-            TranscriptionResult with text, word timestamps, and duration
+        A pipeline keeps per-transcription state (the last speech timestamp
+        used to place words), so each transcription needs its own; only the
+        model underneath is shared.
         """
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
         model = self._load_model()
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            # faster-whisper < 1.0
+            return None
+        return BatchedInferencePipeline(model=model)
 
+    def _transcribe_file(self, audio_path: Path, pipeline=None) -> TranscriptionResult:
         # Transcribe with word-level timestamps
-        segments, info = model.transcribe(
-            str(audio_path),
-            word_timestamps=True,
-            language="en",
-        )
+        if pipeline is not None:
+            segments, info = pipeline.transcribe(
+                str(audio_path),
+                word_timestamps=True,
+                language=self.language,
+                batch_size=self.batch_size,
+            )
+        else:
+            segments, info = self._load_model().transcribe(
+                str(audio_path),
+                word_timestamps=True,
+                language=self.language,
+            )
 
         # Extract word timestamps
         word_timestamps = []
@@ -211,48 +491,56 @@ class FasterWhisperTranscriber:
             text=" ".join(full_text_parts).strip(),
             word_timestamps=word_timestamps,
             duration_seconds=duration,
-            language=info.language if info else "en",
+            language=info.language if info else self.language,
         )
 
+    def _transcribe_files(
+        self,
+        audio_paths: list[Path],
+        max_workers: Optional[int],
+        on_result: Callable[[int, TranscriptionResult | Exception], None],
+    ) -> None:
+        """Transcribe files on a worker pool, each through its own batched pipeline."""
+        self._load_model()
+        workers = max(1, min(max_workers or self.num_workers, len(audio_paths)))
+
+        def run(idx: int) -> TranscriptionResult | Exception:
+            try:
+                return self._transcribe_file(audio_paths[idx], self._batched_pipeline())
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, idx): idx for idx in range(len(audio_paths))}
+            for future in as_completed(futures):
+                on_result(futures[future], future.result())
+
 
 def get_audio_duration(audio_path: Path | str) -> float:
-    """Get audio duration using ffprobe.
+    """Get audio duration from the file's headers (ffprobe as a fallback).
 
     Args:
         audio_path: Path to the audio file
 
     Returns:
         Duration in seconds
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        RuntimeError: If the duration cannot be determined
     """
     audio_path = Path(audio_path)
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-    try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(audio_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            return float(result.stdout.strip())
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError) as e:
-        raise RuntimeError(f"Failed to get audio duration: {e}")
-
-    raise RuntimeError(f"ffprobe failed for {audio_path}")
+    return probe_media(audio_path).duration_seconds
 
 
 def get_transcriber(
     backend: str = "auto",
     model: str = "base",
     device: str = "auto",
+    cache: Optional[TranscriptionCache] = None,
 ) -> WhisperTranscriber | FasterWhisperTranscriber:
     """Get a transcriber instance.
 
@@ -260,6 +548,7 @@ def get_transcriber(
         backend: Which backend to use. "auto", "whisper", or "faster-whisper"
         model: Model size to use
         device: Device to run on
+        cache: Optional transcript cache
 
     Returns:
         A transcriber instance
@@ -282,8 +571,8 @@ def get_transcriber(
                 )
 
     if backend == "faster-whisper":
-        return FasterWhisperTranscriber(model=model, device=device)
+        return FasterWhisperTranscriber(model=model, device=device, cache=cache)
     elif backend == "whisper":
-        return WhisperTranscriber(model=model, device=device)
+        return WhisperTranscriber(model=model, device=device, cache=cache)
     else:
         raise ValueError(f"Unknown transcription backend: {backend}")
@@ -5,14 +5,23 @@ import base64
 import os
 import re
 import subprocess
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
 import httpx
 
+from .. import budget
 from ..config import Config, TTSConfig, load_config
+from ..media_info import get_media_duration
+
+# ElevenLabs charges per character (~$0.30 per 1000 characters, Starter plan)
+ELEVENLABS_COST_PER_CHAR = 0.0003
 
 
 @dataclass
@@ -33,11 +42,48 @@ class TTSResult:
     word_timestamps: list[WordTimestamp] = field(default_factory=list)
 
 
+@dataclass
+class TTSRequest:
+    """A single item in a batch TTS request."""
+
+    text: str
+    output_path: Path
+    scene_id: str = ""
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart."""
+
+    def __init__(self, requests_per_second: float | None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
 
+    # Batch defaults; TTSConfig.max_concurrency / requests_per_second override them
+    MAX_CONCURRENCY = 4
+    REQUESTS_PER_SECOND: float | None = None
+    RETRY_BACKOFF_SECONDS = 1.0
+
     def __init__(self, config: TTSConfig):
         self.config = config
+        self._rate_limiter = RateLimiter(
+            config.requests_per_second or self.REQUESTS_PER_SECOND
+        )
 
     @abstractmethod
     def generate(self, text: str, output_path: str | Path) -> Path:
@@ -88,11 +134,104 @@ class TTSProvider(ABC):
         """
         pass
 
+    def generate_batch_with_timestamps(
+        self,
+        requests: list[TTSRequest],
+        max_workers: int | None = None,
+        on_result: Callable[[int, TTSResult | Exception], None] | None = None,
+        stop_on_error: bool = False,
+    ) -> list[TTSResult | Exception]:
+        """Generate speech with timestamps for many texts concurrently.
+
+        Requests run on a bounded thread pool, are spaced by the provider's
+        rate limit and retried with exponential backoff on transient errors.
+        A failing request does not affect the others unless stop_on_error
+        is set.
+
+        Args:
+            requests: Items to synthesize
+            max_workers: Concurrency cap (defaults to config.max_concurrency,
+                then the provider's MAX_CONCURRENCY; 1 = sequential)
+            on_result: Optional callback(index, outcome) invoked as each
+                request finishes, for progress reporting
+            stop_on_error: Cancel requests that have not started yet once
+                one fails, so no more synthesis is paid for (requests
+                already in flight still finish)
+
+        Returns:
+            One TTSResult or the raised Exception per request, in request
+            order; cancelled requests hold a CancelledError
+        """
+        outcomes: list[TTSResult | Exception] = [None] * len(requests)  # type: ignore[list-item]
+        workers = max_workers or self.config.max_concurrency or self.MAX_CONCURRENCY
+        workers = max(1, min(workers, len(requests)))
+
+        def run(idx: int) -> TTSResult | Exception:
+            try:
+                return self._generate_request_with_retries(requests[idx])
+            except Exception as e:
+                return e
+
+        if workers == 1:
+            for idx in range(len(requests)):
+                outcomes[idx] = run(idx)
+                if on_result:
+                    on_result(idx, outcomes[idx])
+                if stop_on_error and isinstance(outcomes[idx], Exception):
+                    for rest in range(idx + 1, len(requests)):
+                        outcomes[rest] = CancelledError("cancelled after an earlier failure")
+                    break
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, idx): idx for idx in range(len(requests))}
+            for future in as_completed(futures):
+                idx = futures[future]
+                if future.cancelled():
+                    outcomes[idx] = CancelledError("cancelled after an earlier failure")
+                    continue
+                outcomes[idx] = future.result()
+                if on_result:
+                    on_result(idx, outcomes[idx])
+                if stop_on_error and isinstance(outcomes[idx], Exception):
+                    for pending in futures:
+                        pending.cancel()
+
+        return outcomes
+
+    def _generate_request_with_retries(self, request: TTSRequest) -> TTSResult:
+        """Run one batch request, honoring the rate limit and retrying."""
+        max_retries = self.config.max_retries
+        attempt = 0
+        while True:
+            self._rate_limiter.wait()
+            try:
+                return self._generate_request(request)
+            except Exception as e:
+                if attempt >= max_retries or not self._is_retryable(e):
+                    raise
+                time.sleep(self.RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                attempt += 1
+
+    def _generate_request(self, request: TTSRequest) -> TTSResult:
+        """Generate a single batch request."""
+        return self.generate_with_timestamps(request.text, request.output_path)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Whether a failed request is worth retrying (network errors, 429, 5xx)."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        return isinstance(error, (httpx.TransportError, TimeoutError, ConnectionError))
+
 
 class ElevenLabsTTS(TTSProvider):
     """ElevenLabs TTS provider."""
 
     BASE_URL = "https://api.elevenlabs.io/v1"
+    # Concurrent request limits are per plan; stay under the Starter tier's cap
+    MAX_CONCURRENCY = 3
+    REQUESTS_PER_SECOND = 2.0
 
     def __init__(self, config: TTSConfig, api_key: str | None = None):
         """Initialize ElevenLabs TTS.
@@ -135,7 +274,7 @@ class ElevenLabsTTS(TTSProvider):
             },
         }
 
-        with httpx.Client(timeout=60.0) as client:
+        with self._budgeted(text), httpx.Client(timeout=60.0) as client:
             response = client.post(
                 url,
                 headers=self._get_headers(),
@@ -161,7 +300,7 @@ class ElevenLabsTTS(TTSProvider):
             },
         }
 
-        with httpx.Client(timeout=60.0) as client:
+        with self._budgeted(text), httpx.Client(timeout=60.0) as client:
             with client.stream(
                 "POST",
                 url,
@@ -209,7 +348,7 @@ class ElevenLabsTTS(TTSProvider):
             },
         }
 
-        with httpx.Client(timeout=120.0) as client:
+        with self._budgeted(text), httpx.Client(timeout=120.0) as client:
             response = client.post(
                 url,
                 headers=self._get_headers(),
@@ -298,9 +437,30 @@ class ElevenLabsTTS(TTSProvider):
         Returns:
             Estimated cost in USD
         """
-        # Approximate cost per character (varies by plan)
-        cost_per_char = 0.0003  # $0.30 per 1000 chars
-        return len(text) * cost_per_char
+        return len(text) * ELEVENLABS_COST_PER_CHAR
+
+    @contextmanager
+    def _budgeted(self, text: str) -> Iterator[None]:
+        """Hold a synthesis request's cost against the active budget while it runs.
+
+        The cost is recorded if the request succeeds and released if it fails.
+
+        Raises:
+            budget.BudgetExceededError: If the request would exceed the budget
+        """
+        tracker = budget.active_tracker()
+        if tracker is None:
+            yield
+            return
+        hold = tracker.authorize(
+            "tts", self.estimate_cost(text), description=f"ElevenLabs TTS ({len(text)} chars)"
+        )
+        try:
+            yield
+        except BaseException:
+            hold.release()
+            raise
+        hold.settle()
 
 
 class EdgeTTS(TTSProvider):
@@ -313,6 +473,7 @@ class EdgeTTS(TTSProvider):
         "british_male": "en-GB-RyanNeural",
         "british_female": "en-GB-SoniaNeural",
     }
+    MAX_CONCURRENCY = 6
 
     def __init__(self, config: TTSConfig, voice: str | None = None):
         """Initialize Edge TTS.
@@ -413,7 +574,7 @@ class EdgeTTS(TTSProvider):
         if word_timestamps:
             duration = word_timestamps[-1].end_seconds
         else:
-            # Fallback: estimate from audio file using ffprobe
+            # Fallback: read it from the audio file
             duration = self._get_audio_duration(output_path)
 
         return TTSResult(
@@ -423,25 +584,8 @@ class EdgeTTS(TTSProvider):
         )
 
     def _get_audio_duration(self, audio_path: Path) -> float:
-        """Get audio duration using ffprobe."""
-        try:
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(audio_path),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                return float(result.stdout.strip())
-        except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-            pass
-        return 0.0
+        """Get audio duration (0.0 if it can't be read)."""
+        return get_media_duration(audio_path)
 
     def generate_stream(self, text: str) -> Iterator[bytes]:
         """Generate speech from text as a stream."""
@@ -500,12 +644,18 @@ class EdgeTTS(TTSProvider):
         all_voices = self.get_available_voices()
         return [v for v in all_voices if v["locale"].startswith("en-")]
 
+    def _is_retryable(self, error: Exception) -> bool:
+        """Edge TTS surfaces websocket/aiohttp errors; retry anything but misuse."""
+        return not isinstance(error, (ImportError, ValueError, TypeError))
+
 
 class ManualVoiceoverProvider(TTSProvider):
     """Provider for manually recorded voiceovers.
 
     This provider imports user-recorded audio files and uses Whisper
     to generate word-level timestamps for video synchronization.
+    Transcripts are cached by recording content, so re-importing unchanged
+    recordings doesn't transcribe them again.
     """
 
     def __init__(
@@ -514,6 +664,8 @@ class ManualVoiceoverProvider(TTSProvider):
         audio_dir: Path | str,
         whisper_model: str = "base",
         whisper_backend: str = "auto",
+        use_cache: bool = True,
+        cache_dir: Path | str | None = None,
     ):
         """Initialize manual voiceover provider.
 
@@ -523,11 +675,15 @@ class ManualVoiceoverProvider(TTSProvider):
                        Files should be named by scene_id (e.g., scene1_hook.mp3)
             whisper_model: Whisper model size for transcription
             whisper_backend: Whisper backend ("auto", "whisper", "faster-whisper")
+            use_cache: Reuse transcripts of recordings transcribed before
+            cache_dir: Transcript cache directory (default: user cache dir)
         """
         super().__init__(config)
         self.audio_dir = Path(audio_dir)
         self.whisper_model = whisper_model
         self.whisper_backend = whisper_backend
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
         self._transcriber = None
 
         if not self.audio_dir.exists():
@@ -536,10 +692,11 @@ class ManualVoiceoverProvider(TTSProvider):
     def _get_transcriber(self):
         """Lazy load the transcriber."""
         if self._transcriber is None:
-            from .transcribe import get_transcriber
+            from .transcribe import TranscriptionCache, get_transcriber
             self._transcriber = get_transcriber(
                 backend=self.whisper_backend,
                 model=self.whisper_model,
+                cache=TranscriptionCache(self.cache_dir) if self.use_cache else None,
             )
         return self._transcriber
 
@@ -649,6 +806,91 @@ class ManualVoiceoverProvider(TTSProvider):
             word_timestamps=result.word_timestamps,
         )
 
+    def _generate_request(self, request: TTSRequest) -> TTSResult:
+        """Generate a single batch request using its scene_id."""
+        return self.generate_with_timestamps(
+            request.text, request.output_path, scene_id=request.scene_id
+        )
+
+    def generate_batch_with_timestamps(
+        self,
+        requests: list[TTSRequest],
+        max_workers: int | None = None,
+        on_result: Callable[[int, TTSResult | Exception], None] | None = None,
+        stop_on_error: bool = False,
+    ) -> list[TTSResult | Exception]:
+        """Import all recordings, then transcribe them in one batch.
+
+        Recordings are copied first; the transcriber then handles them
+        together (one shared model, cached transcripts reused, the rest
+        batched on its worker pool).
+
+        Args:
+            requests: Scenes to import
+            max_workers: Recordings transcribed concurrently (defaults to
+                config.max_concurrency, then the transcriber's default)
+            on_result: Optional callback(index, outcome) invoked as each
+                request finishes, for progress reporting
+            stop_on_error: Skip transcription entirely if any recording
+                fails to import
+
+        Returns:
+            One TTSResult or the raised Exception per request, in request
+            order; skipped requests hold a CancelledError
+        """
+        outcomes: list[TTSResult | Exception] = [None] * len(requests)  # type: ignore[list-item]
+
+        def finish(idx: int, outcome: TTSResult | Exception) -> None:
+            outcomes[idx] = outcome
+            if on_result:
+                on_result(idx, outcome)
+
+        imported: list[int] = []
+        for idx, request in enumerate(requests):
+            try:
+                self.generate(request.text, request.output_path, request.scene_id)
+            except Exception as e:
+                finish(idx, e)
+                continue
+            imported.append(idx)
+
+        if stop_on_error and len(imported) < len(requests):
+            for idx in imported:
+                outcomes[idx] = CancelledError("cancelled after an earlier failure")
+            return outcomes
+
+        if not imported:
+            return outcomes
+
+        def transcribed(position: int, outcome) -> None:
+            idx = imported[position]
+            if isinstance(outcome, Exception):
+                finish(idx, outcome)
+                return
+            finish(idx, TTSResult(
+                audio_path=Path(requests[idx].output_path),
+                duration_seconds=outcome.duration_seconds,
+                word_timestamps=outcome.word_timestamps,
+            ))
+
+        try:
+            transcriber = self._get_transcriber()
+        except Exception as e:
+            for idx in imported:
+                finish(idx, e)
+            return outcomes
+
+        transcriber.transcribe_many(
+            [Path(requests[idx].output_path) for idx in imported],
+            max_workers=max_workers or self.config.max_concurrency,
+            on_result=transcribed,
+        )
+        return outcomes
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Local files and transcription never recover on retry."""
+        return False
+
     def generate_stream(self, text: str) -> Iterator[bytes]:
         """Not supported for manual recordings."""
         raise NotImplementedError(
@@ -0,0 +1,473 @@
+"""Runtime budget and deadline tracking for paid providers.
+
+`BudgetConfig` caps what one video may spend per category (LLM, TTS, image
+generation, video generation) and in total, and optionally how long one run
+may take. A `BudgetTracker` is started for the project a CLI command works
+on; every paid provider asks it before spending (`authorize` / `choose`),
+which checks the caps and holds the estimated cost in one locked step, then
+settles the returned `SpendHold` with what the call actually cost.
+
+When a call would exceed a cap the tracker follows `BudgetConfig.on_exceed`:
+
+- "abort": raise BudgetExceededError
+- "degrade": accept a cheaper alternative offered by the caller (e.g. a
+  shorter clip or cheaper model) and raise only if none fits; calls with
+  no cheaper alternative (TTS, LLM) warn and go ahead
+- "warn": print a warning and spend anyway
+
+Spend is persisted per project in telemetry/spend.jsonl, tagged with the
+run (one video generation) it belongs to, so caps hold across the commands
+of a run. `generate` and `budget --reset` start a new run.
+"""
+
+import json
+import math
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .config import BudgetConfig
+
+CATEGORIES = ("llm", "tts", "image_gen", "video_gen")
+
+SPEND_FILENAME = "spend.jsonl"
+RUN_FILENAME = "budget_run.json"
+
+# Rough per-scene LLM cost and time (scene generation with validation and
+# fix-up rounds dominates), used when forecasting a run from its script
+LLM_COST_PER_SCENE = 0.40
+LLM_SECONDS_PER_SCENE = 90.0
+TTS_SECONDS_PER_CHAR = 0.01
+VIDEO_GEN_SECONDS_PER_CLIP = 120.0
+DEFAULT_CLIP_SECONDS = 5
+
+T = TypeVar("T")
+
+
+class BudgetExceededError(Exception):
+    """A paid call would exceed a budget cap (or the run deadline)."""
+
+    def __init__(self, message: str, category: str, projected: float, limit: float):
+        super().__init__(message)
+        self.category = category
+        self.projected = projected
+        self.limit = limit
+
+
+class DeadlineExceededError(BudgetExceededError):
+    """The run has used up its wall-clock deadline."""
+
+
+@dataclass
+class SpendRecord:
+    """One paid call, as written to the spend ledger."""
+
+    timestamp: str
+    category: str
+    cost_usd: float
+    description: str = ""
+    run_id: str = ""
+
+
+@dataclass
+class SpendHold:
+    """Estimated cost held against the budget while a paid call runs.
+
+    Returned by `BudgetTracker.authorize` and `choose`. Settle it with what
+    the call cost once it succeeds, or release it if the call failed.
+    """
+
+    tracker: "BudgetTracker" = field(repr=False)
+    category: str
+    cost_usd: float
+    description: str = ""
+    open: bool = True
+
+    def settle(self, cost: float | None = None, description: str | None = None) -> None:
+        """Record the call's actual cost (default: the held estimate)."""
+        self.tracker._close(self, self.cost_usd if cost is None else cost, description)
+
+    def release(self) -> None:
+        """Drop the hold without recording any spend."""
+        self.tracker._close(self, None)
+
+
+@dataclass
+class BudgetForecast:
+    """Projected cost and time of a run, by category."""
+
+    costs: dict[str, float] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+    over: list[str] = field(default_factory=list)  # Categories (or "total") over their cap
+
+    @property
+    def total_cost(self) -> float:
+        return sum(self.costs.values())
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.seconds.values())
+
+    @property
+    def within_budget(self) -> bool:
+        return not self.over
+
+
+class BudgetTracker:
+    """Tracks spend against BudgetConfig caps and the run deadline."""
+
+    def __init__(
+        self,
+        config: BudgetConfig,
+        spend_path: Path | None = None,
+        run_id: str | None = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            config: Budget caps, deadline and exceed policy
+            spend_path: JSONL spend ledger to load and append to (None keeps
+                spend in memory only)
+            run_id: Run whose earlier spend counts against the caps (default:
+                a fresh run)
+        """
+        self.config = config
+        self.spend_path = Path(spend_path) if spend_path else None
+        self.run_id = run_id or new_run_id()
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._spent = {category: 0.0 for category in CATEGORIES}
+        self._held = {category: 0.0 for category in CATEGORIES}
+        self._warned: set[str] = set()
+
+        if self.spend_path and self.spend_path.exists():
+            for record in self._read_spend(self.spend_path):
+                if record.run_id == self.run_id and record.category in self._spent:
+                    self._spent[record.category] += record.cost_usd
+
+    def limit(self, category: str) -> float:
+        """Spend cap for a category in USD (inf if uncapped)."""
+        value = getattr(self.config, f"{category}_per_video", None)
+        return math.inf if value is None else value
+
+    def spent(self, category: str | None = None) -> float:
+        """Spend so far for one category, or in total."""
+        with self._lock:
+            if category is None:
+                return sum(self._spent.values())
+            return self._spent.get(category, 0.0)
+
+    def remaining(self, category: str) -> float:
+        """What a category may still spend, honouring the total cap too.
+
+        Costs held for calls still in flight count as spent.
+        """
+        with self._lock:
+            return self._remaining(category)
+
+    def fits(self, category: str, cost: float) -> bool:
+        """Whether spending `cost` in a category stays within every cap."""
+        return cost <= self.remaining(category) + 1e-9
+
+    def authorize(self, category: str, cost: float, description: str = "") -> SpendHold:
+        """Check a paid call before making it and hold its estimated cost.
+
+        Checking and holding happen under one lock, so concurrent callers
+        can't all pass the check and overspend together.
+
+        Args:
+            category: Spend category ("llm", "tts", "image_gen", "video_gen")
+            cost: Estimated cost of the call in USD
+            description: What the call is for (used in messages)
+
+        Returns:
+            The hold to settle (or release) once the call finishes
+
+        Raises:
+            BudgetExceededError: If the call would exceed a cap and the
+                policy is "abort"
+            DeadlineExceededError: If the run deadline has passed
+        """
+        self.check_deadline()
+        with self._lock:
+            if cost > self._remaining(category) + 1e-9:
+                if self.config.on_exceed == "abort":
+                    raise self._exceeded(category, cost, description)
+                # "warn", or "degrade" with no cheaper alternative to fall back to
+                self._warn(category, cost, description)
+            return self._hold(category, cost, description)
+
+    def choose(
+        self, category: str, options: list[tuple[T, float]], description: str = ""
+    ) -> tuple[T, SpendHold]:
+        """Pick the preferred option that fits the budget and hold its cost.
+
+        Under the "degrade" policy the first affordable option wins (a lone
+        option that doesn't fit goes ahead with a warning, as in
+        `authorize`); under "abort" only the first (preferred) option is
+        acceptable; under "warn" the first option is always returned.
+
+        Args:
+            category: Spend category
+            options: (option, estimated cost) pairs, most preferred first
+            description: What the call is for (used in messages)
+
+        Returns:
+            The chosen option and the hold on its estimated cost
+
+        Raises:
+            BudgetExceededError: If no acceptable option fits
+            DeadlineExceededError: If the run deadline has passed
+        """
+        if not options:
+            raise ValueError("choose() needs at least one option")
+        self.check_deadline()
+
+        preferred, preferred_cost = options[0]
+        with self._lock:
+            remaining = self._remaining(category)
+            if preferred_cost <= remaining + 1e-9:
+                return preferred, self._hold(category, preferred_cost, description)
+            if self.config.on_exceed == "degrade":
+                for option, cost in options[1:]:
+                    if cost <= remaining + 1e-9:
+                        print(
+                            f"Budget: degrading {description or category} "
+                            f"(${preferred_cost:.2f} -> ${cost:.2f}) to stay within budget"
+                        )
+                        return option, self._hold(category, cost, description)
+            policy = self.config.on_exceed
+            if policy == "abort" or (policy == "degrade" and len(options) > 1):
+                raise self._exceeded(category, preferred_cost, description)
+            self._warn(category, preferred_cost, description)
+            return preferred, self._hold(category, preferred_cost, description)
+
+    def record(self, category: str, cost: float, description: str = "") -> None:
+        """Record money actually spent, outside of any hold.
+
+        Args:
+            category: Spend category
+            cost: Cost in USD
+            description: What the money was spent on
+        """
+        with self._lock:
+            self._add_spend(category, cost, description)
+
+    def deadline_remaining(self) -> float | None:
+        """Seconds left before the run deadline (None if there is none)."""
+        if self.config.deadline_minutes is None:
+            return None
+        return self.config.deadline_minutes * 60 - (time.monotonic() - self.started_at)
+
+    def check_deadline(self) -> None:
+        """Raise DeadlineExceededError once the run deadline has passed."""
+        remaining = self.deadline_remaining()
+        if remaining is not None and remaining <= 0:
+            limit = self.config.deadline_minutes
+            raise DeadlineExceededError(
+                f"Run deadline of {limit:g} minutes exceeded", "deadline", limit - remaining / 60, limit
+            )
+
+    def forecast(
+        self,
+        script: dict[str, Any],
+        tts_provider: str = "elevenlabs",
+        video_model: str | None = None,
+    ) -> BudgetForecast:
+        """Project the remaining cost and time of a run from its script.
+
+        Args:
+            script: script.json contents (explainer scenes with `voiceover`,
+                or director scenes with `audio.text` and `background`)
+            tts_provider: TTS provider the run will use (only ElevenLabs is paid)
+            video_model: fal.ai model for scenes with AI video backgrounds
+                (None = config default)
+
+        Returns:
+            BudgetForecast, with `over` listing caps the projection (added to
+            spend so far) would exceed
+        """
+        from .audio.tts import ELEVENLABS_COST_PER_CHAR
+        from .video_gen.fal_generator import FalVideoConfig, FalVideoGenerator
+
+        scenes = script.get("scenes", [])
+        chars = sum(len(_scene_narration(scene)) for scene in scenes)
+        clips = [scene for scene in scenes if _scene_needs_video(scene)]
+        video_model = video_model or FalVideoConfig.model
+
+        forecast = BudgetForecast()
+        forecast.costs["llm"] = len(scenes) * LLM_COST_PER_SCENE
+        forecast.seconds["llm"] = len(scenes) * LLM_SECONDS_PER_SCENE
+        forecast.costs["tts"] = chars * ELEVENLABS_COST_PER_CHAR if tts_provider == "elevenlabs" else 0.0
+        forecast.seconds["tts"] = chars * TTS_SECONDS_PER_CHAR
+        forecast.costs["video_gen"] = sum(
+            FalVideoGenerator.cost_for(DEFAULT_CLIP_SECONDS, model=video_model) for _ in clips
+        )
+        forecast.seconds["video_gen"] = len(clips) * VIDEO_GEN_SECONDS_PER_CLIP
+
+        for category, cost in forecast.costs.items():
+            if self.spent(category) + cost > self.limit(category):
+                forecast.over.append(category)
+        if self.spent() + forecast.total_cost > self.config.total_per_video:
+            forecast.over.append("total")
+        deadline = self.deadline_remaining()
+        if deadline is not None and forecast.total_seconds > deadline:
+            forecast.over.append("deadline")
+        return forecast
+
+    def _remaining(self, category: str) -> float:
+        # Callers hold self._lock
+        committed = {c: self._spent[c] + self._held[c] for c in self._spent}
+        total_left = self.config.total_per_video - sum(committed.values())
+        return min(self.limit(category) - committed.get(category, 0.0), total_left)
+
+    def _hold(self, category: str, cost: float, description: str) -> SpendHold:
+        # Callers hold self._lock
+        self._held[category] = self._held.get(category, 0.0) + cost
+        return SpendHold(self, category, cost, description)
+
+    def _close(self, hold: SpendHold, cost: float | None, description: str | None = None) -> None:
+        with self._lock:
+            if not hold.open:
+                return
+            hold.open = False
+            self._held[hold.category] -= hold.cost_usd
+            if cost is not None:
+                self._add_spend(hold.category, cost, description or hold.description)
+
+    def _add_spend(self, category: str, cost: float, description: str) -> None:
+        # Callers hold self._lock
+        self._spent[category] = self._spent.get(category, 0.0) + cost
+        if not self.spend_path or not cost:
+            return
+        record = SpendRecord(
+            datetime.now().isoformat(), category, round(cost, 6), description, self.run_id
+        )
+        try:
+            self.spend_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spend_path, "a") as f:
+                f.write(json.dumps(asdict(record)) + "\n")
+        except OSError:
+            pass  # Losing a ledger line must not fail a paid call that succeeded
+
+    def _exceeded(self, category: str, cost: float, description: str) -> BudgetExceededError:
+        # Callers hold self._lock
+        limit = min(self.limit(category), self.config.total_per_video)
+        projected = self._spent.get(category, 0.0) + self._held.get(category, 0.0) + cost
+        what = f" for {description}" if description else ""
+        return BudgetExceededError(
+            f"{category} budget exceeded{what}: ${cost:.2f} requested, "
+            f"${max(self._remaining(category), 0.0):.2f} of ${limit:.2f} left",
+            category,
+            projected,
+            limit,
+        )
+
+    def _warn(self, category: str, cost: float, description: str) -> None:
+        # Once per category, so a run of small LLM calls doesn't flood the output
+        if category in self._warned:
+            return
+        self._warned.add(category)
+        what = f" ({description})" if description else ""
+        print(
+            f"Warning: {category} spend of ${cost:.2f}{what} exceeds the remaining budget; "
+            f"continuing over budget"
+        )
+
+    @staticmethod
+    def _read_spend(path: Path) -> list[SpendRecord]:
+        records = []
+        with open(path) as f:
+            for line in f:
+                try:
+                    records.append(SpendRecord(**json.loads(line)))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+        return records
+
+
+def _scene_narration(scene: dict[str, Any]) -> str:
+    return scene.get("voiceover") or scene.get("narration") or scene.get("audio", {}).get("text", "") or ""
+
+
+def _scene_needs_video(scene: dict[str, Any]) -> bool:
+    background = scene.get("background") or {}
+    return isinstance(background, dict) and background.get("type") in ("video", "ai_video")
+
+
+_active_tracker: BudgetTracker | None = None
+
+
+def spend_path(project_dir: Path) -> Path:
+    """Location of the spend ledger for a project."""
+    return Path(project_dir) / "telemetry" / SPEND_FILENAME
+
+
+def run_path(project_dir: Path) -> Path:
+    """Location of the file naming a project's current budget run."""
+    return Path(project_dir) / "telemetry" / RUN_FILENAME
+
+
+def new_run_id() -> str:
+    """A fresh, sortable run id."""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+def current_run_id(project_dir: Path) -> str | None:
+    """The project's current budget run, if one was started."""
+    try:
+        with open(run_path(project_dir)) as f:
+            return json.load(f).get("run_id") or None
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None
+
+
+def start_run(project_dir: Path) -> str:
+    """Start a new budget run for a project, so earlier spend stops counting.
+
+    Earlier spend stays in the ledger, tagged with its own run.
+
+    Returns:
+        The new run id
+    """
+    run_id = new_run_id()
+    path = run_path(project_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"run_id": run_id, "started_at": datetime.now().isoformat()}, f)
+    return run_id
+
+
+def start_tracking(project_dir: Path, config: BudgetConfig, new_run: bool = False) -> BudgetTracker:
+    """Start enforcing a project's budget for paid provider calls.
+
+    Args:
+        project_dir: Project root directory
+        config: Budget caps, deadline and exceed policy
+        new_run: Start a new run instead of continuing the current one
+
+    Returns:
+        The active tracker
+    """
+    run_id = None if new_run else current_run_id(project_dir)
+    if run_id is None:
+        run_id = start_run(project_dir)
+
+    global _active_tracker
+    _active_tracker = BudgetTracker(config, spend_path=spend_path(project_dir), run_id=run_id)
+    return _active_tracker
+
+
+def stop_tracking() -> None:
+    """Stop enforcing the budget."""
+    global _active_tracker
+    _active_tracker = None
+
+
+def active_tracker() -> BudgetTracker | None:
+    """The tracker paid providers report into, if any."""
+    return _active_tracker
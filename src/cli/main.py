@@ -73,6 +73,9 @@ UTILITY COMMANDS
 Project management:
     python -m src.cli list                                    # List all projects
     python -m src.cli info <project>                          # Show project info
+    python -m src.cli stats <project>                         # LLM latency/cost per stage
+    python -m src.cli budget <project>                        # Spend vs budget + run forecast
+    python -m src.cli budget <project> --reset                # Start a fresh budget run
 
 Audio & Sound:
     python -m src.cli sound <project> plan                    # Plan sound effects
@@ -204,10 +207,125 @@ def cmd_info(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_stats(args: argparse.Namespace) -> int:
+    """Summarize recorded LLM calls for a project."""
+    from ..config import load_config
+    from ..understanding.telemetry import TelemetryLedger, ledger_path, summarize
+
+    project_dir = Path(args.projects_dir) / args.project
+    if not project_dir.is_dir():
+        print(f"Error: Project not found: {project_dir}", file=sys.stderr)
+        return 1
+
+    records = TelemetryLedger.read(ledger_path(project_dir))
+    if not records:
+        print(f"No LLM calls recorded for {args.project} yet.")
+        print(f"  (ledger: {ledger_path(project_dir)})")
+        return 0
+
+    summary = summarize(records)
+    total = summary.total
+    budget = load_config().budget.llm_per_video
+
+    print(f"LLM calls for {args.project}: {total.calls} "
+          f"({total.cached} cached, {total.coalesced} coalesced, {total.failed} failed)")
+    print(f"  Wall time:  {total.total_s:.1f}s (p50 {total.p50_s:.1f}s, p95 {total.p95_s:.1f}s)")
+    print(f"  Tokens:     {total.input_tokens:,} in / {total.output_tokens:,} out")
+    if budget:
+        print(f"  Est. cost:  ${total.cost_usd:.2f} of ${budget:.2f} LLM budget "
+              f"({total.cost_usd / budget:.0%})")
+    else:
+        print(f"  Est. cost:  ${total.cost_usd:.2f}")
+    if any(r.tokens_estimated for r in records):
+        print("  (tokens estimated from prompt/response size where the provider reports none)")
+
+    groups = [("Stage", summary.by_stage)]
+    if getattr(args, "by_component", True):
+        groups.append(("Component", summary.by_component))
+    for title, group in groups:
+        print()
+        print(f"  {title:<28} {'calls':>6} {'p50':>7} {'p95':>7} {'total':>8} {'cost':>8}")
+        for name, stats in group.items():
+            print(
+                f"  {name:<28} {stats.calls:>6} {stats.p50_s:>6.1f}s {stats.p95_s:>6.1f}s "
+                f"{stats.total_s:>7.1f}s {'$' + format(stats.cost_usd, '.2f'):>8}"
+            )
+
+    return 0
+
+
+def _print_budget_forecast(tracker, script_path: Path, tts_provider: str):
+    """Print the projected cost/time of a run from its script.
+
+    Returns:
+        The BudgetForecast, or None if the script is missing or unreadable
+    """
+    try:
+        with open(script_path) as f:
+            script = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    forecast = tracker.forecast(script, tts_provider=tts_provider)
+    print(f"Budget forecast ({len(script.get('scenes', []))} scenes):")
+    for category, cost in forecast.costs.items():
+        spent = tracker.spent(category)
+        marker = "  ← over budget" if category in forecast.over else ""
+        print(
+            f"  {category:<10} ${cost:>7.2f} projected + ${spent:.2f} spent "
+            f"of ${tracker.limit(category):.2f}, ~{forecast.seconds[category] / 60:.0f} min{marker}"
+        )
+    print(
+        f"  {'total':<10} ${forecast.total_cost:>7.2f} projected + ${tracker.spent():.2f} spent "
+        f"of ${tracker.config.total_per_video:.2f}, ~{forecast.total_seconds / 60:.0f} min"
+    )
+    if "deadline" in forecast.over:
+        print(f"  ← projected time exceeds the {tracker.config.deadline_minutes:g} min deadline")
+    return forecast
+
+
+def cmd_budget(args: argparse.Namespace) -> int:
+    """Show spend against the budget and forecast a run from the script."""
+    from .. import budget
+    from ..config import load_config
+
+    project_dir = Path(args.projects_dir) / args.project
+    if not project_dir.is_dir():
+        print(f"Error: Project not found: {project_dir}", file=sys.stderr)
+        return 1
+
+    reset = getattr(args, "reset", False)
+    tracker = budget.active_tracker()
+    if tracker is None or reset:
+        tracker = budget.start_tracking(project_dir, load_config().budget, new_run=reset)
+    config = tracker.config
+    if reset:
+        print("Started a new budget run; earlier spend no longer counts against the caps.\n")
+
+    print(f"Budget for {args.project}, run {tracker.run_id} (on exceed: {config.on_exceed}):")
+    for category in budget.CATEGORIES:
+        print(
+            f"  {category:<10} ${tracker.spent(category):>7.2f} spent "
+            f"of ${tracker.limit(category):.2f}"
+        )
+    print(f"  {'total':<10} ${tracker.spent():>7.2f} spent of ${config.total_per_video:.2f}")
+    if config.deadline_minutes is not None:
+        print(f"  Deadline: {config.deadline_minutes:g} min per run")
+
+    script_path = project_dir / "script" / "script.json"
+    print()
+    forecast = _print_budget_forecast(tracker, script_path, getattr(args, "tts_provider", "elevenlabs"))
+    if forecast is None:
+        print(f"No script yet at {script_path}; nothing to forecast.")
+    return 0
+
+
 def cmd_voiceover(args: argparse.Namespace) -> int:
     """Generate voiceovers for a project."""
+    from concurrent.futures import CancelledError
+
     from ..project import load_project
-    from ..audio import get_tts_provider, ManualVoiceoverProvider
+    from ..audio import get_tts_provider, ManualVoiceoverProvider, TTSRequest
     from ..config import Config, TTSConfig
 
     try:
@@ -256,6 +374,7 @@ def cmd_voiceover(args: argparse.Namespace) -> int:
             config.tts,
             audio_dir=audio_dir,
             whisper_model=args.whisper_model or "base",
+            use_cache=not getattr(args, "no_cache", False),
         )
 
         scene_ids = [n.scene_id for n in narrations]
@@ -283,49 +402,65 @@ def cmd_voiceover(args: argparse.Namespace) -> int:
     output_dir = project.voiceover_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    results = []
-    total_duration = 0.0
+    requests = [
+        TTSRequest(
+            text=narration.narration,
+            output_path=output_dir / f"{narration.scene_id}.mp3",
+            scene_id=narration.scene_id,
+        )
+        for narration in narrations
+    ]
 
-    for narration in narrations:
-        print(f"  Processing: {narration.title}...")
-        output_path = output_dir / f"{narration.scene_id}.mp3"
+    # Without --continue-on-error the run fails on the first error anyway, so
+    # don't pay to synthesize the scenes that have not started yet
+    concurrency = getattr(args, "concurrency", None)
+    outcomes = tts.generate_batch_with_timestamps(
+        requests,
+        max_workers=concurrency,
+        on_result=lambda idx, outcome: print(
+            f"  {'✗' if isinstance(outcome, Exception) else '✓'} {requests[idx].scene_id}"
+        ),
+        stop_on_error=not args.continue_on_error,
+    )
+    print()
 
-        try:
-            # ManualVoiceoverProvider needs scene_id passed explicitly
-            if provider_name == "manual":
-                result = tts.generate_with_timestamps(
-                    narration.narration,
-                    output_path,
-                    scene_id=narration.scene_id,
-                )
-            else:
-                result = tts.generate_with_timestamps(narration.narration, output_path)
+    results = []
+    total_duration = 0.0
+    titles = {n.scene_id: n.title for n in narrations}
 
-            results.append({
-                "scene_id": narration.scene_id,
-                "audio_path": str(output_path),
-                "duration_seconds": result.duration_seconds,
-                "word_timestamps": [
-                    {
-                        "word": ts.word,
-                        "start_seconds": ts.start_seconds,
-                        "end_seconds": ts.end_seconds,
-                    }
-                    for ts in result.word_timestamps
-                ],
-            })
-            total_duration += result.duration_seconds
-            print(f"    Duration: {result.duration_seconds:.2f}s")
-            if provider_name == "manual":
-                print(f"    Words transcribed: {len(result.word_timestamps)}")
-        except FileNotFoundError as e:
-            print(f"    Skipped: {e}", file=sys.stderr)
+    # Report and record in narration order so the manifest is stable
+    for request, outcome in zip(requests, outcomes):
+        if isinstance(outcome, CancelledError):
+            continue
+        print(f"  Processing: {titles[request.scene_id]}...")
+        if isinstance(outcome, FileNotFoundError):
+            print(f"    Skipped: {outcome}", file=sys.stderr)
             if not args.continue_on_error:
                 return 1
-        except Exception as e:
-            print(f"    Error: {e}", file=sys.stderr)
+            continue
+        if isinstance(outcome, Exception):
+            print(f"    Error: {outcome}", file=sys.stderr)
             if not args.continue_on_error:
                 return 1
+            continue
+
+        results.append({
+            "scene_id": request.scene_id,
+            "audio_path": str(request.output_path),
+            "duration_seconds": outcome.duration_seconds,
+            "word_timestamps": [
+                {
+                    "word": ts.word,
+                    "start_seconds": ts.start_seconds,
+                    "end_seconds": ts.end_seconds,
+                }
+                for ts in outcome.word_timestamps
+            ],
+        })
+        total_duration += outcome.duration_seconds
+        print(f"    Duration: {outcome.duration_seconds:.2f}s")
+        if provider_name == "manual":
+            print(f"    Words transcribed: {len(outcome.word_timestamps)}")
 
     # Save manifest
     manifest = {
@@ -500,26 +635,10 @@ def _export_recording_script(project, narrations, args) -> int:
 
 
 def _get_audio_duration(audio_path: Path) -> float:
-    """Get audio duration using ffprobe."""
-    import subprocess
-    try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(audio_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return float(result.stdout.strip())
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        pass
-    return 0.0
+    """Get audio duration (0.0 if it can't be read)."""
+    from ..media_info import get_media_duration
+
+    return get_media_duration(audio_path)
 
 
 def cmd_storyboard(args: argparse.Namespace) -> int:
@@ -1036,6 +1155,7 @@ def cmd_scenes(args: argparse.Namespace) -> int:
         working_dir=project.root_dir.parent.parent,  # Repo root
         timeout=args.timeout,
         skip_validation=getattr(args, 'no_validate', False),
+        max_workers=getattr(args, "concurrency", None),
     )
 
     try:
@@ -1403,6 +1523,12 @@ def cmd_render(args: argparse.Namespace) -> int:
             print(f"Error: Storyboard not found: {storyboard_path}", file=sys.stderr)
             print(f"Run 'python -m src.cli short {project.id}' first")
             return 1
+
+        # Short music has its ducking baked in; flag it if the voiceover moved
+        from ..music.generator import short_music_is_stale
+        if short_music_is_stale(project.root_dir, variant):
+            print("Warning: Background music was ducked for an older voiceover")
+            print(f"Re-run 'python -m src.cli music {project.id} short --variant {variant}' to re-duck it")
     else:
         storyboard_path = project.get_path("storyboard")
         voiceover_dir = project.voiceover_dir
@@ -1414,6 +1540,28 @@ def cmd_render(args: argparse.Namespace) -> int:
             print("Run storyboard generation first or create storyboard/storyboard.json")
             return 1
 
+        # A pre-mixed soundtrack replaces the per-element audio; re-mix it if
+        # cues, music or voiceovers changed since it was rendered, keeping
+        # the loudness setting it was mixed with
+        try:
+            with open(storyboard_path) as f:
+                recorded_mixdown = (json.load(f).get("audio") or {}).get("mixdown") or {}
+        except (OSError, ValueError):
+            recorded_mixdown = {}
+        if recorded_mixdown:
+            from ..audio.mixdown import MixdownError, mix_storyboard
+            try:
+                mixdown = mix_storyboard(
+                    project.root_dir,
+                    storyboard_path,
+                    normalize=recorded_mixdown.get("normalize", True),
+                )
+            except MixdownError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+            if not mixdown.up_to_date:
+                print(f"Re-mixed soundtrack: {mixdown.output_path}")
+
     # Check for voiceover/audio files
     voiceover_files = list(voiceover_dir.glob("*.mp3"))
     print(f"Found {len(voiceover_files)} audio files")
@@ -1780,6 +1928,7 @@ def cmd_music(args: argparse.Namespace) -> int:
             topic=topic,
             target_duration=target_duration,
             update_storyboard=not args.no_update,
+            duck=not getattr(args, "no_duck", False),
         )
 
         if result.success:
@@ -1836,6 +1985,7 @@ def cmd_music(args: argparse.Namespace) -> int:
             target_duration=args.duration,
             custom_style=args.style,
             update_storyboard=not args.no_update,
+            duck=not getattr(args, "no_duck", False),
         )
 
         if result.success:
@@ -1862,19 +2012,13 @@ def cmd_music(args: argparse.Namespace) -> int:
         # Check for existing music
         music_path = project.root_dir / "music" / "background.mp3"
         if music_path.exists():
-            import subprocess
-            result = subprocess.run(
-                ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", str(music_path)],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                info = json.loads(result.stdout)
-                duration = float(info.get("format", {}).get("duration", 0))
-                print(f"Existing music: {music_path}")
-                print(f"Duration: {duration:.1f}s")
-            else:
-                print(f"Existing music: {music_path}")
+            from ..media_info import MediaInfoError, probe_media
+
+            print(f"Existing music: {music_path}")
+            try:
+                print(f"Duration: {probe_media(music_path).duration_seconds:.1f}s")
+            except MediaInfoError:
+                pass
         else:
             print("No background music generated yet.")
 
@@ -1922,11 +2066,13 @@ def cmd_sound(args: argparse.Namespace) -> int:
         print("  analyze    Analyze scenes for sound moments (dry run)")
         print("  generate   Generate SFX cues and write to storyboard")
         print("  clear      Remove SFX cues from storyboard")
+        print("  mixdown    Pre-mix voiceover, SFX and music into one stem")
+        print("  loudness   Measure EBU R128 loudness of all project audio")
         print("\nNote: SFX cues are defined in storyboard.json and rendered by Remotion.")
         return 1
 
     if args.sound_command == "library":
-        library = SoundLibrary(sfx_dir)
+        library = SoundLibrary(sfx_dir, use_cache=not getattr(args, "no_cache", False))
 
         if args.list:
             print(f"Sound Library ({len(SOUND_MANIFEST)} sounds)")
@@ -1949,6 +2095,8 @@ def cmd_sound(args: argparse.Namespace) -> int:
 
             generated = library.generate_all()
             print(f"Generated {len(generated)} sounds to: {sfx_dir}")
+            if library.cache is not None:
+                print(f"  ({library.cache.hits} reused from cache, {library.cache.misses} rendered)")
 
             for name in generated:
                 print(f"  - {name}.wav")
@@ -1971,6 +2119,12 @@ def cmd_sound(args: argparse.Namespace) -> int:
     elif args.sound_command == "clear":
         return _cmd_sound_clear(project, args)
 
+    elif args.sound_command == "mixdown":
+        return _cmd_sound_mixdown(project, args)
+
+    elif args.sound_command == "loudness":
+        return _cmd_sound_loudness(project, args)
+
     else:
         print(f"Unknown sound command: {args.sound_command}")
         return 1
@@ -1985,60 +2139,65 @@ def _cmd_sound_analyze(project, args: argparse.Namespace) -> int:
     print(f"Analyzing scenes for {project.id}...")
     print()
 
-    orchestrator = SFXOrchestrator(project_dir=project.root_dir)
+    orchestrator = SFXOrchestrator(
+        project_dir=project.root_dir,
+        use_cache=not getattr(args, "no_cache", False),
+    )
 
-    try:
-        preview = orchestrator.preview_analysis()
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+    # The AST analyzer keeps a node process running until closed
+    with orchestrator:
+        try:
+            preview = orchestrator.preview_analysis()
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
 
-    if not preview:
-        print("No scenes found to analyze.")
-        return 0
+        if not preview:
+            print("No scenes found to analyze.")
+            return 0
 
-    # Filter to specific scene if requested
-    if args.scene:
-        if args.scene not in preview:
-            print(f"Error: Scene '{args.scene}' not found", file=sys.stderr)
-            print(f"Available scenes: {', '.join(preview.keys())}")
-            return 1
-        preview = {args.scene: preview[args.scene]}
+        # Filter to specific scene if requested
+        if args.scene:
+            if args.scene not in preview:
+                print(f"Error: Scene '{args.scene}' not found", file=sys.stderr)
+                print(f"Available scenes: {', '.join(preview.keys())}")
+                return 1
+            preview = {args.scene: preview[args.scene]}
 
-    total_moments = 0
-    for scene_id, data in preview.items():
-        print(f"Scene: {scene_id}")
-        print(f"  Type: {data['scene_type']}")
-        print(f"  Duration: {data['duration_frames']} frames ({data['duration_frames']/30:.1f}s)")
-        print(f"  Detected moments: {data['total_moments']}")
+        total_moments = 0
+        for scene_id, data in preview.items():
+            print(f"Scene: {scene_id}")
+            print(f"  Type: {data['scene_type']}")
+            print(f"  Duration: {data['duration_frames']} frames ({data['duration_frames']/30:.1f}s)")
+            print(f"  Detected moments: {data['total_moments']}")
 
-        if data['moments_by_type']:
-            print("  By type:")
-            for moment_type, count in sorted(data['moments_by_type'].items()):
-                print(f"    - {moment_type}: {count}")
+            if data['moments_by_type']:
+                print("  By type:")
+                for moment_type, count in sorted(data['moments_by_type'].items()):
+                    print(f"    - {moment_type}: {count}")
 
-        if data['notes']:
-            print("  Notes:")
-            for note in data['notes']:
-                print(f"    - {note}")
+            if data['notes']:
+                print("  Notes:")
+                for note in data['notes']:
+                    print(f"    - {note}")
 
-        if args.verbose:
-            moments = orchestrator.get_scene_moments(scene_id)
-            if moments:
-                print("  Detailed moments:")
-                for m in moments:
-                    print(f"    Frame {m.frame:4d}: {m.type:<18} (conf={m.confidence:.2f}, src={m.source})")
-                    if m.context:
-                        print(f"                    {m.context}")
-
-        total_moments += data['total_moments']
-        print()
+            if args.verbose:
+                moments = orchestrator.get_scene_moments(scene_id)
+                if moments:
+                    print("  Detailed moments:")
+                    for m in moments:
+                        print(f"    Frame {m.frame:4d}: {m.type:<18} (conf={m.confidence:.2f}, src={m.source})")
+                        if m.context:
+                            print(f"                    {m.context}")
+
+            total_moments += data['total_moments']
+            print()
 
-    print(f"Total: {len(preview)} scenes, {total_moments} moments detected")
-    print()
-    print("Run 'sound generate' to create SFX cues in storyboard.json")
+        print(f"Total: {len(preview)} scenes, {total_moments} moments detected")
+        print()
+        print("Run 'sound generate' to create SFX cues in storyboard.json")
 
-    return 0
+        return 0
 
 
 def _cmd_sound_generate(project, args: argparse.Namespace) -> int:
@@ -2058,6 +2217,7 @@ def _cmd_sound_generate(project, args: argparse.Namespace) -> int:
         project_dir=project.root_dir,
         theme=theme,
         use_library=True,  # Use pre-generated library sounds
+        use_cache=not getattr(args, "no_cache", False),
     )
 
     use_llm = not args.no_llm
@@ -2070,14 +2230,17 @@ def _cmd_sound_generate(project, args: argparse.Namespace) -> int:
     print(f"LLM analysis: {'enabled' if use_llm else 'disabled'}")
     print()
 
-    result = orchestrator.generate_sfx_cues(
-        use_llm=use_llm,
-        dry_run=args.dry_run,
-        max_per_second=args.max_density,
-        min_gap_frames=args.min_gap,
-    )
+    with orchestrator:
+        result = orchestrator.generate_sfx_cues(
+            use_llm=use_llm,
+            dry_run=args.dry_run,
+            max_per_second=args.max_density,
+            min_gap_frames=args.min_gap,
+        )
 
     print(f"Scenes analyzed: {result.scenes_analyzed}")
+    if orchestrator.cache is not None and orchestrator.cache.hits:
+        print(f"  ({orchestrator.cache.hits} unchanged, reused from cache)")
     print(f"Moments detected: {result.moments_detected}")
     print(f"Cues generated: {result.cues_generated}")
 
@@ -2129,6 +2292,70 @@ def _cmd_sound_clear(project, args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_sound_mixdown(project, args: argparse.Namespace) -> int:
+    """Render voiceover, SFX cues and music to a single stem."""
+    from ..audio.mixdown import MixdownError, mix_storyboard
+
+    print(f"Mixing soundtrack for {project.id}...")
+
+    try:
+        result = mix_storyboard(
+            project.root_dir,
+            update_storyboard=not getattr(args, "no_update", False),
+            force=getattr(args, "force", False),
+            normalize=not getattr(args, "no_normalize", False),
+        )
+    except (FileNotFoundError, MixdownError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for path in result.missing:
+        print(f"  [missing] {path}")
+
+    if result.up_to_date:
+        print(f"Mixdown is up to date: {result.output_path}")
+        return 0
+
+    print(f"Clips mixed: {result.clips_mixed}")
+    print(f"Duration: {result.duration_seconds:.1f}s")
+    print(f"Peak: {result.peak:.2f}")
+    if result.clipped_samples:
+        print(f"Warning: {result.clipped_samples} samples clipped")
+    print(f"Mixdown written to: {result.output_path}")
+
+    return 0
+
+
+def _cmd_sound_loudness(project, args: argparse.Namespace) -> int:
+    """Measure the loudness of voiceover, SFX and music and save the report."""
+    from ..audio.loudness import LoudnessAnalyzer
+
+    analyzer = LoudnessAnalyzer(use_cache=not getattr(args, "no_cache", False))
+    report = analyzer.analyze_project(project.root_dir)
+
+    if not report.entries:
+        print(f"No audio found in {project.root_dir}")
+        return 1
+
+    print(f"Loudness of {project.id} (EBU R128)")
+    print("=" * 50)
+    for entry in report.entries:
+        if entry.error:
+            print(f"  [error] {entry.path}: {entry.error}")
+            continue
+        measurement = entry.measurement
+        lufs = "silent" if measurement.integrated_lufs is None else f"{measurement.integrated_lufs:6.1f} LUFS"
+        peak = "" if measurement.true_peak_dbtp is None else f"{measurement.true_peak_dbtp:5.1f} dBTP"
+        print(f"  {entry.path:<40} {lufs:>12} {peak:>10}  gain {entry.gain_db:+.1f} dB")
+
+    if analyzer.cache is not None:
+        print(f"\n({analyzer.cache.hits} reused from cache, {analyzer.cache.misses} measured)")
+    print(f"Report written to: {report.save()}")
+    print("Corrections are applied by: python -m src.cli sound <project> mixdown")
+
+    return 0
+
+
 def cmd_evidence(args: argparse.Namespace) -> int:
     """Review and curate evidence screenshots."""
     from ..evidence import curate_evidence, review_evidence
@@ -4550,7 +4777,10 @@ def cmd_generate(args: argparse.Namespace) -> int:
     6. storyboard - Create storyboard linking scenes + audio
     7. render - Render final video
     """
+    from .. import budget
+    from ..pipeline.dag import DAGRunner, RunLedger, Stage
     from ..project import load_project
+    from ..understanding import telemetry as llm_telemetry
 
     # Define pipeline steps in order
     PIPELINE_STEPS = ["plan", "script", "narration", "scenes", "voiceover", "storyboard", "render"]
@@ -4594,7 +4824,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
     if args.force:
         print(f"Mode: Force regenerate all steps")
     else:
-        print(f"Mode: Skip completed steps")
+        print("Mode: Re-run only steps whose inputs changed")
     print(f"{'=' * 60}\n")
 
     # Helper to check if step output exists
@@ -4633,17 +4863,20 @@ def cmd_generate(args: argparse.Namespace) -> int:
             return len(mp4_files) > 0
         return False
 
-    # Run each step
-    for step_num, step in enumerate(steps_to_run, 1):
-        step_header = f"[{step_num}/{len(steps_to_run)}] {step.upper()}"
-        print(f"\n{'─' * 60}")
-        print(f"{step_header}")
-        print(f"{'─' * 60}")
+    root = project.root_dir
+    input_dir = root / "input"
+    plan_path = project.plan_dir / "plan.json"
+    script_path = root / "script" / "script.json"
+    narrations_path = root / "narration" / "narrations.json"
+    scenes_dir = root / "scenes"
+    manifest_path = root / "voiceover" / "manifest.json"
+    storyboard_path = root / "storyboard" / "storyboard.json"
 
-        # Check if we can skip this step
-        if not args.force and step_output_exists(step):
-            print(f"✓ Output already exists, skipping (use --force to regenerate)")
-            continue
+    paused = False
+
+    def run_step(step: str) -> int:
+        """Run one pipeline step through its sub-command."""
+        nonlocal paused
 
         # Create args namespace for the step command
         step_args = argparse.Namespace(
@@ -4662,7 +4895,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
             step_args.plan_command = "create"
             step_args.duration = None
             step_args.mock = args.mock
-            step_args.force = args.force or not step_output_exists(step)
+            step_args.force = True  # Only reached when the step is stale
             # Auto-approve plan unless --interactive is specified
             step_args.no_interactive = not getattr(args, "interactive", False)
             result = cmd_plan(step_args)
@@ -4670,6 +4903,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
             # If interactive mode and plan wasn't approved, stop pipeline
             if getattr(args, "interactive", False) and result != 0:
                 print("\nPipeline paused. Approve the plan to continue.")
+                paused = True
                 return result
 
             # Auto-approve plan if not interactive
@@ -4700,7 +4934,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
             step_args.duration = None
             step_args.mock = args.mock
             step_args.timeout = args.timeout
-            step_args.force = args.force or not step_output_exists(step)
+            step_args.force = True  # Only reached when the step is stale
             step_args.verbose = False
             step_args.skip_plan = False  # Use plan if available
             step_args.continue_on_error = False
@@ -4709,7 +4943,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
         elif step == "narration":
             step_args.mock = args.mock
             step_args.timeout = args.timeout
-            step_args.force = args.force or not step_output_exists(step)
+            step_args.force = True  # Only reached when the step is stale
             step_args.topic = None  # Use project title
             step_args.verbose = False
             result = cmd_narration(step_args)
@@ -4717,7 +4951,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
         elif step == "scenes":
             step_args.mock = args.mock
             step_args.timeout = args.timeout
-            step_args.force = args.force or not step_output_exists(step)
+            step_args.force = True  # Only reached when the step is stale
             step_args.sync = False  # Generate mode, not sync
             step_args.scene = None
             step_args.no_validate = False
@@ -4740,7 +4974,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
             step_args.view = False
             step_args.mock = args.mock
             step_args.timeout = args.timeout
-            step_args.force = args.force or not step_output_exists(step)
+            step_args.force = True  # Only reached when the step is stale
             result = cmd_storyboard(step_args)
 
         elif step == "render":
@@ -4759,14 +4993,91 @@ def cmd_generate(args: argparse.Namespace) -> int:
             print(f"Error: Unknown step '{step}'")
             return 1
 
-        # Check result
-        if result != 0:
-            print(f"\n{'=' * 60}")
-            print(f"PIPELINE FAILED at step: {step}")
-            print(f"{'=' * 60}")
-            return result
+        if result == 0:
+            print(f"✓ {step.upper()} completed successfully")
+        return result
+
+    tracker = budget.active_tracker()
+
+    def over_budget_abort() -> bool:
+        """Print the run forecast; True if it exceeds a cap under the abort policy."""
+        forecast = _print_budget_forecast(tracker, script_path, args.voice_provider)
+        if forecast and not forecast.within_budget and tracker.config.on_exceed == "abort":
+            print(f"Error: projected run exceeds budget ({', '.join(forecast.over)})")
+            return True
+        return False
+
+    def run_stage(step: str) -> int:
+        """Run one step with its LLM calls attributed to it."""
+        if tracker is not None:
+            tracker.check_deadline()
+        with llm_telemetry.stage(step):
+            result = run_step(step)
+        if step == "script" and result == 0 and tracker is not None and over_budget_abort():
+            return 1
+        return result
+
+    # Each step declares what it depends on and which files determine its
+    # output; scenes and voiceover only need the narration, so they run
+    # side by side.
+    stage_specs = {
+        "plan": ([], [input_dir], {}),
+        "script": (["plan"], [input_dir, plan_path], {}),
+        "narration": (["script"], [script_path], {}),
+        "scenes": (["narration"], [script_path, narrations_path], {}),
+        "voiceover": (["narration"], [narrations_path], {"provider": args.voice_provider}),
+        "storyboard": (["scenes", "voiceover"], [script_path, scenes_dir, manifest_path], {}),
+        "render": (
+            ["storyboard"],
+            [storyboard_path, scenes_dir, root / "voiceover"],
+            {"resolution": args.resolution},
+        ),
+    }
+    stages = []
+    for step in steps_to_run:
+        deps, inputs, params = stage_specs[step]
+        stages.append(
+            Stage(
+                name=step,
+                run=lambda step=step: run_stage(step),
+                deps=deps,
+                inputs=inputs,
+                outputs_exist=lambda step=step: step_output_exists(step),
+                params={"mock": bool(args.mock), **params},
+            )
+        )
+
+    step_numbers = {step: num for num, step in enumerate(steps_to_run, 1)}
 
-        print(f"✓ {step.upper()} completed successfully")
+    def on_decision(stage: Stage, reason: str) -> None:
+        print(f"\n{'─' * 60}")
+        print(f"[{step_numbers[stage.name]}/{len(steps_to_run)}] {stage.name.upper()}")
+        print(f"{'─' * 60}")
+        if reason in ("up_to_date", "adopted"):
+            print("✓ Output already exists, skipping (inputs unchanged; use --force to regenerate)")
+        elif reason == "changed":
+            print("↻ Inputs changed since last run, regenerating")
+
+    if tracker is not None and script_path.exists() and over_budget_abort():
+        return 1
+
+    runner = DAGRunner(
+        stages,
+        ledger=RunLedger(root / "pipeline" / "ledger.json"),
+        root=root,
+        force=args.force,
+        on_decision=on_decision,
+    )
+    run_result = runner.run()
+
+    if paused:
+        return run_result.returncode
+
+    if not run_result.success:
+        print(f"\n{'=' * 60}")
+        print(f"PIPELINE FAILED at step: {run_result.failed}")
+        print(f"{'=' * 60}")
+        return run_result.returncode
 
     # Success
     print(f"\n{'=' * 60}")
@@ -4806,6 +5117,37 @@ def main() -> int:
     info_parser.add_argument("project", help="Project ID")
     info_parser.set_defaults(func=cmd_info)
 
+    # stats command
+    stats_parser = subparsers.add_parser(
+        "stats", help="Show LLM call latency, token and cost statistics for a project"
+    )
+    stats_parser.add_argument("project", help="Project ID")
+    stats_parser.add_argument(
+        "--no-components",
+        dest="by_component",
+        action="store_false",
+        help="Only break down by pipeline stage, not by calling component",
+    )
+    stats_parser.set_defaults(func=cmd_stats)
+
+    # budget command
+    budget_parser = subparsers.add_parser(
+        "budget", help="Show spend against the budget and forecast a run's cost and time"
+    )
+    budget_parser.add_argument("project", help="Project ID")
+    budget_parser.add_argument(
+        "--tts-provider",
+        choices=["elevenlabs", "edge"],
+        default="elevenlabs",
+        help="TTS provider to forecast for (default: elevenlabs)",
+    )
+    budget_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Start a new budget run so earlier spend no longer counts against the caps",
+    )
+    budget_parser.set_defaults(func=cmd_budget)
+
     # create command
     create_parser = subparsers.add_parser("create", help="Create a new project")
     create_parser.add_argument("project_id", help="Project ID (used as directory name)")
@@ -4827,7 +5169,9 @@ Run all steps to generate a video from input documents:
   6. storyboard - Create storyboard linking scenes + audio
   7. render     - Render final video
 
-By default, skips steps that have already been completed.
+By default, re-runs only steps whose inputs changed since the last run
+(tracked in <project>/pipeline/ledger.json). Scenes and voiceover both
+depend only on the narration and run concurrently.
 Use --force to regenerate all steps.
 Use --interactive to pause for plan review before continuing.
         """,
@@ -4922,6 +5266,11 @@ Use --interactive to pause for plan review before continuing.
         default="base",
         help="Whisper model size for transcription (default: base)",
     )
+    voiceover_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-transcribe recordings even if they were transcribed before (with --provider manual)",
+    )
     voiceover_parser.add_argument(
         "--no-sync",
         action="store_true",
@@ -4932,6 +5281,12 @@ Use --interactive to pause for plan review before continuing.
         action="store_true",
         help="Add delivery tags to guide voice actor (with --export-script)",
     )
+    voiceover_parser.add_argument(
+        "--concurrency", "-j",
+        type=int,
+        default=None,
+        help="Number of scenes to synthesize in parallel (default: provider limit, 1 = sequential)",
+    )
     voiceover_parser.set_defaults(func=cmd_voiceover)
 
     # storyboard command
@@ -5129,6 +5484,12 @@ Commands:
         action="store_true",
         help="Skip validation (generate scene without checking for errors). Use when LLM keeps failing validation.",
     )
+    scenes_parser.add_argument(
+        "--concurrency", "-j",
+        type=int,
+        default=None,
+        help="Number of scenes to generate in parallel (default: 4, 1 = sequential)",
+    )
     scenes_parser.add_argument(
         "--verify",
         action="store_true",
@@ -5542,6 +5903,11 @@ For manual voiceover recording:
         action="store_true",
         help="Don't update storyboard.json with music config",
     )
+    music_generate_parser.add_argument(
+        "--no-duck",
+        action="store_true",
+        help="Keep the music at constant volume instead of ducking under narration",
+    )
 
     # music short
     music_short_parser = music_subparsers.add_parser(
@@ -5571,6 +5937,11 @@ For manual voiceover recording:
         action="store_true",
         help="Don't update shorts_storyboard.json with music config",
     )
+    music_short_parser.add_argument(
+        "--no-duck",
+        action="store_true",
+        help="Keep the music at constant volume instead of ducking under narration",
+    )
 
     # music info
     music_subparsers.add_parser(
@@ -5612,6 +5983,11 @@ For manual voiceover recording:
         action="store_true",
         help="Alias for --generate (for backwards compatibility)",
     )
+    sound_library_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every sound instead of reusing the shared SFX cache",
+    )
 
     # sound analyze - analyze scenes for sound moments
     sound_analyze_parser = sound_subparsers.add_parser(
@@ -5628,6 +6004,11 @@ For manual voiceover recording:
         action="store_true",
         help="Show detailed moment information",
     )
+    sound_analyze_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every scene instead of reusing cached results",
+    )
 
     # sound generate - generate SFX cues
     sound_generate_parser = sound_subparsers.add_parser(
@@ -5663,6 +6044,11 @@ For manual voiceover recording:
         default=10,
         help="Minimum frames between sounds (default: 10)",
     )
+    sound_generate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every scene instead of reusing cached results",
+    )
 
     # sound clear - remove SFX cues
     sound_clear_parser = sound_subparsers.add_parser(
@@ -5675,6 +6061,38 @@ For manual voiceover recording:
         help="Clear only a specific scene ID",
     )
 
+    # sound mixdown - pre-mix the soundtrack
+    sound_mixdown_parser = sound_subparsers.add_parser(
+        "mixdown",
+        help="Pre-mix voiceover, SFX cues and music into one stem for Remotion",
+    )
+    sound_mixdown_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render even if the existing mixdown is up to date",
+    )
+    sound_mixdown_parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="Write the stem without pointing storyboard.json at it",
+    )
+    sound_mixdown_parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="Mix assets at their own levels instead of their loudness targets",
+    )
+
+    # sound loudness - EBU R128 loudness report
+    sound_loudness_parser = sound_subparsers.add_parser(
+        "loudness",
+        help="Measure EBU R128 loudness of voiceover, SFX and music",
+    )
+    sound_loudness_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-measure every file instead of reusing cached measurements",
+    )
+
     sound_parser.set_defaults(func=cmd_sound)
 
     # evidence command (review and curate screenshots)
@@ -5988,6 +6406,29 @@ Full Workflow:
         parser.print_help()
         return 0
 
+    # Record every LLM call made on behalf of a project (see `stats`) and
+    # hold paid providers to the project's budget (see `budget`)
+    project_id = getattr(args, "project", None)
+    if isinstance(project_id, str) and args.command not in ("stats", "budget"):
+        project_dir = Path(args.projects_dir) / project_id
+        if project_dir.is_dir():
+            from .. import budget
+            from ..config import load_config
+            from ..understanding import telemetry
+
+            telemetry.start_recording(project_dir, stage=args.command)
+            # Each `generate` is a new video generation with fresh caps; other
+            # commands spend against the current run (see `budget --reset`)
+            budget.start_tracking(
+                project_dir, load_config().budget, new_run=args.command == "generate"
+            )
+
+    # A forced or uncached run asks for fresh LLM responses, not stored ones
+    if getattr(args, "force", False) or getattr(args, "no_cache", False):
+        from ..understanding.llm_provider import bypass_response_cache
+
+        bypass_response_cache()
+
     return args.func(args)
 
 
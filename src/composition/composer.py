@@ -1,12 +1,12 @@
 """Video composer - assemble videos from animation and audio assets."""
 
-import json
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from ..config import Config, load_config
+from ..media_info import get_media_duration
 from ..models import Script, Storyboard
 
 
@@ -225,24 +225,7 @@ class VideoComposer:
 
     def _get_video_duration(self, video_path: Path) -> float:
         """Get the duration of a video file."""
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "json",
-            str(video_path),
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            return 0.0
-
-        try:
-            data = json.loads(result.stdout)
-            return float(data.get("format", {}).get("duration", 0))
-        except (json.JSONDecodeError, ValueError):
-            return 0.0
+        return get_media_duration(video_path)
 
     def generate_thumbnail(
         self,
@@ -1,7 +1,7 @@
 """Configuration loading and management."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field
@@ -24,6 +24,19 @@ class LLMConfig(BaseModel):
     model: str = "claude-sonnet-4-20250514"
     max_tokens: int = 4096
     temperature: float = 0.7
+    # Response cache (see src/understanding/response_cache.py); --force and
+    # --no-cache runs bypass it
+    cache_enabled: bool = True
+    cache_dir: str | None = None  # None = ~/.cache/video-explainer/llm
+    cache_max_entries: int = 2000
+    cache_max_size_mb: int = 500
+    cache_max_age_days: float = 30.0
+    # Share one call among identical requests in flight at the same time
+    coalesce_requests: bool = True
+    # Anthropic API provider (provider: "anthropic")
+    base_url: str | None = None  # None = ANTHROPIC_BASE_URL or the public API
+    request_timeout: float = 300.0
+    max_retries: int = 3
 
 
 class TTSConfig(BaseModel):
@@ -33,6 +46,10 @@ class TTSConfig(BaseModel):
     voice_id: str | None = None
     model: str = "eleven_multilingual_v2"
     output_format: str = "mp3_44100_128"
+    # Batch synthesis (None = provider default, see TTSProvider.MAX_CONCURRENCY)
+    max_concurrency: int | None = None
+    requests_per_second: float | None = None
+    max_retries: int = 3
 
 
 class BudgetConfig(BaseModel):
@@ -41,7 +58,14 @@ class BudgetConfig(BaseModel):
     llm_per_video: float = 50.0
     tts_per_video: float = 10.0
     image_gen_per_video: float = 20.0
+    video_gen_per_video: float = 30.0
     total_per_video: float = 100.0
+    # Wall-clock limit for one CLI run (None = no deadline)
+    deadline_minutes: float | None = None
+    # When a paid call would exceed a cap: "abort", "degrade" (cheaper model,
+    # shorter clips where the provider offers one; calls with no cheaper
+    # option, like TTS and LLM, warn and go ahead) or "warn"
+    on_exceed: Literal["abort", "degrade", "warn"] = "degrade"
 
 
 class PathsConfig(BaseModel):
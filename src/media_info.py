@@ -0,0 +1,404 @@
+"""Media file metadata (duration, sample rate, channels) without subprocesses.
+
+Durations used to come from one `ffprobe` subprocess per file, often for the
+same file several times in one command. `probe_media` reads them from the
+container headers instead:
+
+- WAV: the fmt/fact/data chunks
+- MP3: the Xing/Info or VBRI frame count, or the first frame's bitrate for
+  constant-bitrate files (as EdgeTTS writes)
+- MP4/MOV/M4A: the movie header (mvhd) box
+
+Anything else, or a header that doesn't parse, falls back to ffprobe.
+Results are kept in a process-wide cache keyed by (path, size, mtime), so a
+file is read at most once until it changes.
+"""
+
+import os
+import struct
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+FFPROBE_TIMEOUT_SECONDS = 10
+
+# How far past any ID3v2 tag to look for the first MP3 frame
+_MP3_SYNC_SEARCH_BYTES = 64 * 1024
+
+# Larger moov boxes are left to ffprobe rather than read into memory
+_MAX_MOOV_BYTES = 64 * 1024 * 1024
+
+_MP4_TOP_LEVEL_BOXES = {b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip", b"pnot"}
+
+
+class MediaInfoError(RuntimeError):
+    """Raised when a file's metadata cannot be read."""
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Metadata of one media file.
+
+    Attributes:
+        duration_seconds: Length of the media
+        sample_rate: Audio sample rate (None if not known)
+        channels: Audio channel count (None if not known)
+        source: Where the values came from: "wav", "mp3", "mp4" or "ffprobe"
+    """
+
+    duration_seconds: float
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    source: str = "ffprobe"
+
+
+# =============================================================================
+# Header parsers - each returns None if the file isn't in its format
+# =============================================================================
+
+
+def _parse_wav(f: BinaryIO, size: int) -> Optional[MediaInfo]:
+    """Read a RIFF/WAVE file's duration from its chunks."""
+    f.seek(0)
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    fmt = None
+    fact_samples = None
+    data_size = None
+    position = 12
+    while position + 8 <= size:
+        f.seek(position)
+        chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+        body = position + 8
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            fmt = struct.unpack("<HHIIHH", f.read(16))
+        elif chunk_id == b"fact" and chunk_size >= 4:
+            fact_samples = struct.unpack("<I", f.read(4))[0]
+        elif chunk_id == b"data":
+            # Streamed writers leave the size at 0xFFFFFFFF (or wrong)
+            data_size = min(chunk_size, size - body)
+        if fmt is not None and data_size is not None:
+            break
+        position = body + chunk_size + (chunk_size & 1)  # Chunks are word-aligned
+
+    if fmt is None or data_size is None:
+        return None
+
+    audio_format, channels, sample_rate, byte_rate, block_align, _ = fmt
+    if not sample_rate:
+        return None
+    if audio_format in (1, 3, 0xFFFE) and block_align:  # PCM, float, extensible
+        duration = (data_size // block_align) / sample_rate
+    elif fact_samples is not None:
+        duration = fact_samples / sample_rate
+    elif byte_rate:
+        duration = data_size / byte_rate
+    else:
+        return None
+    return MediaInfo(duration, sample_rate, channels, "wav")
+
+
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 2.5: (11025, 12000, 8000)}
+_MP3_VERSIONS = {0b00: 2.5, 0b10: 2, 0b11: 1}
+_MP3_LAYERS = {0b01: 3, 0b10: 2, 0b11: 1}
+
+
+@dataclass(frozen=True)
+class _Mp3Frame:
+    version: float
+    layer: int
+    bitrate: int  # bits per second
+    sample_rate: int
+    channels: int
+    samples: int  # per frame
+    length: int  # bytes
+
+
+def _mp3_frame(header: bytes) -> Optional[_Mp3Frame]:
+    """Decode a 4-byte MPEG audio frame header (None if it isn't one)."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = _MP3_VERSIONS.get((header[1] >> 3) & 0b11)
+    layer = _MP3_LAYERS.get((header[1] >> 1) & 0b11)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0b11
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    bitrate = _MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 1
+    channels = 1 if header[3] >> 6 == 0b11 else 2
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 576 if layer == 3 and version != 1 else 1152
+        length = (samples // 8) * bitrate // sample_rate + padding
+    return _Mp3Frame(version, layer, bitrate, sample_rate, channels, samples, length)
+
+
+def _parse_mp3(f: BinaryIO, size: int) -> Optional[MediaInfo]:
+    """Read an MP3's duration from its VBR header or first frame."""
+    f.seek(0)
+    start = 0
+    head = f.read(10)
+    if head[:3] == b"ID3" and len(head) == 10:
+        # ID3v2 size is syncsafe: 7 bits per byte
+        tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+
+    f.seek(start)
+    buffer = f.read(_MP3_SYNC_SEARCH_BYTES)
+
+    # First frame header that is followed by another valid header
+    offset = buffer.find(b"\xff")
+    frame = None
+    while offset != -1 and offset + 4 <= len(buffer):
+        frame = _mp3_frame(buffer[offset:offset + 4])
+        if frame is not None and frame.length:
+            following = offset + frame.length
+            if start + following <= size < start + following + 4:
+                break  # The last frame in the file
+            if following + 4 <= len(buffer) and _mp3_frame(buffer[following:following + 4]):
+                break
+        frame = None
+        offset = buffer.find(b"\xff", offset + 1)
+    if frame is None:
+        return None
+
+    # Xing/Info (LAME) and VBRI headers carry the total frame count
+    if frame.version == 1:
+        side_info = 17 if frame.channels == 1 else 32
+    else:
+        side_info = 9 if frame.channels == 1 else 17
+    xing = offset + 4 + side_info
+    frames = None
+    if buffer[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", buffer[xing + 4:xing + 8])[0]
+        if flags & 1:
+            frames = struct.unpack(">I", buffer[xing + 8:xing + 12])[0]
+    elif buffer[offset + 36:offset + 40] == b"VBRI":
+        frames = struct.unpack(">I", buffer[offset + 50:offset + 54])[0]
+
+    if frames:
+        duration = frames * frame.samples / frame.sample_rate
+    else:
+        # Constant bitrate: the audio bytes divided by the byte rate
+        audio_bytes = size - (start + offset)
+        f.seek(max(0, size - 128))
+        if f.read(3) == b"TAG":  # ID3v1
+            audio_bytes -= 128
+        duration = audio_bytes * 8 / frame.bitrate
+
+    return MediaInfo(duration, frame.sample_rate, frame.channels, "mp3")
+
+
+def _parse_mp4(f: BinaryIO, size: int) -> Optional[MediaInfo]:
+    """Read an MP4/MOV file's duration from its movie header box."""
+
+    def boxes(read, position: int, end: int):
+        """Yield (type, body_start, body_end) of the boxes in [position, end)."""
+        while position + 8 <= end:
+            box_size, box_type = struct.unpack(">I4s", read(position, 8))
+            header = 8
+            if box_size == 1:
+                box_size = struct.unpack(">Q", read(position + 8, 8))[0]
+                header = 16
+            elif box_size == 0:
+                box_size = end - position
+            if box_size < header:
+                return
+            yield box_type, position + header, min(position + box_size, end)
+            position += box_size
+
+    def read_file(position: int, count: int) -> bytes:
+        f.seek(position)
+        return f.read(count)
+
+    f.seek(4)
+    if f.read(4) not in _MP4_TOP_LEVEL_BOXES:
+        return None
+
+    for box_type, body, end in boxes(read_file, 0, size):
+        if box_type != b"moov":
+            continue
+        if end - body > _MAX_MOOV_BYTES:
+            return None
+        f.seek(body)
+        moov = f.read(end - body)
+        for child_type, child_body, _ in boxes(lambda p, n: moov[p:p + n], 0, len(moov)):
+            if child_type != b"mvhd":
+                continue
+            if moov[child_body] == 1:
+                timescale, duration = struct.unpack(">IQ", moov[child_body + 20:child_body + 32])
+            else:
+                timescale, duration = struct.unpack(">II", moov[child_body + 12:child_body + 20])
+            # Fragmented files have no duration here
+            if not timescale or not duration:
+                return None
+            return MediaInfo(duration / timescale, source="mp4")
+        return None
+    return None
+
+
+def _probe_ffprobe(path: Path) -> MediaInfo:
+    """Get a file's duration from ffprobe."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=FFPROBE_TIMEOUT_SECONDS,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        raise MediaInfoError(f"ffprobe failed for {path}: {e}")
+
+    if result.returncode != 0:
+        raise MediaInfoError(f"ffprobe failed for {path}")
+    try:
+        return MediaInfo(float(result.stdout.strip()), source="ffprobe")
+    except ValueError:
+        raise MediaInfoError(f"ffprobe returned no duration for {path}")
+
+
+def read_headers(path: Path | str) -> Optional[MediaInfo]:
+    """Parse a file's container headers (None if the format isn't recognized)."""
+    path = Path(path)
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        for parser in (_parse_wav, _parse_mp4, _parse_mp3):
+            try:
+                info = parser(f, size)
+            except (struct.error, IndexError):
+                info = None
+            if info is not None:
+                return info
+    return None
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class MediaInfoCache:
+    """In-memory MediaInfo keyed by (path, size, mtime), least recently used first out."""
+
+    DEFAULT_MAX_ENTRIES = 4096
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, MediaInfo] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(path: Path, stat: os.stat_result) -> tuple:
+        """Cache key for a file: changes whenever the file is rewritten."""
+        return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    def get(self, key: tuple) -> Optional[MediaInfo]:
+        """Return the cached info for a key, or None on a miss."""
+        with self._lock:
+            info = self._entries.get(key)
+            if info is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return info
+
+    def put(self, key: tuple, info: MediaInfo) -> None:
+        """Store info under a key."""
+        with self._lock:
+            self._entries[key] = info
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every caller in the process
+MEDIA_INFO_CACHE = MediaInfoCache()
+
+
+def probe_media(path: Path | str, use_cache: bool = True) -> MediaInfo:
+    """Get a media file's duration (and audio format when the header has it).
+
+    Args:
+        path: Audio or video file
+        use_cache: Reuse the result for an unchanged file
+
+    Returns:
+        MediaInfo
+
+    Raises:
+        MediaInfoError: If neither the headers nor ffprobe give a duration
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        # Nothing to parse or cache; ffprobe may still handle it (e.g. a URL)
+        return _probe_ffprobe(path)
+
+    key = MediaInfoCache.make_key(path, stat)
+    if use_cache:
+        info = MEDIA_INFO_CACHE.get(key)
+        if info is not None:
+            return info
+
+    try:
+        info = read_headers(path)
+    except OSError as e:
+        raise MediaInfoError(f"Cannot read {path}: {e}")
+    if info is None:
+        info = _probe_ffprobe(path)
+
+    if use_cache:
+        MEDIA_INFO_CACHE.put(key, info)
+    return info
+
+
+def get_media_duration(path: Path | str, default: float = 0.0) -> float:
+    """Duration of a media file in seconds, or default if it can't be read."""
+    try:
+        return probe_media(path).duration_seconds
+    except MediaInfoError:
+        return default
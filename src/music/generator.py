@@ -4,6 +4,7 @@ Generates ambient/electronic background music appropriate for technical explaine
 Supports Apple Silicon (MPS), CUDA, and CPU backends.
 """
 
+import hashlib
 import os
 import json
 import subprocess
@@ -12,6 +13,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Literal
 
+from ..audio.ducking import DuckingEnvelope, DuckingRule, speech_spans_from_words
+from ..audio.loudness import MUSIC_TARGET_LUFS, normalize_loudness
+
 
 @dataclass
 class MusicConfig:
@@ -32,12 +36,17 @@ class MusicConfig:
     # Output format
     sample_rate: int = 32000
 
-    # Volume level (0.0 to 1.0) for final output
+    # Playback volume (0.0 to 1.0). The file itself is written at the music
+    # loudness target; this is recorded in the storyboard and applied by the
+    # player or mixdown, after any loudness correction
     volume: float = 0.3
 
     # Device: "auto", "mps", "cuda", "cpu"
     device: str = "auto"
 
+    # Ducking under narration (None = constant volume)
+    ducking: Optional[DuckingRule] = field(default_factory=DuckingRule)
+
 
 @dataclass
 class MusicGenerationResult:
@@ -308,6 +317,7 @@ class MusicGenerator:
         topic: str,
         target_duration: Optional[int] = None,
         custom_style: Optional[str] = None,
+        speech_spans: Optional[list[tuple[float, float]]] = None,
     ) -> MusicGenerationResult:
         """Generate background music for a video.
 
@@ -316,6 +326,8 @@ class MusicGenerator:
             topic: Video topic (used to determine music style)
             target_duration: Target duration in seconds (loops if needed)
             custom_style: Optional custom style prompt
+            speech_spans: (start, end) seconds when the narration speaks;
+                the music ducks under them per config.ducking
 
         Returns:
             MusicGenerationResult with generation details
@@ -390,9 +402,14 @@ class MusicGenerator:
                 fade_out = np.linspace(1, 0, fade_out_samples)
                 final_audio[-fade_out_samples:] *= fade_out
 
+            # Duck under the narration
+            gain = None
+            if speech_spans and self.config.ducking is not None:
+                gain = DuckingEnvelope(speech_spans, self.config.ducking, sr).gain(0, len(final_audio))
+
             # Save to file
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            self._save_audio(final_audio, sr, output_path)
+            self._save_audio(final_audio, sr, output_path, gain=gain)
 
             actual_duration = len(final_audio) / sr
 
@@ -411,21 +428,29 @@ class MusicGenerator:
                 prompt_used=prompt if 'prompt' in dir() else "",
             )
 
-    def _save_audio(self, audio: "np.ndarray", sample_rate: int, output_path: Path):
+    def _save_audio(
+        self,
+        audio: "np.ndarray",
+        sample_rate: int,
+        output_path: Path,
+        gain: Optional["np.ndarray"] = None,
+    ):
         """Save audio array to MP3 file.
 
         Args:
             audio: Audio samples as numpy array
             sample_rate: Sample rate in Hz
             output_path: Output file path
+            gain: Optional per-sample gain (e.g. ducking), applied after
+                normalization so it isn't normalized away
         """
         import scipy.io.wavfile as wavfile
 
-        # Normalize audio to prevent clipping
-        audio = audio / (np.abs(audio).max() + 1e-8)
+        # Normalize to the music loudness target, with true-peak headroom
+        audio = normalize_loudness(audio, sample_rate, MUSIC_TARGET_LUFS)
 
-        # Apply volume
-        audio = audio * self.config.volume
+        if gain is not None:
+            audio = audio * gain
 
         # Scale to int16 range
         audio_int16 = (audio * 32767).astype("int16")
@@ -465,6 +490,7 @@ def generate_for_project(
     topic: str,
     target_duration: Optional[int] = None,
     update_storyboard: bool = True,
+    duck: bool = True,
 ) -> MusicGenerationResult:
     """Generate background music for a project.
 
@@ -473,6 +499,12 @@ def generate_for_project(
         topic: Video topic for style selection
         target_duration: Target duration in seconds
         update_storyboard: Whether to update storyboard.json with music config
+        duck: Duck the music under the narration. The file itself stays at
+            constant volume: the rule is recorded as
+            `audio.background_music.ducking` in the storyboard and applied
+            at render time (under each scene's voiceover by the player, under
+            the spoken words by the mixdown), so it follows re-recorded
+            voiceovers and the music's looping.
 
     Returns:
         MusicGenerationResult
@@ -484,7 +516,8 @@ def generate_for_project(
     output_path = music_dir / "background.mp3"
 
     # Generate music
-    generator = MusicGenerator()
+    config = MusicConfig()
+    generator = MusicGenerator(config)
     result = generator.generate(
         output_path=output_path,
         topic=topic,
@@ -493,17 +526,51 @@ def generate_for_project(
 
     # Update storyboard if requested and generation succeeded
     if result.success and update_storyboard:
-        _update_storyboard_with_music(project_dir, output_path)
+        _update_storyboard_with_music(
+            project_dir,
+            output_path,
+            volume=config.volume,
+            ducking=config.ducking if duck else None,
+        )
 
     return result
 
 
-def _update_storyboard_with_music(project_dir: Path, music_path: Path):
+def speech_spans_signature(spans: list[tuple[float, float]]) -> str:
+    """Short hash identifying the narration timing music was ducked for."""
+    data = json.dumps([[round(start, 3), round(end, 3)] for start, end in spans])
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def _short_speech_spans(project_dir: Path, variant: str) -> list[tuple[float, float]]:
+    """When the narration speaks in a short (its voiceover starts at 0)."""
+    manifest_path = project_dir / "short" / variant / "voiceover" / "short_voiceover_manifest.json"
+    if not manifest_path.exists():
+        return []
+
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except json.JSONDecodeError as e:
+        print(f"Warning: Could not read narration timing: {e}")
+        return []
+
+    return speech_spans_from_words(manifest.get("word_timestamps", []))
+
+
+def _update_storyboard_with_music(
+    project_dir: Path,
+    music_path: Path,
+    volume: float = 0.3,
+    ducking: Optional[DuckingRule] = None,
+):
     """Update storyboard.json to include background music.
 
     Args:
         project_dir: Path to project directory
         music_path: Path to the generated music file
+        volume: Playback volume (0.0 to 1.0)
+        ducking: Ducking rule for the player and mixdown to apply (None = constant volume)
     """
     storyboard_path = project_dir / "storyboard" / "storyboard.json"
 
@@ -524,14 +591,18 @@ def _update_storyboard_with_music(project_dir: Path, music_path: Path):
 
         storyboard["audio"]["background_music"] = {
             "path": str(relative_path),
-            "volume": 0.3,
+            "volume": volume,
         }
+        if ducking is not None:
+            storyboard["audio"]["background_music"]["ducking"] = ducking.to_dict()
 
         # Save updated storyboard
         with open(storyboard_path, "w") as f:
             json.dump(storyboard, f, indent=2)
 
         print(f"Updated storyboard with background music config")
+        if ducking is not None:
+            print("Music ducks under the narration when rendered")
 
     except (json.JSONDecodeError, KeyError) as e:
         print(f"Warning: Could not update storyboard: {e}")
@@ -544,6 +615,7 @@ def generate_for_short(
     target_duration: Optional[int] = None,
     custom_style: Optional[str] = None,
     update_storyboard: bool = True,
+    duck: bool = True,
 ) -> MusicGenerationResult:
     """Generate punchy background music for a YouTube Short.
 
@@ -557,6 +629,10 @@ def generate_for_short(
         target_duration: Target duration in seconds (reads from storyboard if not provided)
         custom_style: Optional custom style override
         update_storyboard: Whether to update shorts_storyboard.json with music config
+        duck: Duck the music under the narration. Shorts have no mixdown, so
+            the ducking is written into the file and the narration timing it
+            was made for is recorded as `audio.background_music.ducked_for`
+            (see short_music_is_stale).
 
     Returns:
         MusicGenerationResult
@@ -611,27 +687,66 @@ def generate_for_short(
 
     # Generate music
     generator = MusicGenerator(config)
+    speech_spans = _short_speech_spans(project_dir, variant) if duck else None
     result = generator.generate(
         output_path=output_path,
         topic=topic,
         target_duration=target_duration,
         custom_style=prompt,
+        speech_spans=speech_spans,
     )
 
     # Update storyboard if requested and generation succeeded
     if result.success and update_storyboard:
-        _update_shorts_storyboard_with_music(project_dir, variant, output_path)
+        _update_shorts_storyboard_with_music(
+            project_dir, variant, output_path, volume=config.volume, speech_spans=speech_spans
+        )
 
     return result
 
 
-def _update_shorts_storyboard_with_music(project_dir: Path, variant: str, music_path: Path):
+def short_music_is_stale(project_dir: Path, variant: str = "default") -> bool:
+    """Whether a short's music was ducked for narration that has since changed.
+
+    Args:
+        project_dir: Path to project directory
+        variant: Short variant name
+
+    Returns:
+        True if the music file has ducking baked in for different timing
+        than the short's current voiceover
+    """
+    storyboard_path = project_dir / "short" / variant / "storyboard" / "shorts_storyboard.json"
+    if not storyboard_path.exists():
+        return False
+
+    try:
+        with open(storyboard_path) as f:
+            storyboard = json.load(f)
+    except json.JSONDecodeError:
+        return False
+
+    ducked_for = storyboard.get("audio", {}).get("background_music", {}).get("ducked_for")
+    if not ducked_for:
+        return False
+    return ducked_for != speech_spans_signature(_short_speech_spans(project_dir, variant))
+
+
+def _update_shorts_storyboard_with_music(
+    project_dir: Path,
+    variant: str,
+    music_path: Path,
+    volume: float = 0.35,
+    speech_spans: Optional[list[tuple[float, float]]] = None,
+):
     """Update shorts_storyboard.json to include background music.
 
     Args:
         project_dir: Path to project directory
         variant: Short variant name
         music_path: Path to the generated music file
+        volume: Playback volume (0.0 to 1.0)
+        speech_spans: Narration spans the music was ducked under (None = not ducked)
     """
     storyboard_path = project_dir / "short" / variant / "storyboard" / "shorts_storyboard.json"
 
@@ -652,8 +767,12 @@ def _update_shorts_storyboard_with_music(project_dir: Path, variant: str, music_
 
         storyboard["audio"]["background_music"] = {
             "path": str(relative_path),
-            "volume": 0.35,
+            "volume": volume,
         }
+        if speech_spans:
+            storyboard["audio"]["background_music"]["ducked_for"] = speech_spans_signature(
+                speech_spans
+            )
 
         # Save updated storyboard
         with open(storyboard_path, "w") as f:
@@ -0,0 +1,256 @@
+"""Incremental DAG runner for project pipeline stages.
+
+Each stage declares the stages it depends on, the files it reads and a check
+for whether its outputs exist. After a stage succeeds, the content hashes of
+its inputs are recorded in a run ledger. On the next run, a stage whose
+outputs exist and whose inputs hash the same is skipped. A stage that is
+re-run rewrites its outputs, which changes the inputs of its dependents, so
+only the affected part of the graph is regenerated.
+
+Stages whose dependencies have all finished run concurrently.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+
+@dataclass
+class Stage:
+    """A pipeline stage in the DAG.
+
+    Attributes:
+        name: Stage name (e.g. "script")
+        run: Executes the stage; returns a process exit code (0 = success)
+        deps: Names of stages that must finish before this one
+        inputs: Files or directories whose contents determine the outputs
+        outputs_exist: Whether the stage's outputs are present on disk
+        params: Extra settings that affect the outputs (e.g. resolution)
+    """
+
+    name: str
+    run: Callable[[], int]
+    deps: list[str] = field(default_factory=list)
+    inputs: list[Path] = field(default_factory=list)
+    outputs_exist: Callable[[], bool] = lambda: False
+    params: dict = field(default_factory=dict)
+
+
+def hash_inputs(paths: list[Path], root: Path, params: dict | None = None) -> str:
+    """Hash the contents of files and directories (recursively).
+
+    Missing paths hash as absent, so creating one changes the hash.
+
+    Args:
+        paths: Files or directories to hash
+        root: Directory that paths are reported relative to
+        params: Extra settings folded into the hash
+
+    Returns:
+        Hex digest over the paths' names and contents
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files = sorted(p for p in path.rglob("*") if p.is_file())
+        elif path.is_file():
+            files = [path]
+        else:
+            digest.update(f"missing:{_relative(path, root)}\0".encode())
+            continue
+
+        for file in files:
+            digest.update(f"file:{_relative(file, root)}\0".encode())
+            with open(file, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return str(path.relative_to(root))
+    except ValueError:
+        return str(path)
+
+
+class RunLedger:
+    """Per-project record of the input hash each stage last completed with."""
+
+    def __init__(self, path: Path):
+        """Initialize the ledger.
+
+        Args:
+            path: JSON file holding the ledger (created on first record)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f).get("stages", {})
+            except (json.JSONDecodeError, OSError, AttributeError):
+                self._entries = {}
+
+    def get(self, stage: str) -> str | None:
+        """Input hash recorded for a stage, or None if never recorded."""
+        with self._lock:
+            entry = self._entries.get(stage)
+            return entry.get("input_hash") if entry else None
+
+    def record(self, stage: str, input_hash: str) -> None:
+        """Record that a stage is up to date with the given input hash."""
+        with self._lock:
+            self._entries[stage] = {
+                "input_hash": input_hash,
+                "completed_at": datetime.now().isoformat(),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"stages": self._entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+@dataclass
+class DAGRunResult:
+    """Outcome of a DAG run."""
+
+    returncode: int = 0
+    ran: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0
+
+
+class DAGRunner:
+    """Runs stages in dependency order, skipping stages that are up to date."""
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        ledger: RunLedger,
+        root: Path,
+        force: bool = False,
+        max_workers: int = 2,
+        on_decision: Callable[[Stage, str], None] | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            stages: Stages to run; dependencies on stages not in this list
+                are treated as already satisfied
+            ledger: Ledger of previously recorded input hashes
+            root: Project directory (input paths are recorded relative to it)
+            force: Run every stage regardless of the ledger
+            max_workers: Maximum number of stages running at once
+            on_decision: Called with (stage, reason) before a stage runs or
+                is skipped. Reasons: "forced", "missing", "changed",
+                "up_to_date", "adopted".
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = [stage.name for stage in stages]
+        self.ledger = ledger
+        self.root = Path(root)
+        self.force = force
+        self.max_workers = max(1, max_workers)
+        self.on_decision = on_decision
+
+    def decide(self, stage: Stage) -> tuple[bool, str, str]:
+        """Decide whether a stage must run.
+
+        A stage with outputs but no ledger entry (produced before the ledger
+        existed, or by running the step command directly) is adopted as up
+        to date rather than regenerated.
+
+        Returns:
+            (should_run, reason, input_hash)
+        """
+        input_hash = hash_inputs(stage.inputs, self.root, stage.params)
+        if self.force:
+            return True, "forced", input_hash
+        if not stage.outputs_exist():
+            return True, "missing", input_hash
+
+        recorded = self.ledger.get(stage.name)
+        if recorded is None:
+            self.ledger.record(stage.name, input_hash)
+            return False, "adopted", input_hash
+        if recorded != input_hash:
+            return True, "changed", input_hash
+        return False, "up_to_date", input_hash
+
+    def run(self) -> DAGRunResult:
+        """Run all stages, concurrently where dependencies allow.
+
+        Stops scheduling new stages after the first failure and waits for
+        stages already running.
+
+        Returns:
+            DAGRunResult describing what ran, what was skipped and any failure
+        """
+        result = DAGRunResult()
+        done: set[str] = set()
+        pending = list(self.order)
+        running: dict[Future, tuple[Stage, str]] = {}
+
+        def ready(name: str) -> bool:
+            return all(dep in done or dep not in self.stages for dep in self.stages[name].deps)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if result.failed is None:
+                    for name in [n for n in pending if ready(n)]:
+                        pending.remove(name)
+                        stage = self.stages[name]
+                        should_run, reason, input_hash = self.decide(stage)
+                        if self.on_decision:
+                            self.on_decision(stage, reason)
+                        if not should_run:
+                            result.skipped.append(name)
+                            done.add(name)
+                            continue
+                        running[executor.submit(stage.run)] = (stage, input_hash)
+                else:
+                    pending.clear()
+
+                if not running:
+                    # Skipping a stage may have unblocked others; stop only
+                    # when nothing left can ever become ready
+                    if pending and not any(ready(n) for n in pending):
+                        break
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, input_hash = running.pop(future)
+                    try:
+                        code = future.result()
+                    except Exception as e:
+                        print(f"Error in {stage.name}: {e}")
+                        code = 1
+                    if code != 0:
+                        if result.failed is None:
+                            result.failed = stage.name
+                            result.returncode = code
+                        continue
+                    self.ledger.record(stage.name, input_hash)
+                    result.ran.append(stage.name)
+                    done.add(stage.name)
+
+        return result
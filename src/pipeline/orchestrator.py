@@ -14,10 +14,11 @@ from ..animation.renderer import (
     RenderResult,
     get_renderer,
 )
-from ..audio.tts import get_tts_provider
+from ..audio.tts import TTSRequest, get_tts_provider
 from ..composition.composer import CompositionResult, VideoComposer
 from ..config import Config, load_config
 from ..ingestion import parse_document
+from ..media_info import get_media_duration
 from ..models import ParsedDocument, Script, ContentAnalysis
 from ..script import ScriptGenerator
 from ..understanding import ContentAnalyzer
@@ -96,20 +97,8 @@ class VideoPipeline:
             self._progress_callback(stage, progress)
 
     def _get_video_duration(self, video_path: Path) -> float:
-        """Get duration of a video file."""
-        cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path),
-        ]
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return float(result.stdout.strip())
-        except (ValueError, subprocess.SubprocessError):
-            pass
-        return 0.0
+        """Get the duration of a video file."""
+        return get_media_duration(video_path)
 
     def generate_from_document(
         self,
@@ -163,13 +152,7 @@ class VideoPipeline:
             audio_dir = self.output_dir / "audio" / project_name
             audio_dir.mkdir(parents=True, exist_ok=True)
 
-            audio_files = []
-            for i, scene in enumerate(script.scenes):
-                audio_path = audio_dir / f"{scene.scene_id}.mp3"
-                self.tts.generate(scene.voiceover, audio_path)
-                audio_files.append(audio_path)
-                progress = (i + 1) / len(script.scenes) * 100
-                self._report_progress("audio", progress)
+            audio_files = self._generate_audio(script, audio_dir)
 
             stages_completed.append("audio")
 
@@ -264,13 +247,7 @@ class VideoPipeline:
             audio_dir = self.output_dir / "audio" / project_name
             audio_dir.mkdir(parents=True, exist_ok=True)
 
-            audio_files = []
-            for i, scene in enumerate(script.scenes):
-                audio_path = audio_dir / f"{scene.scene_id}.mp3"
-                self.tts.generate(scene.voiceover, audio_path)
-                audio_files.append(audio_path)
-                progress = (i + 1) / len(script.scenes) * 100
-                self._report_progress("audio", progress)
+            audio_files = self._generate_audio(script, audio_dir)
 
             stages_completed.append("audio")
 
@@ -332,6 +309,29 @@ class VideoPipeline:
                 error_message=str(e),
             )
 
+    def _generate_audio(self, script: Script, audio_dir: Path) -> list[Path]:
+        """Synthesize every scene's voiceover concurrently, in script order."""
+        requests = [
+            TTSRequest(
+                text=scene.voiceover,
+                output_path=audio_dir / f"{scene.scene_id}.mp3",
+                scene_id=scene.scene_id,
+            )
+            for scene in script.scenes
+        ]
+        completed = 0
+
+        def on_result(idx: int, outcome) -> None:
+            nonlocal completed
+            completed += 1
+            self._report_progress("audio", completed / len(requests) * 100)
+
+        outcomes = self.tts.generate_batch_with_timestamps(requests, on_result=on_result)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+        return [result.audio_path for result in outcomes]
+
     def _combine_audio_files(self, audio_files: list[Path], output_path: Path) -> None:
         """Combine multiple audio files into one using FFmpeg."""
         if not audio_files:
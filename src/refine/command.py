@@ -25,7 +25,7 @@ from .models import (
     UpdateVisualCuePatch,
 )
 from .validation import validate_project_sync, ProjectValidator
-from .visual import VisualInspector, ClaudeCodeVisualInspector
+from .visual import BrowserPool, VisualInspector, ClaudeCodeVisualInspector
 from .script import ScriptAnalyzer, ScriptRefiner
 from .visual_cue import VisualCueRefiner
 
@@ -186,7 +186,11 @@ def _run_script_phase(project: Project, args: argparse.Namespace) -> int:
 
     verbose = not getattr(args, "quiet", False)
     batch_approve = getattr(args, "batch_approve", False)
-    refiner = ScriptRefiner(project=project, verbose=verbose)
+    refiner = ScriptRefiner(
+        project=project,
+        verbose=verbose,
+        max_workers=getattr(args, "concurrency", None),
+    )
 
     # Run analysis to get all patches (Phase 1 patches + storytelling patches)
     all_patches, narration_result = refiner.refine()
@@ -236,6 +240,8 @@ def _print_narration_analysis(result: NarrationRefinementResult) -> None:
     print(f"\n   Overall Storytelling Score: {result.overall_storytelling_score:.1f}/10")
     print(f"   Total Issues Found: {result.total_issues_found}")
     print(f"   Scenes Needing Revision: {len(result.scenes_needing_revision)}")
+    if result.failed_scenes:
+        print(f"   ⚠️  Analysis Failed For: {', '.join(result.failed_scenes)} (partial results)")
 
     for analysis in result.scene_analyses:
         status = "⚠️" if analysis.needs_revision else "✅"
@@ -401,6 +407,8 @@ def _run_visual_phase(project: Project, args: argparse.Namespace) -> int:
             project=project,
             screenshots_dir=screenshots_dir,
             verbose=verbose,
+            capture_backend=getattr(args, "capture_backend", None) or "studio",
+            capture_pages=getattr(args, "capture_pages", None) or BrowserPool.DEFAULT_SIZE,
         )
     else:
         # Default: use Claude Code with --chrome for browser-based inspection
@@ -417,22 +425,26 @@ def _run_visual_phase(project: Project, args: argparse.Namespace) -> int:
     # Collect results
     results: list = []
 
-    if scene_index is not None:
-        # Refine specific scene (convert to 0-based index)
-        idx = scene_index - 1
-        if idx < 0 or idx >= total_scenes:
-            print(f"\n   ❌ Invalid scene number {scene_index}. Valid range: 1-{total_scenes}")
-            return 1
+    try:
+        if scene_index is not None:
+            # Refine specific scene (convert to 0-based index)
+            idx = scene_index - 1
+            if idx < 0 or idx >= total_scenes:
+                print(f"\n   ❌ Invalid scene number {scene_index}. Valid range: 1-{total_scenes}")
+                return 1
 
-        print(f"\n   Refining scene {scene_index} of {total_scenes}...")
-        result = inspector.refine_scene(idx)
-        results.append(result)
-    else:
-        # Refine all scenes
-        print(f"\n   Refining all {total_scenes} scenes...")
-        for idx in range(total_scenes):
+            print(f"\n   Refining scene {scene_index} of {total_scenes}...")
             result = inspector.refine_scene(idx)
             results.append(result)
+        else:
+            # Refine all scenes
+            print(f"\n   Refining all {total_scenes} scenes...")
+            for idx in range(total_scenes):
+                result = inspector.refine_scene(idx)
+                results.append(result)
+    finally:
+        if use_legacy:
+            inspector.close()  # Shared browser kept open across scenes
 
     # Print summary
     _print_refinement_summary(results)
@@ -756,6 +768,20 @@ Example usage:
         help="Use legacy Playwright-based screenshot capture instead of Claude Code with browser",
     )
 
+    refine_parser.add_argument(
+        "--capture-backend",
+        choices=["studio", "still"],
+        default="studio",
+        help="Frame capture for --legacy: drive Remotion Studio (studio) or render stills directly (still)",
+    )
+
+    refine_parser.add_argument(
+        "--capture-pages",
+        type=int,
+        default=None,
+        help="Frames captured in parallel for --legacy (default: 4)",
+    )
+
     refine_parser.add_argument(
         "--live",
         action="store_true",
@@ -774,6 +800,13 @@ Example usage:
         help="Apply patches to script.json (for --phase visual-cue)",
     )
 
+    refine_parser.add_argument(
+        "--concurrency", "-j",
+        type=int,
+        default=None,
+        help="Number of scenes to analyze in parallel (for --phase script, default: 4, 1 = sequential)",
+    )
+
     # Sync phase arguments
     refine_parser.add_argument(
         "--full",
@@ -919,6 +919,7 @@ class NarrationRefinementResult:
     overall_storytelling_score: float = 0.0
     total_issues_found: int = 0
     revisions_applied: int = 0
+    failed_scenes: list[str] = field(default_factory=list)  # Scenes whose analysis failed
 
     @property
     def scenes_needing_revision(self) -> list[str]:
@@ -941,6 +942,7 @@ class NarrationRefinementResult:
             "overall_storytelling_score": self.overall_storytelling_score,
             "total_issues_found": self.total_issues_found,
             "revisions_applied": self.revisions_applied,
+            "failed_scenes": self.failed_scenes,
             "scenes_needing_revision": self.scenes_needing_revision,
             "high_priority_scenes": self.high_priority_scenes,
         }
@@ -956,4 +958,5 @@ class NarrationRefinementResult:
             overall_storytelling_score=data.get("overall_storytelling_score", 0.0),
             total_issues_found=data.get("total_issues_found", 0),
             revisions_applied=data.get("revisions_applied", 0),
+            failed_scenes=data.get("failed_scenes", []),
         )
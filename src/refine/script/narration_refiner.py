@@ -8,8 +8,10 @@ This module:
 4. Applies approved patches to script.json and narrations.json
 """
 
+import contextvars
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -122,11 +124,14 @@ If no revision is needed, set "patch" to null.
 class ScriptRefiner:
     """Applies patches to refine scripts and narrations."""
 
+    DEFAULT_MAX_WORKERS = 4  # Scenes analyzed in parallel by refine
+
     def __init__(
         self,
         project: Project,
         llm_provider: Optional[LLMProvider] = None,
         verbose: bool = True,
+        max_workers: int | None = None,
     ):
         """Initialize the script refiner.
 
@@ -134,9 +139,12 @@ class ScriptRefiner:
             project: The project to refine
             llm_provider: LLM provider to use (defaults to ClaudeCodeLLMProvider)
             verbose: Whether to print progress messages
+            max_workers: Number of scenes to analyze concurrently
+                (default: DEFAULT_MAX_WORKERS, 1 = sequential)
         """
         self.project = project
         self.verbose = verbose
+        self.max_workers = max(1, max_workers or self.DEFAULT_MAX_WORKERS)
 
         # Use ClaudeCodeLLMProvider by default
         if llm_provider is None:
@@ -243,33 +251,62 @@ class ScriptRefiner:
 
         self._log(f"Analyzing {len(scenes)} scenes for storytelling improvements...")
 
-        # Step 3: Analyze each scene and generate storytelling patches
+        # Step 3: Analyze each scene and generate storytelling patches.
+        # Each analysis only needs its scene, the neighbours' narration and
+        # the shared gap context, so scenes are independent LLM round trips;
+        # fan them out and slot outcomes back by index to keep scene order.
+        contexts = [
+            (
+                self._get_scene_ending(scenes[i - 1] if i > 0 else None),
+                self._get_scene_start(scenes[i + 1] if i < len(scenes) - 1 else None),
+            )
+            for i in range(len(scenes))
+        ]
+
+        def analyze_one(idx: int) -> tuple[SceneNarrationAnalysis, Optional[ScriptPatch], bool]:
+            scene = scenes[idx]
+            prev_ending, next_start = contexts[idx]
+            self._log(f"Analyzing scene {idx + 1}/{len(scenes)}: {scene.get('title', 'Unknown')}")
+            try:
+                analysis, patch = self._request_scene_analysis(
+                    scene=scene,
+                    prev_ending=prev_ending,
+                    next_start=next_start,
+                    gap_context=gap_context,
+                )
+                return analysis, patch, False
+            except Exception as e:
+                self._log(f"Error analyzing scene {scene.get('scene_id', 'unknown')}: {e}")
+                return self._failed_scene_analysis(scene, e), None, True
+
+        outcomes: list = [None] * len(scenes)
+        workers = min(self.max_workers, len(scenes))
+        if workers <= 1:
+            outcomes = [analyze_one(idx) for idx in range(len(scenes))]
+        else:
+            self._log(f"Analyzing with {workers} workers...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(contextvars.copy_context().run, analyze_one, idx): idx for idx in range(len(scenes))}
+                for future in as_completed(futures):
+                    outcomes[futures[future]] = future.result()
+
         scene_analyses = []
         storytelling_patches: list[ScriptPatch] = []
+        failed_scenes: list[str] = []
         total_issues = 0
-
-        for i, scene in enumerate(scenes):
-            prev_ending = self._get_scene_ending(scenes[i - 1] if i > 0 else None)
-            next_start = self._get_scene_start(scenes[i + 1] if i < len(scenes) - 1 else None)
-
-            self._log(f"Analyzing scene {i + 1}/{len(scenes)}: {scene.get('title', 'Unknown')}")
-
-            analysis, patch = self._analyze_scene(
-                scene=scene,
-                prev_ending=prev_ending,
-                next_start=next_start,
-                gap_context=gap_context,
-            )
-
+        for analysis, patch, failed in outcomes:
             scene_analyses.append(analysis)
+            if failed:
+                failed_scenes.append(str(analysis.scene_id))
+                continue
             total_issues += len(analysis.issues)
-
             if patch:
                 storytelling_patches.append(patch)
 
-        # Calculate overall score
-        if scene_analyses:
-            overall_score = sum(s.scores.overall for s in scene_analyses) / len(scene_analyses)
+        # Calculate overall score from the scenes that were actually analyzed
+        analyzed = [a for a, _, failed in outcomes if not failed]
+        if analyzed:
+            overall_score = sum(s.scores.overall for s in analyzed) / len(analyzed)
         else:
             overall_score = 0.0
 
@@ -278,8 +315,15 @@ class ScriptRefiner:
             scene_analyses=scene_analyses,
             overall_storytelling_score=overall_score,
             total_issues_found=total_issues,
+            failed_scenes=failed_scenes,
         )
 
+        if failed_scenes:
+            self._log(
+                f"Partial results: {len(failed_scenes)}/{len(scenes)} scene analyses failed "
+                f"({', '.join(failed_scenes)})"
+            )
+
         # Combine all patches
         all_patches = phase1_patches + storytelling_patches
 
@@ -364,6 +408,31 @@ class ScriptRefiner:
     ) -> tuple[SceneNarrationAnalysis, Optional[ScriptPatch]]:
         """Analyze a single scene's narration and generate patch if needed.
 
+        Args:
+            scene: Scene dictionary
+            prev_ending: End of previous scene's narration
+            next_start: Start of next scene's narration
+            gap_context: Context from gap analysis
+
+        Returns:
+            Tuple of (SceneNarrationAnalysis, optional ModifyScenePatch). If the
+            analysis fails, a placeholder analysis describing the failure.
+        """
+        try:
+            return self._request_scene_analysis(scene, prev_ending, next_start, gap_context)
+        except Exception as e:
+            self._log(f"Error analyzing scene {scene.get('scene_id', 'unknown')}: {e}")
+            return self._failed_scene_analysis(scene, e), None
+
+    def _request_scene_analysis(
+        self,
+        scene: dict,
+        prev_ending: str,
+        next_start: str,
+        gap_context: str,
+    ) -> tuple[SceneNarrationAnalysis, Optional[ScriptPatch]]:
+        """Ask the LLM to analyze one scene's narration.
+
         Args:
             scene: Scene dictionary
             prev_ending: End of previous scene's narration
@@ -372,6 +441,9 @@ class ScriptRefiner:
 
         Returns:
             Tuple of (SceneNarrationAnalysis, optional ModifyScenePatch)
+
+        Raises:
+            Exception: If the LLM call fails or returns an unusable response
         """
         scene_id = scene.get("scene_id", "unknown")
         scene_title = scene.get("title", "Unknown")
@@ -393,90 +465,91 @@ class ScriptRefiner:
             principles=format_principles_for_prompt(),
         )
 
-        try:
-            response = self.llm.generate_json(
-                prompt=prompt,
-                system_prompt=NARRATION_ANALYSIS_SYSTEM_PROMPT,
-            )
-
-            # Parse scores
-            scores_data = response.get("scores", {})
-            scores = NarrationScores(
-                hook=scores_data.get("hook", 5.0),
-                flow=scores_data.get("flow", 5.0),
-                tension=scores_data.get("tension", 5.0),
-                insight=scores_data.get("insight", 5.0),
-                engagement=scores_data.get("engagement", 5.0),
-                accuracy=scores_data.get("accuracy", 5.0),
-                length=scores_data.get("length", 5.0),
-                specificity=scores_data.get("specificity", 5.0),
-                mechanism=scores_data.get("mechanism", 5.0),
-            )
+        response = self.llm.generate_json(
+            prompt=prompt,
+            system_prompt=NARRATION_ANALYSIS_SYSTEM_PROMPT,
+        )
 
-            # Parse issues
-            issues = []
-            for issue_data in response.get("issues", []):
-                try:
-                    issue_type = NarrationIssueType(issue_data.get("issue_type", "other"))
-                except ValueError:
-                    issue_type = NarrationIssueType.OTHER
-
-                issues.append(
-                    NarrationIssue(
-                        scene_id=scene_id,
-                        issue_type=issue_type,
-                        description=issue_data.get("description", ""),
-                        current_text=issue_data.get("current_text", ""),
-                        severity=issue_data.get("severity", "medium"),
-                        suggested_fix=issue_data.get("suggested_fix"),
-                    )
-                )
+        # Parse scores
+        scores_data = response.get("scores", {})
+        scores = NarrationScores(
+            hook=scores_data.get("hook", 5.0),
+            flow=scores_data.get("flow", 5.0),
+            tension=scores_data.get("tension", 5.0),
+            insight=scores_data.get("insight", 5.0),
+            engagement=scores_data.get("engagement", 5.0),
+            accuracy=scores_data.get("accuracy", 5.0),
+            length=scores_data.get("length", 5.0),
+            specificity=scores_data.get("specificity", 5.0),
+            mechanism=scores_data.get("mechanism", 5.0),
+        )
 
-            # Parse patch
-            patch = None
-            patch_data = response.get("patch")
-            if patch_data and patch_data.get("patch_type") == "modify_scene":
-                patch = ModifyScenePatch(
-                    reason=patch_data.get("reason", "Storytelling improvement"),
-                    priority=patch_data.get("priority", "medium"),
-                    scene_id=patch_data.get("scene_id", scene_id),
-                    field_name=patch_data.get("field_name", "narration"),
-                    old_value=patch_data.get("old_value", narration),
-                    new_value=patch_data.get("new_value", ""),
+        # Parse issues
+        issues = []
+        for issue_data in response.get("issues", []):
+            try:
+                issue_type = NarrationIssueType(issue_data.get("issue_type", "other"))
+            except ValueError:
+                issue_type = NarrationIssueType.OTHER
+
+            issues.append(
+                NarrationIssue(
+                    scene_id=scene_id,
+                    issue_type=issue_type,
+                    description=issue_data.get("description", ""),
+                    current_text=issue_data.get("current_text", ""),
+                    severity=issue_data.get("severity", "medium"),
+                    suggested_fix=issue_data.get("suggested_fix"),
                 )
+            )
 
-            analysis = SceneNarrationAnalysis(
-                scene_id=scene_id,
-                scene_title=scene_title,
-                current_narration=narration,
-                duration_seconds=duration,
-                word_count=word_count,
-                scores=scores,
-                issues=issues,
-                suggested_revision=patch.new_value if patch else None,
+        # Parse patch
+        patch = None
+        patch_data = response.get("patch")
+        if patch_data and patch_data.get("patch_type") == "modify_scene":
+            patch = ModifyScenePatch(
+                reason=patch_data.get("reason", "Storytelling improvement"),
+                priority=patch_data.get("priority", "medium"),
+                scene_id=patch_data.get("scene_id", scene_id),
+                field_name=patch_data.get("field_name", "narration"),
+                old_value=patch_data.get("old_value", narration),
+                new_value=patch_data.get("new_value", ""),
             )
 
-            return analysis, patch
+        analysis = SceneNarrationAnalysis(
+            scene_id=scene_id,
+            scene_title=scene_title,
+            current_narration=narration,
+            duration_seconds=duration,
+            word_count=word_count,
+            scores=scores,
+            issues=issues,
+            suggested_revision=patch.new_value if patch else None,
+        )
 
-        except Exception as e:
-            self._log(f"Error analyzing scene {scene_id}: {e}")
-            return SceneNarrationAnalysis(
-                scene_id=scene_id,
-                scene_title=scene_title,
-                current_narration=narration,
-                duration_seconds=duration,
-                word_count=word_count,
-                scores=NarrationScores(),
-                issues=[
-                    NarrationIssue(
-                        scene_id=scene_id,
-                        issue_type=NarrationIssueType.OTHER,
-                        description=f"Analysis failed: {e}",
-                        current_text="",
-                        severity="low",
-                    )
-                ],
-            ), None
+        return analysis, patch
+
+    def _failed_scene_analysis(self, scene: dict, error: Exception) -> SceneNarrationAnalysis:
+        """Placeholder analysis for a scene whose analysis failed."""
+        scene_id = scene.get("scene_id", "unknown")
+        narration = scene.get("narration", scene.get("voiceover", ""))
+        return SceneNarrationAnalysis(
+            scene_id=scene_id,
+            scene_title=scene.get("title", "Unknown"),
+            current_narration=narration,
+            duration_seconds=scene.get("duration_seconds", 30),
+            word_count=len(narration.split()),
+            scores=NarrationScores(),
+            issues=[
+                NarrationIssue(
+                    scene_id=scene_id,
+                    issue_type=NarrationIssueType.OTHER,
+                    description=f"Analysis failed: {error}",
+                    current_text="",
+                    severity="low",
+                )
+            ],
+        )
 
     def apply_patch(self, patch: ScriptPatch) -> bool:
         """Apply a single patch to script.json and/or narrations.json.
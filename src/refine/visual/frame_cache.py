@@ -0,0 +1,208 @@
+"""
+Perceptual-hash cache of analyzed beat frames.
+
+Each captured beat screenshot is reduced to a 64-bit difference hash (dHash):
+the frame is shrunk to 9x8 grayscale and each bit records whether a pixel is
+brighter than its right neighbour. A re-capture of a visually unchanged frame
+hashes identically, or within a few bits of antialiasing noise, so the
+analysis stored for a (scene, beat, frame) can be reused instead of sending
+the screenshot to the LLM again.
+
+Hashes are kept rather than image paths because each capture pass overwrites
+the previous pass's screenshot files.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = None
+
+from ..models import Beat, Issue
+from .screenshot import CapturedScreenshot
+
+HASH_SIZE = 8  # 8x8 comparisons -> 64-bit hash
+
+
+def dhash(image_path: Path, hash_size: int = HASH_SIZE) -> Optional[int]:
+    """
+    Compute the difference hash of an image.
+
+    Args:
+        image_path: Image file to hash.
+        hash_size: Hash is hash_size x hash_size bits.
+
+    Returns:
+        The hash as an integer, or None if the image can't be read.
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    try:
+        with Image.open(image_path) as img:
+            small = img.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+            pixels = small.tobytes()  # One byte per pixel in mode "L"
+    except (OSError, ValueError):
+        return None
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | int(pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class CachedFrame:
+    """The analysis of one beat frame, keyed by its perceptual hash."""
+
+    frame_hash: int
+    beat_text: str
+    issues: list[Issue] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "frame_hash": f"{self.frame_hash:016x}",
+            "beat_text": self.beat_text,
+            "issues": [i.to_dict() for i in self.issues],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachedFrame":
+        return cls(
+            frame_hash=int(data["frame_hash"], 16),
+            beat_text=data.get("beat_text", ""),
+            issues=[Issue.from_dict(i) for i in data.get("issues", [])],
+        )
+
+
+class FrameCache:
+    """Analyses of beat frames, reused while a frame looks the same."""
+
+    FILENAME = "frame_hashes.json"
+    DEFAULT_THRESHOLD = 4  # Max differing bits (of 64) for "unchanged"
+
+    def __init__(self, path: Optional[Path] = None, threshold: int = DEFAULT_THRESHOLD):
+        """
+        Initialize the frame cache.
+
+        Args:
+            path: JSON file to load from and save to. If None, the cache
+                lives in memory only.
+            threshold: Maximum Hamming distance for two frames to count as
+                the same.
+        """
+        self.path = Path(path) if path else None
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self._frames: dict[str, CachedFrame] = {}
+        self._hashes: dict[tuple[str, int], Optional[int]] = {}
+
+        if self.path and self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                self._frames = {
+                    key: CachedFrame.from_dict(entry) for key, entry in data.get("frames", {}).items()
+                }
+            except (json.JSONDecodeError, KeyError, ValueError):
+                self._frames = {}
+
+    @staticmethod
+    def key(scene_id: str, beat_index: int, frame_number: int) -> str:
+        return f"{scene_id}:{beat_index}:{frame_number}"
+
+    def frame_hash(self, screenshot: CapturedScreenshot) -> Optional[int]:
+        """Perceptual hash of a screenshot (computed once per file version)."""
+        try:
+            stamp = (str(screenshot.path), screenshot.path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        if stamp not in self._hashes:
+            self._hashes[stamp] = dhash(screenshot.path)
+        return self._hashes[stamp]
+
+    def is_unchanged(self, scene_id: str, beat: Beat, screenshot: CapturedScreenshot) -> bool:
+        """Whether a frame looks the same as when it was last analyzed."""
+        cached = self._frames.get(self.key(scene_id, beat.index, screenshot.expected_frame))
+        current = self.frame_hash(screenshot)
+        if cached is None or current is None:
+            return False
+        return hamming_distance(cached.frame_hash, current) <= self.threshold
+
+    def lookup(
+        self, scene_id: str, beat: Beat, screenshot: CapturedScreenshot
+    ) -> Optional[list[Issue]]:
+        """
+        Get the stored analysis of a frame if it is unchanged.
+
+        Args:
+            scene_id: Scene the beat belongs to.
+            beat: The beat the frame was captured for.
+            screenshot: The new capture of the frame.
+
+        Returns:
+            The issues found last time (pointing at the new screenshot), or
+            None if the frame or its narration changed.
+        """
+        cached = self._frames.get(self.key(scene_id, beat.index, screenshot.expected_frame))
+        if cached is None or cached.beat_text != beat.text or not self.is_unchanged(scene_id, beat, screenshot):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [
+            Issue(
+                beat_index=issue.beat_index,
+                principle_violated=issue.principle_violated,
+                description=issue.description,
+                severity=issue.severity,
+                screenshot_path=screenshot.path,
+            )
+            for issue in cached.issues
+        ]
+
+    def store(
+        self,
+        scene_id: str,
+        beat: Beat,
+        screenshot: CapturedScreenshot,
+        issues: list[Issue],
+    ) -> None:
+        """Remember the analysis of a frame (no-op if it can't be hashed)."""
+        current = self.frame_hash(screenshot)
+        if current is None:
+            return
+        self._frames[self.key(scene_id, beat.index, screenshot.expected_frame)] = CachedFrame(
+            frame_hash=current,
+            beat_text=beat.text,
+            issues=list(issues),
+        )
+
+    def save(self) -> None:
+        """Write the cache to its file, if it has one."""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(
+                    {"frames": {key: entry.to_dict() for key, entry in self._frames.items()}},
+                    f,
+                    indent=2,
+                )
+        except OSError:
+            pass  # Losing the cache only costs a re-analysis
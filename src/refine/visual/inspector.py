@@ -6,6 +6,7 @@ Uses Claude Code with --chrome flag for browser-based visual inspection.
 """
 
 import json
+import shutil
 import subprocess
 import tempfile
 import time
@@ -31,9 +32,12 @@ from ..models import (
 from ..principles import format_principles_for_prompt, GUIDING_PRINCIPLES
 from ..validation import ProjectValidator
 from .beat_parser import BeatParser, MockBeatParser
+from .frame_cache import FrameCache
 from .screenshot import (
+    BrowserPool,
     CapturedScreenshot,
     MockScreenshotCapture,
+    RemotionStillCapture,
     ScreenshotCapture,
     check_remotion_running,
     PLAYWRIGHT_AVAILABLE,
@@ -1021,14 +1025,22 @@ class VisualInspector:
     3. AI analysis against quality principles
     4. Fix generation and application
     5. Verification of improvements
+
+    With the "studio" capture backend, one browser and its Remotion Studio
+    pages are kept open across scenes; call close() when done.
     """
 
+    CAPTURE_BACKENDS = ("studio", "still")
+
     def __init__(
         self,
         project: Project,
         llm_provider: Optional[LLMProvider] = None,
         screenshots_dir: Optional[Path] = None,
         verbose: bool = True,
+        capture_backend: str = "studio",
+        capture_pages: int = BrowserPool.DEFAULT_SIZE,
+        use_frame_cache: bool = True,
     ):
         """
         Initialize the visual inspector.
@@ -1038,10 +1050,25 @@ class VisualInspector:
             llm_provider: LLM provider for AI analysis. If None, creates ClaudeCodeLLMProvider.
             screenshots_dir: Directory for screenshots. If None, uses temp directory.
             verbose: Whether to print progress messages.
+            capture_backend: "studio" to capture frames from Remotion Studio with
+                Playwright, or "still" to render them with Remotion's renderStill.
+            capture_pages: Frames captured in parallel (Studio pages, or
+                concurrent stills).
+            use_frame_cache: Reuse the analysis of beats whose frames look
+                unchanged since they were last analyzed (perceptual hash).
         """
+        if capture_backend not in self.CAPTURE_BACKENDS:
+            raise ValueError(
+                f"Unknown capture backend: {capture_backend} "
+                f"(expected one of {', '.join(self.CAPTURE_BACKENDS)})"
+            )
+
         self.project = project
         self.verbose = verbose
         self.validator = ProjectValidator(project)
+        self.capture_backend = capture_backend
+        self.capture_pages = max(1, capture_pages)
+        self._browser_pool: Optional[BrowserPool] = None
 
         # Set up screenshots directory
         if screenshots_dir:
@@ -1050,6 +1077,11 @@ class VisualInspector:
             self.screenshots_dir = Path(tempfile.mkdtemp(prefix="refine_screenshots_"))
         self.screenshots_dir.mkdir(parents=True, exist_ok=True)
 
+        # Persisted next to the screenshots so later passes reuse it
+        self.frame_cache: Optional[FrameCache] = (
+            FrameCache(self.screenshots_dir / FrameCache.FILENAME) if use_frame_cache else None
+        )
+
         # Set up LLM provider
         if llm_provider is None:
             config = LLMConfig(provider="claude-code", model="claude-sonnet-4-20250514")
@@ -1069,6 +1101,18 @@ class VisualInspector:
         if self.verbose:
             print(message)
 
+    def close(self) -> None:
+        """Close the shared browser, if one was started."""
+        if self._browser_pool is not None:
+            self._browser_pool.stop()
+            self._browser_pool = None
+
+    def _get_browser_pool(self) -> BrowserPool:
+        """Browser pool shared by every scene's captures."""
+        if self._browser_pool is None:
+            self._browser_pool = BrowserPool(size=self.capture_pages, headless=True)
+        return self._browser_pool
+
     def refine_scene(self, scene_index: int) -> SceneRefinementResult:
         """
         Refine a single scene through the full visual inspection process.
@@ -1222,18 +1266,31 @@ class VisualInspector:
         scene_index: int,
     ) -> list[CapturedScreenshot]:
         """Capture screenshots for all beats."""
+        if self.capture_backend == "still":
+            if shutil.which("node"):
+                capture = RemotionStillCapture(
+                    self.screenshots_dir,
+                    self.project.root_dir,
+                    fps=self.project.video.fps,
+                    concurrency=self.capture_pages,
+                )
+            else:
+                self._log("   ⚠️ Node.js not available. Using mock screenshots.")
+                capture = MockScreenshotCapture(self.screenshots_dir, self.project.video.fps)
         # Check if Remotion is running
-        if not check_remotion_running():
+        elif not check_remotion_running():
             self._log("   ⚠️ Remotion Studio not running. Using mock screenshots.")
             capture = MockScreenshotCapture(self.screenshots_dir, self.project.video.fps)
         elif not PLAYWRIGHT_AVAILABLE:
             self._log("   ⚠️ Playwright not available. Using mock screenshots.")
             capture = MockScreenshotCapture(self.screenshots_dir, self.project.video.fps)
         else:
+            # Pages stay open after the scene, for the next one
             capture = ScreenshotCapture(
                 self.screenshots_dir,
                 fps=self.project.video.fps,
                 headless=True,
+                pool=self._get_browser_pool(),
             )
 
         start_frame = scene_info["start_frame"]
@@ -1252,10 +1309,29 @@ class VisualInspector:
         scene_info: dict,
         scene_file: Path,
     ) -> list[Issue]:
-        """Analyze screenshots using AI."""
+        """Analyze screenshots using AI.
+
+        Beats whose frames look unchanged since their last analysis reuse
+        that analysis; only the remaining beats are sent to the LLM.
+        """
+        scene_id = scene_info["id"]
+        reused: list[Issue] = []
+        pending: list[tuple[int, Beat, CapturedScreenshot]] = []
+        for i, (beat, screenshot) in enumerate(zip(beats, screenshots)):
+            cached = self.frame_cache.lookup(scene_id, beat, screenshot) if self.frame_cache else None
+            if cached is None:
+                pending.append((i, beat, screenshot))
+            else:
+                reused.extend(cached)
+
+        if len(pending) < len(screenshots):
+            self._log(f"   ♻️ Reusing analysis for {len(screenshots) - len(pending)} unchanged beats")
+        if not pending:
+            return reused
+
         # Build beats info string
         beats_info_lines = []
-        for i, (beat, screenshot) in enumerate(zip(beats, screenshots)):
+        for i, beat, screenshot in pending:
             beats_info_lines.append(
                 f"Beat {i + 1} [{beat.start_seconds:.1f}s - {beat.end_seconds:.1f}s]:\n"
                 f"  Narration: \"{beat.text}\"\n"
@@ -1285,15 +1361,23 @@ class VisualInspector:
 
             if not result.success:
                 self._log(f"   ❌ Analysis failed: {result.error_message}")
-                return []
+                return reused
 
             # Parse the response
             response_data = self._parse_json_from_response(result.response)
-            return self._parse_issues(response_data, screenshots)
+            issues = self._parse_issues(response_data, screenshots)
 
         except Exception as e:
             self._log(f"   ❌ Analysis error: {e}")
-            return []
+            return reused
+
+        if self.frame_cache:
+            for i, beat, screenshot in pending:
+                beat_issues = [issue for issue in issues if issue.beat_index == beat.index]
+                self.frame_cache.store(scene_id, beat, screenshot, beat_issues)
+            self.frame_cache.save()
+
+        return sorted(reused + issues, key=lambda issue: issue.beat_index)
 
     def _parse_issues(
         self, response_data: dict, screenshots: list[CapturedScreenshot]
@@ -1410,6 +1494,30 @@ class VisualInspector:
         if not new_screenshots:
             return False
 
+        # Only beats whose frames changed need another look. An unchanged
+        # frame that had issues still has them, so verification fails
+        # without asking the LLM.
+        changed = list(zip(range(len(beats)), beats, new_screenshots))
+        if self.frame_cache:
+            scene_id = scene_info["id"]
+            changed = [
+                (i, beat, screenshot)
+                for i, beat, screenshot in changed
+                if not self.frame_cache.is_unchanged(scene_id, beat, screenshot)
+            ]
+            changed_beats = {beat.index for _, beat, _ in changed}
+            issue_beats = {issue.beat_index for issue in original_issues}
+            unchanged_with_issues = [
+                beat.index for beat in beats
+                if beat.index in issue_beats and beat.index not in changed_beats
+            ]
+            if unchanged_with_issues:
+                beat_list = ", ".join(str(b + 1) for b in unchanged_with_issues)
+                self._log(f"   ⚠️ Beat(s) {beat_list} look unchanged after fixes; their issues remain")
+                return False
+            if not changed:
+                return True
+
         # Build verification prompt
         original_issues_desc = "\n".join(
             f"- Beat {i.beat_index + 1}: {i.description}"
@@ -1422,7 +1530,7 @@ class VisualInspector:
         )
 
         new_beats_info_lines = []
-        for i, (beat, screenshot) in enumerate(zip(beats, new_screenshots)):
+        for i, beat, screenshot in changed:
             new_beats_info_lines.append(
                 f"Beat {i + 1}:\n  Screenshot file: {screenshot.path}"
             )
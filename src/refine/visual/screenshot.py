@@ -1,11 +1,14 @@
 """
 Screenshot capture for visual refinement.
 
-Uses Playwright to control Remotion Studio and capture screenshots at specific frames.
+Uses Playwright to control Remotion Studio and capture screenshots at specific frames,
+or renders the frames directly as stills through Remotion's renderer.
 """
 
+import json
 import shutil
 import subprocess
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -50,11 +53,146 @@ class CapturedScreenshot:
     verified: bool = False
 
 
+def _beat_target_frame(beat: Beat, scene_start_frame: int, fps: int) -> int:
+    """Frame to capture for a beat (the middle of the beat)."""
+    return scene_start_frame + int(beat.mid_seconds * fps)
+
+
+def _beat_filename(scene_index: int, beat: Beat, target_frame: int) -> str:
+    """Descriptive screenshot filename for a beat."""
+    return f"scene{scene_index + 1}_beat{beat.index + 1}_frame{target_frame}.png"
+
+
+def _open_studio(page, remotion_url: str, composition: str) -> None:
+    """Load a composition in Remotion Studio on a page and wait for it to render."""
+    # Remotion Studio 4.x URL format: http://localhost:3000/{compositionId}
+    url = f"{remotion_url}/{composition}"
+
+    try:
+        page.goto(url, timeout=20000)
+        page.wait_for_load_state("networkidle", timeout=20000)
+        # Extra wait for React/Remotion to fully render
+        time.sleep(2)
+    except Exception as e:
+        raise RemotionNotRunningError(
+            f"Could not connect to Remotion Studio at {url}. "
+            f"Make sure it's running with: cd remotion && npm run dev\n"
+            f"Error: {e}"
+        )
+
+
+class BrowserPool:
+    """A browser with warm Remotion Studio pages, shared across captures.
+
+    Launching Chromium and loading the Studio UI costs seconds, so the pool
+    does it once and every ScreenshotCapture borrows the same pages. Each
+    page is an independent Studio tab, which lets several frames be
+    navigated and settle at the same time.
+
+    Playwright's sync API is bound to the thread that started it, so a pool
+    must be used from a single thread.
+    """
+
+    DEFAULT_SIZE = 4
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        remotion_url: str = "http://localhost:3000",
+        composition: str = "ScenePlayer",
+        headless: bool = True,
+    ):
+        """
+        Initialize the browser pool.
+
+        Args:
+            size: Maximum number of Studio pages to keep open.
+            remotion_url: URL of Remotion Studio.
+            composition: Remotion composition ID.
+            headless: Whether to run browser in headless mode.
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            raise PlaywrightNotAvailableError(
+                "Playwright is not installed. Run: pip install playwright && playwright install chromium"
+            )
+
+        self.size = max(1, size)
+        self.remotion_url = remotion_url
+        self.composition = composition
+        self.headless = headless
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._pages: list[Page] = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    @property
+    def started(self) -> bool:
+        return self._browser is not None
+
+    def start(self) -> None:
+        """Launch the browser (no-op if already running)."""
+        if self.started:
+            return
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=self.headless)
+
+    def pages(self, count: int = 1) -> list[Page]:
+        """
+        Get up to `count` Studio pages, opening new ones as needed.
+
+        Args:
+            count: Number of pages wanted (capped at the pool size).
+
+        Returns:
+            Pages with the composition loaded in Remotion Studio.
+
+        Raises:
+            RemotionNotRunningError: If Remotion Studio can't be reached.
+        """
+        self.start()
+        count = max(1, min(count, self.size))
+        while len(self._pages) < count:
+            page = self._browser.new_page()
+            # Set viewport to match typical video dimensions
+            page.set_viewport_size({"width": 1920, "height": 1080})
+            try:
+                _open_studio(page, self.remotion_url, self.composition)
+            except RemotionNotRunningError:
+                page.close()
+                raise
+            self._pages.append(page)
+        return self._pages[:count]
+
+    def stop(self) -> None:
+        """Close all pages and the browser."""
+        for page in self._pages:
+            try:
+                page.close()
+            except Exception:
+                pass
+        self._pages = []
+        if self._browser:
+            self._browser.close()
+            self._browser = None
+        if self._playwright:
+            self._playwright.stop()
+            self._playwright = None
+
+
 class ScreenshotCapture:
     """Captures screenshots from Remotion Studio using Playwright."""
 
     DEFAULT_REMOTION_URL = "http://localhost:3000"
     DEFAULT_COMPOSITION = "ScenePlayer"
+    FRAME_SETTLE_SECONDS = 1.0  # Time for Studio to render a frame after seeking
 
     def __init__(
         self,
@@ -63,6 +201,7 @@ class ScreenshotCapture:
         remotion_url: str = DEFAULT_REMOTION_URL,
         composition: str = DEFAULT_COMPOSITION,
         headless: bool = True,
+        pool: Optional[BrowserPool] = None,
     ):
         """
         Initialize the screenshot capture.
@@ -73,6 +212,8 @@ class ScreenshotCapture:
             remotion_url: URL of Remotion Studio.
             composition: Remotion composition ID.
             headless: Whether to run browser in headless mode.
+            pool: Shared browser pool to borrow pages from. If None, the
+                capture launches (and closes) its own single-page browser.
         """
         if not PLAYWRIGHT_AVAILABLE:
             raise PlaywrightNotAvailableError(
@@ -86,8 +227,10 @@ class ScreenshotCapture:
         self.composition = composition
         self.headless = headless
 
-        self._playwright: Optional[Playwright] = None
-        self._browser: Optional[Browser] = None
+        self._owns_pool = pool is None
+        self._pool = pool or BrowserPool(
+            size=1, remotion_url=remotion_url, composition=composition, headless=headless
+        )
         self._page: Optional[Page] = None
 
     def __enter__(self):
@@ -101,45 +244,14 @@ class ScreenshotCapture:
         return False
 
     def start(self) -> None:
-        """Start the browser and connect to Remotion Studio."""
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch(headless=self.headless)
-        self._page = self._browser.new_page()
-
-        # Set viewport to match typical video dimensions
-        self._page.set_viewport_size({"width": 1920, "height": 1080})
-
-        # Navigate to Remotion Studio
-        self._navigate_to_remotion()
+        """Start the browser (or borrow the pool's) and connect to Remotion Studio."""
+        self._page = self._pool.pages(1)[0]
 
     def stop(self) -> None:
-        """Stop the browser."""
-        if self._page:
-            self._page.close()
-            self._page = None
-        if self._browser:
-            self._browser.close()
-            self._browser = None
-        if self._playwright:
-            self._playwright.stop()
-            self._playwright = None
-
-    def _navigate_to_remotion(self) -> None:
-        """Navigate to Remotion Studio and verify it's running."""
-        # Remotion Studio 4.x URL format: http://localhost:3000/{compositionId}
-        url = f"{self.remotion_url}/{self.composition}"
-
-        try:
-            self._page.goto(url, timeout=20000)
-            self._page.wait_for_load_state("networkidle", timeout=20000)
-            # Extra wait for React/Remotion to fully render
-            time.sleep(2)
-        except Exception as e:
-            raise RemotionNotRunningError(
-                f"Could not connect to Remotion Studio at {url}. "
-                f"Make sure it's running with: cd remotion && npm run dev\n"
-                f"Error: {e}"
-            )
+        """Stop the browser, unless it belongs to a shared pool."""
+        self._page = None
+        if self._owns_pool:
+            self._pool.stop()
 
     def navigate_to_frame(self, frame_number: int) -> None:
         """
@@ -148,20 +260,34 @@ class ScreenshotCapture:
         Args:
             frame_number: The frame number to navigate to.
         """
+        if self._start_navigation(self._page, frame_number):
+            time.sleep(self.FRAME_SETTLE_SECONDS)
+
+    def _start_navigation(self, page: Page, frame_number: int) -> bool:
+        """
+        Seek a Studio page to a frame without waiting for it to render.
+
+        Args:
+            page: Studio page to navigate.
+            frame_number: The frame number to navigate to.
+
+        Returns:
+            True if the frame was entered, False if navigation fell back.
+        """
         # Method: Click on the frame number button and type the new frame
         # In Remotion Studio 4.x, the frame number is a clickable button
         # that turns into an input field when clicked
         try:
             # Find the frame number button - it's typically a button with digits
             # located in the bottom left area near the time display
-            frame_button = self._page.locator('button').filter(
-                has_text=self._page.locator('text=/^\\d+$/')
+            frame_button = page.locator('button').filter(
+                has_text=page.locator('text=/^\\d+$/')
             ).first
 
             # Alternative: look for buttons containing only numbers
             if frame_button.count() == 0:
                 # Try to find any button that looks like a frame counter
-                buttons = self._page.locator('button').all()
+                buttons = page.locator('button').all()
                 for btn in buttons:
                     try:
                         text = btn.inner_text(timeout=500)
@@ -179,12 +305,11 @@ class ScreenshotCapture:
             # Use Meta+a on Mac, Control+a on others
             import platform
             select_all = "Meta+a" if platform.system() == "Darwin" else "Control+a"
-            self._page.keyboard.press(select_all)
+            page.keyboard.press(select_all)
             time.sleep(0.1)
-            self._page.keyboard.type(str(frame_number))
-            self._page.keyboard.press("Enter")
-            time.sleep(1)
-            return
+            page.keyboard.type(str(frame_number))
+            page.keyboard.press("Enter")
+            return True
 
         except Exception as e:
             print(f"Method 1 (click frame button) failed: {e}")
@@ -192,7 +317,7 @@ class ScreenshotCapture:
         # Fallback: Try pressing Home then using arrow keys or direct input
         try:
             # Press Home to go to frame 0
-            self._page.keyboard.press("Home")
+            page.keyboard.press("Home")
             time.sleep(0.5)
 
             # For short videos, we could navigate frame by frame, but that's slow
@@ -201,24 +326,29 @@ class ScreenshotCapture:
 
         except Exception as e:
             print(f"Warning: Could not navigate to frame {frame_number}: {e}")
+        return False
 
-    def get_current_frame(self) -> int:
+    def get_current_frame(self, page: Optional[Page] = None) -> int:
         """
         Get the current frame number from Remotion Studio.
 
+        Args:
+            page: Studio page to read (defaults to the capture's page).
+
         Returns:
             Current frame number, or -1 if unable to determine.
         """
+        page = page or self._page
         try:
             # Try to read frame from URL
-            url = self._page.url
+            url = page.url
             if "frame=" in url:
                 frame_str = url.split("frame=")[1].split("&")[0]
                 return int(frame_str)
 
             # Fallback: Try to read from the UI
             # Remotion shows frame number in the timeline area
-            frame_indicator = self._page.query_selector('[data-testid="frame-indicator"]')
+            frame_indicator = page.query_selector('[data-testid="frame-indicator"]')
             if frame_indicator:
                 text = frame_indicator.inner_text()
                 # Parse frame number from text like "Frame: 120"
@@ -231,52 +361,39 @@ class ScreenshotCapture:
 
         return -1
 
-    def capture_screenshot(
+    def _screenshot_page(
         self,
+        page: Page,
         frame_number: int,
         filename: str,
-        verify: bool = True,
-    ) -> CapturedScreenshot:
+        verify: bool,
+    ) -> tuple[CapturedScreenshot, Optional[int]]:
         """
-        Navigate to a frame and capture a screenshot.
-
-        Args:
-            frame_number: The frame number to capture.
-            filename: Filename for the screenshot.
-            verify: Whether to verify the frame number matches.
+        Screenshot a page that has been navigated to a frame.
 
         Returns:
-            CapturedScreenshot with path and metadata.
-
-        Raises:
-            FrameMismatchError: If verification fails and frame doesn't match.
+            Tuple of (screenshot, mismatched frame number or None).
         """
-        self.navigate_to_frame(frame_number)
-
-        # Capture screenshot
         screenshot_path = self.screenshots_dir / filename
-        self._page.screenshot(path=str(screenshot_path))
+        page.screenshot(path=str(screenshot_path))
 
         # Verify frame number if requested
         verified = False
         actual_frame = -1
+        mismatch = None
         if verify:
-            actual_frame = self.get_current_frame()
+            actual_frame = self.get_current_frame(page)
             if actual_frame >= 0:
                 # Allow 1 frame tolerance
                 if abs(actual_frame - frame_number) <= 1:
                     verified = True
                 else:
-                    raise FrameMismatchError(
-                        f"Frame mismatch: expected {frame_number}, got {actual_frame}"
-                    )
-            else:
-                # Couldn't verify, but screenshot was taken
-                verified = False
+                    mismatch = actual_frame
+            # else: couldn't verify, but screenshot was taken
         else:
             verified = True  # Skip verification
 
-        return CapturedScreenshot(
+        screenshot = CapturedScreenshot(
             path=screenshot_path,
             beat_index=-1,  # Will be set by caller
             frame_number=actual_frame if actual_frame >= 0 else frame_number,
@@ -284,6 +401,75 @@ class ScreenshotCapture:
             timestamp_seconds=frame_number / self.fps,
             verified=verified,
         )
+        return screenshot, mismatch
+
+    def capture_screenshot(
+        self,
+        frame_number: int,
+        filename: str,
+        verify: bool = True,
+    ) -> CapturedScreenshot:
+        """
+        Navigate to a frame and capture a screenshot.
+
+        Args:
+            frame_number: The frame number to capture.
+            filename: Filename for the screenshot.
+            verify: Whether to verify the frame number matches.
+
+        Returns:
+            CapturedScreenshot with path and metadata.
+
+        Raises:
+            FrameMismatchError: If verification fails and frame doesn't match.
+        """
+        self.navigate_to_frame(frame_number)
+        screenshot, mismatch = self._screenshot_page(self._page, frame_number, filename, verify)
+        if mismatch is not None:
+            raise FrameMismatchError(
+                f"Frame mismatch: expected {frame_number}, got {mismatch}"
+            )
+        return screenshot
+
+    def capture_frames(
+        self,
+        frames: list[tuple[int, str]],
+        verify: bool = True,
+    ) -> list[CapturedScreenshot]:
+        """
+        Capture several frames, spread across the pool's pages.
+
+        Frames are taken in batches of one per page: every page in a batch is
+        seeked before a single shared settle wait, then each is captured, so
+        render waits overlap instead of adding up.
+
+        Args:
+            frames: (frame_number, filename) pairs to capture.
+            verify: Whether to verify the frame numbers match.
+
+        Returns:
+            CapturedScreenshot per frame, in input order. Frames that fail
+            verification are kept with verified=False.
+        """
+        if not frames:
+            return []
+
+        pages = self._pool.pages(len(frames))
+        screenshots = []
+        for offset in range(0, len(frames), len(pages)):
+            batch = list(zip(pages, frames[offset:offset + len(pages)]))
+            navigated = [self._start_navigation(page, frame) for page, (frame, _) in batch]
+            if any(navigated):
+                time.sleep(self.FRAME_SETTLE_SECONDS)
+
+            for page, (frame, filename) in batch:
+                screenshot, mismatch = self._screenshot_page(page, frame, filename, verify)
+                if mismatch is not None:
+                    print(f"Warning: Frame mismatch: expected {frame}, got {mismatch}")
+                    screenshot.verified = False
+                screenshots.append(screenshot)
+
+        return screenshots
 
     def capture_beat(
         self,
@@ -305,16 +491,8 @@ class ScreenshotCapture:
         Returns:
             CapturedScreenshot with beat information.
         """
-        # Calculate the target frame (middle of the beat)
-        beat_mid_seconds = beat.mid_seconds
-        beat_frame = int(beat_mid_seconds * self.fps)
-        target_frame = scene_start_frame + beat_frame
-
-        # Generate descriptive filename
-        filename = (
-            f"scene{scene_index + 1}_beat{beat.index + 1}_"
-            f"frame{target_frame}.png"
-        )
+        target_frame = _beat_target_frame(beat, scene_start_frame, self.fps)
+        filename = _beat_filename(scene_index, beat, target_frame)
 
         screenshot = self.capture_screenshot(target_frame, filename, verify=True)
         screenshot.beat_index = beat.index
@@ -330,39 +508,202 @@ class ScreenshotCapture:
         """
         Capture screenshots for all beats in a scene.
 
+        Beats are captured in parallel on the pool's pages (see
+        capture_frames).
+
         Args:
             beats: List of beats to capture.
             scene_start_frame: Starting frame of the scene.
             scene_index: Index of the scene.
 
         Returns:
-            List of CapturedScreenshot objects.
+            List of CapturedScreenshot objects, one per beat.
+        """
+        frames = []
+        for beat in beats:
+            target_frame = _beat_target_frame(beat, scene_start_frame, self.fps)
+            frames.append((target_frame, _beat_filename(scene_index, beat, target_frame)))
+
+        screenshots = self.capture_frames(frames, verify=True)
+        for beat, screenshot in zip(beats, screenshots):
+            screenshot.beat_index = beat.index
+        return screenshots
+
+
+class StillRenderError(Exception):
+    """Raised when rendering stills through Remotion fails."""
+    pass
+
+
+class RemotionStillCapture:
+    """Renders beat frames as stills through Remotion's renderStill API.
+
+    An alternative to driving the Studio UI: remotion/scripts/render-stills.mjs
+    bundles the project once per batch and renders every requested frame in
+    one headless browser, several at a time. Remotion Studio does not need to
+    be running, and each still is exactly the requested frame.
+    """
+
+    DEFAULT_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        screenshots_dir: Path,
+        project_dir: Path,
+        fps: int = 30,
+        composition: str = ScreenshotCapture.DEFAULT_COMPOSITION,
+        remotion_dir: Optional[Path] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: int = 600,
+    ):
+        """
+        Initialize the still capture.
+
+        Args:
+            screenshots_dir: Directory to save screenshots.
+            project_dir: Project directory (storyboard, scenes and assets).
+            fps: Frames per second of the video.
+            composition: Remotion composition ID.
+            remotion_dir: Remotion package directory (defaults to the repo's).
+            concurrency: Stills rendered at the same time.
+            timeout: Timeout for one batch in seconds.
+        """
+        self.screenshots_dir = Path(screenshots_dir)
+        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        self.project_dir = Path(project_dir)
+        self.fps = fps
+        self.composition = composition
+        self.remotion_dir = Path(remotion_dir) if remotion_dir else (
+            Path(__file__).parent.parent.parent.parent / "remotion"
+        )
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    @property
+    def script_path(self) -> Path:
+        return self.remotion_dir / "scripts" / "render-stills.mjs"
+
+    def start(self) -> None:
+        """Check that Node.js and the still render script are available."""
+        if not shutil.which("node"):
+            raise StillRenderError("node not found. Please install Node.js.")
+        if not self.script_path.exists():
+            raise StillRenderError(f"Still render script not found: {self.script_path}")
+
+    def stop(self) -> None:
+        pass
+
+    def capture_frames(
+        self,
+        frames: list[tuple[int, str]],
+        verify: bool = True,
+    ) -> list[CapturedScreenshot]:
+        """
+        Render several frames in one batch.
+
+        Args:
+            frames: (frame_number, filename) pairs to render.
+            verify: Unused; rendered stills are always the requested frame.
+
+        Returns:
+            CapturedScreenshot per frame, in input order.
+
+        Raises:
+            StillRenderError: If rendering fails or a still is missing.
         """
+        if not frames:
+            return []
+
+        jobs = [
+            {"frame": frame, "output": str((self.screenshots_dir / filename).resolve())}
+            for frame, filename in frames
+        ]
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", prefix="stills_", dir=self.screenshots_dir, delete=False
+        ) as f:
+            json.dump(jobs, f)
+            jobs_path = Path(f.name)
+
+        cmd = [
+            "node",
+            str(self.script_path),
+            "--project", str(self.project_dir.resolve()),
+            "--composition", self.composition,
+            "--frames", str(jobs_path),
+            "--concurrency", str(self.concurrency),
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=str(self.remotion_dir),
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise StillRenderError(f"Still rendering timed out after {self.timeout}s")
+        finally:
+            jobs_path.unlink(missing_ok=True)
+
+        if result.returncode != 0:
+            raise StillRenderError(f"Still rendering failed: {result.stderr.strip()[-500:]}")
+
         screenshots = []
+        for job in jobs:
+            path = Path(job["output"])
+            if not path.exists():
+                raise StillRenderError(f"Still was not rendered: {path}")
+            screenshots.append(
+                CapturedScreenshot(
+                    path=path,
+                    beat_index=-1,
+                    frame_number=job["frame"],
+                    expected_frame=job["frame"],
+                    timestamp_seconds=job["frame"] / self.fps,
+                    verified=True,
+                )
+            )
+        return screenshots
+
+    def capture_screenshot(
+        self,
+        frame_number: int,
+        filename: str,
+        verify: bool = True,
+    ) -> CapturedScreenshot:
+        """Render a single frame."""
+        return self.capture_frames([(frame_number, filename)], verify=verify)[0]
+
+    def capture_beat(
+        self,
+        beat: Beat,
+        scene_start_frame: int,
+        scene_index: int,
+    ) -> CapturedScreenshot:
+        return self.capture_beats([beat], scene_start_frame, scene_index)[0]
+
+    def capture_beats(
+        self,
+        beats: list[Beat],
+        scene_start_frame: int,
+        scene_index: int,
+    ) -> list[CapturedScreenshot]:
+        """Render all beats of a scene in one batch."""
+        frames = []
         for beat in beats:
-            try:
-                screenshot = self.capture_beat(beat, scene_start_frame, scene_index)
-                screenshots.append(screenshot)
-            except FrameMismatchError as e:
-                print(f"Warning: {e}")
-                # Still include the screenshot with verification failed
-                beat_mid_seconds = beat.mid_seconds
-                beat_frame = int(beat_mid_seconds * self.fps)
-                target_frame = scene_start_frame + beat_frame
-                filename = f"scene{scene_index + 1}_beat{beat.index + 1}_frame{target_frame}_unverified.png"
-                screenshot_path = self.screenshots_dir / filename
-                if screenshot_path.exists():
-                    screenshots.append(
-                        CapturedScreenshot(
-                            path=screenshot_path,
-                            beat_index=beat.index,
-                            frame_number=-1,
-                            expected_frame=target_frame,
-                            timestamp_seconds=beat_mid_seconds,
-                            verified=False,
-                        )
-                    )
+            target_frame = _beat_target_frame(beat, scene_start_frame, self.fps)
+            frames.append((target_frame, _beat_filename(scene_index, beat, target_frame)))
 
+        screenshots = self.capture_frames(frames)
+        for beat, screenshot in zip(beats, screenshots):
+            screenshot.beat_index = beat.index
         return screenshots
 
 
@@ -13,6 +13,8 @@ from typing import Literal
 
 import httpx
 
+from .. import budget
+
 
 @dataclass
 class RunwayResult:
@@ -52,6 +54,15 @@ class RunwayGenerator:
         "gen4_turbo": "Latest model, highest quality",
     }
 
+    # Approximate price per second of video (varies by plan)
+    COST_PER_SECOND = {
+        "gen3a_turbo": 0.05,
+        "gen4_turbo": 0.10,
+    }
+
+    # Shortest clip to fall back to when degrading for budget
+    MIN_BUDGET_DURATION = 5
+
     def __init__(self, api_key: str | None = None, config: RunwayConfig | None = None):
         """Initialize Runway generator.
 
@@ -104,18 +115,39 @@ class RunwayGenerator:
         model = model or self.config.model
         ratio = ratio or self.config.ratio
 
-        # Create generation task
+        # Check the budget, falling back to a shorter clip or cheaper model
+        tracker = budget.active_tracker()
+        hold = None
+        if tracker is not None:
+            (model, duration), hold = tracker.choose(
+                "video_gen",
+                self._budget_options(model, duration),
+                description=f"Runway clip ({output_path.name})",
+            )
+
         start_time = time.time()
-        task_id = await self._create_task(prompt, image_url, duration, model, ratio)
+        try:
+            # Create generation task
+            task_id = await self._create_task(prompt, image_url, duration, model, ratio)
 
-        # Poll for completion
-        video_url = await self._wait_for_completion(task_id)
+            # Poll for completion
+            video_url = await self._wait_for_completion(task_id)
 
-        # Download video
-        await self._download_video(video_url, output_path)
+            # Download video
+            await self._download_video(video_url, output_path)
+        except BaseException:
+            if hold is not None:
+                hold.release()
+            raise
 
         generation_time = time.time() - start_time
 
+        if hold is not None:
+            hold.settle(
+                duration * self.COST_PER_SECOND.get(model, self.COST_PER_SECOND["gen4_turbo"]),
+                description=f"Runway {model} {duration}s ({output_path.name})",
+            )
+
         return RunwayResult(
             video_path=output_path,
             duration_seconds=duration,
@@ -258,10 +290,25 @@ class RunwayGenerator:
         Returns:
             Dict with cost estimates per model
         """
-        return {
-            "gen3a_turbo": duration * 0.05,
-            "gen4_turbo": duration * 0.10,
-        }
+        return {model: duration * rate for model, rate in self.COST_PER_SECOND.items()}
+
+    def _budget_options(self, model: str, duration: int) -> list[tuple[tuple[str, int], float]]:
+        """(model, duration) choices for a clip, most preferred first.
+
+        The requested clip comes first, then a shorter clip, then the same
+        lengths on cheaper models.
+        """
+        durations = [duration] + ([self.MIN_BUDGET_DURATION] if duration > self.MIN_BUDGET_DURATION else [])
+        models = [model] + sorted(
+            (m for m in self.COST_PER_SECOND if self.COST_PER_SECOND[m] < self.COST_PER_SECOND.get(model, 0)),
+            key=lambda m: -self.COST_PER_SECOND[m],
+        )
+        default_rate = self.COST_PER_SECOND["gen4_turbo"]
+        return [
+            ((m, d), d * self.COST_PER_SECOND.get(m, default_rate))
+            for m in models
+            for d in durations
+        ]
 
     @staticmethod
     def get_optimal_prompt(
@@ -1,7 +1,9 @@
 """Scene generator - creates Remotion scene components from scripts."""
 
+import contextvars
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -1531,6 +1533,7 @@ class SceneGenerator:
     """Generates Remotion scene components from scripts using Claude Code."""
 
     MAX_RETRIES = 3  # Maximum attempts to generate a valid scene
+    DEFAULT_MAX_WORKERS = 4  # Scenes generated in parallel by generate_all_scenes
 
     def __init__(
         self,
@@ -1538,6 +1541,7 @@ class SceneGenerator:
         working_dir: Path | None = None,
         timeout: int = 300,
         skip_validation: bool = False,
+        max_workers: int | None = None,
     ):
         """Initialize the scene generator.
 
@@ -1546,11 +1550,14 @@ class SceneGenerator:
             working_dir: Working directory for Claude Code
             timeout: Timeout for LLM calls in seconds
             skip_validation: Skip validation and auto-correction (for debugging)
+            max_workers: Number of scenes to generate concurrently
+                (default: DEFAULT_MAX_WORKERS, 1 = sequential)
         """
         self.config = config or load_config()
         self.working_dir = working_dir or Path.cwd()
         self.timeout = timeout
         self.skip_validation = skip_validation
+        self.max_workers = max(1, max_workers or self.DEFAULT_MAX_WORKERS)
         self.validator = SceneValidator()
 
     def generate_all_scenes(
@@ -1620,7 +1627,11 @@ class SceneGenerator:
             "errors": [],
         }
 
-        for idx, scene in enumerate(script.get("scenes", [])):
+        scenes = script.get("scenes", [])
+
+        def generate_one(idx: int) -> tuple[dict | None, dict | None]:
+            """Generate scene idx, returning (result, error) - never raises."""
+            scene = scenes[idx]
             scene_num = idx + 1
             # Get word timestamps for this scene (if available)
             scene_id = scene.get("scene_id", f"scene{scene_num}")
@@ -1633,14 +1644,32 @@ class SceneGenerator:
                     example_scene=example_scene,
                     word_timestamps=word_timestamps,
                 )
-                results["scenes"].append(result)
                 print(f"  ✓ Generated scene {scene_num}: {result['component_name']}")
+                return result, None
 
             except Exception as e:
                 title = scene.get("title", f"Scene {scene_num}")
-                error = {"scene_number": scene_num, "title": title, "error": str(e)}
-                results["errors"].append(error)
                 print(f"  ✗ Failed to generate scene {scene_num}: {e}")
+                return None, {"scene_number": scene_num, "title": title, "error": str(e)}
+
+        # Scenes are independent LLM round trips, so fan them out. Outcomes are
+        # slotted back by index so results and index.ts keep script order.
+        outcomes: list[tuple[dict | None, dict | None]] = [(None, None)] * len(scenes)
+        workers = min(self.max_workers, len(scenes))
+        if workers <= 1:
+            outcomes = [generate_one(idx) for idx in range(len(scenes))]
+        else:
+            print(f"  Generating {len(scenes)} scenes with {workers} workers...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(contextvars.copy_context().run, generate_one, idx): idx for idx in range(len(scenes))}
+                for future in as_completed(futures):
+                    outcomes[futures[future]] = future.result()
+
+        for result, error in outcomes:
+            if result is not None:
+                results["scenes"].append(result)
+            if error is not None:
+                results["errors"].append(error)
 
         # Generate index.ts
         self._generate_index(scenes_dir, results["scenes"], script.get("title", "Untitled"))
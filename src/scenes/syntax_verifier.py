@@ -11,6 +11,55 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .ts_checker import (
+    TSDiagnostic,
+    TypeScriptChecker,
+    get_typescript_checker,
+    parse_tsc_output,
+)
+
+# Syntax/parse (TS1xxx) and JSX (TS17xxx) diagnostics. The shared tsc run is
+# strict, so the check has to be by code: TS18xxx (e.g. possibly-null values)
+# are type errors, not syntax errors.
+SYNTAX_ERROR_CODES = {
+    "TS1002",  # Unterminated string literal
+    "TS1003",  # Identifier expected
+    "TS1005",  # 'x' expected (missing punctuation)
+    "TS1009",  # Trailing comma not allowed
+    "TS1010",  # Asterisk expected
+    "TS1011",  # Element access expression should take an argument
+    "TS1012",  # Unexpected token
+    "TS1014",  # Rest parameter must be last
+    "TS1015",  # Parameter cannot have question mark
+    "TS1016",  # Required parameter cannot follow optional
+    "TS1019",  # Duplicate identifier
+    "TS1029",  # Unexpected token (modifier)
+    "TS1035",  # Comments are not permitted
+    "TS1036",  # Statements not allowed in ambient context
+    "TS1039",  # Initializers are not allowed in ambient
+    "TS1042",  # Modifier cannot appear
+    "TS1046",  # Top-level declarations require export
+    "TS1048",  # Cannot access before declaration
+    "TS1068",  # Unexpected token
+    "TS1109",  # Expression expected
+    "TS1110",  # Type expected
+    "TS1126",  # Unexpected end of text
+    "TS1127",  # Invalid character
+    "TS1128",  # Declaration or statement expected
+    "TS1136",  # Property assignment expected
+    "TS1137",  # Expression or comma expected
+    "TS1138",  # Unexpected keyword
+    "TS1141",  # String literal expected
+    "TS1160",  # Unterminated template literal
+    "TS1161",  # Unterminated regular expression
+    "TS1185",  # Merge conflict marker
+    "TS1381",  # Unexpected token in type
+    "TS17002",  # Expected corresponding JSX closing tag
+    "TS17008",  # JSX element has no corresponding closing tag
+    "TS17009",  # Expected corresponding JSX closing tag
+    "TS17014",  # JSX expressions may not use the comma operator
+}
+
 
 @dataclass
 class SyntaxError:
@@ -67,13 +116,20 @@ class SyntaxVerifier:
         (r'=\{([^{}]+)\}\}>', r'={{\1}}>'),
     ]
 
-    def __init__(self, remotion_dir: Path | None = None):
+    def __init__(
+        self,
+        remotion_dir: Path | None = None,
+        checker: TypeScriptChecker | None = None,
+    ):
         """Initialize the syntax verifier.
 
         Args:
             remotion_dir: Path to remotion project directory (for TypeScript checks)
+            checker: TypeScript checker to use (default: the shared checker
+                for remotion_dir)
         """
         self.remotion_dir = remotion_dir or Path(__file__).parent.parent.parent / "remotion"
+        self.checker = checker or get_typescript_checker(self.remotion_dir)
 
     def verify_scenes(
         self,
@@ -213,7 +269,7 @@ class SyntaxVerifier:
         return result
 
     def _run_typescript_syntax_check(self, scenes_dir: Path) -> list[SyntaxError]:
-        """Run TypeScript compiler in syntax-only mode.
+        """Get syntax errors for a directory from the shared TypeScript check.
 
         Args:
             scenes_dir: Directory containing scene files
@@ -223,50 +279,9 @@ class SyntaxVerifier:
         """
         errors: list[SyntaxError] = []
 
-        # Create a minimal tsconfig for syntax checking only
-        tsconfig_content = """{
-  "compilerOptions": {
-    "target": "ES2022",
-    "module": "ES2022",
-    "moduleResolution": "bundler",
-    "jsx": "react-jsx",
-    "strict": false,
-    "skipLibCheck": true,
-    "noEmit": true,
-    "isolatedModules": true,
-    "allowJs": true
-  },
-  "include": ["*.tsx", "*.ts"],
-  "exclude": ["node_modules"]
-}
-"""
-        tsconfig_path = scenes_dir / "tsconfig.syntax.json"
-        tsconfig_existed = tsconfig_path.exists()
-        original_content = None
-
         try:
-            if tsconfig_existed:
-                original_content = tsconfig_path.read_text()
-            tsconfig_path.write_text(tsconfig_content)
-
-            # Find tsc
-            tsc_path = self.remotion_dir / "node_modules" / ".bin" / "tsc"
-            if tsc_path.exists():
-                cmd = [str(tsc_path), "--project", str(tsconfig_path), "--pretty", "false"]
-            else:
-                cmd = ["npx", "tsc", "--project", str(tsconfig_path), "--pretty", "false"]
-
-            result = subprocess.run(
-                cmd,
-                cwd=scenes_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode != 0:
-                errors = self._parse_typescript_errors(result.stdout + result.stderr)
-
+            check = self.checker.check(scenes_dir)
+            errors = self._syntax_errors_from(check.diagnostics)
         except subprocess.TimeoutExpired:
             errors.append(
                 SyntaxError(
@@ -290,18 +305,15 @@ class SyntaxVerifier:
                     severity="warning",
                 )
             )
-        finally:
-            # Cleanup
-            if original_content is not None:
-                tsconfig_path.write_text(original_content)
-            elif tsconfig_path.exists() and not tsconfig_existed:
-                tsconfig_path.unlink()
 
         return errors
 
     def _check_file_syntax(self, file_path: Path) -> list[SyntaxError]:
         """Check syntax of a single file.
 
+        The file's directory is checked as a whole, so the result is shared
+        with any other check of the same directory.
+
         Args:
             file_path: Path to the file
 
@@ -312,31 +324,28 @@ class SyntaxVerifier:
 
         # First try TypeScript if available
         try:
-            tsc_path = self.remotion_dir / "node_modules" / ".bin" / "tsc"
-            if tsc_path.exists():
-                cmd = [str(tsc_path), "--noEmit", "--pretty", "false", str(file_path)]
-            else:
-                cmd = ["npx", "tsc", "--noEmit", "--pretty", "false", str(file_path)]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if result.returncode != 0:
-                errors = self._parse_typescript_errors(
-                    result.stdout + result.stderr,
-                    base_filename=file_path.name
-                )
-
+            check = self.checker.check(file_path.parent)
+            errors = self._syntax_errors_from(check.for_file(file_path.name))
         except (subprocess.TimeoutExpired, FileNotFoundError):
             # Fall back to basic checks
             errors = self._run_basic_syntax_check_file(file_path)
 
         return errors
 
+    def _syntax_errors_from(self, diagnostics: list[TSDiagnostic]) -> list[SyntaxError]:
+        """Keep the syntax and JSX diagnostics (SYNTAX_ERROR_CODES)."""
+        return [
+            SyntaxError(
+                file=d.file,
+                line=d.line,
+                column=d.column,
+                message=d.message,
+                code=d.code,
+            )
+            for d in diagnostics
+            if d.code in SYNTAX_ERROR_CODES
+        ]
+
     def _parse_typescript_errors(
         self,
         output: str,
@@ -351,72 +360,7 @@ class SyntaxVerifier:
         Returns:
             List of parsed errors
         """
-        errors: list[SyntaxError] = []
-
-        # TypeScript error format: file(line,col): error TSxxxx: message
-        error_pattern = r"([^:\s(]+\.tsx?)\((\d+),(\d+)\):\s*error\s+(TS\d+):\s*(.+)"
-
-        # Only include syntax-related error codes
-        # TS1xxx are syntax/parse errors
-        syntax_error_codes = {
-            "TS1002",  # Unterminated string literal
-            "TS1003",  # Identifier expected
-            "TS1005",  # 'x' expected (missing punctuation)
-            "TS1009",  # Trailing comma not allowed
-            "TS1010",  # Asterisk expected
-            "TS1011",  # Element access expression should take an argument
-            "TS1012",  # Unexpected token
-            "TS1014",  # Rest parameter must be last
-            "TS1015",  # Parameter cannot have question mark
-            "TS1016",  # Required parameter cannot follow optional
-            "TS1019",  # Duplicate identifier
-            "TS1029",  # Unexpected token (modifier)
-            "TS1035",  # Comments are not permitted
-            "TS1036",  # Statements not allowed in ambient context
-            "TS1039",  # Initializers are not allowed in ambient
-            "TS1042",  # Modifier cannot appear
-            "TS1046",  # Top-level declarations require export
-            "TS1048",  # Cannot access before declaration
-            "TS1068",  # Unexpected token
-            "TS1109",  # Expression expected
-            "TS1110",  # Type expected
-            "TS1126",  # Unexpected end of text
-            "TS1127",  # Invalid character
-            "TS1128",  # Declaration or statement expected
-            "TS1136",  # Property assignment expected
-            "TS1137",  # Expression or comma expected
-            "TS1138",  # Unexpected keyword
-            "TS1141",  # String literal expected
-            "TS1160",  # Unterminated template literal
-            "TS1161",  # Unterminated regular expression
-            "TS1185",  # Merge conflict marker
-            "TS1381",  # Unexpected token in type
-            "TS17002",  # Expected corresponding JSX closing tag
-            "TS17008",  # JSX element has no corresponding closing tag
-            "TS17009",  # Expected corresponding JSX closing tag
-            "TS17014",  # JSX expressions may not use the comma operator
-        }
-
-        for line in output.split("\n"):
-            match = re.match(error_pattern, line)
-            if match:
-                filepath = match.group(1)
-                filename = Path(filepath).name if "/" in filepath or "\\" in filepath else filepath
-                error_code = match.group(4)
-
-                # Only include syntax errors (TS1xxx) and JSX errors (TS17xxx)
-                if error_code.startswith("TS1") or error_code.startswith("TS17"):
-                    errors.append(
-                        SyntaxError(
-                            file=filename,
-                            line=int(match.group(2)),
-                            column=int(match.group(3)),
-                            message=match.group(5),
-                            code=error_code,
-                        )
-                    )
-
-        return errors
+        return self._syntax_errors_from(parse_tsc_output(output))
 
     def _run_basic_syntax_check(self, scenes_dir: Path) -> list[SyntaxError]:
         """Run basic syntax checks without TypeScript.
@@ -0,0 +1,233 @@
+"""Shared TypeScript compiler check for generated scene files.
+
+SyntaxVerifier and SceneValidator both need tsc diagnostics for the same
+scenes directory. TypeScriptChecker runs tsc once per directory state (the
+names, sizes and mtimes of the scene files), parses the output once, and
+hands the same diagnostics to every caller. tsc runs in incremental mode
+with its .tsbuildinfo kept in the remotion project's node_modules/.cache,
+so a re-check after an auto-fix only re-checks what changed.
+"""
+
+import hashlib
+import re
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TSC_TIMEOUT_SECONDS = 60
+
+# TypeScript error format: file(line,col): error TSxxxx: message
+DIAGNOSTIC_PATTERN = re.compile(r"([^:\s(]+\.tsx?)\((\d+),(\d+)\):\s*error\s+(TS\d+):\s*(.+)")
+
+CHECK_TSCONFIG_NAME = "tsconfig.check.json"
+
+
+@dataclass
+class TSDiagnostic:
+    """A single error reported by tsc."""
+
+    file: str  # Base filename, e.g. "HookScene.tsx"
+    line: int
+    column: int
+    code: str  # e.g. "TS1005"
+    message: str
+
+
+@dataclass
+class TSCheckResult:
+    """Outcome of one tsc run over a scenes directory."""
+
+    returncode: int
+    output: str
+    diagnostics: list[TSDiagnostic] = field(default_factory=list)
+
+    def for_file(self, filename: str) -> list[TSDiagnostic]:
+        """Diagnostics reported for one file (by base filename)."""
+        return [d for d in self.diagnostics if d.file == filename]
+
+
+def parse_tsc_output(output: str) -> list[TSDiagnostic]:
+    """Parse `tsc --pretty false` output into diagnostics.
+
+    Args:
+        output: Combined stdout/stderr of tsc
+
+    Returns:
+        List of parsed diagnostics
+    """
+    diagnostics: list[TSDiagnostic] = []
+    for line in output.split("\n"):
+        match = DIAGNOSTIC_PATTERN.match(line)
+        if match:
+            filepath = match.group(1)
+            filename = Path(filepath).name if "/" in filepath or "\\" in filepath else filepath
+            diagnostics.append(
+                TSDiagnostic(
+                    file=filename,
+                    line=int(match.group(2)),
+                    column=int(match.group(3)),
+                    code=match.group(4),
+                    message=match.group(5),
+                )
+            )
+    return diagnostics
+
+
+class TypeScriptChecker:
+    """Runs tsc over a scenes directory and shares the parsed diagnostics.
+
+    Results are memoized per directory until a scene file is added, removed
+    or modified, so several consumers checking the same files pay for a
+    single compiler run.
+    """
+
+    def __init__(self, remotion_dir: Path):
+        """Initialize the checker.
+
+        Args:
+            remotion_dir: Path to remotion project directory (provides tsc
+                and the remotion type declarations)
+        """
+        self.remotion_dir = Path(remotion_dir)
+        self.runs = 0
+        self._lock = threading.Lock()
+        self._results: dict[Path, tuple[tuple, TSCheckResult]] = {}
+
+    def check(self, scenes_dir: Path) -> TSCheckResult:
+        """Get tsc diagnostics for all scene files in a directory.
+
+        Args:
+            scenes_dir: Directory containing scene files
+
+        Returns:
+            TSCheckResult for the current contents of the directory
+
+        Raises:
+            subprocess.TimeoutExpired: If tsc does not finish in time
+            FileNotFoundError: If neither tsc nor npx is available
+        """
+        scenes_dir = Path(scenes_dir).resolve()
+        with self._lock:
+            fingerprint = self._fingerprint(scenes_dir)
+            cached = self._results.get(scenes_dir)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+
+            result = self._run_tsc(scenes_dir)
+            self._results[scenes_dir] = (fingerprint, result)
+            return result
+
+    def invalidate(self, scenes_dir: Path | None = None) -> None:
+        """Drop memoized results for one directory, or for all of them."""
+        with self._lock:
+            if scenes_dir is None:
+                self._results.clear()
+            else:
+                self._results.pop(Path(scenes_dir).resolve(), None)
+
+    @staticmethod
+    def _fingerprint(scenes_dir: Path) -> tuple:
+        """Identify the current state of the scene files in a directory."""
+        entries = []
+        for pattern in ("*.tsx", "*.ts"):
+            for path in scenes_dir.glob(pattern):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+
+    def _build_info_path(self, scenes_dir: Path) -> Path:
+        """Location of the incremental build info for a scenes directory."""
+        digest = hashlib.sha256(str(scenes_dir).encode()).hexdigest()[:16]
+        return self.remotion_dir / "node_modules" / ".cache" / "scene-check" / f"{digest}.tsbuildinfo"
+
+    def _tsconfig(self, scenes_dir: Path) -> str:
+        """tsconfig covering both syntax and type checks of the scenes."""
+        build_info = self._build_info_path(scenes_dir)
+        return f"""{{
+  "compilerOptions": {{
+    "target": "ES2022",
+    "module": "ES2022",
+    "moduleResolution": "bundler",
+    "jsx": "react-jsx",
+    "strict": true,
+    "esModuleInterop": true,
+    "skipLibCheck": true,
+    "noEmit": true,
+    "incremental": true,
+    "tsBuildInfoFile": "{build_info}",
+    "baseUrl": ".",
+    "paths": {{
+      "remotion": ["{self.remotion_dir}/node_modules/remotion"],
+      "@remotion/*": ["{self.remotion_dir}/node_modules/@remotion/*"]
+    }}
+  }},
+  "include": ["*.tsx", "*.ts"],
+  "exclude": ["node_modules"]
+}}
+"""
+
+    def _run_tsc(self, scenes_dir: Path) -> TSCheckResult:
+        """Run tsc once over the scenes directory."""
+        tsconfig_path = scenes_dir / CHECK_TSCONFIG_NAME
+        tsconfig_existed = tsconfig_path.exists()
+        original_content = None
+
+        try:
+            if tsconfig_existed:
+                original_content = tsconfig_path.read_text()
+            tsconfig_path.write_text(self._tsconfig(scenes_dir))
+
+            try:
+                self._build_info_path(scenes_dir).parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass
+
+            tsc_path = self.remotion_dir / "node_modules" / ".bin" / "tsc"
+            if tsc_path.exists():
+                cmd = [str(tsc_path), "--project", str(tsconfig_path), "--pretty", "false"]
+            else:
+                cmd = ["npx", "tsc", "--project", str(tsconfig_path), "--pretty", "false"]
+
+            self.runs += 1
+            result = subprocess.run(
+                cmd,
+                cwd=self.remotion_dir if self.remotion_dir.is_dir() else scenes_dir,
+                capture_output=True,
+                text=True,
+                timeout=TSC_TIMEOUT_SECONDS,
+            )
+        finally:
+            if original_content is not None:
+                tsconfig_path.write_text(original_content)
+            elif tsconfig_path.exists() and not tsconfig_existed:
+                tsconfig_path.unlink()
+
+        output = result.stdout + result.stderr
+        diagnostics = parse_tsc_output(output) if result.returncode != 0 else []
+        return TSCheckResult(result.returncode, output, diagnostics)
+
+
+_checkers: dict[Path, TypeScriptChecker] = {}
+_checkers_lock = threading.Lock()
+
+
+def get_typescript_checker(remotion_dir: Path) -> TypeScriptChecker:
+    """Return the process-wide checker for a remotion project.
+
+    Args:
+        remotion_dir: Path to remotion project directory
+
+    Returns:
+        The shared TypeScriptChecker for that directory
+    """
+    key = Path(remotion_dir).resolve()
+    with _checkers_lock:
+        checker = _checkers.get(key)
+        if checker is None:
+            checker = TypeScriptChecker(key)
+            _checkers[key] = checker
+        return checker
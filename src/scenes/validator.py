@@ -5,6 +5,8 @@ import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .ts_checker import TypeScriptChecker, get_typescript_checker
+
 
 @dataclass
 class ValidationIssue:
@@ -36,13 +38,20 @@ class ValidationResult:
 class SceneValidator:
     """Validates generated Remotion scene components for common issues."""
 
-    def __init__(self, remotion_dir: Path | None = None):
+    def __init__(
+        self,
+        remotion_dir: Path | None = None,
+        checker: TypeScriptChecker | None = None,
+    ):
         """Initialize validator.
 
         Args:
             remotion_dir: Path to remotion project directory (for TypeScript checks)
+            checker: TypeScript checker to use (default: the shared checker
+                for remotion_dir)
         """
         self.remotion_dir = remotion_dir or Path(__file__).parent.parent.parent / "remotion"
+        self.checker = checker or get_typescript_checker(self.remotion_dir)
 
     def validate_scenes(self, scenes_dir: Path) -> ValidationResult:
         """Validate all scenes in a directory.
@@ -807,68 +816,15 @@ class SceneValidator:
     def _run_typescript_check(self, scenes_dir: Path) -> list[ValidationIssue]:
         """Run TypeScript compiler to check for type errors.
 
-        Uses the remotion project's TypeScript installation to check scenes.
+        Uses the remotion project's TypeScript installation to check scenes,
+        through the shared checker so the run is reused by SyntaxVerifier.
         """
         issues: list[ValidationIssue] = []
 
-        # Check if remotion directory has TypeScript
-        tsc_path = self.remotion_dir / "node_modules" / ".bin" / "tsc"
-        if not tsc_path.exists():
-            # Try finding it via npx in remotion directory
-            tsc_path = None
-
-        # Create a temporary tsconfig for the scenes directory
-        scenes_relative = scenes_dir.relative_to(scenes_dir.parent.parent) if scenes_dir.is_relative_to(scenes_dir.parent.parent) else scenes_dir
-        remotion_relative = self.remotion_dir.relative_to(scenes_dir.parent.parent) if self.remotion_dir.is_relative_to(scenes_dir.parent.parent) else self.remotion_dir
-
-        tsconfig_content = f"""{{
-  "compilerOptions": {{
-    "target": "ES2022",
-    "module": "ES2022",
-    "moduleResolution": "bundler",
-    "jsx": "react-jsx",
-    "strict": true,
-    "esModuleInterop": true,
-    "skipLibCheck": true,
-    "noEmit": true,
-    "baseUrl": ".",
-    "paths": {{
-      "remotion": ["{self.remotion_dir}/node_modules/remotion"],
-      "@remotion/*": ["{self.remotion_dir}/node_modules/@remotion/*"]
-    }}
-  }},
-  "include": ["*.tsx", "*.ts"],
-  "exclude": ["node_modules"]
-}}
-"""
-        tsconfig_path = scenes_dir / "tsconfig.json"
-        tsconfig_existed = tsconfig_path.exists()
-        original_content = None
-
         try:
-            if tsconfig_existed:
-                original_content = tsconfig_path.read_text()
-            tsconfig_path.write_text(tsconfig_content)
-
-            # Run TypeScript compiler from remotion directory
-            if tsc_path and tsc_path.exists():
-                cmd = [str(tsc_path), "--project", str(tsconfig_path), "--pretty", "false"]
-            else:
-                cmd = ["npx", "tsc", "--project", str(tsconfig_path), "--pretty", "false"]
-
-            result = subprocess.run(
-                cmd,
-                cwd=self.remotion_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode != 0:
-                # Parse TypeScript errors
-                error_pattern = r"([^:\s]+\.tsx?)\((\d+),\d+\):\s*error\s+TS(\d+):\s*(.+)"
-                output = result.stdout + result.stderr
+            check = self.checker.check(scenes_dir)
 
+            if check.returncode != 0:
                 # TypeScript error codes to ignore (module resolution, not actual code errors)
                 # TS2307: Cannot find module
                 # TS2792: Cannot find module (type declarations)
@@ -889,38 +845,30 @@ class SceneValidator:
                 ]
 
                 code_errors = []
-                for line in output.split("\n"):
-                    match = re.match(error_pattern, line)
-                    if match:
-                        error_code = match.group(3)
-                        error_msg = match.group(4)
-
-                        # Skip ignored error codes
-                        if error_code in ignored_error_codes:
-                            continue
-
-                        # Skip errors containing ignored phrases
-                        if any(phrase in error_msg for phrase in ignored_phrases):
-                            continue
-
-                        # Get just the filename
-                        filepath = match.group(1)
-                        filename = Path(filepath).name if "/" in filepath or "\\" in filepath else filepath
-                        code_errors.append(
-                            ValidationIssue(
-                                severity="error",
-                                message=f"TypeScript: {error_msg}",
-                                file=filename,
-                                line=int(match.group(2)),
-                            )
+                for diagnostic in check.diagnostics:
+                    # Skip ignored error codes
+                    if diagnostic.code.removeprefix("TS") in ignored_error_codes:
+                        continue
+
+                    # Skip errors containing ignored phrases
+                    if any(phrase in diagnostic.message for phrase in ignored_phrases):
+                        continue
+
+                    code_errors.append(
+                        ValidationIssue(
+                            severity="error",
+                            message=f"TypeScript: {diagnostic.message}",
+                            file=diagnostic.file,
+                            line=diagnostic.line,
                         )
+                    )
 
                 issues.extend(code_errors)
 
                 # If no code errors but still failed with output, check for common issues
-                if not code_errors and output.strip():
+                if not code_errors and check.output.strip():
                     # Check for "not the tsc command" message (tsc not installed)
-                    if "not the tsc command" in output:
+                    if "not the tsc command" in check.output:
                         issues.append(
                             ValidationIssue(
                                 severity="warning",
@@ -945,12 +893,6 @@ class SceneValidator:
                     file="",
                 )
             )
-        finally:
-            # Restore or remove tsconfig
-            if original_content is not None:
-                tsconfig_path.write_text(original_content)
-            elif tsconfig_path.exists() and not tsconfig_existed:
-                tsconfig_path.unlink()
 
         return issues
 
@@ -7,6 +7,7 @@ from typing import Any
 from ..config import Config, load_config
 from ..models import Script
 from ..project.loader import Project
+from ..sync.alignment import NarrationAlignment
 from ..understanding.llm_provider import LLMProvider, get_llm_provider
 from .models import (
     ShortConfig,
@@ -148,6 +149,26 @@ def merge_number_tokens(timestamps: list[dict]) -> list[dict]:
     return merged
 
 
+def align_caption_words(timestamps: list[dict], narration: str) -> list[dict]:
+    """Re-tokenize voiceover word timestamps to the narration's words.
+
+    TTS and Whisper split words differently from the script ("150" + ",528",
+    detached punctuation). Aligning the timestamps to the narration text
+    gives one caption word per narration word, spelled as in the script.
+    Without narration text, only split numbers are merged.
+
+    Args:
+        timestamps: List of word timestamp dicts with 'word', 'start_seconds', 'end_seconds'.
+        narration: The narration text that was spoken.
+
+    Returns:
+        List of word timestamp dicts matching the narration's words.
+    """
+    if not timestamps or not narration.strip():
+        return merge_number_tokens(timestamps)
+    return NarrationAlignment.from_timestamps(narration, timestamps).narration_words()
+
+
 HOOK_ANALYSIS_SYSTEM_PROMPT = """You are an expert at creating viral YouTube Shorts.
 
 Your job is to analyze a full video script and identify the SINGLE most intriguing 30-45 second segment that would make viewers desperate to watch the full video.
@@ -1264,6 +1285,7 @@ class ShortGenerator:
         self,
         storyboard: ShortsStoryboard,
         word_timestamps: list,
+        narration: str = "",
     ) -> ShortsStoryboard:
         """Update storyboard beats with word timestamps from voiceover.
 
@@ -1272,6 +1294,10 @@ class ShortGenerator:
         Args:
             storyboard: The storyboard to update.
             word_timestamps: List of WordTimestamp objects from voiceover.
+            narration: The narration the voiceover was generated from (the
+                short script's condensed and CTA narration). Caption text is
+                not used, since it may be paraphrased; without narration only
+                split numbers are merged.
 
         Returns:
             Updated ShortsStoryboard with word timestamps in each beat.
@@ -1286,8 +1312,8 @@ class ShortGenerator:
             for ts in word_timestamps
         ]
 
-        # Merge number tokens (e.g., "150" + ",528" → "150,528")
-        timestamps = merge_number_tokens(timestamps)
+        # Match caption words to the script (e.g., "150" + ",528" → "150,528")
+        timestamps = align_caption_words(timestamps, narration)
 
         # Assign timestamps to beats based on timing
         for beat in storyboard.beats:
@@ -1335,8 +1361,14 @@ class ShortGenerator:
             for ts in word_timestamps
         ]
 
-        # Merge number tokens (e.g., "150" + ",528" → "150,528")
-        timestamps = merge_number_tokens(timestamps)
+        # Match caption words to the script (e.g., "150" + ",528" → "150,528"),
+        # using the same narration the voiceover was generated from
+        narration = " ".join(
+            part.strip()
+            for part in (short_script.condensed_narration, short_script.cta_narration)
+            if part
+        )
+        timestamps = align_caption_words(timestamps, narration)
 
         if not timestamps:
             # Fallback to old method if no timestamps
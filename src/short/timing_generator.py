@@ -6,15 +6,15 @@ voiceover timing changes.
 """
 
 import json
-import re
 from pathlib import Path
 from typing import Any
 
+from ..sync.word_timeline import WordTimeline
 from .models import ShortsStoryboard, ShortsBeat, PhaseMarker
 
 
 def find_word_frame(
-    word_timestamps: list[dict[str, Any]],
+    word_timestamps: list[dict[str, Any]] | WordTimeline,
     target_word: str,
     fps: int = 30,
     match_mode: str = "contains",
@@ -24,7 +24,8 @@ def find_word_frame(
     """Find the frame number when a specific word is spoken.
 
     Args:
-        word_timestamps: List of word timestamp dicts with 'word', 'start_seconds', 'end_seconds'.
+        word_timestamps: List of word timestamp dicts with 'word', 'start_seconds', 'end_seconds',
+            or a WordTimeline built from them.
         target_word: The word to find (case-insensitive).
         fps: Frames per second for conversion.
         match_mode: How to match words:
@@ -37,36 +38,12 @@ def find_word_frame(
     Returns:
         Frame number when the word starts/ends (plus offset), or None if not found.
     """
-    target_lower = target_word.lower().strip()
-    # Also strip punctuation from target for matching
-    target_clean = re.sub(r"[.,!?;:'\"]+$", "", target_lower)
-
-    for ts in word_timestamps:
-        word = ts.get("word", "")
-        # Strip common punctuation for matching
-        word_clean = re.sub(r"[.,!?;:'\"]+$", "", word.lower().strip())
-
-        matched = False
-        if match_mode == "exact":
-            matched = word_clean == target_clean
-        elif match_mode == "contains":
-            matched = target_clean in word_clean or word_clean in target_clean
-        elif match_mode == "starts_with":
-            matched = word_clean.startswith(target_clean)
-
-        if matched:
-            # Return frame at start or end of word
-            if use_start:
-                time_seconds = ts.get("start_seconds", 0)
-            else:
-                time_seconds = ts.get("end_seconds", 0)
-            return int(time_seconds * fps) + offset_frames
-
-    return None
+    timeline = WordTimeline.of(word_timestamps, fps)
+    return timeline.find_frame(target_word, match_mode, use_start, offset_frames, fps=fps)
 
 
 def find_word_frame_fuzzy(
-    word_timestamps: list[dict[str, Any]],
+    word_timestamps: list[dict[str, Any]] | WordTimeline,
     target_word: str,
     fps: int = 30,
     use_start: bool = False,
@@ -74,8 +51,10 @@ def find_word_frame_fuzzy(
 ) -> int | None:
     """Find word frame with fuzzy matching, trying multiple strategies.
 
+    Tries an exact match first, then contains, then starts_with.
+
     Args:
-        word_timestamps: List of word timestamp dicts.
+        word_timestamps: List of word timestamp dicts, or a WordTimeline.
         target_word: The word to find.
         fps: Frames per second.
         use_start: If True, return frame at word START.
@@ -84,22 +63,7 @@ def find_word_frame_fuzzy(
     Returns:
         Frame number or None if not found.
     """
-    # Try exact match first
-    frame = find_word_frame(word_timestamps, target_word, fps, "exact", use_start, offset_frames)
-    if frame is not None:
-        return frame
-
-    # Try contains match
-    frame = find_word_frame(word_timestamps, target_word, fps, "contains", use_start, offset_frames)
-    if frame is not None:
-        return frame
-
-    # Try starts_with match
-    frame = find_word_frame(word_timestamps, target_word, fps, "starts_with", use_start, offset_frames)
-    if frame is not None:
-        return frame
-
-    return None
+    return find_word_frame(word_timestamps, target_word, fps, "fuzzy", use_start, offset_frames)
 
 
 def calculate_beat_timing(
@@ -127,9 +91,10 @@ def calculate_beat_timing(
 
     # Process each phase marker
     # Use word START time with a lead offset so animations begin just before the word
+    timeline = WordTimeline(beat.word_timestamps, fps)
     for marker in beat.phase_markers:
         frame = find_word_frame_fuzzy(
-            beat.word_timestamps,
+            timeline,
             marker.end_word,
             fps,
             use_start=True,  # Use word start time
@@ -0,0 +1,89 @@
+"""Persistent cache of per-scene SFX analysis results.
+
+Analyzing a TSX scene (AST extraction, regex fallback, semantic mapping) is
+a pure function of the scene source, its duration, the frame rate and the
+analyzer code itself. Results are stored under a hash of exactly those
+inputs, so after editing one scene only that scene is re-analyzed.
+
+Entries are individual JSON files written atomically, so concurrent runs
+never observe a partially written entry.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from .models import SceneAnalysisResult
+
+# Bump when analyzer, extraction script or semantic mapping output changes,
+# so stale cached analyses are not reused.
+ANALYZER_VERSION = 1
+
+
+class SceneAnalysisCache:
+    """Content-addressed store of SceneAnalysisResults, one file per entry."""
+
+    def __init__(self, cache_dir: Path | str):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        source: bytes,
+        duration_frames: int,
+        fps: int,
+        analyzer: str,
+    ) -> str:
+        """Compute the cache key for one scene analysis.
+
+        Args:
+            source: Raw contents of the scene file
+            duration_frames: Scene duration in frames
+            fps: Frames per second
+            analyzer: Which analyzer produced the result (e.g. "ast", "regex")
+        """
+        digest = hashlib.sha256()
+        digest.update(hashlib.sha256(source).digest())
+        digest.update(
+            json.dumps(
+                {
+                    "analyzer_version": ANALYZER_VERSION,
+                    "analyzer": analyzer,
+                    "duration_frames": duration_frames,
+                    "fps": fps,
+                },
+                sort_keys=True,
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Path of the cache entry for a key (may not exist yet)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[SceneAnalysisResult]:
+        """Return the cached result for a key, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            result = SceneAnalysisResult.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: SceneAnalysisResult) -> None:
+        """Store a result under a key."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(result.to_dict()))
+        os.replace(tmp_path, path)
@@ -20,7 +20,7 @@ from .models import (
     VOLUME_BY_TYPE,
     MOMENT_TO_SOUND,
 )
-from .generator import SoundGenerator, SoundEvent, SoundTheme, save_wav
+from .generator import SoundGenerator, SoundEvent, SoundTheme, save_wav, stable_seed
 
 
 # Mapping from moment types to SoundEvent enum
@@ -132,7 +132,7 @@ class CueGenerator:
             volume = calculate_volume(moment)
 
             # Generate unique sound with reproducible seed
-            seed = hash(f"{scene_id}_{moment.type}_{i}_{moment.frame}") & 0xFFFFFFFF
+            seed = stable_seed(scene_id, moment.type, i, moment.frame)
 
             samples = self.generator.generate(
                 event=event,
@@ -11,17 +11,29 @@ Design Principles:
 - Professional quality: FM synthesis, filtering, reverb, proper mastering
 """
 
+import hashlib
+import os
+import shutil
 import wave
 import json
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Optional, Literal, Union, Tuple
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Optional, Literal, Union, Tuple
 from enum import Enum
 
 import numpy as np
 from scipy import signal
 from scipy.ndimage import gaussian_filter1d
 
+try:
+    from ..audio.loudness import SFX_TARGET_LUFS, normalize_loudness
+    LOUDNESS_AVAILABLE = True
+except ImportError:
+    # Imported as a top-level module (as the tests beside this file do)
+    LOUDNESS_AVAILABLE = False
+
 SAMPLE_RATE = 44100
 
 
@@ -192,6 +204,16 @@ def normalize(samples: np.ndarray, target_db: float = -3.0) -> np.ndarray:
     return samples
 
 
+def normalize_sfx(samples: np.ndarray, sample_rate: int = SAMPLE_RATE, offset_db: float = 0.0) -> np.ndarray:
+    """Normalize to the SFX loudness target (EBU R128), offset by offset_db.
+
+    Falls back to peak normalization when the loudness meter isn't importable.
+    """
+    if LOUDNESS_AVAILABLE:
+        return normalize_loudness(samples, sample_rate, SFX_TARGET_LUFS + offset_db)
+    return normalize(samples, -6.0 + offset_db)
+
+
 def soft_clip(samples: np.ndarray, threshold: float = 0.8) -> np.ndarray:
     """Soft saturation using tanh."""
     return np.tanh(samples / threshold) * threshold
@@ -359,14 +381,18 @@ def simple_reverb(samples: np.ndarray, size: float = 0.3, damping: float = 0.5)
 
     output = samples.copy()
 
-    # Comb filters in parallel
+    # Comb filters in parallel: y[n] = x[n - d] + g * y[n - d]. Folding the
+    # signal into rows of length d turns this into the first-order IIR
+    # z^-1 / (1 - g z^-1) down each column, which lfilter runs in one pass.
+    feedback = 0.7 * (1 - damping * 0.3)
+    n = len(samples)
     for delay in delays[:4]:
-        if delay < len(samples):
-            comb = np.zeros_like(samples)
-            feedback = 0.7 * (1 - damping * 0.3)
-            for i in range(delay, len(samples)):
-                comb[i] = samples[i - delay] + feedback * comb[i - delay] if i >= delay else 0
-            output += comb * 0.15
+        if delay < n:
+            rows = -(-n // delay)
+            folded = np.zeros(rows * delay, dtype=samples.dtype)
+            folded[:n] = samples
+            comb = signal.lfilter([0.0, 1.0], [1.0, -feedback], folded.reshape(rows, delay), axis=0)
+            output += comb.ravel()[:n] * 0.15
 
     # Simple lowpass for damping
     if damping > 0:
@@ -502,7 +528,7 @@ class SoundGenerator:
         # Final processing
         samples = apply_fade(samples)
         samples = soft_clip(samples)
-        samples = normalize(samples, -6.0 - (1 - intensity) * 6)
+        samples = normalize_sfx(samples, SAMPLE_RATE, -(1 - intensity) * 6)
 
         return samples
 
@@ -919,70 +945,257 @@ class SoundGenerator:
 # =============================================================================
 
 def save_wav(samples: np.ndarray, filepath: Path, sample_rate: int = SAMPLE_RATE):
-    """Save samples to WAV file."""
-    samples = normalize(samples, -3.0)
+    """Save samples to WAV file, normalized to the SFX loudness target."""
+    samples = normalize_sfx(samples, sample_rate)
     samples_int = np.int16(np.clip(samples, -1, 1) * 32767)
 
+    filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with wave.open(str(filepath), 'w') as wav:
+    # Write then rename so a hard-linked cache entry is replaced, never rewritten
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    with wave.open(str(tmp_path), 'w') as wav:
         wav.setnchannels(1)
         wav.setsampwidth(2)
         wav.setframerate(sample_rate)
         wav.writeframes(samples_int.tobytes())
+    os.replace(tmp_path, filepath)
+
+
+# =============================================================================
+# SFX Cache - generated WAVs shared across projects
+# =============================================================================
+
+# Bump whenever synthesis here or in library.py changes, so cached WAVs
+# rendered by older code are not reused.
+SYNTHESIS_VERSION = 4
+
+
+def default_sfx_cache_dir() -> Path:
+    """Return the user-level cache directory for generated SFX."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "video-explainer" / "sfx"
+
+
+def stable_seed(*parts) -> int:
+    """Derive a reproducible 32-bit RNG seed from the given values.
+
+    Unlike hash(), the result does not change between interpreter runs.
+    """
+    return zlib.crc32(json.dumps(parts, default=str).encode())
+
+
+@dataclass
+class SFXJob:
+    """One sound to materialize.
+
+    ``render(output_path, *args)`` writes the WAV. It must be a module-level
+    function so it can be sent to a worker process. ``params`` is everything
+    the output depends on and becomes the cache key.
+    """
+
+    name: str
+    params: dict
+    render: Callable
+    args: tuple = ()
+
+
+class SFXCache:
+    """Content-addressed store of generated WAVs, one file per parameter set."""
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached WAVs (default: user cache dir)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_sfx_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        """Compute the cache key for a set of synthesis parameters."""
+        payload = json.dumps(
+            {"synthesis_version": SYNTHESIS_VERSION, **params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Path of the cached WAV for a key (may not exist yet)."""
+        return self.cache_dir / key[:2] / f"{key}.wav"
+
+    def link_into(self, key: str, dest: Path) -> Path:
+        """Hard-link a cached WAV to dest, copying if linking is not possible."""
+        source = self.path_for(key)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()
+        try:
+            os.link(source, dest)
+        except OSError:
+            shutil.copy2(source, dest)
+        return dest
+
+
+def _render_job(render: Callable, args: tuple, output_path: Path) -> Path:
+    """Worker entry point: render one sound to output_path."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    render(output_path, *args)
+    return output_path
+
+
+def _render_jobs(targets: list[tuple[SFXJob, Path]], max_workers: int | None) -> None:
+    """Render jobs to their paths, in a process pool when there are several."""
+    workers = min(max_workers or os.cpu_count() or 1, len(targets))
+    if workers <= 1:
+        for job, path in targets:
+            _render_job(job.render, job.args, path)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_render_job, job.render, job.args, path) for job, path in targets
+        ]
+        for future in futures:
+            future.result()
+
+
+def materialize_sfx(
+    jobs: list[SFXJob],
+    dest_dir: Path,
+    cache: SFXCache | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Path]:
+    """Make every job's WAV available as dest_dir/<name>.wav.
+
+    With a cache, only entries missing from it are rendered (in parallel)
+    and all files are then linked into dest_dir. Without one, every job is
+    rendered straight into dest_dir.
+
+    Args:
+        jobs: Sounds to materialize
+        dest_dir: Directory the WAVs should end up in
+        cache: Shared SFX cache, or None to always render
+        max_workers: Worker processes for rendering (default: CPU count)
+
+    Returns:
+        Dictionary mapping job names to file paths, in job order
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    if cache is None:
+        targets = [(job, dest_dir / f"{job.name}.wav") for job in jobs]
+        _render_jobs(targets, max_workers)
+        return {job.name: path for job, path in targets}
+
+    keys = {job.name: cache.make_key(job.params) for job in jobs}
+    missing = [job for job in jobs if not cache.path_for(keys[job.name]).exists()]
+    cache.hits += len(jobs) - len(missing)
+    cache.misses += len(missing)
+    _render_jobs([(job, cache.path_for(keys[job.name])) for job in missing], max_workers)
+
+    return {job.name: cache.link_into(keys[job.name], dest_dir / f"{job.name}.wav") for job in jobs}
+
+
+def render_event_sfx(
+    output_path: Path,
+    theme: str,
+    event: str,
+    duration: float,
+    intensity: float,
+    pitch_offset: float,
+    seed: int,
+) -> None:
+    """Render one themed event sound to a WAV file (process-pool safe)."""
+    samples = SoundGenerator(SoundTheme(theme)).generate(
+        SoundEvent(event),
+        duration=duration,
+        intensity=intensity,
+        pitch_offset=pitch_offset,
+        variation_seed=seed,
+    )
+    save_wav(samples, output_path)
 
 
 class ProjectSFXManager:
     """Manages SFX generation for a video project."""
 
-    def __init__(self, project_dir: Path, theme: SoundTheme = SoundTheme.TECH_AI):
+    # (suffix, events, duration, intensity) for each library variant
+    LIBRARY_VARIANTS = [
+        ("", list(SoundEvent), 0.4, 0.7),
+        ("_short", [SoundEvent.TEXT_REVEAL, SoundEvent.PING, SoundEvent.PULSE], 0.15, 0.6),
+        ("_intense", [SoundEvent.REVEAL, SoundEvent.SUCCESS, SoundEvent.WARNING], 0.6, 1.0),
+    ]
+
+    def __init__(
+        self,
+        project_dir: Path,
+        theme: SoundTheme = SoundTheme.TECH_AI,
+        use_cache: bool = True,
+        cache_dir: Path | None = None,
+        seed: int = 0,
+        max_workers: int | None = None,
+    ):
         """Initialize SFX manager for a project.
 
         Args:
             project_dir: Path to project directory
             theme: Sound theme for the project
+            use_cache: Reuse WAVs from the shared SFX cache
+            cache_dir: Cache location (default: user cache dir)
+            seed: Base seed for sound variations
+            max_workers: Worker processes for rendering missing sounds
         """
         self.project_dir = Path(project_dir)
         self.sfx_dir = self.project_dir / "sfx"
         self.generator = SoundGenerator(theme)
         self.theme = theme
+        self.cache = SFXCache(cache_dir) if use_cache else None
+        self.seed = seed
+        self.max_workers = max_workers
+
+    def _job(
+        self,
+        name: str,
+        event: SoundEvent,
+        duration: float,
+        intensity: float,
+        pitch_offset: float = 0.0,
+    ) -> SFXJob:
+        """Build the render job for one sound."""
+        seed = stable_seed(self.seed, name)
+        args = (self.theme.value, event.value, duration, intensity, pitch_offset, seed)
+        params = {
+            "kind": "event",
+            "palette": asdict(self.generator.palette),
+            "event": event.value,
+            "duration": duration,
+            "intensity": intensity,
+            "pitch_offset": pitch_offset,
+            "seed": seed,
+        }
+        return SFXJob(name=name, params=params, render=render_event_sfx, args=args)
 
     def generate_library(self) -> dict[str, Path]:
         """Generate a complete SFX library for all event types.
 
+        Sounds already in the shared cache are linked instead of rendered;
+        the rest are rendered in parallel.
+
         Returns:
             Dictionary mapping sound names to file paths
         """
-        self.sfx_dir.mkdir(parents=True, exist_ok=True)
-
-        generated = {}
-
-        # Generate sounds for each event type
+        jobs = []
+        # Keep the historical per-event ordering: base, then short/intense variants
         for event in SoundEvent:
-            # Generate base version
-            samples = self.generator.generate(event, duration=0.4, intensity=0.7)
-            filename = f"{event.value}.wav"
-            filepath = self.sfx_dir / filename
-            save_wav(samples, filepath)
-            generated[event.value] = filepath
-
-            # Generate short version for quick events
-            if event in [SoundEvent.TEXT_REVEAL, SoundEvent.PING, SoundEvent.PULSE]:
-                samples_short = self.generator.generate(event, duration=0.15, intensity=0.6)
-                filename_short = f"{event.value}_short.wav"
-                filepath_short = self.sfx_dir / filename_short
-                save_wav(samples_short, filepath_short)
-                generated[f"{event.value}_short"] = filepath_short
-
-            # Generate intense version for emphasis
-            if event in [SoundEvent.REVEAL, SoundEvent.SUCCESS, SoundEvent.WARNING]:
-                samples_intense = self.generator.generate(event, duration=0.6, intensity=1.0)
-                filename_intense = f"{event.value}_intense.wav"
-                filepath_intense = self.sfx_dir / filename_intense
-                save_wav(samples_intense, filepath_intense)
-                generated[f"{event.value}_intense"] = filepath_intense
-
-        return generated
+            for suffix, events, duration, intensity in self.LIBRARY_VARIANTS:
+                if event in events:
+                    jobs.append(self._job(f"{event.value}{suffix}", event, duration, intensity))
+
+        return materialize_sfx(jobs, self.sfx_dir, self.cache, self.max_workers)
 
     def generate_custom(
         self,
@@ -1004,19 +1217,8 @@ class ProjectSFXManager:
         Returns:
             Path to generated file
         """
-        self.sfx_dir.mkdir(parents=True, exist_ok=True)
-
-        samples = self.generator.generate(
-            event,
-            duration=duration,
-            intensity=intensity,
-            pitch_offset=pitch_offset
-        )
-
-        filepath = self.sfx_dir / f"{name}.wav"
-        save_wav(samples, filepath)
-
-        return filepath
+        job = self._job(name, event, duration, intensity, pitch_offset)
+        return materialize_sfx([job], self.sfx_dir, self.cache, max_workers=1)[name]
 
     def list_sounds(self) -> list[str]:
         """List all generated sounds in the project."""
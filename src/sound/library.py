@@ -11,12 +11,16 @@ Design Philosophy:
 - Inspired by Apple/iOS UI aesthetics
 """
 
+import os
 import wave
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
+from ..audio.loudness import SFX_TARGET_LUFS, normalize_loudness
+from .generator import SFXCache, SFXJob, materialize_sfx, stable_seed
+
 SAMPLE_RATE = 44100
 
 
@@ -90,15 +94,19 @@ def soft_saturate(samples: np.ndarray, amount: float = 0.3) -> np.ndarray:
 
 
 def save_wav(samples: np.ndarray, filename: str, sample_rate: int = SAMPLE_RATE) -> None:
-    """Save as 16-bit WAV."""
-    samples = normalize(samples, -3.0)
+    """Save as 16-bit WAV, normalized to the SFX loudness target."""
+    samples = normalize_loudness(samples, sample_rate, SFX_TARGET_LUFS)
     samples_int = np.int16(samples * 32767)
 
-    with wave.open(filename, "w") as wav:
+    # Write then rename so a hard-linked cache entry is replaced, never rewritten
+    path = Path(filename)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with wave.open(str(tmp_path), "w") as wav:
         wav.setnchannels(1)
         wav.setsampwidth(2)
         wav.setframerate(sample_rate)
         wav.writeframes(samples_int.tobytes())
+    os.replace(tmp_path, path)
 
 
 # For backwards compatibility with tests
@@ -635,29 +643,52 @@ GENERATORS = {
 }
 
 
+def render_library_sound(output_path: Path, generator_name: str, seed: int) -> None:
+    """Render one manifest sound to a WAV file (process-pool safe)."""
+    np.random.seed(seed)
+    save_wav(GENERATORS[generator_name](), str(output_path))
+
+
 class SoundLibrary:
     """Manages the SFX library for a project."""
 
-    def __init__(self, sfx_dir: Path):
-        """Initialize with path to sfx directory."""
+    def __init__(
+        self,
+        sfx_dir: Path,
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize with path to sfx directory.
+
+        Args:
+            sfx_dir: Project directory the WAVs are written to
+            use_cache: Reuse WAVs from the shared SFX cache
+            cache_dir: Cache location (default: user cache dir)
+            max_workers: Worker processes for rendering missing sounds
+        """
         self.sfx_dir = sfx_dir
+        self.cache = SFXCache(cache_dir) if use_cache else None
+        self.max_workers = max_workers
 
     def generate_all(self) -> list[str]:
-        """Generate all sounds in the library."""
-        self.sfx_dir.mkdir(parents=True, exist_ok=True)
-        generated = []
+        """Generate all sounds in the library.
 
+        Sounds already in the shared cache are linked instead of rendered.
+        """
+        jobs = []
         for name, info in SOUND_MANIFEST.items():
             generator_name = info["generator"]
-            generator = GENERATORS.get(generator_name)
-
-            if generator:
-                samples = generator()
-                output_path = self.sfx_dir / f"{name}.wav"
-                save_wav(samples, str(output_path))
-                generated.append(name)
-
-        return generated
+            if generator_name in GENERATORS:
+                seed = stable_seed(name)
+                jobs.append(SFXJob(
+                    name=name,
+                    params={"kind": "library", "generator": generator_name, "seed": seed},
+                    render=render_library_sound,
+                    args=(generator_name, seed),
+                ))
+
+        return list(materialize_sfx(jobs, self.sfx_dir, self.cache, self.max_workers))
 
     def list_sounds(self) -> list[str]:
         """List available sounds."""
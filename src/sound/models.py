@@ -58,6 +58,31 @@ class SoundMoment:
         self.intensity = max(0.0, min(1.0, self.intensity))
         self.frame = max(0, self.frame)
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "type": self.type,
+            "frame": self.frame,
+            "confidence": self.confidence,
+            "context": self.context,
+            "intensity": self.intensity,
+            "source": self.source,
+            "duration_frames": self.duration_frames,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SoundMoment":
+        """Create from dictionary."""
+        return cls(
+            type=data["type"],
+            frame=data["frame"],
+            confidence=data["confidence"],
+            context=data.get("context", ""),
+            intensity=data.get("intensity", 0.7),
+            source=data.get("source", "code"),
+            duration_frames=data.get("duration_frames"),
+        )
+
 
 @dataclass
 class SFXCue:
@@ -168,6 +193,29 @@ class SceneAnalysisResult:
         """Get moments within a frame range."""
         return [m for m in self.moments if start_frame <= m.frame <= end_frame]
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "scene_id": self.scene_id,
+            "scene_type": self.scene_type,
+            "duration_frames": self.duration_frames,
+            "moments": [m.to_dict() for m in self.moments],
+            "source_file": self.source_file,
+            "analysis_notes": list(self.analysis_notes),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SceneAnalysisResult":
+        """Create from dictionary."""
+        return cls(
+            scene_id=data["scene_id"],
+            scene_type=data["scene_type"],
+            duration_frames=data["duration_frames"],
+            moments=[SoundMoment.from_dict(m) for m in data.get("moments", [])],
+            source_file=data.get("source_file"),
+            analysis_notes=list(data.get("analysis_notes", [])),
+        )
+
 
 # Volume guidelines by moment type
 VOLUME_BY_TYPE = {
@@ -15,6 +15,7 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
+from ..sync.alignment import NarrationAlignment
 from .models import SoundMoment, WordTimestamp
 
 
@@ -132,18 +133,17 @@ class NarrationSyncAnalyzer:
         """
         moments = []
 
-        # Create word lookup for timestamp matching
-        word_lookup = self._build_word_lookup(word_timestamps)
+        # Map narration character spans to the timed words they were spoken in
+        alignment = NarrationAlignment.from_timestamps(narration, word_timestamps)
 
         # Apply each pattern
         for pattern in self.patterns:
             for match in pattern.pattern.finditer(narration):
                 matched_text = match.group(0)
-                start_pos = match.start()
 
-                # Find the word timestamp for this position
-                timestamp = self._find_timestamp_for_position(
-                    start_pos, narration, word_lookup
+                # Find the word timestamp for this span of the narration
+                timestamp = self._find_timestamp_for_span(
+                    match.start(), match.end(), alignment, word_timestamps
                 )
 
                 if timestamp:
@@ -164,62 +164,28 @@ class NarrationSyncAnalyzer:
 
         return moments
 
-    def _build_word_lookup(
+    def _find_timestamp_for_span(
         self,
-        timestamps: list[WordTimestamp],
-    ) -> dict[str, list[WordTimestamp]]:
-        """Build a lookup table for word timestamps.
-
-        Args:
-            timestamps: List of word timestamps
-
-        Returns:
-            Dict mapping lowercase words to their timestamps
-        """
-        lookup: dict[str, list[WordTimestamp]] = {}
-
-        for ts in timestamps:
-            word_lower = ts.word.lower().strip(".,!?;:'\"")
-            if word_lower not in lookup:
-                lookup[word_lower] = []
-            lookup[word_lower].append(ts)
-
-        return lookup
-
-    def _find_timestamp_for_position(
-        self,
-        char_position: int,
-        text: str,
-        word_lookup: dict[str, list[WordTimestamp]],
+        char_start: int,
+        char_end: int,
+        alignment: NarrationAlignment,
+        word_timestamps: list[WordTimestamp],
     ) -> Optional[WordTimestamp]:
-        """Find the word timestamp for a character position in text.
+        """Find the timestamp of the first word spoken for a narration span.
 
         Args:
-            char_position: Character position in text
-            text: Full narration text
-            word_lookup: Word timestamp lookup table
+            char_start: Start of the span in the narration text
+            char_end: End of the span (exclusive)
+            alignment: Alignment of the narration to the word timestamps
+            word_timestamps: The aligned word timestamps
 
         Returns:
-            WordTimestamp if found, None otherwise
+            WordTimestamp if the span was spoken, None otherwise
         """
-        # Extract the word at this position
-        word_start = char_position
-        word_end = char_position
-
-        # Find word boundaries
-        while word_start > 0 and text[word_start - 1].isalnum():
-            word_start -= 1
-        while word_end < len(text) and text[word_end].isalnum():
-            word_end += 1
-
-        word = text[word_start:word_end].lower()
-
-        # Look up timestamp
-        if word in word_lookup and word_lookup[word]:
-            # Return the first available timestamp for this word
-            return word_lookup[word].pop(0)
-
-        return None
+        words = alignment.word_range(char_start, char_end)
+        if words is None:
+            return None
+        return word_timestamps[words[0]]
 
     def _deduplicate_nearby(
         self,
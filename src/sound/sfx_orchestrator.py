@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .analysis_cache import SceneAnalysisCache
 from .models import SoundMoment, SFXCue, SceneAnalysisResult
 from .scene_analyzer import SceneAnalyzer, find_scene_files
 from .ts_analyzer import TypeScriptAnalyzer
@@ -57,6 +58,8 @@ class SFXOrchestrator:
         fps: int = 30,
         use_library: bool = True,
         use_ast_analyzer: bool = True,
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize the orchestrator.
 
@@ -66,6 +69,8 @@ class SFXOrchestrator:
             fps: Frames per second (default 30)
             use_library: Use library sounds vs custom generation
             use_ast_analyzer: Use TypeScript AST analyzer (falls back to regex)
+            use_cache: Reuse analysis results of unchanged scene files
+            cache_dir: Analysis cache location (default: <project>/.cache/scene-analysis)
         """
         self.project_dir = Path(project_dir)
         self.theme = theme
@@ -76,6 +81,11 @@ class SFXOrchestrator:
         # Determine paths
         self.storyboard_path = self.project_dir / "storyboard" / "storyboard.json"
         self.sfx_dir = self.project_dir / "sfx"
+        self.cache = (
+            SceneAnalysisCache(cache_dir or self.project_dir / ".cache" / "scene-analysis")
+            if use_cache
+            else None
+        )
 
         # Components - both analyzers available
         self.regex_analyzer = SceneAnalyzer(fps=fps)
@@ -87,6 +97,17 @@ class SFXOrchestrator:
             sfx_dir=self.sfx_dir,
         )
 
+    def __enter__(self) -> "SFXOrchestrator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the AST analyzer's node extraction server, if one was started."""
+        if self.ts_analyzer is not None:
+            self.ts_analyzer.close()
+
     def _find_remotion_dir(self) -> Path:
         """Find the remotion directory relative to project."""
         # Try common locations
@@ -195,6 +216,9 @@ class SFXOrchestrator:
         updater = load_storyboard(self.storyboard_path)
         project_id = updater.get_project_info().get("project", "")
 
+        # (scene_id, scene_type, duration_frames, scene_file) awaiting analysis
+        pending: list[tuple[str, str, int, Path]] = []
+
         for scene in updater.get_scenes():
             scene_id = scene.get("id", "")
             scene_type = scene.get("type", "")
@@ -211,10 +235,8 @@ class SFXOrchestrator:
 
             # Create analysis result
             if scene_file:
-                result = self._analyze_scene_file(
-                    scene_file, scene_id, scene_type, duration_frames
-                )
-                results[scene_id] = result
+                pending.append((scene_id, scene_type, duration_frames, scene_file))
+                results[scene_id] = None
             else:
                 # No scene file found - create empty result
                 results[scene_id] = SceneAnalysisResult(
@@ -224,8 +246,63 @@ class SFXOrchestrator:
                     analysis_notes=["Scene file not found"],
                 )
 
+        # Reuse cached analyses of unchanged scene files
+        cache_keys: dict[str, str] = {}
+        if self.cache is not None:
+            misses = []
+            for entry in pending:
+                scene_id, scene_type, duration_frames, scene_file = entry
+                key = self._cache_key(scene_file, duration_frames)
+                cached = self.cache.get(key) if key else None
+                if cached is None:
+                    if key:
+                        cache_keys[scene_id] = key
+                    misses.append(entry)
+                    continue
+                cached.scene_id = scene_id
+                cached.scene_type = scene_type
+                cached.source_file = str(scene_file)
+                results[scene_id] = cached
+            pending = misses
+
+        # Run every scene through one AST extraction process
+        if self.use_ast_analyzer and self.ts_analyzer and pending:
+            ast_outcomes = self.ts_analyzer.analyze_scenes(
+                [(scene_file, duration_frames) for _, _, duration_frames, scene_file in pending]
+            )
+        else:
+            ast_outcomes = [None] * len(pending)
+
+        for (scene_id, scene_type, duration_frames, scene_file), ast_outcome in zip(
+            pending, ast_outcomes
+        ):
+            result = self._complete_scene_analysis(
+                scene_file, scene_id, scene_type, duration_frames, ast_outcome
+            )
+            results[scene_id] = result
+
+            # Failed analyses (AST errors, or regex errors which leave
+            # source_file unset) are retried next run rather than cached
+            if scene_id in cache_keys and not isinstance(ast_outcome, Exception) and (
+                result.source_file is not None
+            ):
+                self.cache.put(cache_keys[scene_id], result)
+
         return results
 
+    def _cache_key(self, scene_file: Path, duration_frames: int) -> Optional[str]:
+        """Compute the analysis cache key for a scene file.
+
+        Returns:
+            The key, or None if the scene file cannot be read
+        """
+        try:
+            source = scene_file.read_bytes()
+        except OSError:
+            return None
+        analyzer = "ast" if self.use_ast_analyzer and self.ts_analyzer else "regex"
+        return SceneAnalysisCache.make_key(source, duration_frames, self.fps, analyzer)
+
     def _analyze_scene_file(
         self,
         scene_file: Path,
@@ -244,16 +321,48 @@ class SFXOrchestrator:
         Returns:
             SceneAnalysisResult with detected moments
         """
-        result = None
-        analysis_notes = []
+        ast_outcome = None
 
         # Try TypeScript AST analyzer first (if enabled)
         if self.use_ast_analyzer and self.ts_analyzer:
             try:
-                result = self.ts_analyzer.analyze_scene(scene_file, duration_frames)
-                analysis_notes.append("Analyzed with TypeScript AST parser")
+                ast_outcome = self.ts_analyzer.analyze_scene(scene_file, duration_frames)
             except Exception as e:
-                analysis_notes.append(f"AST analysis failed: {e}, falling back to regex")
+                ast_outcome = e
+
+        return self._complete_scene_analysis(
+            scene_file, scene_id, scene_type, duration_frames, ast_outcome
+        )
+
+    def _complete_scene_analysis(
+        self,
+        scene_file: Path,
+        scene_id: str,
+        scene_type: str,
+        duration_frames: int,
+        ast_outcome: Optional[SceneAnalysisResult | Exception],
+    ) -> SceneAnalysisResult:
+        """Finish analyzing a scene given the outcome of AST analysis.
+
+        Args:
+            scene_file: Path to the TSX file
+            scene_id: Scene identifier
+            scene_type: Scene type string
+            duration_frames: Duration in frames
+            ast_outcome: AST analysis result, the exception it raised,
+                or None if the AST analyzer was not used
+
+        Returns:
+            SceneAnalysisResult with detected moments
+        """
+        result = None
+        analysis_notes = []
+
+        if isinstance(ast_outcome, Exception):
+            analysis_notes.append(f"AST analysis failed: {ast_outcome}, falling back to regex")
+        elif ast_outcome is not None:
+            result = ast_outcome
+            analysis_notes.append("Analyzed with TypeScript AST parser")
 
         # Fall back to regex analyzer
         if result is None or not result.moments:
@@ -435,16 +544,15 @@ def generate_project_sfx(
     """
     theme_enum = SoundTheme(theme) if theme in [t.value for t in SoundTheme] else SoundTheme.TECH_AI
 
-    orchestrator = SFXOrchestrator(
+    with SFXOrchestrator(
         project_dir=project_dir,
         theme=theme_enum,
         use_library=use_library,
-    )
-
-    return orchestrator.generate_sfx_cues(
-        use_llm=use_llm,
-        dry_run=dry_run,
-    )
+    ) as orchestrator:
+        return orchestrator.generate_sfx_cues(
+            use_llm=use_llm,
+            dry_run=dry_run,
+        )
 
 
 def analyze_project_scenes(project_dir: Path) -> dict:
@@ -456,5 +564,5 @@ def analyze_project_scenes(project_dir: Path) -> dict:
     Returns:
         Analysis preview dict
     """
-    orchestrator = SFXOrchestrator(project_dir=project_dir)
-    return orchestrator.preview_analysis()
+    with SFXOrchestrator(project_dir=project_dir) as orchestrator:
+        return orchestrator.preview_analysis()
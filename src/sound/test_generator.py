@@ -11,47 +11,44 @@ Tests cover:
 """
 
 import tempfile
-from pathlib import Path
 import wave
+from pathlib import Path
 
 import numpy as np
 import pytest
-
 from generator import (
-    # Constants
     SAMPLE_RATE,
-    # Enums
-    SoundTheme,
+    THEME_PALETTES,
+    ProjectSFXManager,
     SoundEvent,
-    # Dataclasses
+    SoundGenerator,
+    SoundTheme,
     ThemePalette,
-    # Theme presets
-    THEME_PALETTES,
-    # Utility functions
-    db_to_amp,
     amp_to_db,
-    normalize,
-    soft_clip,
     apply_fade,
-    # Synthesis components
-    fm_oscillator,
+    db_to_amp,
+    envelope_adsr,
     filtered_noise,
+    fm_oscillator,
+    generate_project_sfx,
     granular_texture,
-    simple_reverb,
-    envelope_adsr,
-    # Classes
-    SoundGenerator,
-    ProjectSFXManager,
-    # Functions
+    normalize,
     save_wav,
-    generate_project_sfx,
+    simple_reverb,
+    soft_clip,
+    stable_seed,
 )
 
-
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the shared SFX cache out of the real user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
@@ -268,6 +265,14 @@ class TestGranularTexture:
         # Output should be different from source (grains have been moved/mixed)
         assert not np.array_equal(output, source)
 
+    def test_seeded_output_is_reproducible(self):
+        """Seeding the global RNG should give identical output."""
+        source = np.random.default_rng(0).standard_normal(SAMPLE_RATE // 2)
+        np.random.seed(11)
+        first = granular_texture(source)
+        np.random.seed(11)
+        np.testing.assert_array_equal(granular_texture(source), first)
+
 
 class TestSimpleReverb:
     """Tests for reverb effect."""
@@ -293,6 +298,33 @@ class TestSimpleReverb:
         output = simple_reverb(samples, size=0.01)
         np.testing.assert_allclose(output, samples, atol=0.01)
 
+    @staticmethod
+    def _loop_reverb(samples, size=0.3, damping=0.5):
+        """Reference per-sample comb filter reverb (the original implementation)."""
+        from scipy.ndimage import gaussian_filter1d
+
+        delays = [int(d * (0.5 + size)) for d in [1557, 1617, 1491, 1422, 1277, 1356]]
+        output = samples.copy()
+        for delay in delays[:4]:
+            if delay < len(samples):
+                comb = np.zeros_like(samples)
+                feedback = 0.7 * (1 - damping * 0.3)
+                for i in range(delay, len(samples)):
+                    comb[i] = samples[i - delay] + feedback * comb[i - delay]
+                output += comb * 0.15
+        if damping > 0:
+            output = gaussian_filter1d(output, sigma=damping * 3)
+        return output
+
+    @pytest.mark.parametrize("size,damping", [(0.3, 0.5), (0.8, 0.0), (0.5, 1.0)])
+    def test_matches_reference_loop(self, size, damping):
+        """IIR comb filters should match the per-sample loop."""
+        rng = np.random.default_rng(0)
+        samples = rng.standard_normal(SAMPLE_RATE // 4)
+        expected = self._loop_reverb(samples, size=size, damping=damping)
+        output = simple_reverb(samples, size=size, damping=damping)
+        np.testing.assert_allclose(output, expected, rtol=1e-9, atol=1e-9)
+
 
 class TestEnvelopeADSR:
     """Tests for ADSR envelope generation."""
@@ -610,6 +642,60 @@ class TestProjectSFXManager:
 # Test generate_project_sfx Function
 # =============================================================================
 
+class TestSFXCache:
+    """Tests for cached, parallel library generation."""
+
+    def test_stable_seed_is_deterministic(self):
+        """Seeds should not depend on interpreter hash randomization."""
+        assert stable_seed(0, "ping") == stable_seed(0, "ping")
+        assert stable_seed(0, "ping") != stable_seed(1, "ping")
+
+    def test_library_is_reproducible(self, temp_dir):
+        """Same theme and parameters should give identical files."""
+        a = ProjectSFXManager(temp_dir / "a", use_cache=False, max_workers=1).generate_library()
+        b = ProjectSFXManager(temp_dir / "b", use_cache=False, max_workers=1).generate_library()
+        assert list(a) == list(b)
+        for name in a:
+            assert a[name].read_bytes() == b[name].read_bytes()
+
+    def test_second_project_reuses_cache(self, temp_dir):
+        """A new project with the same theme should link every sound from cache."""
+        cache_dir = temp_dir / "cache"
+        first = ProjectSFXManager(temp_dir / "p1", cache_dir=cache_dir, max_workers=2)
+        generated = first.generate_library()
+        assert first.cache.misses == len(generated)
+
+        second = ProjectSFXManager(temp_dir / "p2", cache_dir=cache_dir)
+        linked = second.generate_library()
+
+        assert second.cache.hits == len(linked)
+        assert second.cache.misses == 0
+        for name, path in linked.items():
+            assert path.parent == temp_dir / "p2" / "sfx"
+            assert path.read_bytes() == generated[name].read_bytes()
+
+    def test_cache_key_depends_on_theme(self, temp_dir):
+        """Different themes must not share cache entries."""
+        cache_dir = temp_dir / "cache"
+        ProjectSFXManager(temp_dir / "p1", SoundTheme.TECH_AI, cache_dir=cache_dir).generate_custom(
+            "ping", SoundEvent.PING
+        )
+        other = ProjectSFXManager(temp_dir / "p2", SoundTheme.SPACE, cache_dir=cache_dir)
+        other.generate_custom("ping", SoundEvent.PING)
+        assert other.cache.misses == 1
+
+    def test_overwriting_project_file_leaves_cache_intact(self, temp_dir):
+        """Rewriting a linked project file must not modify the cached WAV."""
+        manager = ProjectSFXManager(temp_dir, cache_dir=temp_dir / "cache")
+        path = manager.generate_custom("ping", SoundEvent.PING)
+        cached = list((temp_dir / "cache").rglob("*.wav"))[0]
+        original = cached.read_bytes()
+
+        save_wav(np.zeros(100), path)
+
+        assert cached.read_bytes() == original
+
+
 class TestGenerateProjectSfx:
     """Tests for generate_project_sfx convenience function."""
 
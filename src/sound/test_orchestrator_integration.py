@@ -250,6 +250,124 @@ class TestAnalyzeScenes:
             assert "scene-1" in results
             assert "scene-2" in results
 
+    def test_analyze_scenes_batches_ast_analysis(self):
+        """Test that all scene files go through one batched AST call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir, storyboard_path = self.create_test_project(tmpdir)
+
+            orchestrator = SFXOrchestrator(project_dir)
+
+            def mock_analyze_scenes(scenes):
+                outcomes = []
+                for scene_file, duration_frames in scenes:
+                    if scene_file.stem == "MainScene":
+                        outcomes.append(RuntimeError("AST failed"))
+                        continue
+                    result = SceneAnalysisResult(
+                        scene_id=scene_file.stem,
+                        scene_type="test",
+                        duration_frames=duration_frames,
+                    )
+                    result.add_moment(SoundMoment(
+                        type="element_appear",
+                        frame=0,
+                        confidence=0.9,
+                        context="ast moment",
+                        intensity=0.7,
+                    ))
+                    outcomes.append(result)
+                return outcomes
+
+            regex_result = SceneAnalysisResult(
+                scene_id="MainScene",
+                scene_type="test",
+                duration_frames=450,
+            )
+            regex_result.add_moment(SoundMoment(
+                type="element_appear",
+                frame=5,
+                confidence=0.8,
+                context="regex moment",
+                intensity=0.7,
+            ))
+
+            with patch.object(
+                orchestrator.ts_analyzer, "analyze_scenes", side_effect=mock_analyze_scenes
+            ) as mock_batch, patch.object(
+                orchestrator.ts_analyzer, "analyze_scene"
+            ) as mock_single, patch.object(
+                orchestrator.regex_analyzer, "analyze_scene", return_value=regex_result
+            ):
+                results = orchestrator.analyze_scenes()
+
+            assert mock_batch.call_count == 1
+            assert len(mock_batch.call_args[0][0]) == 2
+            mock_single.assert_not_called()
+            assert list(results) == ["scene-1", "scene-2"]
+            assert "TypeScript AST" in " ".join(results["scene-1"].analysis_notes)
+            assert "falling back" in " ".join(results["scene-2"].analysis_notes)
+            assert results["scene-2"].moments[0].frame == 5
+
+    def test_unchanged_scenes_reuse_cached_analysis(self):
+        """Test that only edited scene files are re-analyzed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir, storyboard_path = self.create_test_project(tmpdir)
+
+            def mock_analyze(scene_file):
+                result = SceneAnalysisResult(
+                    scene_id=scene_file.stem,
+                    scene_type="test",
+                    duration_frames=300,
+                )
+                result.add_moment(SoundMoment(
+                    type="element_appear",
+                    frame=len(scene_file.read_text()),
+                    confidence=0.8,
+                    context="test moment",
+                    intensity=0.7,
+                ))
+                return result
+
+            def run():
+                orchestrator = SFXOrchestrator(project_dir, use_ast_analyzer=False)
+                with patch.object(
+                    orchestrator.regex_analyzer, "analyze_scene", side_effect=mock_analyze
+                ) as mock_regex:
+                    results = orchestrator.analyze_scenes()
+                analyzed = [call.args[0].stem for call in mock_regex.call_args_list]
+                return results, analyzed, orchestrator.cache
+
+            first, analyzed, _ = run()
+            assert analyzed == ["HookScene", "MainScene"]
+
+            second, analyzed, cache = run()
+            assert analyzed == []
+            assert cache.hits == 2
+            assert second["scene-1"].moments[0].frame == first["scene-1"].moments[0].frame
+            assert second["scene-1"].moments[0].context == first["scene-1"].moments[0].context
+            assert second["scene-2"].source_file == first["scene-2"].source_file
+
+            (project_dir / "scenes" / "MainScene.tsx").write_text("// main scene, edited")
+            third, analyzed, _ = run()
+            assert analyzed == ["MainScene"]
+            assert third["scene-2"].moments[0].frame == len("// main scene, edited")
+
+    def test_failed_ast_analysis_is_not_cached(self):
+        """Test that regex fallbacks after AST errors are retried next run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir, storyboard_path = self.create_test_project(tmpdir)
+
+            for _ in range(2):
+                orchestrator = SFXOrchestrator(project_dir)
+                with patch.object(
+                    orchestrator.ts_analyzer,
+                    "analyze_scenes",
+                    side_effect=lambda scenes: [RuntimeError("no node")] * len(scenes),
+                ) as mock_batch:
+                    orchestrator.analyze_scenes()
+                assert len(mock_batch.call_args[0][0]) == 2
+                assert orchestrator.cache.hits == 0
+
     def test_analyze_filtered_scenes(self):
         """Test analyzing specific scene types only."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -432,6 +550,21 @@ class TestConvenienceFunctions:
 
             assert isinstance(preview, dict)
 
+    def test_close_stops_ts_analyzer(self):
+        """Test that closing the orchestrator stops the node extraction server."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orchestrator = SFXOrchestrator(Path(tmpdir))
+            with patch.object(orchestrator.ts_analyzer, "close") as close:
+                with orchestrator:
+                    pass
+            close.assert_called_once()
+
+    def test_close_without_ast_analyzer(self):
+        """Test that closing works when the regex analyzer is used alone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with SFXOrchestrator(Path(tmpdir), use_ast_analyzer=False) as orchestrator:
+                assert orchestrator.ts_analyzer is None
+
 
 class TestSemanticMappingIntegration:
     """Tests for semantic mapping integration with orchestrator."""
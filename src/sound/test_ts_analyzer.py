@@ -9,12 +9,14 @@ These tests verify that the Python wrapper correctly:
 
 import json
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
 from .ts_analyzer import (
+    ExtractionServer,
     TypeScriptAnalyzer,
     ExtractedAnimation,
     AnimationContext,
@@ -490,6 +492,125 @@ class TestTypeScriptAnalyzer:
             analyzer.analyze_scene(Path("/nonexistent/scene.tsx"), 300)
 
 
+# Stand-in for `extract-animations.ts --server`: answers each request with one
+# opacity animation starting at frame 10, errors for scenes named "Broken*",
+# and exits without answering for scenes named "Crash*".
+FAKE_SERVER = """
+import json, sys
+for line in sys.stdin:
+    request = json.loads(line)
+    name = request["scenePath"].rsplit("/", 1)[-1]
+    if name.startswith("Crash"):
+        sys.exit(1)
+    if name.startswith("Broken"):
+        response = {"id": request["id"], "error": "parse error"}
+    else:
+        response = {"id": request["id"], "result": {"animations": [{
+            "type": "opacity", "property": "opacity",
+            "frameStart": 10, "frameEnd": 40, "fromValue": 0, "toValue": 1,
+            "context": {"componentHint": "title"},
+        }], "errors": []}}
+    print(json.dumps(response), flush=True)
+"""
+
+
+class TestExtractionServer:
+    """Tests for the persistent extraction server and batch analysis."""
+
+    @pytest.fixture
+    def popen_calls(self):
+        """Patch Popen to launch FAKE_SERVER and record each launch."""
+        calls = []
+        real_popen = subprocess.Popen
+
+        def fake_popen(cmd, **kwargs):
+            calls.append(cmd)
+            kwargs.pop("cwd", None)
+            return real_popen([sys.executable, "-c", FAKE_SERVER], **kwargs)
+
+        with patch("subprocess.Popen", side_effect=fake_popen):
+            yield calls
+
+    @pytest.fixture
+    def analyzer(self):
+        analyzer = TypeScriptAnalyzer()
+        analyzer._script_path = Path("/fake/script.ts")
+        analyzer._remotion_dir = Path("/fake/remotion")
+        yield analyzer
+        analyzer.close()
+
+    def make_scenes(self, tmpdir, *names):
+        scenes = []
+        for name in names:
+            path = Path(tmpdir) / f"{name}.tsx"
+            path.write_text("// scene")
+            scenes.append((path, 300))
+        return scenes
+
+    def test_batch_uses_one_process(self, analyzer, popen_calls):
+        """Test that many scenes are analyzed by a single server process."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scenes = self.make_scenes(tmpdir, "A", "B", "C")
+
+            results = analyzer.analyze_scenes(scenes)
+            analyzer.analyze_scenes(scenes[:1])
+
+        assert len(popen_calls) == 1
+        assert popen_calls[0][-1] == "--server"
+        assert [r.scene_id for r in results] == ["A", "B", "C"]
+        assert all(r.moments[0].frame == 10 for r in results)
+
+    def test_batch_reports_per_scene_failures(self, analyzer, popen_calls):
+        """Test that failing scenes do not affect the rest of the batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scenes = self.make_scenes(tmpdir, "A", "BrokenB")
+            scenes.insert(1, (Path(tmpdir) / "Missing.tsx", 300))
+
+            results = analyzer.analyze_scenes(scenes)
+
+        assert isinstance(results[0], SceneAnalysisResult)
+        assert isinstance(results[1], FileNotFoundError)
+        assert isinstance(results[2], RuntimeError)
+        assert "parse error" in str(results[2])
+
+    def test_restarts_after_crash(self, analyzer, popen_calls):
+        """Test that a crashed server fails pending scenes and is restarted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            crashed = analyzer.analyze_scenes(self.make_scenes(tmpdir, "CrashA", "B"))
+            recovered = analyzer.analyze_scenes(self.make_scenes(tmpdir, "C"))
+
+        assert all(isinstance(r, RuntimeError) for r in crashed)
+        assert isinstance(recovered[0], SceneAnalysisResult)
+        assert len(popen_calls) == 2
+
+    def test_node_not_found(self, analyzer):
+        """Test that a missing npx is reported for every scene."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scenes = self.make_scenes(tmpdir, "A", "B")
+            with patch("subprocess.Popen", side_effect=FileNotFoundError()):
+                results = analyzer.analyze_scenes(scenes)
+
+        assert all(isinstance(r, RuntimeError) and "Node.js" in str(r) for r in results)
+
+    def test_timeout_kills_server(self):
+        """Test that an unresponsive server times out and is stopped."""
+        server = ExtractionServer(Path("/fake/script.ts"), Path("."), timeout=0.1)
+        server.STARTUP_TIMEOUT = 0.1
+        real_popen = subprocess.Popen
+
+        def silent_popen(cmd, **kwargs):
+            kwargs.pop("cwd", None)
+            return real_popen(
+                [sys.executable, "-c", "import sys\nfor _ in sys.stdin: pass"], **kwargs
+            )
+
+        with patch("subprocess.Popen", side_effect=silent_popen):
+            results = server.request_many([(Path("scene.tsx"), 300)])
+
+        assert "timed out" in str(results[0])
+        assert not server.running
+
+
 class TestAnalyzeSceneWithAst:
     """Tests for the convenience function."""
 
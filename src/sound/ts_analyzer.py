@@ -8,13 +8,19 @@ The TypeScript analyzer overcomes regex limitations by:
 2. Evaluating expressions like Math.round(durationInFrames * 0.10)
 3. Resolving variable references
 4. Extracting component context for semantic mapping
+
+Batch analysis keeps one ``extract-animations.ts --server`` process alive
+and streams scene requests to it, so Node startup and ts-node compilation
+are paid once per batch instead of once per scene.
 """
 
 import json
+import queue
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from .models import SoundMoment, SceneAnalysisResult
 
@@ -43,6 +49,180 @@ class ExtractedAnimation:
     context: AnimationContext
 
 
+class ExtractionServer:
+    """A long-lived ``extract-animations.ts --server`` process.
+
+    Requests are line-delimited JSON written to the process's stdin and
+    responses are read back line by line from stdout. The process is started
+    lazily, restarted after it dies, and exits on its own once stdin closes.
+    """
+
+    # ts-node compiles the script on the first request, so allow extra time
+    STARTUP_TIMEOUT = 60.0
+
+    def __init__(
+        self,
+        script_path: Path,
+        remotion_dir: Path,
+        timeout: float = 30.0,
+    ):
+        """Initialize the server wrapper.
+
+        Args:
+            script_path: Path to extract-animations.ts
+            remotion_dir: Working directory for the Node.js process
+            timeout: Seconds to wait for each response
+        """
+        self.script_path = script_path
+        self.remotion_dir = remotion_dir
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._warm = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the server process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Start the server process if it is not already running.
+
+        Raises:
+            RuntimeError: If Node.js/npx is not installed
+        """
+        if self.running:
+            return
+
+        cmd = [
+            "npx",
+            "ts-node",
+            "--transpile-only",
+            str(self.script_path),
+            "--server",
+        ]
+
+        try:
+            self._process = subprocess.Popen(
+                cmd,
+                cwd=str(self.remotion_dir),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except FileNotFoundError:
+            raise RuntimeError("Node.js/npx not found. Ensure Node.js is installed.")
+
+        # A fresh queue so stale lines from a dead process are never read
+        self._responses = queue.Queue()
+        self._warm = False
+        threading.Thread(
+            target=self._read_stdout,
+            args=(self._process.stdout, self._responses),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _read_stdout(stream, responses: "queue.Queue[Optional[str]]") -> None:
+        """Forward stdout lines to the response queue; None marks EOF."""
+        for line in stream:
+            responses.put(line)
+        responses.put(None)
+
+    def request_many(
+        self,
+        scenes: list[tuple[Path, int]],
+    ) -> list[Union[dict, Exception]]:
+        """Send a batch of extraction requests and collect the responses.
+
+        All requests are written up front so the server never waits on
+        Python between scenes.
+
+        Args:
+            scenes: (scene_path, duration_frames) pairs
+
+        Returns:
+            Extraction output dict or the exception for each scene, in order
+        """
+        with self._lock:
+            self.start()
+
+            ids = []
+            try:
+                for scene_path, duration_frames in scenes:
+                    self._next_id += 1
+                    ids.append(self._next_id)
+                    request = {
+                        "id": self._next_id,
+                        "scenePath": str(Path(scene_path).absolute()),
+                        "durationFrames": int(duration_frames),
+                    }
+                    self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self.close()
+                error = RuntimeError(f"Animation extraction server died: {e}")
+                return [error] * len(scenes)
+
+            pending = set(ids)
+            outcomes: dict[int, Union[dict, Exception]] = {}
+            while pending:
+                timeout = self.timeout if self._warm else self.STARTUP_TIMEOUT
+                try:
+                    line = self._responses.get(timeout=timeout)
+                except queue.Empty:
+                    self.close()
+                    error = RuntimeError("Animation extraction timed out")
+                    break
+
+                if line is None:
+                    self.close()
+                    error = RuntimeError("Animation extraction server exited unexpectedly")
+                    break
+
+                self._warm = True
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    # Stray output (e.g. npx notices) is not a response
+                    continue
+
+                request_id = response.get("id")
+                if request_id not in pending:
+                    continue
+                pending.discard(request_id)
+                if "error" in response:
+                    outcomes[request_id] = RuntimeError(
+                        f"Animation extraction failed: {response['error']}"
+                    )
+                else:
+                    outcomes[request_id] = response.get("result", {})
+
+            for request_id in pending:
+                outcomes[request_id] = error
+
+            return [outcomes[request_id] for request_id in ids]
+
+    def close(self) -> None:
+        """Stop the server process."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
 class TypeScriptAnalyzer:
     """Analyzes TSX scene files using Node.js AST parsing.
 
@@ -60,6 +240,28 @@ class TypeScriptAnalyzer:
         self.fps = fps
         self._remotion_dir = remotion_dir
         self._script_path: Optional[Path] = None
+        self._server: Optional[ExtractionServer] = None
+
+    def __enter__(self) -> "TypeScriptAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the persistent extraction server, if one was started."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    def _get_server(self) -> ExtractionServer:
+        """Get the persistent extraction server, creating it on first use."""
+        if self._server is None:
+            self._server = ExtractionServer(
+                self._get_script_path(),
+                self._find_remotion_dir(),
+            )
+        return self._server
 
     def _find_remotion_dir(self) -> Path:
         """Find the remotion directory."""
@@ -131,6 +333,46 @@ class TypeScriptAnalyzer:
         # Convert to SceneAnalysisResult
         return self._build_result(scene_path, duration_frames, animations)
 
+    def analyze_scenes(
+        self,
+        scenes: list[tuple[Path, int]],
+    ) -> list[Union[SceneAnalysisResult, Exception]]:
+        """Analyze many TSX scene files with a single Node.js process.
+
+        Args:
+            scenes: (scene_path, duration_frames) pairs
+
+        Returns:
+            A SceneAnalysisResult or the exception raised for each scene,
+            in the same order as ``scenes``
+        """
+        outcomes: list[Union[SceneAnalysisResult, Exception, None]] = [None] * len(scenes)
+        batch: list[tuple[int, Path, int]] = []
+
+        for idx, (scene_path, duration_frames) in enumerate(scenes):
+            scene_path = Path(scene_path)
+            if not scene_path.exists():
+                outcomes[idx] = FileNotFoundError(f"Scene file not found: {scene_path}")
+            else:
+                batch.append((idx, scene_path, duration_frames))
+
+        if batch:
+            try:
+                responses = self._get_server().request_many(
+                    [(path, frames) for _, path, frames in batch]
+                )
+            except (FileNotFoundError, RuntimeError) as e:
+                responses = [e] * len(batch)
+
+            for (idx, scene_path, duration_frames), response in zip(batch, responses):
+                if isinstance(response, Exception):
+                    outcomes[idx] = response
+                    continue
+                animations = self._parse_animations(response)
+                outcomes[idx] = self._build_result(scene_path, duration_frames, animations)
+
+        return outcomes
+
     def _run_extraction(
         self,
         scene_path: Path,
@@ -182,6 +424,17 @@ class TypeScriptAnalyzer:
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse extraction output: {e}")
 
+        return self._parse_animations(data)
+
+    def _parse_animations(self, data: dict) -> list[ExtractedAnimation]:
+        """Convert extraction script output to ExtractedAnimation objects.
+
+        Args:
+            data: Parsed JSON output of extract-animations.ts
+
+        Returns:
+            List of extracted animations
+        """
         # Check for errors in the result
         if data.get("errors"):
             # Log errors but continue with partial results
@@ -42,6 +42,8 @@ from .utils import (
     extract_timing_vars,
     validate_trigger_word,
 )
+from .word_timeline import WordTimeline
+from .alignment import NarrationAlignment, align_narration
 
 
 __all__ = [
@@ -65,6 +67,9 @@ __all__ = [
     "find_word_frame_fuzzy",
     "extract_timing_vars",
     "validate_trigger_word",
+    "WordTimeline",
+    "NarrationAlignment",
+    "align_narration",
 ]
 
 
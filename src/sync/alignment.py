@@ -0,0 +1,395 @@
+"""
+Forced alignment between narration text and timed words.
+
+TTS providers and Whisper tokenize the same narration differently: numbers
+come back split ("150", ",528"), punctuation is attached or detached, and
+contractions or hyphenated words may be one token or two. Instead of patching
+each case, `NarrationAlignment` aligns the two texts character by character:
+
+- both sides are reduced to their lowercase alphanumeric characters, so
+  tokenization and punctuation differences vanish
+- a banded edit-distance DP with affine gap costs (NumPy-vectorized one row
+  at a time) finds the cheapest character alignment near the diagonal
+- every narration character then points at the timed word it was spoken in
+
+Any character span of the narration (a regex match, a trigger phrase, a
+caption token) maps to a word range and a time span in one lookup, and
+repeated words resolve to the occurrence at that position.
+"""
+
+import re
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+DEFAULT_BAND = 64  # Characters either side of the diagonal searched by the DP
+
+# Share of a word's characters that must match the narration token it was
+# aligned to before the narration's spelling replaces what was spoken
+MIN_SPELLING_MATCH = 0.6
+
+# Unreachable cell cost; small enough that adding edit costs can't overflow
+_INF = np.iinfo(np.int32).max // 2
+
+_TOKEN = re.compile(r"\S+")
+
+
+def _alnum_codes(text: str) -> tuple[np.ndarray, np.ndarray]:
+    """Lowercase alphanumeric characters of a text and their positions."""
+    positions = [i for i, char in enumerate(text) if char.isalnum()]
+    codes = np.fromiter((ord(text[i].lower()[0]) for i in positions), dtype=np.int64, count=len(positions))
+    return codes, np.array(positions, dtype=np.int64)
+
+
+def _find_word(text: str, needle: str, start: int, end: int | None = None) -> int:
+    """Index of `needle` in text[start:end], not inside a longer word, or -1."""
+    pattern = re.escape(needle)
+    if needle[0].isalnum():
+        pattern = r"(?<!\w)" + pattern
+    if needle[-1].isalnum():
+        pattern += r"(?!\w)"
+    match = re.compile(pattern).search(text, start, len(text) if end is None else end)
+    return match.start() if match else -1
+
+
+def _take(row: np.ndarray, row_lo: int, cols: np.ndarray) -> np.ndarray:
+    """Costs of a banded DP row at the given columns (_INF outside the band)."""
+    idx = cols - row_lo
+    valid = (idx >= 0) & (idx < len(row))
+    out = np.full(len(cols), _INF, dtype=np.int64)
+    out[valid] = row[idx[valid]]
+    return out
+
+
+def banded_edit_alignment(
+    a: np.ndarray,
+    b: np.ndarray,
+    band: int = DEFAULT_BAND,
+    gap_open: int = 1,
+) -> tuple[int, np.ndarray, np.ndarray]:
+    """Align two code sequences with a banded edit-distance DP.
+
+    Substitutions and each skipped element cost 1, and every run of skipped
+    elements costs `gap_open` extra (affine gaps, Gotoh's three-state DP), so
+    a skipped word stays one gap instead of being scattered over stray
+    matching letters. With gap_open=0 this is the Levenshtein distance.
+
+    Rows follow `a`; each row only covers columns within `band` of the
+    diagonal scaled to the two lengths, so time and memory are
+    O(len(a) * band). Within a row, substitutions and skips of `a` are one
+    vectorized step and runs of skips of `b` are a running minimum.
+
+    Args:
+        a: First sequence (integer codes).
+        b: Second sequence (integer codes).
+        band: Half-width of the searched band.
+        gap_open: Extra cost of starting a gap.
+
+    Returns:
+        Tuple of (alignment cost, indices into a, indices into b) where the
+        index arrays list the aligned (matched or substituted) pairs in order.
+    """
+    n, m = len(a), len(b)
+    empty = np.zeros(0, dtype=np.int64)
+    if n == 0 or m == 0:
+        return (gap_open + max(n, m) if max(n, m) else 0), empty, empty
+
+    slope = m / n
+    # Wide enough for consecutive rows' windows to overlap and to absorb the
+    # length difference as one contiguous gap
+    width = max(band, abs(n - m)) + int(np.ceil(slope))
+
+    # Per row: window start, and costs of paths ending in a match or
+    # substitution (diag), a skip of a (skip_a) or a skip of b (skip_b)
+    los = np.zeros(n + 1, dtype=np.int64)
+    diag_rows: list[np.ndarray] = []
+    skip_a_rows: list[np.ndarray] = []
+    skip_b_rows: list[np.ndarray] = []
+    for i in range(n + 1):
+        center = int(round(i * slope))
+        lo, hi = max(0, center - width), min(m, center + width)
+        cols = np.arange(lo, hi + 1, dtype=np.int64)
+        if i == 0:
+            diag = np.where(cols == 0, 0, _INF)
+            skip_a = np.full(len(cols), _INF, dtype=np.int64)
+        else:
+            prev_lo = los[i - 1]
+            prev_best = np.minimum(
+                np.minimum(diag_rows[i - 1], skip_a_rows[i - 1]), skip_b_rows[i - 1]
+            )
+            diag = _take(prev_best, prev_lo, cols - 1) + (b[cols - 1] != a[i - 1])
+            skip_a = np.minimum(
+                _take(skip_a_rows[i - 1], prev_lo, cols) + 1,
+                _take(prev_best, prev_lo, cols) + gap_open + 1,
+            )
+        # skip_b[j] = min over k < j of min(diag, skip_a)[k] + gap_open + (j - k)
+        opened = np.minimum.accumulate(np.minimum(diag, skip_a) - cols) + gap_open
+        skip_b = np.full(len(cols), _INF, dtype=np.int64)
+        skip_b[1:] = opened[:-1] + cols[1:]
+        los[i] = lo
+        diag_rows.append(np.minimum(diag, _INF))
+        skip_a_rows.append(np.minimum(skip_a, _INF))
+        skip_b_rows.append(np.minimum(skip_b, _INF))
+
+    states = (diag_rows, skip_a_rows, skip_b_rows)
+
+    def cost(state: int, i: int, j: int) -> int:
+        row = states[state][i]
+        k = j - los[i]
+        return int(row[k]) if 0 <= k < len(row) else _INF
+
+    def best_state(i: int, j: int, target: int) -> int:
+        """First state (diag, skip_a, skip_b) whose cost at (i, j) is target."""
+        for state in range(3):
+            if cost(state, i, j) == target:
+                return state
+        return 0
+
+    pairs_a: list[int] = []
+    pairs_b: list[int] = []
+    i, j = n, m
+    total = min(cost(state, n, m) for state in range(3))
+    state = best_state(n, m, total)
+    while i > 0 and j > 0:
+        current = cost(state, i, j)
+        if state == 0:
+            pairs_a.append(i - 1)
+            pairs_b.append(j - 1)
+            i, j = i - 1, j - 1
+            state = best_state(i, j, current - int(a[i] != b[j]))
+        elif state == 1:
+            i -= 1
+            if cost(1, i, j) + 1 != current:
+                state = best_state(i, j, current - gap_open - 1)
+        else:
+            j -= 1
+            if cost(2, i, j) + 1 != current:
+                state = best_state(i, j, current - gap_open - 1)
+
+    return (
+        total,
+        np.array(pairs_a[::-1], dtype=np.int64),
+        np.array(pairs_b[::-1], dtype=np.int64),
+    )
+
+
+def _timestamp_field(ts: Any, name: str, default: Any) -> Any:
+    """Read a field from a timestamp dict or WordTimestamp-like object."""
+    if isinstance(ts, dict):
+        return ts.get(name, default)
+    return getattr(ts, name, default)
+
+
+class NarrationAlignment:
+    """Character-level alignment of narration text to timed words."""
+
+    def __init__(
+        self,
+        narration: str,
+        words: list[str],
+        start_seconds: Iterable[float],
+        end_seconds: Iterable[float],
+        band: int = DEFAULT_BAND,
+    ):
+        """Align narration text to timed words.
+
+        Args:
+            narration: The narration text that was spoken.
+            words: Timed words as returned by TTS or transcription.
+            start_seconds: Start time of each word.
+            end_seconds: End time of each word.
+            band: Half-width of the DP band, in characters.
+        """
+        self.narration = narration
+        self.words = list(words)
+        self.start_seconds = np.asarray(list(start_seconds), dtype=np.float64)
+        self.end_seconds = np.asarray(list(end_seconds), dtype=np.float64)
+
+        narration_codes, narration_positions = _alnum_codes(narration)
+        word_codes: list[np.ndarray] = []
+        word_owners: list[np.ndarray] = []
+        for index, word in enumerate(self.words):
+            codes, _ = _alnum_codes(word)
+            word_codes.append(codes)
+            word_owners.append(np.full(len(codes), index, dtype=np.int64))
+        codes = np.concatenate(word_codes) if word_codes else np.zeros(0, dtype=np.int64)
+        owners = np.concatenate(word_owners) if word_owners else np.zeros(0, dtype=np.int64)
+
+        self.cost, pairs_a, pairs_b = banded_edit_alignment(narration_codes, codes, band)
+        self.aligned_chars = narration_positions[pairs_a]
+        self.aligned_words = owners[pairs_b]
+        # Whether each aligned pair is a match rather than a substitution
+        self.aligned_matches = narration_codes[pairs_a] == codes[pairs_b]
+        self.word_lengths = np.array([len(c) for c in word_codes], dtype=np.int64)
+
+        # Narration character -> timed word index (-1 for unspoken characters)
+        self.char_words = np.full(len(narration), -1, dtype=np.int64)
+        self.char_words[self.aligned_chars] = self.aligned_words
+
+    @classmethod
+    def from_timestamps(
+        cls,
+        narration: str,
+        word_timestamps: list[Any],
+        band: int = DEFAULT_BAND,
+    ) -> "NarrationAlignment":
+        """Align narration to word timestamp dicts or WordTimestamp objects."""
+        return cls(
+            narration,
+            [_timestamp_field(ts, "word", "") for ts in word_timestamps],
+            [_timestamp_field(ts, "start_seconds", 0.0) for ts in word_timestamps],
+            [_timestamp_field(ts, "end_seconds", 0.0) for ts in word_timestamps],
+            band=band,
+        )
+
+    def word_range(self, char_start: int, char_end: int) -> Optional[tuple[int, int]]:
+        """Timed words spoken for a narration character span.
+
+        Args:
+            char_start: Start of the span in the narration.
+            char_end: End of the span (exclusive).
+
+        Returns:
+            Tuple of (first, last) word index, or None if no character of the
+            span was aligned to a word.
+        """
+        spoken = self.char_words[max(0, char_start):max(0, char_end)]
+        spoken = spoken[spoken >= 0]
+        if len(spoken) == 0:
+            return None
+        return int(spoken.min()), int(spoken.max())
+
+    def time_span(self, char_start: int, char_end: int) -> Optional[tuple[float, float]]:
+        """Start and end time (seconds) of a narration character span."""
+        words = self.word_range(char_start, char_end)
+        if words is None:
+            return None
+        first, last = words
+        return float(self.start_seconds[first]), float(self.end_seconds[last])
+
+    def find_phrase(
+        self,
+        phrase: str,
+        word: str = "",
+        start: int = 0,
+    ) -> Optional[tuple[int, int]]:
+        """Locate a phrase (and optionally a word within it) in the narration.
+
+        Both are matched as whole words, so "model" is not found inside
+        "remodeled".
+
+        Args:
+            phrase: Phrase to find (case-insensitive).
+            word: Word inside the phrase to narrow the span to.
+            start: Narration position to search from.
+
+        Returns:
+            Character span (start, end) of the word, or of the whole phrase if
+            no word is given, or None if not found.
+        """
+        text = self.narration.lower()
+        phrase = phrase.lower().strip()
+        if not phrase:
+            return None
+        phrase_start = _find_word(text, phrase, start)
+        if phrase_start == -1:
+            return None
+        phrase_end = phrase_start + len(phrase)
+        if not word.strip():
+            return phrase_start, phrase_end
+
+        word = word.lower().strip()
+        word_start = _find_word(text, word, phrase_start, phrase_end)
+        if word_start == -1:
+            return None
+        return word_start, word_start + len(word)
+
+    def narration_words(self) -> list[dict[str, Any]]:
+        """Timed words re-tokenized to the narration's own words.
+
+        Consecutive timed words spoken for the same narration token (e.g.
+        "150" and ",528" for "150,528") are merged into one entry carrying the
+        narration's spelling, and detached punctuation joins the word before
+        it. The narration's spelling is only used when most characters match
+        (see MIN_SPELLING_MATCH): where the speaker said something else
+        ("picture" for "image", "one hundred" for "100"), or the narration
+        isn't what was spoken, the spoken words are kept. Timed words that
+        match no narration token are kept as they are; narration tokens that
+        were not spoken are dropped.
+
+        Returns:
+            Word timestamp dicts with 'word', 'start_seconds', 'end_seconds'.
+        """
+        tokens = [(m.start(), m.end(), m.group(0)) for m in _TOKEN.finditer(self.narration)]
+        token_starts = np.array([start for start, _, _ in tokens], dtype=np.int64)
+        narration_alnum = np.array([char.isalnum() for char in self.narration], dtype=bool)
+        token_lengths = np.array(
+            [int(narration_alnum[start:end].sum()) for start, end, _ in tokens], dtype=np.int64
+        )
+
+        # Timed word -> narration token of its first aligned character, and
+        # how many of its characters match that token
+        word_tokens = np.full(len(self.words), -1, dtype=np.int64)
+        word_hits = np.zeros(len(self.words), dtype=np.int64)
+        if len(self.aligned_chars):
+            char_tokens = np.searchsorted(token_starts, self.aligned_chars, side="right") - 1
+            first = np.unique(self.aligned_words, return_index=True)
+            word_tokens[first[0]] = char_tokens[first[1]]
+            hits = self.aligned_matches & (char_tokens == word_tokens[self.aligned_words])
+            word_hits = np.bincount(self.aligned_words[hits], minlength=len(self.words))
+
+        # Group consecutive timed words by narration token
+        groups: list[tuple[int, list[int]]] = []
+        for index, word in enumerate(self.words):
+            token = int(word_tokens[index])
+            if groups and not any(char.isalnum() for char in word):
+                # Detached punctuation belongs to the word before it
+                groups[-1][1].append(index)
+            elif token >= 0 and groups and token == groups[-1][0]:
+                groups[-1][1].append(index)
+            else:
+                groups.append((token, [index]))
+
+        merged: list[dict[str, Any]] = []
+        for token, indices in groups:
+            if token >= 0:
+                spoken = int(self.word_lengths[indices].sum())
+                matched = int(word_hits[indices].sum())
+                if matched >= MIN_SPELLING_MATCH * max(spoken, int(token_lengths[token]), 1):
+                    merged.append({
+                        "word": tokens[token][2],
+                        "start_seconds": float(self.start_seconds[indices[0]]),
+                        "end_seconds": float(self.end_seconds[indices[-1]]),
+                    })
+                    continue
+            # Keep what was actually said
+            for index in indices:
+                word = self.words[index]
+                if merged and index != indices[0] and not any(char.isalnum() for char in word):
+                    merged[-1]["word"] += word
+                    merged[-1]["end_seconds"] = float(self.end_seconds[index])
+                    continue
+                merged.append({
+                    "word": word,
+                    "start_seconds": float(self.start_seconds[index]),
+                    "end_seconds": float(self.end_seconds[index]),
+                })
+        return merged
+
+
+def align_narration(
+    narration: str,
+    word_timestamps: list[Any],
+    band: int = DEFAULT_BAND,
+) -> NarrationAlignment:
+    """Align narration text to word timestamps.
+
+    Args:
+        narration: The narration text that was spoken.
+        word_timestamps: Word timestamp dicts or WordTimestamp objects.
+        band: Half-width of the DP band, in characters.
+
+    Returns:
+        NarrationAlignment mapping narration character spans to words and times.
+    """
+    return NarrationAlignment.from_timestamps(narration, word_timestamps, band)
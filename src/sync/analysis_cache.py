@@ -0,0 +1,105 @@
+"""Persistent cache of per-scene sync analysis results.
+
+The sync points the LLM finds for a scene depend only on the scene code, the
+voiceover's word timestamps and narration, the scene's duration and the
+analysis prompt. Results are stored under a hash of exactly those inputs, so
+after re-recording one scene's voiceover (or editing one scene) only that
+scene is re-analyzed.
+
+Entries are individual JSON files written atomically, so concurrent runs
+(and concurrent scene analyses) never observe a partially written entry.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .models import SceneSyncConfig
+from .prompts import (
+    SYNC_ANALYSIS_PROMPT_VERSION,
+    SYNC_ANALYSIS_SYSTEM_PROMPT,
+    SYNC_ANALYSIS_USER_PROMPT,
+)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# Editing either prompt template also invalidates cached analyses
+PROMPT_HASH = _sha256((SYNC_ANALYSIS_SYSTEM_PROMPT + SYNC_ANALYSIS_USER_PROMPT).encode())
+
+
+class SyncAnalysisCache:
+    """Content-addressed store of SceneSyncConfigs, one file per entry."""
+
+    def __init__(self, cache_dir: Path | str):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        scene_code: str,
+        word_timestamps: list[dict],
+        narration_text: str = "",
+        scene_title: str = "",
+        duration_seconds: float = 0.0,
+        fps: int = 30,
+    ) -> str:
+        """Compute the cache key for one scene analysis.
+
+        Args:
+            scene_code: Contents of the scene .tsx file
+            word_timestamps: The scene's word timestamps from the manifest
+            narration_text: The scene's narration
+            scene_title: Scene title (part of the prompt)
+            duration_seconds: Scene duration
+            fps: Frames per second
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            {
+                "scene_code": _sha256(scene_code.encode()),
+                "word_timestamps": _sha256(json.dumps(word_timestamps, sort_keys=True).encode()),
+                "prompt_version": SYNC_ANALYSIS_PROMPT_VERSION,
+                "prompt": PROMPT_HASH,
+                "narration_text": narration_text,
+                "scene_title": scene_title,
+                "duration_seconds": duration_seconds,
+                "fps": fps,
+            },
+            sort_keys=True,
+        ).encode())
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Path of the cache entry for a key (may not exist yet)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[SceneSyncConfig]:
+        """Return the cached scene config for a key, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            config = SceneSyncConfig.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return config
+
+    def put(self, key: str, config: SceneSyncConfig) -> None:
+        """Store a scene config under a key."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(config.to_dict()))
+        os.replace(tmp_path, path)
@@ -5,8 +5,10 @@ This module analyzes scene code and word timestamps to generate sync points
 that map visual animations to specific words in the voiceover.
 """
 
+import contextvars
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Optional
 
@@ -22,6 +24,8 @@ from .utils import (
     validate_trigger_word,
     get_scene_duration_frames,
 )
+from .word_timeline import WordTimeline
+from .analysis_cache import SyncAnalysisCache
 from .prompts import (
     SYNC_ANALYSIS_SYSTEM_PROMPT,
     SYNC_ANALYSIS_USER_PROMPT,
@@ -33,11 +37,16 @@ from .prompts import (
 class SyncAnalyzer:
     """Analyzer for generating sync points from scene code and voiceover timestamps."""
 
+    DEFAULT_MAX_WORKERS = 4  # Scenes analyzed in parallel by analyze_project
+
     def __init__(
         self,
         project,
         verbose: bool = True,
         llm_provider: Optional[Any] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize the sync analyzer.
 
@@ -45,11 +54,19 @@ class SyncAnalyzer:
             project: The Project instance.
             verbose: Whether to print progress messages.
             llm_provider: Optional LLM provider for analysis. If None, uses default.
+            max_workers: Maximum scenes analyzed concurrently by analyze_project
+                (default: DEFAULT_MAX_WORKERS, 1 = sequential)
+            use_cache: Reuse analyses of scenes whose code, narration and
+                word timestamps are unchanged
+            cache_dir: Analysis cache location (default: <project>/.cache/sync-analysis)
         """
         self.project = project
         self.verbose = verbose
         self.llm_provider = llm_provider
         self.fps = 30
+        self.max_workers = max(1, max_workers or self.DEFAULT_MAX_WORKERS)
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
 
     def analyze_scene(
         self,
@@ -139,8 +156,12 @@ class SyncAnalyzer:
     def analyze_project(self, force: bool = False) -> SyncMap:
         """Analyze all scenes in the project.
 
+        Scenes whose code, narration and word timestamps are unchanged keep
+        their sync points (from the existing sync map, or the analysis
+        cache); only the remaining scenes are analyzed, concurrently.
+
         Args:
-            force: If True, regenerate even if sync_map exists.
+            force: If True, re-analyze every scene.
 
         Returns:
             SyncMap with all scene configurations.
@@ -152,16 +173,19 @@ class SyncAnalyzer:
         sync_dir = self.project.root_dir / "sync"
         sync_map_path = sync_dir / "sync_map.json"
 
+        existing: Optional[SyncMap] = None
         if sync_map_path.exists() and not force:
-            if self.verbose:
-                print(f"  📄 Loading existing sync map from {sync_map_path}")
             with open(sync_map_path) as f:
-                data = json.load(f)
-            return SyncMap.from_dict(data)
+                existing = SyncMap.from_dict(json.load(f))
 
         # Load manifest for word timestamps
         manifest_path = self.project.root_dir / "voiceover" / "manifest.json"
         if not manifest_path.exists():
+            if existing is not None:
+                # Nothing to compare against, keep the sync map as it is
+                if self.verbose:
+                    print(f"  📄 Loading existing sync map from {sync_map_path}")
+                return existing
             raise FileNotFoundError(f"Voiceover manifest not found: {manifest_path}")
 
         with open(manifest_path) as f:
@@ -174,8 +198,8 @@ class SyncAnalyzer:
         # Map manifest scenes by ID for easy lookup
         manifest_scenes = {s["scene_id"]: s for s in manifest.get("scenes", [])}
 
-        # Analyze each scene
-        scene_configs = []
+        # Collect the analysis inputs of each scene
+        jobs: list[tuple[str, dict[str, Any]]] = []  # (analysis key, analyze_scene kwargs)
         for sb_scene in storyboard_scenes:
             scene_id = sb_scene.get("id", "")
             scene_title = sb_scene.get("title", "")
@@ -192,19 +216,57 @@ class SyncAnalyzer:
             scene_file = self._find_scene_file(scene_id, scene_title)
 
             if scene_file:
-                config = self.analyze_scene(
-                    scene_id=scene_id,
-                    scene_file=scene_file,
-                    word_timestamps=word_timestamps,
+                key = SyncAnalysisCache.make_key(
+                    scene_file.read_text(),
+                    word_timestamps,
                     narration_text=narration_text,
                     scene_title=scene_title,
                     duration_seconds=duration_seconds,
+                    fps=self.fps,
                 )
-                scene_configs.append(config)
+                jobs.append((key, {
+                    "scene_id": scene_id,
+                    "scene_file": scene_file,
+                    "word_timestamps": word_timestamps,
+                    "narration_text": narration_text,
+                    "scene_title": scene_title,
+                    "duration_seconds": duration_seconds,
+                }))
             else:
                 if self.verbose:
                     print(f"  ⚠️ Scene file not found for: {scene_title}")
 
+        # Reuse the analyses of unchanged scenes
+        cache = self._get_cache()
+        scene_configs: list[Optional[SceneSyncConfig]] = [None] * len(jobs)
+        if not force:
+            self._reuse_unchanged(jobs, scene_configs, existing, cache)
+        pending = [idx for idx, config in enumerate(scene_configs) if config is None]
+
+        if self.verbose and len(pending) < len(jobs):
+            print(f"  ♻️ Reusing sync points for {len(jobs) - len(pending)} unchanged scenes")
+
+        def analyze_one(idx: int) -> SceneSyncConfig:
+            key, kwargs = jobs[idx]
+            config = self.analyze_scene(**kwargs)
+            config.analysis_key = key
+            # An empty result may be an unparseable response; retry it next run
+            if cache is not None and config.sync_points:
+                cache.put(key, config)
+            return config
+
+        workers = min(self.max_workers, len(pending))
+        if workers <= 1:
+            for idx in pending:
+                scene_configs[idx] = analyze_one(idx)
+        else:
+            if self.verbose:
+                print(f"  Analyzing {len(pending)} scenes with {workers} workers...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(contextvars.copy_context().run, analyze_one, idx): idx for idx in pending}
+                for future in as_completed(futures):
+                    scene_configs[futures[future]] = future.result()
+
         # Create sync map
         from datetime import datetime
         sync_map = SyncMap(
@@ -216,10 +278,49 @@ class SyncAnalyzer:
 
         if self.verbose:
             total_points = sum(len(s.sync_points) for s in scene_configs)
-            print(f"\n  ✅ Analyzed {len(scene_configs)} scenes, {total_points} sync points")
+            print(
+                f"\n  ✅ Analyzed {len(pending)} of {len(scene_configs)} scenes, "
+                f"{total_points} sync points"
+            )
 
         return sync_map
 
+    def _get_cache(self) -> Optional[SyncAnalysisCache]:
+        """The analysis cache, or None if caching is disabled."""
+        if not self.use_cache:
+            return None
+        return SyncAnalysisCache(self.cache_dir or self.project.root_dir / ".cache" / "sync-analysis")
+
+    def _reuse_unchanged(
+        self,
+        jobs: list[tuple[str, dict[str, Any]]],
+        scene_configs: list[Optional[SceneSyncConfig]],
+        existing: Optional[SyncMap],
+        cache: Optional[SyncAnalysisCache],
+    ) -> None:
+        """Fill in the configs of scenes whose analysis inputs are unchanged.
+
+        The existing sync map entry is preferred (it may have been edited by
+        hand), then the analysis cache. Entries from sync maps written before
+        analysis keys were recorded are kept as they are, as they were before.
+
+        Args:
+            jobs: (analysis key, analyze_scene kwargs) per scene.
+            scene_configs: Per-scene results, filled in place.
+            existing: The sync map from a previous run, if any.
+            cache: The analysis cache, if enabled.
+        """
+        previous = {s.scene_id: s for s in existing.scenes} if existing else {}
+        for idx, (key, kwargs) in enumerate(jobs):
+            config = previous.get(kwargs["scene_id"])
+            if config is None or config.analysis_key not in (key, ""):
+                config = cache.get(key) if cache is not None else None
+            if config is None:
+                continue
+            config.analysis_key = key
+            config.scene_file = str(kwargs["scene_file"])
+            scene_configs[idx] = config
+
     def save_sync_map(self, sync_map: SyncMap) -> Path:
         """Save sync map to project directory.
 
@@ -407,10 +508,11 @@ class SyncAnalyzer:
             List of validated sync points.
         """
         validated = []
+        timeline = WordTimeline(word_timestamps)  # Indexed once for all sync points
 
         for sp in sync_points:
             is_valid, suggestion = validate_trigger_word(
-                sp.trigger_word, word_timestamps
+                sp.trigger_word, timeline
             )
 
             if is_valid:
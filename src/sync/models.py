@@ -74,6 +74,7 @@ class SceneSyncConfig:
     sync_points: list[SyncPoint] = field(default_factory=list)
     current_timing_vars: list[str] = field(default_factory=list)  # Extracted from code
     narration_text: str = ""  # Full narration text for context
+    analysis_key: str = ""  # Hash of the analysis inputs (see SyncAnalysisCache.make_key)
 
     def to_dict(self) -> dict:
         return {
@@ -84,6 +85,7 @@ class SceneSyncConfig:
             "sync_points": [sp.to_dict() for sp in self.sync_points],
             "current_timing_vars": self.current_timing_vars,
             "narration_text": self.narration_text,
+            "analysis_key": self.analysis_key,
         }
 
     @classmethod
@@ -96,6 +98,7 @@ class SceneSyncConfig:
             sync_points=[SyncPoint.from_dict(sp) for sp in data.get("sync_points", [])],
             current_timing_vars=data.get("current_timing_vars", []),
             narration_text=data.get("narration_text", ""),
+            analysis_key=data.get("analysis_key", ""),
         )
 
 
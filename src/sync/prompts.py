@@ -6,6 +6,10 @@ This module contains prompts for:
 2. Scene Migration: Transforming scene code to use centralized timing
 """
 
+# Bump when the sync analysis prompts or response parsing change in a way the
+# prompt text alone doesn't show, so cached scene analyses are not reused.
+SYNC_ANALYSIS_PROMPT_VERSION = 1
+
 SYNC_ANALYSIS_SYSTEM_PROMPT = """You are an expert at analyzing Remotion scene components to identify visual-voiceover synchronization points.
 
 Your task is to analyze a scene's TypeScript/JSX code alongside its narration word timestamps to identify where visual animations should sync with specific words in the voiceover.
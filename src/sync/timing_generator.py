@@ -14,12 +14,15 @@ from .models import (
     SceneSyncConfig,
     SceneTimingBlock,
     ProjectTiming,
+    SyncPoint,
     SyncPointType,
 )
 from .utils import (
     find_word_frame_fuzzy,
     get_scene_duration_frames,
 )
+from .alignment import NarrationAlignment
+from .word_timeline import WordTimeline
 
 
 # Sync point types that are informational only and should NOT be used for code replacement
@@ -30,6 +33,32 @@ INFORMATIONAL_SYNC_TYPES = {
 }
 
 
+def aligned_trigger_frame(
+    alignment: NarrationAlignment,
+    sync_point: SyncPoint,
+    fps: int = 30,
+) -> Optional[int]:
+    """Find a sync point's frame from its trigger phrase in the narration.
+
+    Args:
+        alignment: Alignment of the scene narration to its word timestamps.
+        sync_point: Sync point with trigger_phrase and trigger_word.
+        fps: Frames per second.
+
+    Returns:
+        Frame number (plus the sync point's offset), or None if the phrase
+        or word can't be located in the narration.
+    """
+    span = alignment.find_phrase(sync_point.trigger_phrase, sync_point.trigger_word)
+    if span is None:
+        return None
+    times = alignment.time_span(*span)
+    if times is None:
+        return None
+    seconds = times[0] if sync_point.use_word_start else times[1]
+    return int(seconds * fps) + sync_point.offset_frames
+
+
 def generate_scene_timing(
     scene_config: SceneSyncConfig,
     word_timestamps: list[dict],
@@ -49,6 +78,12 @@ def generate_scene_timing(
     timing_constants: dict[str, int] = {}
     warnings: list[str] = []
     skipped_informational: list[str] = []
+    timeline = WordTimeline(word_timestamps, fps)  # Indexed once for all sync points
+    alignment = (
+        NarrationAlignment.from_timestamps(scene_config.narration_text, word_timestamps)
+        if scene_config.narration_text and word_timestamps
+        else None
+    )
 
     for sync_point in scene_config.sync_points:
         # Skip informational sync types - these should NOT be used for code replacement
@@ -59,14 +94,18 @@ def generate_scene_timing(
             )
             continue
 
-        # Find the frame for this sync point
-        frame = find_word_frame_fuzzy(
-            word_timestamps=word_timestamps,
-            target_word=sync_point.trigger_word,
-            fps=fps,
-            use_start=sync_point.use_word_start,
-            offset_frames=sync_point.offset_frames,
-        )
+        # Find the frame for this sync point: at the trigger phrase's position
+        # in the narration when it can be aligned, so repeated words resolve
+        # to the right occurrence; otherwise by matching the trigger word
+        frame = aligned_trigger_frame(alignment, sync_point, fps) if alignment else None
+        if frame is None:
+            frame = find_word_frame_fuzzy(
+                word_timestamps=timeline,
+                target_word=sync_point.trigger_word,
+                fps=fps,
+                use_start=sync_point.use_word_start,
+                offset_frames=sync_point.offset_frames,
+            )
 
         if frame is not None:
             # Ensure frame is within valid range
@@ -6,11 +6,13 @@ utilities adapted from src/short/timing_generator.py.
 """
 
 import re
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+from .word_timeline import WordTimeline
 
 
 def find_word_frame(
-    word_timestamps: list[dict[str, Any]],
+    word_timestamps: Union[list[dict[str, Any]], WordTimeline],
     target_word: str,
     fps: int = 30,
     match_mode: str = "contains",
@@ -20,7 +22,9 @@ def find_word_frame(
     """Find the frame number when a specific word is spoken.
 
     Args:
-        word_timestamps: List of word timestamp dicts with 'word', 'start_seconds', 'end_seconds'.
+        word_timestamps: List of word timestamp dicts with 'word', 'start_seconds',
+            'end_seconds', or a WordTimeline built from them (build one per
+            scene when looking up several words).
         target_word: The word to find (case-insensitive).
         fps: Frames per second for conversion.
         match_mode: How to match words:
@@ -33,36 +37,12 @@ def find_word_frame(
     Returns:
         Frame number when the word starts/ends (plus offset), or None if not found.
     """
-    target_lower = target_word.lower().strip()
-    # Also strip punctuation from target for matching
-    target_clean = re.sub(r"[.,!?;:'\"]+$", "", target_lower)
-
-    for ts in word_timestamps:
-        word = ts.get("word", "")
-        # Strip common punctuation for matching
-        word_clean = re.sub(r"[.,!?;:'\"]+$", "", word.lower().strip())
-
-        matched = False
-        if match_mode == "exact":
-            matched = word_clean == target_clean
-        elif match_mode == "contains":
-            matched = target_clean in word_clean or word_clean in target_clean
-        elif match_mode == "starts_with":
-            matched = word_clean.startswith(target_clean)
-
-        if matched:
-            # Return frame at start or end of word
-            if use_start:
-                time_seconds = ts.get("start_seconds", 0)
-            else:
-                time_seconds = ts.get("end_seconds", 0)
-            return int(time_seconds * fps) + offset_frames
-
-    return None
+    timeline = WordTimeline.of(word_timestamps, fps)
+    return timeline.find_frame(target_word, match_mode, use_start, offset_frames, fps=fps)
 
 
 def find_word_frame_fuzzy(
-    word_timestamps: list[dict[str, Any]],
+    word_timestamps: Union[list[dict[str, Any]], WordTimeline],
     target_word: str,
     fps: int = 30,
     use_start: bool = True,
@@ -70,8 +50,10 @@ def find_word_frame_fuzzy(
 ) -> Optional[int]:
     """Find word frame with fuzzy matching, trying multiple strategies.
 
+    Tries an exact match first, then contains, then starts_with.
+
     Args:
-        word_timestamps: List of word timestamp dicts.
+        word_timestamps: List of word timestamp dicts, or a WordTimeline.
         target_word: The word to find.
         fps: Frames per second.
         use_start: If True, return frame at word START.
@@ -80,51 +62,24 @@ def find_word_frame_fuzzy(
     Returns:
         Frame number or None if not found.
     """
-    # Try exact match first
-    frame = find_word_frame(word_timestamps, target_word, fps, "exact", use_start, offset_frames)
-    if frame is not None:
-        return frame
-
-    # Try contains match
-    frame = find_word_frame(word_timestamps, target_word, fps, "contains", use_start, offset_frames)
-    if frame is not None:
-        return frame
-
-    # Try starts_with match
-    frame = find_word_frame(word_timestamps, target_word, fps, "starts_with", use_start, offset_frames)
-    if frame is not None:
-        return frame
-
-    return None
+    return find_word_frame(word_timestamps, target_word, fps, "fuzzy", use_start, offset_frames)
 
 
 def find_word_index(
-    word_timestamps: list[dict[str, Any]],
+    word_timestamps: Union[list[dict[str, Any]], WordTimeline],
     target_word: str,
 ) -> Optional[int]:
     """Find the index of a word in the timestamps list.
 
     Args:
-        word_timestamps: List of word timestamp dicts.
+        word_timestamps: List of word timestamp dicts, or a WordTimeline.
         target_word: The word to find.
 
     Returns:
-        Index of the word or None if not found.
+        Index of the first word that matches exactly or contains (or is
+        contained in) the target, or None if not found.
     """
-    target_clean = re.sub(r"[.,!?;:'\"]+$", "", target_word.lower().strip())
-
-    for i, ts in enumerate(word_timestamps):
-        word = ts.get("word", "")
-        word_clean = re.sub(r"[.,!?;:'\"]+$", "", word.lower().strip())
-
-        # Try exact match
-        if word_clean == target_clean:
-            return i
-        # Try contains match
-        if target_clean in word_clean or word_clean in target_clean:
-            return i
-
-    return None
+    return WordTimeline.of(word_timestamps).find_index(target_word, "contains")
 
 
 def extract_timing_vars(code: str) -> list[dict[str, Any]]:
@@ -278,19 +233,20 @@ def get_scene_duration_frames(duration_seconds: float, fps: int = 30) -> int:
 
 def validate_trigger_word(
     trigger_word: str,
-    word_timestamps: list[dict[str, Any]],
+    word_timestamps: Union[list[dict[str, Any]], WordTimeline],
 ) -> tuple[bool, Optional[str]]:
     """Validate that a trigger word exists in the word timestamps.
 
     Args:
         trigger_word: The word to validate.
-        word_timestamps: List of word timestamp dicts.
+        word_timestamps: List of word timestamp dicts, or a WordTimeline.
 
     Returns:
         Tuple of (is_valid, suggestion). If not valid, suggestion contains
         a similar word that was found, if any.
     """
-    index = find_word_index(word_timestamps, trigger_word)
+    timeline = WordTimeline.of(word_timestamps)
+    index = find_word_index(timeline, trigger_word)
     if index is not None:
         return True, None
 
@@ -298,11 +254,11 @@ def validate_trigger_word(
     target_clean = trigger_word.lower().strip()
     suggestions = []
 
-    for ts in word_timestamps:
-        word = ts.get("word", "").lower().strip()
+    for original in timeline.words:
+        word = original.lower().strip()
         # Check for partial matches
         if target_clean[:3] in word or word[:3] in target_clean:
-            suggestions.append(ts.get("word", ""))
+            suggestions.append(original)
 
     if suggestions:
         return False, suggestions[0]
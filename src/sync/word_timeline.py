@@ -0,0 +1,252 @@
+"""
+Indexed word timeline for trigger-word lookups.
+
+Timing generation and scene sync look up many trigger words in the same
+scene's word timestamps. `WordTimeline` normalizes the words once and indexes
+them so each lookup is a hash or substring search instead of a scan that
+re-normalizes every word:
+
+- exact matches come from a token -> positions index
+- starts_with matches come from a prefix -> positions index
+- contains matches combine the token index (a word contained in the target is
+  one of the target's substrings) with one substring search over all tokens
+  joined into a single string (the target contained in a word)
+
+Start/end frames are kept in NumPy arrays, and every query can start from a
+word position or frame so repeated words resolve to the next occurrence.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+# Trailing punctuation ignored when matching words
+_TRAILING_PUNCTUATION = re.compile(r"[.,!?;:'\"]+$")
+
+# Joins tokens for substring search; never appears inside a token
+_SEPARATOR = "\x00"
+
+MATCH_MODES = ("exact", "contains", "starts_with", "fuzzy")
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase a word and strip whitespace and trailing punctuation."""
+    return _TRAILING_PUNCTUATION.sub("", word.lower().strip())
+
+
+def _first_at_or_after(positions: Iterable[int], start: int) -> Optional[int]:
+    """First position >= start in a sorted position list."""
+    positions = positions or ()
+    i = bisect_left(positions, start)
+    return positions[i] if i < len(positions) else None
+
+
+class WordTimeline:
+    """Word timestamps of one scene (or beat), indexed for word lookups."""
+
+    def __init__(self, word_timestamps: list[dict[str, Any]], fps: int = 30):
+        """Build the timeline.
+
+        Args:
+            word_timestamps: Word timestamp dicts with 'word', 'start_seconds',
+                'end_seconds'.
+            fps: Frames per second for the frame arrays.
+        """
+        self.fps = fps
+        self.words = [ts.get("word", "") for ts in word_timestamps]
+        self.tokens = [normalize_word(word) for word in self.words]
+        self.start_seconds = np.array(
+            [ts.get("start_seconds", 0) for ts in word_timestamps], dtype=np.float64
+        )
+        self.end_seconds = np.array(
+            [ts.get("end_seconds", 0) for ts in word_timestamps], dtype=np.float64
+        )
+        self.start_frames = (self.start_seconds * fps).astype(np.int64)
+        self.end_frames = (self.end_seconds * fps).astype(np.int64)
+        self._chronological = bool(np.all(np.diff(self.start_frames) >= 0))
+
+        self._positions: dict[str, list[int]] = {}
+        self._prefixes: dict[str, list[int]] = {}
+        for i, token in enumerate(self.tokens):
+            self._positions.setdefault(token, []).append(i)
+            for length in range(len(token) + 1):
+                self._prefixes.setdefault(token[:length], []).append(i)
+        self._token_lengths = sorted({len(token) for token in self._positions})
+
+        self._haystack = _SEPARATOR.join(self.tokens)
+        self._offsets = np.zeros(len(self.tokens), dtype=np.int64)
+        if self.tokens:
+            lengths = np.array([len(token) + 1 for token in self.tokens[:-1]], dtype=np.int64)
+            self._offsets[1:] = np.cumsum(lengths)
+
+    @classmethod
+    def of(
+        cls,
+        word_timestamps: Union[list[dict[str, Any]], "WordTimeline"],
+        fps: int = 30,
+    ) -> "WordTimeline":
+        """Return a timeline as-is, or build one from word timestamps."""
+        if isinstance(word_timestamps, WordTimeline):
+            return word_timestamps
+        return cls(word_timestamps, fps)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def find_index(
+        self,
+        target_word: str,
+        match_mode: str = "contains",
+        start: int = 0,
+    ) -> Optional[int]:
+        """Find the first word matching a target, at or after a position.
+
+        Args:
+            target_word: The word to find (case-insensitive, trailing
+                punctuation ignored).
+            match_mode: How to match words:
+                - "exact": Word must match exactly
+                - "contains": Word contains the target or vice versa (default)
+                - "starts_with": Word starts with target
+                - "fuzzy": exact, then contains, then starts_with
+            start: First word position to consider.
+
+        Returns:
+            Word position, or None if no word matches.
+        """
+        target = normalize_word(target_word)
+        start = max(0, start)
+        if start >= len(self.tokens):
+            return None
+
+        if match_mode == "exact":
+            return _first_at_or_after(self._positions.get(target), start)
+        if match_mode == "starts_with":
+            return _first_at_or_after(self._prefixes.get(target), start)
+        if match_mode == "contains":
+            return self._find_contains(target, start)
+        if match_mode == "fuzzy":
+            for mode in ("exact", "contains", "starts_with"):
+                index = self.find_index(target, mode, start)
+                if index is not None:
+                    return index
+        return None
+
+    def _find_contains(self, target: str, start: int) -> Optional[int]:
+        """First word at or after start that contains target or is contained in it."""
+        best: Optional[int] = None
+
+        # Words contained in the target are substrings of it
+        for length in self._token_lengths:
+            if length > len(target):
+                break
+            for i in range(len(target) - length + 1):
+                index = _first_at_or_after(self._positions.get(target[i:i + length]), start)
+                if index is not None and (best is None or index < best):
+                    best = index
+                    if best == start:
+                        return best
+
+        # Words containing the target, via one substring search over all tokens
+        offset = self._haystack.find(target, int(self._offsets[start]))
+        if offset != -1:
+            index = int(np.searchsorted(self._offsets, offset, side="right")) - 1
+            if best is None or index < best:
+                best = index
+        return best
+
+    def index_at_frame(self, frame: int) -> int:
+        """Position of the first word starting at or after a frame."""
+        if self._chronological:
+            return int(np.searchsorted(self.start_frames, frame, side="left"))
+        later = np.flatnonzero(self.start_frames >= frame)
+        return int(later[0]) if len(later) else len(self.tokens)
+
+    def frame(
+        self,
+        index: int,
+        use_start: bool = True,
+        offset_frames: int = 0,
+        fps: Optional[int] = None,
+    ) -> int:
+        """Frame at which a word starts (or ends), plus an offset.
+
+        Args:
+            index: Word position.
+            use_start: If True, use the word START, otherwise its END.
+            offset_frames: Frames to add (negative = earlier).
+            fps: Frames per second (defaults to the timeline's).
+        """
+        if fps is None or fps == self.fps:
+            frames = self.start_frames if use_start else self.end_frames
+            return int(frames[index]) + offset_frames
+        seconds = self.start_seconds if use_start else self.end_seconds
+        return int(seconds[index] * fps) + offset_frames
+
+    def find_frame(
+        self,
+        target_word: str,
+        match_mode: str = "contains",
+        use_start: bool = True,
+        offset_frames: int = 0,
+        from_frame: Optional[int] = None,
+        fps: Optional[int] = None,
+    ) -> Optional[int]:
+        """Find the frame when a word is spoken.
+
+        Args:
+            target_word: The word to find.
+            match_mode: See find_index.
+            use_start: If True, return the frame at word START, otherwise END.
+            offset_frames: Frames to add to the result (negative = earlier).
+            from_frame: Only consider words starting at or after this frame,
+                for the next occurrence of a repeated word.
+            fps: Frames per second (defaults to the timeline's).
+
+        Returns:
+            Frame number, or None if the word is not found.
+        """
+        start = 0 if from_frame is None else self.index_at_frame(from_frame)
+        index = self.find_index(target_word, match_mode, start)
+        if index is None:
+            return None
+        return self.frame(index, use_start, offset_frames, fps)
+
+    def cursor(self, from_frame: Optional[int] = None) -> "TimelineCursor":
+        """A cursor for finding words in spoken order."""
+        return TimelineCursor(self, 0 if from_frame is None else self.index_at_frame(from_frame))
+
+
+class TimelineCursor:
+    """Finds words in order, each search starting after the previous match."""
+
+    def __init__(self, timeline: WordTimeline, position: int = 0):
+        self.timeline = timeline
+        self.position = position
+
+    def find(self, target_word: str, match_mode: str = "fuzzy") -> Optional[int]:
+        """Find the next matching word and move past it.
+
+        Returns:
+            Word position, or None if no later word matches (the cursor
+            does not move).
+        """
+        index = self.timeline.find_index(target_word, match_mode, self.position)
+        if index is not None:
+            self.position = index + 1
+        return index
+
+    def find_frame(
+        self,
+        target_word: str,
+        match_mode: str = "fuzzy",
+        use_start: bool = True,
+        offset_frames: int = 0,
+    ) -> Optional[int]:
+        """Frame of the next matching word (see WordTimeline.frame)."""
+        index = self.find(target_word, match_mode)
+        if index is None:
+            return None
+        return self.timeline.frame(index, use_start, offset_frames)
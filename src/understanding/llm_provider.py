@@ -1,15 +1,38 @@
 """LLM Provider abstraction and implementations."""
 
+import asyncio
 import json
 import re
 import subprocess
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
 from ..config import Config, LLMConfig
 from ..models import ContentAnalysis, Concept, Script, ScriptScene, VisualCue
+from .response_cache import ResponseCache
+from .single_flight import llm_requests
+from .telemetry import CallTracker, track_call
+
+
+# Set for --force / --no-cache runs: cached providers then act as if every
+# call passed use_cache=False
+_bypass_cache = False
+
+
+def bypass_response_cache(bypass: bool = True) -> None:
+    """Make every cached provider skip the response cache for this process.
+
+    A module-level switch rather than a ContextVar, so worker threads see it.
+
+    Args:
+        bypass: True to skip the cache (no reads or writes), False to use it
+    """
+    global _bypass_cache
+    _bypass_cache = bypass
 
 
 class ClaudeCodeError(Exception):
@@ -28,6 +51,29 @@ class ClaudeCodeResult:
     error_message: str | None = None
 
 
+def _load_json_response(response: str) -> Any:
+    """Parse JSON from a model response that may be wrapped in prose or markdown.
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON can be extracted
+    """
+    text = response.strip()
+
+    # Try to extract JSON from markdown code blocks
+    json_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
+    matches = re.findall(json_block_pattern, text)
+    if matches:
+        text = matches[0].strip()
+
+    # Try to find JSON object or array
+    json_pattern = r"(\{[\s\S]*\}|\[[\s\S]*\])"
+    json_match = re.search(json_pattern, text)
+    if json_match:
+        text = json_match.group(1)
+
+    return json.loads(text)
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -531,6 +577,7 @@ class ClaudeCodeLLMProvider(LLMProvider):
         config: LLMConfig,
         working_dir: Path | None = None,
         timeout: int = 300,
+        cache: ResponseCache | None = None,
     ):
         """Initialize the Claude Code provider.
 
@@ -538,17 +585,26 @@ class ClaudeCodeLLMProvider(LLMProvider):
             config: LLM configuration
             working_dir: Working directory for file operations (default: cwd)
             timeout: Command timeout in seconds (default: 300)
+            cache: Optional response cache for generate/generate_json
+                (file-access calls are never cached)
         """
         super().__init__(config)
         self.working_dir = working_dir or Path.cwd()
         self.timeout = timeout
+        self.cache = cache
 
-    def generate(self, prompt: str, system_prompt: str | None = None) -> str:
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
+    ) -> str:
         """Generate a text response via Claude Code CLI.
 
         Args:
             prompt: The user prompt
             system_prompt: Optional system prompt
+            use_cache: If False, bypass the response cache for this call
 
         Returns:
             The generated text response
@@ -556,31 +612,37 @@ class ClaudeCodeLLMProvider(LLMProvider):
         Raises:
             ClaudeCodeError: If the CLI command fails
         """
-        cmd = self._build_command(prompt, system_prompt, tools=[])
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(self.working_dir),
-            timeout=self.timeout,
-        )
+        with track_call("claude-code", self.config.model, "generate", prompt, system_prompt) as call:
+            cache_key = self._cache_key(prompt, system_prompt, use_cache)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    call.response, call.cached = cached, True
+                    return cached
 
-        if result.returncode != 0:
-            raise ClaudeCodeError(f"Claude Code failed: {result.stderr}")
+            response = self._print_coalesced(prompt, system_prompt, call).strip()
+            call.response = response
 
-        return result.stdout.strip()
+            if cache_key:
+                self.cache.set(cache_key, response, model=self.config.model)
+            return response
 
     def generate_json(
-        self, prompt: str, system_prompt: str | None = None
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """Generate a JSON response via Claude Code CLI.
 
         The prompt is augmented to request JSON output, and the response
-        is parsed to extract the JSON content.
+        is parsed to extract the JSON content. Only responses that parse
+        successfully are written to the cache.
 
         Args:
             prompt: The user prompt
             system_prompt: Optional system prompt
+            use_cache: If False, bypass the response cache for this call
 
         Returns:
             Parsed JSON response as a dictionary
@@ -589,7 +651,66 @@ class ClaudeCodeLLMProvider(LLMProvider):
             ClaudeCodeError: If the CLI command fails or JSON parsing fails
         """
         json_prompt = f"{prompt}\n\nRespond with valid JSON only. No markdown code blocks."
-        cmd = self._build_command(json_prompt, system_prompt, tools=[])
+        with track_call(
+            "claude-code", self.config.model, "generate_json", json_prompt, system_prompt
+        ) as call:
+            cache_key = self._cache_key(json_prompt, system_prompt, use_cache)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    try:
+                        parsed = self._parse_json_response(cached)
+                        call.response, call.cached = cached, True
+                        return parsed
+                    except ClaudeCodeError:
+                        pass  # Unparseable entry - fall through and regenerate
+
+            output = self._print_coalesced(json_prompt, system_prompt, call)
+            call.response = output
+            parsed = self._parse_json_response(output)
+
+            if cache_key:
+                self.cache.set(cache_key, output, model=self.config.model)
+            return parsed
+
+    def _cache_key(
+        self, prompt: str, system_prompt: str | None, use_cache: bool
+    ) -> str | None:
+        """Return the response cache key, or None if caching is off for this call."""
+        if self.cache is None or not use_cache or _bypass_cache:
+            return None
+        return ResponseCache.make_key(
+            self.config.model,
+            system_prompt,
+            prompt,
+            tools=[],
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+
+    def _print_coalesced(
+        self, prompt: str, system_prompt: str | None, call: CallTracker
+    ) -> str:
+        """Run _run_print, sharing one CLI call among identical concurrent requests.
+
+        Raises:
+            ClaudeCodeError: If the CLI command fails
+        """
+        if not self.config.coalesce_requests:
+            return self._run_print(prompt, system_prompt)
+        key = ("claude-code", self.config.model, str(self.working_dir), system_prompt, prompt)
+        output, call.coalesced = llm_requests.do(
+            key, lambda: self._run_print(prompt, system_prompt)
+        )
+        return output
+
+    def _run_print(self, prompt: str, system_prompt: str | None) -> str:
+        """Run a tool-less `claude --print` call and return its stdout.
+
+        Raises:
+            ClaudeCodeError: If the CLI command fails
+        """
+        cmd = self._build_command(prompt, system_prompt, tools=[])
         result = subprocess.run(
             cmd,
             capture_output=True,
@@ -601,7 +722,7 @@ class ClaudeCodeLLMProvider(LLMProvider):
         if result.returncode != 0:
             raise ClaudeCodeError(f"Claude Code failed: {result.stderr}")
 
-        return self._parse_json_response(result.stdout)
+        return result.stdout
 
     def generate_with_file_access(
         self,
@@ -624,6 +745,22 @@ class ClaudeCodeLLMProvider(LLMProvider):
         Returns:
             ClaudeCodeResult with response and list of modified files
         """
+        with track_call(
+            "claude-code", self.config.model, "generate_with_file_access", prompt, system_prompt
+        ) as call:
+            result = self._run_with_file_access(prompt, system_prompt, allow_writes, live_output)
+            call.response = result.response
+            call.error = result.error_message if not result.success else None
+            return result
+
+    def _run_with_file_access(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        allow_writes: bool,
+        live_output: bool,
+    ) -> ClaudeCodeResult:
+        """Run Claude Code with the file tools selected by allow_writes."""
         if allow_writes:
             tools = self.DEFAULT_TOOLS
         else:
@@ -781,22 +918,8 @@ class ClaudeCodeLLMProvider(LLMProvider):
         Raises:
             ClaudeCodeError: If JSON parsing fails
         """
-        text = response.strip()
-
-        # Try to extract JSON from markdown code blocks
-        json_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
-        matches = re.findall(json_block_pattern, text)
-        if matches:
-            text = matches[0].strip()
-
-        # Try to find JSON object or array
-        json_pattern = r"(\{[\s\S]*\}|\[[\s\S]*\])"
-        json_match = re.search(json_pattern, text)
-        if json_match:
-            text = json_match.group(1)
-
         try:
-            return json.loads(text)
+            return _load_json_response(response)
         except json.JSONDecodeError as e:
             raise ClaudeCodeError(f"Failed to parse JSON response: {e}\nResponse: {response[:500]}")
 
@@ -844,6 +967,408 @@ class ClaudeCodeLLMProvider(LLMProvider):
         return list(set(modified))  # Remove duplicates
 
 
+class AnthropicAPIError(Exception):
+    """Error from an Anthropic Messages API call."""
+
+    pass
+
+
+_clients: dict[tuple, Any] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+class AnthropicAPIProvider(LLMProvider):
+    """LLM provider calling the Anthropic Messages API in-process.
+
+    All providers with the same connection settings share one SDK client,
+    so calls reuse pooled keep-alive connections instead of paying process
+    startup and a TLS handshake each time. Transient failures (connection
+    errors, 429, 5xx) are retried by the SDK with exponential backoff.
+
+    This provider has no file access; callers that need the agent to read
+    or edit files keep using ClaudeCodeLLMProvider.generate_with_file_access.
+    """
+
+    MAX_CONNECTIONS = 20
+
+    def __init__(
+        self,
+        config: LLMConfig,
+        cache: ResponseCache | None = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+    ):
+        """Initialize the Anthropic API provider.
+
+        Args:
+            config: LLM configuration
+            cache: Optional response cache for generate/generate_json
+            api_key: API key (default: ANTHROPIC_API_KEY)
+            base_url: API base URL override (default: config.base_url, then
+                ANTHROPIC_BASE_URL, then the public API)
+            timeout: Request timeout in seconds (default: config.request_timeout)
+            max_retries: Retries for transient failures (default: config.max_retries)
+        """
+        super().__init__(config)
+        self.cache = cache
+        self.api_key = api_key
+        self.base_url = base_url or config.base_url
+        self.timeout = timeout if timeout is not None else config.request_timeout
+        self.max_retries = max_retries if max_retries is not None else config.max_retries
+
+    @property
+    def client(self) -> Any:
+        """Shared synchronous SDK client for this provider's settings."""
+        import anthropic
+        import httpx
+
+        key = self._client_key()
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = anthropic.Anthropic(
+                    **self._client_kwargs(),
+                    http_client=anthropic.DefaultHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=self.MAX_CONNECTIONS,
+                            max_keepalive_connections=self.MAX_CONNECTIONS,
+                        )
+                    ),
+                )
+                _clients[key] = client
+            return client
+
+    @property
+    def async_client(self) -> Any:
+        """Shared async SDK client for this provider's settings.
+
+        Async connections are bound to the event loop that opened them, so
+        one client is kept per running loop.
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        import anthropic
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        key = self._client_key()
+        with _clients_lock:
+            loop_clients = _async_clients.setdefault(loop, {})
+            client = loop_clients.get(key)
+            if client is None:
+                client = anthropic.AsyncAnthropic(
+                    **self._client_kwargs(),
+                    http_client=anthropic.DefaultAsyncHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=self.MAX_CONNECTIONS,
+                            max_keepalive_connections=self.MAX_CONNECTIONS,
+                        )
+                    ),
+                )
+                loop_clients[key] = client
+            return client
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Generate a text response via the Messages API.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            use_cache: If False, bypass the response cache for this call
+
+        Returns:
+            The generated text response
+
+        Raises:
+            AnthropicAPIError: If the request fails after retries
+        """
+        with track_call("anthropic", self.config.model, "generate", prompt, system_prompt) as call:
+            cache_key = self._cache_key(prompt, system_prompt, use_cache)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    call.response, call.cached = cached, True
+                    return cached
+
+            response = self._create(prompt, system_prompt, call).strip()
+
+            if cache_key:
+                self.cache.set(cache_key, response, model=self.config.model)
+            return response
+
+    def generate_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Generate a JSON response via the Messages API.
+
+        Only responses that parse successfully are written to the cache.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            use_cache: If False, bypass the response cache for this call
+
+        Returns:
+            Parsed JSON response as a dictionary
+
+        Raises:
+            AnthropicAPIError: If the request fails or JSON parsing fails
+        """
+        json_prompt = f"{prompt}\n\nRespond with valid JSON only. No markdown code blocks."
+        with track_call(
+            "anthropic", self.config.model, "generate_json", json_prompt, system_prompt
+        ) as call:
+            cache_key = self._cache_key(json_prompt, system_prompt, use_cache)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    try:
+                        parsed = self._parse_json_response(cached)
+                        call.response, call.cached = cached, True
+                        return parsed
+                    except AnthropicAPIError:
+                        pass  # Unparseable entry - fall through and regenerate
+
+            output = self._create(json_prompt, system_prompt, call)
+            parsed = self._parse_json_response(output)
+
+            if cache_key:
+                self.cache.set(cache_key, output, model=self.config.model)
+            return parsed
+
+    def stream(self, prompt: str, system_prompt: str | None = None) -> Iterator[str]:
+        """Stream a text response as it is generated (never cached).
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+
+        Yields:
+            Text deltas in order
+
+        Raises:
+            AnthropicAPIError: If the request fails
+        """
+        with track_call("anthropic", self.config.model, "stream", prompt, system_prompt) as call:
+            try:
+                with self.client.messages.stream(**self._request(prompt, system_prompt)) as stream:
+                    yield from stream.text_stream
+                    self._record_usage(stream.get_final_message(), call)
+            except Exception as e:
+                raise self._wrap_error(e) from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Async variant of generate.
+
+        Raises:
+            AnthropicAPIError: If the request fails after retries
+        """
+        with track_call("anthropic", self.config.model, "agenerate", prompt, system_prompt) as call:
+            cache_key = self._cache_key(prompt, system_prompt, use_cache)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    call.response, call.cached = cached, True
+                    return cached
+
+            response = (await self._acreate(prompt, system_prompt, call)).strip()
+
+            if cache_key:
+                self.cache.set(cache_key, response, model=self.config.model)
+            return response
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Async variant of generate_json.
+
+        Raises:
+            AnthropicAPIError: If the request fails or JSON parsing fails
+        """
+        json_prompt = f"{prompt}\n\nRespond with valid JSON only. No markdown code blocks."
+        with track_call(
+            "anthropic", self.config.model, "agenerate_json", json_prompt, system_prompt
+        ) as call:
+            cache_key = self._cache_key(json_prompt, system_prompt, use_cache)
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    try:
+                        parsed = self._parse_json_response(cached)
+                        call.response, call.cached = cached, True
+                        return parsed
+                    except AnthropicAPIError:
+                        pass  # Unparseable entry - fall through and regenerate
+
+            output = await self._acreate(json_prompt, system_prompt, call)
+            parsed = self._parse_json_response(output)
+
+            if cache_key:
+                self.cache.set(cache_key, output, model=self.config.model)
+            return parsed
+
+    async def astream(
+        self, prompt: str, system_prompt: str | None = None
+    ) -> AsyncIterator[str]:
+        """Async variant of stream.
+
+        Raises:
+            AnthropicAPIError: If the request fails
+        """
+        with track_call("anthropic", self.config.model, "astream", prompt, system_prompt) as call:
+            try:
+                async with self.async_client.messages.stream(
+                    **self._request(prompt, system_prompt)
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+                    self._record_usage(await stream.get_final_message(), call)
+            except Exception as e:
+                raise self._wrap_error(e) from e
+
+    def _create(self, prompt: str, system_prompt: str | None, call: CallTracker) -> str:
+        """Send one Messages API request and return the response text.
+
+        Identical requests already in flight on other threads are joined
+        rather than sent again.
+
+        Raises:
+            AnthropicAPIError: If the request fails after retries
+        """
+        request = self._request(prompt, system_prompt)
+
+        def send() -> Any:
+            try:
+                return self.client.messages.create(**request)
+            except Exception as e:
+                raise self._wrap_error(e) from e
+
+        if self.config.coalesce_requests:
+            key = (
+                "anthropic",
+                self.base_url,
+                self.config.model,
+                self.config.max_tokens,
+                self.config.temperature,
+                system_prompt,
+                prompt,
+            )
+            message, call.coalesced = llm_requests.do(key, send)
+        else:
+            message = send()
+        self._record_usage(message, call)
+        return call.response
+
+    async def _acreate(self, prompt: str, system_prompt: str | None, call: CallTracker) -> str:
+        """Async variant of _create."""
+        try:
+            message = await self.async_client.messages.create(
+                **self._request(prompt, system_prompt)
+            )
+        except Exception as e:
+            raise self._wrap_error(e) from e
+        self._record_usage(message, call)
+        return call.response
+
+    def _record_usage(self, message: Any, call: CallTracker) -> None:
+        """Copy the response text and reported token usage onto a call tracker."""
+        call.response = self._message_text(message)
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            call.input_tokens = usage.input_tokens
+            call.output_tokens = usage.output_tokens
+
+    def _client_key(self) -> tuple:
+        return (self.base_url, self.api_key, self.timeout, self.max_retries)
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"timeout": self.timeout, "max_retries": self.max_retries}
+        if self.api_key is not None:
+            kwargs["api_key"] = self.api_key
+        if self.base_url is not None:
+            kwargs["base_url"] = self.base_url
+        return kwargs
+
+    def _request(self, prompt: str, system_prompt: str | None) -> dict[str, Any]:
+        """Build Messages API request parameters."""
+        request: dict[str, Any] = {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            # Sent as a raw body field: not every SDK version exposes it as a keyword
+            "extra_body": {"temperature": self.config.temperature},
+        }
+        if system_prompt:
+            request["system"] = system_prompt
+        return request
+
+    def _cache_key(
+        self, prompt: str, system_prompt: str | None, use_cache: bool
+    ) -> str | None:
+        """Return the response cache key, or None if caching is off for this call."""
+        if self.cache is None or not use_cache or _bypass_cache:
+            return None
+        return ResponseCache.make_key(
+            self.config.model,
+            system_prompt,
+            prompt,
+            tools=[],
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+
+    @staticmethod
+    def _message_text(message: Any) -> str:
+        """Concatenate the text blocks of a Messages API response."""
+        return "".join(
+            block.text for block in message.content if getattr(block, "type", None) == "text"
+        )
+
+    @staticmethod
+    def _wrap_error(error: Exception) -> Exception:
+        """Convert SDK errors to AnthropicAPIError; leave other errors alone."""
+        import anthropic
+
+        if isinstance(error, AnthropicAPIError) or not isinstance(error, anthropic.AnthropicError):
+            return error
+        return AnthropicAPIError(f"Anthropic API request failed: {error}")
+
+    def _parse_json_response(self, response: str) -> dict[str, Any]:
+        """Parse JSON from a response that may include markdown code blocks.
+
+        Raises:
+            AnthropicAPIError: If JSON parsing fails
+        """
+        try:
+            return _load_json_response(response)
+        except json.JSONDecodeError as e:
+            raise AnthropicAPIError(
+                f"Failed to parse JSON response: {e}\nResponse: {response[:500]}"
+            )
+
+
 def get_llm_provider(config: Config | None = None) -> LLMProvider:
     """Get the appropriate LLM provider based on configuration.
 
@@ -866,10 +1391,9 @@ def get_llm_provider(config: Config | None = None) -> LLMProvider:
     if provider_name == "mock":
         return MockLLMProvider(config.llm)
     elif provider_name == "claude-code":
-        return ClaudeCodeLLMProvider(config.llm)
+        return ClaudeCodeLLMProvider(config.llm, cache=ResponseCache.from_config(config.llm))
     elif provider_name == "anthropic":
-        # TODO: Implement AnthropicLLMProvider
-        raise NotImplementedError("Anthropic provider not yet implemented")
+        return AnthropicAPIProvider(config.llm, cache=ResponseCache.from_config(config.llm))
     elif provider_name == "openai":
         # TODO: Implement OpenAILLMProvider
         raise NotImplementedError("OpenAI provider not yet implemented")
@@ -0,0 +1,262 @@
+"""Persistent on-disk cache for LLM responses.
+
+Responses are content-addressed: the cache key is a hash of everything that
+determines the model output (model, sampling parameters, system prompt,
+prompt, tool set), so a
+re-run of the pipeline that sends an identical request gets the stored
+response back instead of paying for another CLI round trip.
+
+Entries are individual JSON files so concurrent writers never corrupt each
+other, and eviction is by age and by least-recently-used once the cache
+grows past its entry/size limits.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config import LLMConfig
+
+
+def default_cache_dir() -> Path:
+    """Return the user-level cache directory for LLM responses."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "video-explainer" / "llm"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class ResponseCache:
+    """Content-addressed response cache stored as one JSON file per entry."""
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        max_entries: int = 2000,
+        max_size_bytes: int = 500 * 1024 * 1024,
+        max_age_seconds: float | None = 30 * 24 * 3600,
+    ):
+        """Initialize the cache.
+
+        The directory is created lazily on the first write, so constructing a
+        cache has no side effects.
+
+        Args:
+            cache_dir: Directory for cache entries (default: user cache dir)
+            max_entries: Maximum number of entries before LRU eviction
+            max_size_bytes: Maximum total size of entries before LRU eviction
+            max_age_seconds: Entries older than this are treated as misses
+                and removed (None = never expire)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: LLMConfig) -> "ResponseCache | None":
+        """Build a cache from LLM config, or None if caching is disabled."""
+        if not config.cache_enabled:
+            return None
+        max_age = config.cache_max_age_days * 24 * 3600 if config.cache_max_age_days else None
+        return cls(
+            cache_dir=config.cache_dir,
+            max_entries=config.cache_max_entries,
+            max_size_bytes=config.cache_max_size_mb * 1024 * 1024,
+            max_age_seconds=max_age,
+        )
+
+    @staticmethod
+    def make_key(
+        model: str | None,
+        system_prompt: str | None,
+        prompt: str,
+        tools: list[str] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Compute the cache key for a request.
+
+        Args:
+            model: Model identifier
+            system_prompt: Optional system prompt
+            prompt: The user prompt (exactly as sent)
+            tools: Allowed tool names (order-insensitive)
+            temperature: Sampling temperature
+            max_tokens: Response length limit
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "model": model or "",
+                "system_prompt": system_prompt or "",
+                "prompt": prompt,
+                "tools": sorted(tools or []),
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.max_age_seconds is not None and now - created_at > self.max_age_seconds
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The cached response text, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            response = entry["response"]
+            created_at = float(entry.get("created_at", 0))
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        now = time.time()
+        if self._is_expired(created_at, now):
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.stats.misses += 1
+                self.stats.evictions += 1
+            return None
+
+        # Touch the entry so eviction is least-recently-used, not oldest-written
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+        with self._lock:
+            self.stats.hits += 1
+        return response
+
+    def set(self, key: str, response: str, model: str | None = None) -> None:
+        """Store a response and evict old entries if over limits.
+
+        Args:
+            key: Key from make_key()
+            response: Response text to store
+            model: Model identifier (stored for inspection only)
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        entry = {
+            "key": key,
+            "model": model,
+            "created_at": time.time(),
+            "response": response,
+        }
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self.stats.writes += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then least-recently-used ones over the limits.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        removed = 0
+        kept = []
+        for mtime, size, path in entries:
+            if self._is_expired(mtime, now):
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                kept.append((mtime, size, path))
+
+        kept.sort()  # oldest access first
+        total_size = sum(size for _, size, _ in kept)
+        while kept and (len(kept) > self.max_entries or total_size > self.max_size_bytes):
+            _, size, path = kept.pop(0)
+            path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+
+        if removed:
+            with self._lock:
+                self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry from the cache.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
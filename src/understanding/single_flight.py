@@ -0,0 +1,88 @@
+"""Coalescing of identical in-flight LLM requests.
+
+When several workers send the same prompt at the same moment (shared
+context preambles, concurrent retries of the same generate_json call), only
+the first caller reaches the model; the others wait for its result. Unlike
+the response cache this never returns a stale answer: a request joins only
+a call that is still running.
+"""
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    executed: int = 0
+    coalesced: int = 0
+
+    @property
+    def calls(self) -> int:
+        return self.executed + self.coalesced
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"executed": self.executed, "coalesced": self.coalesced, "calls": self.calls}
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self.stats = SingleFlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Run fn, or wait for an identical call already in flight.
+
+        Args:
+            key: Identifies calls that produce the same result
+            fn: The call to make if none with this key is running
+
+        Returns:
+            (result, shared) where shared is True if the result came from
+            another caller's in-flight call
+
+        Raises:
+            Whatever fn raised, in the caller that ran it and every waiter
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.stats.executed += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._inflight)
+
+
+# Shared by every provider instance in the process, since pipeline components
+# each construct their own provider
+llm_requests = SingleFlight()
@@ -0,0 +1,390 @@
+"""Per-call LLM telemetry.
+
+Every LLM call made through a provider is timed and appended as one JSON
+line to a per-project ledger while recording is active (the CLI turns it on
+for commands that operate on a project). Each record carries the pipeline
+stage, the component that made the call (e.g. "SceneGenerator"), prompt and
+response sizes, token counts (reported by the API or estimated from
+character counts) and an estimated cost.
+
+`summarize` aggregates a ledger into per-stage and per-component latency
+percentiles and totals for `video-explainer stats <project>`.
+"""
+
+import contextvars
+import json
+import math
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from .. import budget
+
+LEDGER_FILENAME = "llm_calls.jsonl"
+
+# Rough characters-per-token ratio used when the provider reports no usage
+CHARS_PER_TOKEN = 4
+
+# USD per million (input, output) tokens, matched by substring of the model id
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "opus": (15.0, 75.0),
+    "sonnet": (3.0, 15.0),
+    "haiku": (0.80, 4.0),
+}
+DEFAULT_PRICE = MODEL_PRICES["sonnet"]
+
+# Modules whose frames are skipped when attributing a call to a component
+_INFRA_MODULES = ("src.understanding.llm_provider", __name__, "concurrent.", "threading", "asyncio")
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Estimate the token count of a text from its length."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate the USD cost of a call from its token counts."""
+    model = (model or "").lower()
+    input_price, output_price = next(
+        (price for name, price in MODEL_PRICES.items() if name in model), DEFAULT_PRICE
+    )
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+@dataclass
+class LLMCallRecord:
+    """One LLM call, as written to the ledger."""
+
+    timestamp: str
+    provider: str
+    model: str
+    method: str  # e.g. "generate", "generate_json", "generate_with_file_access"
+    component: str  # Class (or module) that made the call
+    stage: str | None  # Pipeline stage / CLI command
+    duration_s: float
+    prompt_chars: int
+    response_chars: int
+    input_tokens: int
+    output_tokens: int
+    tokens_estimated: bool
+    cost_usd: float
+    cached: bool = False
+    coalesced: bool = False  # Joined an identical in-flight call
+    success: bool = True
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LLMCallRecord":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+class TelemetryLedger:
+    """Append-only JSONL ledger of LLM calls."""
+
+    def __init__(self, path: Path, default_stage: str | None = None):
+        """Initialize the ledger.
+
+        Args:
+            path: JSONL file to append to (created on first record)
+            default_stage: Stage recorded for calls made outside `stage()`
+        """
+        self.path = Path(path)
+        self.default_stage = default_stage
+        self._lock = threading.Lock()
+
+    def append(self, record: LLMCallRecord) -> None:
+        """Append one record; each call is a single whole-line write."""
+        line = json.dumps(record.to_dict()) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line)
+
+    @staticmethod
+    def read(path: Path) -> list[LLMCallRecord]:
+        """Read all records from a ledger, skipping malformed lines."""
+        path = Path(path)
+        if not path.exists():
+            return []
+        records = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(LLMCallRecord.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+        return records
+
+
+_active_ledger: TelemetryLedger | None = None
+_current_stage: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "llm_telemetry_stage", default=None
+)
+
+
+def ledger_path(project_dir: Path) -> Path:
+    """Location of the LLM call ledger for a project."""
+    return Path(project_dir) / "telemetry" / LEDGER_FILENAME
+
+
+def start_recording(project_dir: Path, stage: str | None = None) -> TelemetryLedger:
+    """Start recording LLM calls into a project's ledger.
+
+    Args:
+        project_dir: Project root directory
+        stage: Stage recorded for calls made outside `stage()`
+
+    Returns:
+        The active ledger
+    """
+    global _active_ledger
+    _active_ledger = TelemetryLedger(ledger_path(project_dir), default_stage=stage)
+    return _active_ledger
+
+
+def stop_recording() -> None:
+    """Stop recording LLM calls."""
+    global _active_ledger
+    _active_ledger = None
+
+
+def active_ledger() -> TelemetryLedger | None:
+    """The ledger calls are currently recorded into, if any."""
+    return _active_ledger
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Attribute LLM calls made in this context (and thread) to a stage.
+
+    Executor threads don't inherit it: submit work with
+    ``contextvars.copy_context().run`` so calls keep the caller's stage.
+    """
+    token = _current_stage.set(name)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+def caller_component() -> str:
+    """Name the component that made the current LLM call.
+
+    Walks up the stack past provider and threading frames to the first
+    caller frame, and reports its class name (or module name for plain
+    functions).
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_INFRA_MODULES) and module != "contextlib":
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return type(owner).__name__
+            return module.rsplit(".", 1)[-1]
+        frame = frame.f_back
+    return "unknown"
+
+
+@dataclass
+class CallTracker:
+    """Collects the outcome of one in-progress LLM call."""
+
+    response: str | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cached: bool = False
+    coalesced: bool = False
+    error: str | None = None  # For failures reported without raising
+
+
+@contextmanager
+def track_call(
+    provider: str,
+    model: str,
+    method: str,
+    prompt: str,
+    system_prompt: str | None = None,
+) -> Iterator[CallTracker]:
+    """Time an LLM call and append it to the active ledger.
+
+    A no-op (beyond yielding a tracker) when neither recording nor a budget
+    is active. The caller fills in the tracker's response, and token usage
+    when the provider reports it. Failed calls are recorded and the
+    exception re-raised. The call's cost is reported to the active budget.
+
+    Args:
+        provider: Provider name (e.g. "claude-code")
+        model: Model id
+        method: Provider method being called
+        prompt: User prompt
+        system_prompt: Optional system prompt
+
+    Raises:
+        budget.BudgetExceededError: If the LLM budget is already spent
+    """
+    tracker = CallTracker()
+    spend = budget.active_tracker()
+    hold = None
+    if spend is not None:
+        # Refuse calls once the LLM budget is spent; the prompt's input
+        # cost is the least the call will cost
+        prompt_tokens = estimate_tokens((system_prompt or "") + prompt)
+        hold = spend.authorize("llm", estimate_cost(model, prompt_tokens, 0), description=method)
+
+    ledger = _active_ledger
+    if ledger is None and hold is None:
+        yield tracker
+        return
+
+    component = caller_component()
+    started = time.perf_counter()
+    error: str | None = None
+    try:
+        yield tracker
+    except GeneratorExit:
+        raise  # A stream closed early by its consumer is not a failure
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"[:500]
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        prompt_text = (system_prompt or "") + prompt
+        estimated = tracker.input_tokens is None or tracker.output_tokens is None
+        input_tokens = tracker.input_tokens
+        output_tokens = tracker.output_tokens
+        if input_tokens is None:
+            input_tokens = estimate_tokens(prompt_text)
+        if output_tokens is None:
+            output_tokens = estimate_tokens(tracker.response)
+        # Cache hits and coalesced waiters did not pay for the call
+        free = tracker.cached or tracker.coalesced
+        cost = 0.0 if free else estimate_cost(model, input_tokens, output_tokens)
+
+        if hold is not None:
+            hold.settle(cost)
+        if ledger is not None:
+            try:
+                ledger.append(
+                    LLMCallRecord(
+                        timestamp=datetime.now().isoformat(),
+                        provider=provider,
+                        model=model,
+                        method=method,
+                        component=component,
+                        stage=_current_stage.get() or ledger.default_stage,
+                        duration_s=round(duration, 4),
+                        prompt_chars=len(prompt_text),
+                        response_chars=len(tracker.response or ""),
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        tokens_estimated=estimated,
+                        cost_usd=round(cost, 6),
+                        cached=tracker.cached,
+                        coalesced=tracker.coalesced,
+                        success=error is None and tracker.error is None,
+                        error=error or tracker.error,
+                    )
+                )
+            except OSError:
+                pass  # Telemetry must never break a pipeline run
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class CallGroupSummary:
+    """Aggregate statistics for a group of LLM calls."""
+
+    calls: int = 0
+    cached: int = 0
+    coalesced: int = 0
+    failed: int = 0
+    total_s: float = 0.0
+    p50_s: float = 0.0
+    p95_s: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    durations: list[float] = field(default_factory=list, repr=False)
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.calls += 1
+        self.cached += int(record.cached)
+        self.coalesced += int(record.coalesced)
+        self.failed += int(not record.success)
+        self.total_s += record.duration_s
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cost_usd += record.cost_usd
+        if not (record.cached or record.coalesced):
+            self.durations.append(record.duration_s)
+
+    def finish(self) -> "CallGroupSummary":
+        self.p50_s = percentile(self.durations, 50)
+        self.p95_s = percentile(self.durations, 95)
+        return self
+
+
+@dataclass
+class TelemetrySummary:
+    """Ledger totals, broken down by stage and by component."""
+
+    total: CallGroupSummary
+    by_stage: dict[str, CallGroupSummary]
+    by_component: dict[str, CallGroupSummary]
+
+
+def summarize(records: list[LLMCallRecord]) -> TelemetrySummary:
+    """Aggregate LLM call records.
+
+    Latency percentiles only count calls that reached the model (cache hits
+    and coalesced waiters are excluded); totals include every call.
+
+    Args:
+        records: Records read from a ledger
+
+    Returns:
+        TelemetrySummary with per-stage and per-component groups, each
+        sorted by total wall time (largest first)
+    """
+    total = CallGroupSummary()
+    by_stage: dict[str, CallGroupSummary] = {}
+    by_component: dict[str, CallGroupSummary] = {}
+    for record in records:
+        total.add(record)
+        by_stage.setdefault(record.stage or "unknown", CallGroupSummary()).add(record)
+        by_component.setdefault(record.component, CallGroupSummary()).add(record)
+
+    def ordered(groups: dict[str, CallGroupSummary]) -> dict[str, CallGroupSummary]:
+        return {
+            name: group.finish()
+            for name, group in sorted(groups.items(), key=lambda item: -item[1].total_s)
+        }
+
+    return TelemetrySummary(
+        total=total.finish(),
+        by_stage=ordered(by_stage),
+        by_component=ordered(by_component),
+    )
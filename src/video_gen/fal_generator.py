@@ -19,6 +19,8 @@ from typing import Literal
 
 import httpx
 
+from .. import budget
+
 
 class AspectRatio(str, Enum):
     """Supported aspect ratios for video generation."""
@@ -151,30 +153,51 @@ class FalVideoGenerator:
         generate_audio = generate_audio if generate_audio is not None else self.config.generate_audio
         seed = seed if seed is not None else self.config.seed
         
-        # Submit generation request
+        # Check the budget, falling back to a shorter clip or cheaper model
+        tracker = budget.active_tracker()
+        hold = None
+        if tracker is not None:
+            (model, duration), hold = tracker.choose(
+                "video_gen",
+                self._budget_options(model, duration, aspect_ratio, generate_audio),
+                description=f"fal.ai clip ({output_path.name})",
+            )
+
         start_time = time.time()
-        request_id = await self._submit_request(
-            prompt=prompt,
-            negative_prompt=negative_prompt,
-            aspect_ratio=aspect_ratio.value if isinstance(aspect_ratio, AspectRatio) else aspect_ratio,
-            duration=duration.value if isinstance(duration, Duration) else duration,
-            resolution=resolution.value if isinstance(resolution, Resolution) else resolution,
-            generate_audio=generate_audio,
-            model=model,
-            seed=seed,
-        )
-        
-        # Poll for completion
-        video_url = await self._wait_for_completion(model, request_id)
-        
-        # Download video
-        await self._download_video(video_url, output_path)
-        
+        try:
+            # Submit generation request
+            request_id = await self._submit_request(
+                prompt=prompt,
+                negative_prompt=negative_prompt,
+                aspect_ratio=aspect_ratio.value if isinstance(aspect_ratio, AspectRatio) else aspect_ratio,
+                duration=duration.value if isinstance(duration, Duration) else duration,
+                resolution=resolution.value if isinstance(resolution, Resolution) else resolution,
+                generate_audio=generate_audio,
+                model=model,
+                seed=seed,
+            )
+
+            # Poll for completion
+            video_url = await self._wait_for_completion(model, request_id)
+
+            # Download video
+            await self._download_video(video_url, output_path)
+        except BaseException:
+            if hold is not None:
+                hold.release()
+            raise
+
         generation_time = time.time() - start_time
         
         # Parse duration to seconds
         duration_seconds = int(duration.value.replace("s", "") if isinstance(duration, Duration) else duration.replace("s", ""))
         
+        if hold is not None:
+            hold.settle(
+                self.cost_for(duration_seconds, model, generate_audio),
+                description=f"fal.ai {model} {duration_seconds}s ({output_path.name})",
+            )
+
         return FalVideoResult(
             video_path=output_path,
             video_url=video_url,
@@ -368,19 +391,55 @@ class FalVideoGenerator:
             Estimated cost in USD
         """
         model = model or self.config.model
+        return self.cost_for(_duration_seconds(duration), model, generate_audio)
+
+    @classmethod
+    def cost_for(cls, seconds: int, model: str, generate_audio: bool = False) -> float:
+        """Cost of a clip of the given length, without needing an API key.
         
-        # Parse duration to seconds
-        if isinstance(duration, Duration):
-            seconds = int(duration.value.replace("s", ""))
-        else:
-            seconds = int(str(duration).replace("s", ""))
-        
-        # Get pricing
-        pricing = self.PRICING.get(model, self.PRICING["fal-ai/veo3/fast"])
+        Args:
+            seconds: Clip length in seconds
+            model: fal.ai model
+            generate_audio: Whether audio is enabled
+
+        Returns:
+            Estimated cost in USD
+        """
+        pricing = cls.PRICING.get(model, cls.PRICING["fal-ai/veo3/fast"])
         rate = pricing["with_audio"] if generate_audio else pricing["no_audio"]
-        
         return seconds * rate
     
+    def _budget_options(
+        self,
+        model: str,
+        duration: Duration | str,
+        aspect_ratio: AspectRatio | str,
+        generate_audio: bool,
+    ) -> list[tuple[tuple[str, Duration | str], float]]:
+        """(model, duration) choices for a clip, most preferred first.
+
+        The requested clip comes first, then shorter clips from the same
+        model, then cheaper models that support the aspect ratio.
+        """
+        requested = _duration_seconds(duration)
+        ratio = aspect_ratio.value if isinstance(aspect_ratio, AspectRatio) else aspect_ratio
+
+        options = [((model, duration), self.cost_for(requested, model, generate_audio))]
+        candidates = [model] + sorted(
+            (
+                m for m in self.PRICING
+                if m != model and ratio in self.SUPPORTED_ASPECT_RATIOS.get(m, [])
+            ),
+            key=lambda m: self.cost_for(requested, m, generate_audio),
+        )
+        for candidate in candidates:
+            for option in sorted(_model_durations(candidate), key=_duration_seconds, reverse=True):
+                seconds = _duration_seconds(option)
+                if seconds > requested or (candidate, option) == (model, duration):
+                    continue
+                options.append(((candidate, option), self.cost_for(seconds, candidate, generate_audio)))
+        return options
+
     @staticmethod
     def get_optimal_prompt(
         narration: str,
@@ -431,6 +490,19 @@ class FalVideoGenerator:
         return ". ".join(prompt_parts)
 
 
+def _duration_seconds(duration: Duration | str) -> int:
+    """Length in seconds of a Duration (or a "6s" / "5" style string)."""
+    value = duration.value if isinstance(duration, Duration) else str(duration)
+    return int(value.replace("s", ""))
+
+
+def _model_durations(model: str) -> list[Duration]:
+    """Durations a model accepts (Kling uses "5"/"10", Veo3 "4s"/"6s"/"8s")."""
+    if "kling" in model:
+        return [Duration.FIVE, Duration.TEN]
+    return [Duration.SHORT, Duration.MEDIUM, Duration.LONG]
+
+
 def get_video_generator(api_key: str | None = None) -> FalVideoGenerator:
     """Factory function to get a video generator instance.
     
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..audio import EdgeTTS, TTSResult, WordTimestamp, get_tts_provider
+from ..audio import EdgeTTS, TTSRequest, TTSResult, WordTimestamp, get_tts_provider
 from ..config import Config, TTSConfig, load_config
 from .narration import SceneNarration
 
@@ -206,28 +206,54 @@ class VoiceoverGenerator:
         self,
         output_dir: Path,
         narrations: list[SceneNarration],
+        max_workers: int | None = None,
     ) -> VoiceoverResult:
         """Generate voiceovers for all scenes.
 
+        Scenes are synthesized concurrently through the provider's batch API;
+        the manifest keeps narration order.
+
         Args:
             output_dir: Directory to save audio files.
             narrations: List of narrations to generate voiceovers for.
+            max_workers: Concurrent TTS requests (None = provider default).
 
         Returns:
             VoiceoverResult with all generated audio.
+
+        Raises:
+            Exception: The first scene failure, after all scenes have finished.
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        print(f"Generating voiceovers for {len(narrations)} scenes...")
+        requests = [
+            TTSRequest(
+                text=narration.narration,
+                output_path=output_dir / f"{narration.scene_id}.mp3",
+                scene_id=narration.scene_id,
+            )
+            for narration in narrations
+        ]
+        outcomes = self.tts.generate_batch_with_timestamps(requests, max_workers=max_workers)
+
         scenes = []
         total_duration = 0.0
 
-        for narration in narrations:
-            print(f"Generating voiceover for: {narration.title}...")
-            scene_voiceover = self.generate_scene_voiceover(narration, output_dir)
+        for narration, outcome in zip(narrations, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"  {narration.title}: failed ({outcome})")
+                raise outcome
+            scene_voiceover = SceneVoiceover(
+                scene_id=narration.scene_id,
+                audio_path=outcome.audio_path,
+                duration_seconds=outcome.duration_seconds,
+                word_timestamps=outcome.word_timestamps,
+            )
             scenes.append(scene_voiceover)
             total_duration += scene_voiceover.duration_seconds
-            print(f"  Duration: {scene_voiceover.duration_seconds:.2f}s")
+            print(f"  {narration.title}: {scene_voiceover.duration_seconds:.2f}s")
 
         result = VoiceoverResult(
             scenes=scenes,
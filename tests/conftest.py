@@ -41,6 +41,21 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(skip_llm)
 
 
+@pytest.fixture(autouse=True)
+def isolated_user_cache(tmp_path, monkeypatch):
+    """Point user-level caches (SFX, transcripts, loudness...) at a temp dir."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache_bypass():
+    """Undo the process-wide LLM cache bypass a forced CLI run turns on."""
+    yield
+    from src.understanding.llm_provider import bypass_response_cache
+
+    bypass_response_cache(False)
+
+
 @pytest.fixture
 def test_config() -> Config:
     """Provide a test configuration."""
@@ -0,0 +1,193 @@
+"""Tests for the perceptual-hash frame cache."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.refine.models import Beat, Issue, IssueType
+from src.refine.visual.frame_cache import FrameCache, dhash, hamming_distance
+from src.refine.visual.inspector import VisualInspector
+from src.refine.visual.screenshot import CapturedScreenshot
+from src.understanding.llm_provider import ClaudeCodeResult
+
+
+def draw_frame(path: Path, box=(40, 40, 120, 100), color=(255, 200, 0)) -> Path:
+    """Write a simple frame: a colored box on a dark background."""
+    img = Image.new("RGB", (320, 180), (20, 20, 30))
+    ImageDraw.Draw(img).rectangle(box, fill=color)
+    img.save(path)
+    return path
+
+
+def make_screenshot(path: Path, beat_index: int, frame: int) -> CapturedScreenshot:
+    return CapturedScreenshot(
+        path=path,
+        beat_index=beat_index,
+        frame_number=frame,
+        expected_frame=frame,
+        timestamp_seconds=frame / 30,
+        verified=True,
+    )
+
+
+class TestDHash:
+    """Tests for the difference hash."""
+
+    def test_same_image_same_hash(self, tmp_path):
+        a = dhash(draw_frame(tmp_path / "a.png"))
+        b = dhash(draw_frame(tmp_path / "b.png"))
+        assert a is not None
+        assert a == b
+
+    def test_rescaled_image_is_close(self, tmp_path):
+        original = draw_frame(tmp_path / "a.png")
+        Image.open(original).resize((640, 360)).save(tmp_path / "big.png")
+        assert hamming_distance(dhash(original), dhash(tmp_path / "big.png")) <= FrameCache.DEFAULT_THRESHOLD
+
+    def test_moved_content_differs(self, tmp_path):
+        a = dhash(draw_frame(tmp_path / "a.png"))
+        b = dhash(draw_frame(tmp_path / "b.png", box=(180, 60, 300, 170)))
+        assert hamming_distance(a, b) > FrameCache.DEFAULT_THRESHOLD
+
+    def test_unreadable_file(self, tmp_path):
+        bad = tmp_path / "bad.png"
+        bad.write_text("not an image")
+        assert dhash(bad) is None
+
+
+class TestFrameCache:
+    """Tests for FrameCache."""
+
+    @pytest.fixture
+    def beat(self):
+        return Beat(index=0, start_seconds=0, end_seconds=4, text="Latency drops 10x")
+
+    @pytest.fixture
+    def issue(self):
+        return Issue(
+            beat_index=0,
+            principle_violated=IssueType.VISUAL_HIERARCHY,
+            description="Numbers too small",
+        )
+
+    def test_unchanged_frame_reuses_issues(self, tmp_path, beat, issue):
+        cache = FrameCache()
+        cache.store("scene1", beat, make_screenshot(draw_frame(tmp_path / "v1.png"), 0, 60), [issue])
+
+        recapture = make_screenshot(draw_frame(tmp_path / "v2.png"), 0, 60)
+        reused = cache.lookup("scene1", beat, recapture)
+
+        assert [i.description for i in reused] == ["Numbers too small"]
+        assert reused[0].screenshot_path == recapture.path
+        assert cache.hits == 1
+
+    def test_changed_frame_misses(self, tmp_path, beat, issue):
+        cache = FrameCache()
+        cache.store("scene1", beat, make_screenshot(draw_frame(tmp_path / "v1.png"), 0, 60), [issue])
+
+        moved = make_screenshot(draw_frame(tmp_path / "v2.png", box=(180, 60, 300, 170)), 0, 60)
+
+        assert cache.lookup("scene1", beat, moved) is None
+        assert not cache.is_unchanged("scene1", beat, moved)
+
+    def test_changed_narration_or_frame_number_misses(self, tmp_path, beat):
+        cache = FrameCache()
+        shot = make_screenshot(draw_frame(tmp_path / "v1.png"), 0, 60)
+        cache.store("scene1", beat, shot, [])
+
+        reworded = Beat(index=0, start_seconds=0, end_seconds=4, text="Latency drops 12x")
+        assert cache.lookup("scene1", reworded, shot) is None
+        assert cache.lookup("scene1", beat, make_screenshot(shot.path, 0, 75)) is None
+        assert cache.lookup("scene1", beat, shot) == []  # No issues is a valid result
+
+    def test_persists_between_instances(self, tmp_path, beat, issue):
+        path = tmp_path / FrameCache.FILENAME
+        cache = FrameCache(path)
+        cache.store("scene1", beat, make_screenshot(draw_frame(tmp_path / "v1.png"), 0, 60), [issue])
+        cache.save()
+
+        reloaded = FrameCache(path)
+        reused = reloaded.lookup("scene1", beat, make_screenshot(draw_frame(tmp_path / "v2.png"), 0, 60))
+
+        assert reused[0].principle_violated == IssueType.VISUAL_HIERARCHY
+        assert "scene1:0:60" in json.loads(path.read_text())["frames"]
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / FrameCache.FILENAME
+        path.write_text("{not json")
+        assert FrameCache(path).hits == 0
+
+
+class TestInspectorFrameReuse:
+    """VisualInspector only re-analyzes beats whose frames changed."""
+
+    @pytest.fixture
+    def beats(self):
+        return [
+            Beat(index=0, start_seconds=0, end_seconds=4, text="First"),
+            Beat(index=1, start_seconds=4, end_seconds=8, text="Second"),
+        ]
+
+    @pytest.fixture
+    def scene_info(self):
+        return {"id": "scene1", "title": "Scene", "duration_seconds": 8, "narration": "First. Second."}
+
+    @pytest.fixture
+    def inspector(self, project_with_files, tmp_path):
+        llm = MagicMock()
+        llm.generate_with_file_access.return_value = ClaudeCodeResult(
+            success=True,
+            response=json.dumps({"issues": [
+                {"beat_index": 1, "principle_violated": "visual_hierarchy", "description": "Cluttered"}
+            ]}),
+        )
+        return VisualInspector(project_with_files, llm_provider=llm, screenshots_dir=tmp_path / "shots", verbose=False)
+
+    def capture(self, tmp_path, second_box=(40, 40, 120, 100)):
+        return [
+            make_screenshot(draw_frame(tmp_path / "b1.png"), 0, 60),
+            make_screenshot(draw_frame(tmp_path / "b2.png", box=second_box), 1, 180),
+        ]
+
+    def test_second_pass_skips_unchanged_beats(self, inspector, beats, scene_info, tmp_path):
+        first = inspector._analyze_screenshots(self.capture(tmp_path), beats, scene_info, Path("S.tsx"))
+        second = inspector._analyze_screenshots(self.capture(tmp_path), beats, scene_info, Path("S.tsx"))
+
+        assert inspector.llm.generate_with_file_access.call_count == 1
+        assert [i.description for i in first] == [i.description for i in second] == ["Cluttered"]
+
+    def test_only_changed_beat_is_sent(self, inspector, beats, scene_info, tmp_path):
+        inspector._analyze_screenshots(self.capture(tmp_path), beats, scene_info, Path("S.tsx"))
+        inspector._analyze_screenshots(
+            self.capture(tmp_path, second_box=(180, 60, 300, 170)), beats, scene_info, Path("S.tsx")
+        )
+
+        prompt = inspector.llm.generate_with_file_access.call_args_list[1].args[0]
+        assert "Beat 2 [" in prompt
+        assert "Beat 1 [" not in prompt
+
+    def test_verify_fails_fast_when_issue_frame_unchanged(self, inspector, beats, scene_info, tmp_path):
+        issues = inspector._analyze_screenshots(self.capture(tmp_path), beats, scene_info, Path("S.tsx"))
+        inspector._capture_screenshots = MagicMock(return_value=self.capture(tmp_path))
+
+        passed = inspector._verify_fixes([], beats, scene_info, 0, issues, [])
+
+        assert passed is False
+        assert inspector.llm.generate_with_file_access.call_count == 1  # Analysis only
+
+    def test_verify_sends_only_changed_beats(self, inspector, beats, scene_info, tmp_path):
+        issues = inspector._analyze_screenshots(self.capture(tmp_path), beats, scene_info, Path("S.tsx"))
+        inspector._capture_screenshots = MagicMock(
+            return_value=self.capture(tmp_path, second_box=(180, 60, 300, 170))
+        )
+        inspector.llm.generate_with_file_access.return_value = ClaudeCodeResult(
+            success=True, response='{"verification_passed": true}'
+        )
+
+        assert inspector._verify_fixes([], beats, scene_info, 0, issues, []) is True
+        prompt = inspector.llm.generate_with_file_access.call_args.args[0]
+        assert "b2.png" in prompt
+        assert "b1.png" not in prompt
@@ -67,6 +67,54 @@ class TestVisualInspector:
         assert captured.out == ""
 
 
+class TestCaptureBackends:
+    """Tests for the inspector's frame capture backends."""
+
+    def test_unknown_backend_rejected(self, project_with_files, mock_llm_provider):
+        """An unknown capture backend raises ValueError."""
+        with pytest.raises(ValueError):
+            VisualInspector(
+                project=project_with_files,
+                llm_provider=mock_llm_provider,
+                capture_backend="screenshots",
+            )
+
+    def test_browser_pool_shared_across_scenes(self, project_with_files, mock_llm_provider):
+        """One browser pool serves every scene until close()."""
+        inspector = VisualInspector(
+            project=project_with_files,
+            llm_provider=mock_llm_provider,
+            capture_pages=3,
+        )
+
+        with patch("src.refine.visual.inspector.BrowserPool") as pool_cls:
+            first = inspector._get_browser_pool()
+            second = inspector._get_browser_pool()
+            inspector.close()
+
+        assert first is second
+        pool_cls.assert_called_once_with(size=3, headless=True)
+        first.stop.assert_called_once()
+
+    def test_still_backend_skips_studio(self, project_with_files, mock_llm_provider, sample_beats):
+        """The still backend renders without checking for Remotion Studio."""
+        inspector = VisualInspector(
+            project=project_with_files,
+            llm_provider=mock_llm_provider,
+            capture_backend="still",
+            verbose=False,
+        )
+
+        with patch("src.refine.visual.inspector.shutil.which", return_value="/usr/bin/node"), \
+             patch("src.refine.visual.inspector.check_remotion_running") as studio_check, \
+             patch("src.refine.visual.inspector.RemotionStillCapture") as still_cls:
+            still_cls.return_value.capture_beats.return_value = ["shot"]
+            screenshots = inspector._capture_screenshots(sample_beats, {"start_frame": 0}, 0)
+
+        assert screenshots == ["shot"]
+        studio_check.assert_not_called()
+
+
 class TestMockVisualInspector:
     """Tests for MockVisualInspector."""
 
@@ -479,6 +479,107 @@ class TestScriptRefiner:
         # Called once per scene
         assert mock_llm.generate_json.call_count == 2
 
+    def scene_response(self, scene_id):
+        return {
+            "scores": {"hook": 8.0},
+            "issues": [],
+            "patch": {
+                "patch_type": "modify_scene",
+                "scene_id": scene_id,
+                "new_value": f"Revised {scene_id}",
+            },
+        }
+
+    def test_concurrent_refine_keeps_scene_order(self, project_with_narrations, mock_llm):
+        """Analyses and patches come back in scene order whichever finishes first."""
+        import threading
+
+        second_done = threading.Event()
+
+        def generate_json(prompt, system_prompt=None):
+            if "Scene ID: scene1_hook" in prompt:
+                second_done.wait(5)  # Finish after scene 2
+                return self.scene_response("scene1_hook")
+            second_done.set()
+            return self.scene_response("scene2_context")
+
+        mock_llm.generate_json.side_effect = generate_json
+        refiner = ScriptRefiner(
+            project=project_with_narrations,
+            llm_provider=mock_llm,
+            verbose=False,
+            max_workers=2,
+        )
+
+        patches, result = refiner.refine()
+
+        assert [a.scene_id for a in result.scene_analyses] == ["scene1_hook", "scene2_context"]
+        assert [p.scene_id for p in patches] == ["scene1_hook", "scene2_context"]
+        assert result.failed_scenes == []
+
+    def test_concurrent_refine_keeps_telemetry_stage(self, project_with_narrations, mock_llm):
+        """LLM calls made on worker threads are attributed to the caller's stage."""
+        from src.understanding import telemetry
+
+        stages = []
+
+        def generate_json(prompt, system_prompt=None):
+            stages.append(telemetry._current_stage.get())
+            return self.scene_response("scene1_hook")
+
+        mock_llm.generate_json.side_effect = generate_json
+        refiner = ScriptRefiner(
+            project=project_with_narrations,
+            llm_provider=mock_llm,
+            verbose=False,
+            max_workers=2,
+        )
+
+        with telemetry.stage("refine"):
+            refiner.refine()
+
+        assert stages == ["refine", "refine"]
+
+    def test_refine_reports_partial_results(self, project_with_narrations, mock_llm):
+        """A failed scene analysis is reported without losing the others."""
+
+        def generate_json(prompt, system_prompt=None):
+            if "Scene ID: scene1_hook" in prompt:
+                raise RuntimeError("timed out")
+            return self.scene_response("scene2_context")
+
+        mock_llm.generate_json.side_effect = generate_json
+        refiner = ScriptRefiner(
+            project=project_with_narrations,
+            llm_provider=mock_llm,
+            verbose=False,
+        )
+
+        patches, result = refiner.refine()
+
+        assert result.failed_scenes == ["scene1_hook"]
+        assert "Analysis failed: timed out" in result.scene_analyses[0].issues[0].description
+        assert [p.scene_id for p in patches] == ["scene2_context"]
+        # Failed placeholders don't drag down the score or count as issues
+        assert result.overall_storytelling_score == result.scene_analyses[1].scores.overall
+        assert result.total_issues_found == 0
+        assert NarrationRefinementResult.from_dict(result.to_dict()).failed_scenes == ["scene1_hook"]
+
+    def test_single_worker_analyzes_sequentially(self, project_with_narrations, mock_llm):
+        """max_workers=1 analyzes scenes one at a time, in order."""
+        refiner = ScriptRefiner(
+            project=project_with_narrations,
+            llm_provider=mock_llm,
+            verbose=False,
+            max_workers=1,
+        )
+
+        refiner.refine()
+
+        prompts = [c.kwargs["prompt"] for c in mock_llm.generate_json.call_args_list]
+        assert "scene1_hook" in prompts[0]
+        assert "scene2_context" in prompts[1]
+
     def test_apply_modify_patch(self, project_with_narrations, mock_llm, temp_project_dir):
         """Test applying a ModifyScenePatch."""
         refiner = ScriptRefiner(
@@ -1,13 +1,18 @@
 """Tests for screenshot capture."""
 
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 
 from src.refine.models import Beat
 from src.refine.visual.screenshot import (
+    BrowserPool,
     MockScreenshotCapture,
     CapturedScreenshot,
+    RemotionStillCapture,
+    ScreenshotCapture,
+    StillRenderError,
     check_remotion_running,
     start_remotion_studio,
 )
@@ -109,6 +114,136 @@ class TestContextManager:
             assert screenshot.path.exists()
 
 
+@pytest.fixture
+def fake_playwright():
+    """Stand-in for Playwright: every new page writes its screenshots."""
+    browser = MagicMock()
+
+    def new_page():
+        page = MagicMock()
+        page.screenshot.side_effect = lambda path: Path(path).write_bytes(b"png")
+        return page
+
+    browser.new_page.side_effect = new_page
+    playwright = MagicMock()
+    playwright.chromium.launch.return_value = browser
+
+    with patch("src.refine.visual.screenshot.PLAYWRIGHT_AVAILABLE", True), \
+         patch("src.refine.visual.screenshot.sync_playwright", create=True) as sync_pw, \
+         patch("src.refine.visual.screenshot.time.sleep") as sleep:
+        sync_pw.return_value.start.return_value = playwright
+        yield playwright, browser, sleep
+
+
+class TestBrowserPool:
+    """Tests for the shared browser pool."""
+
+    def test_pages_are_opened_once_and_reused(self, fake_playwright):
+        """The browser launches once and pages are reused across calls."""
+        playwright, browser, _ = fake_playwright
+        pool = BrowserPool(size=3)
+
+        first = pool.pages(2)
+        second = pool.pages(3)
+
+        assert playwright.chromium.launch.call_count == 1
+        assert browser.new_page.call_count == 3
+        assert second[:2] == first
+        # Each page loads the Studio composition once
+        for page in second:
+            page.goto.assert_called_once()
+
+    def test_pages_capped_at_pool_size(self, fake_playwright):
+        """Asking for more pages than the pool size returns the pool size."""
+        pool = BrowserPool(size=2)
+        assert len(pool.pages(5)) == 2
+
+    def test_capture_does_not_close_shared_pool(self, fake_playwright, temp_project_dir):
+        """A capture borrowing a pool leaves the browser open for the next scene."""
+        _, browser, _ = fake_playwright
+        pool = BrowserPool(size=2)
+
+        with ScreenshotCapture(temp_project_dir / "shots", pool=pool):
+            pass
+        assert pool.started
+        browser.close.assert_not_called()
+
+        pool.stop()
+        browser.close.assert_called_once()
+        assert not pool.started
+
+
+class TestBatchedCapture:
+    """Tests for capturing beats across several pages."""
+
+    def test_capture_beats_in_parallel_batches(self, fake_playwright, temp_project_dir, sample_beats):
+        """Beats are spread across pages with one settle wait per batch."""
+        _, _, sleep = fake_playwright
+        capture = ScreenshotCapture(temp_project_dir / "shots", fps=30, pool=BrowserPool(size=2))
+
+        with patch.object(ScreenshotCapture, "_start_navigation", return_value=True) as navigate, \
+             patch.object(ScreenshotCapture, "get_current_frame", return_value=-1):
+            with capture:
+                screenshots = capture.capture_beats(sample_beats, scene_start_frame=300, scene_index=0)
+
+        assert [s.beat_index for s in screenshots] == [b.index for b in sample_beats]
+        assert [s.expected_frame for s in screenshots] == [
+            300 + int(b.mid_seconds * 30) for b in sample_beats
+        ]
+        assert all(s.path.exists() for s in screenshots)
+        # 4 beats on 2 pages: two batches, each waiting once
+        assert navigate.call_count == 4
+        settle_waits = [c for c in sleep.call_args_list if c.args == (ScreenshotCapture.FRAME_SETTLE_SECONDS,)]
+        assert len(settle_waits) == 2
+
+    def test_frame_mismatch_keeps_unverified_screenshot(self, fake_playwright, temp_project_dir):
+        """A mismatched frame is kept (unverified) so beats and screenshots stay aligned."""
+        capture = ScreenshotCapture(temp_project_dir / "shots", pool=BrowserPool(size=2))
+
+        with patch.object(ScreenshotCapture, "_start_navigation", return_value=True), \
+             patch.object(ScreenshotCapture, "get_current_frame", return_value=500):
+            with capture:
+                screenshots = capture.capture_frames([(100, "a.png"), (500, "b.png")])
+
+        assert [s.verified for s in screenshots] == [False, True]
+
+
+class TestRemotionStillCapture:
+    """Tests for rendering stills through Remotion."""
+
+    @staticmethod
+    def fake_render(cmd, **kwargs):
+        jobs_path = Path(cmd[cmd.index("--frames") + 1])
+        for job in json.loads(jobs_path.read_text()):
+            Path(job["output"]).write_bytes(b"png")
+        return MagicMock(returncode=0, stdout="", stderr="")
+
+    def test_capture_beats_renders_one_batch(self, temp_project_dir, sample_beats):
+        """All beats of a scene are rendered by a single script invocation."""
+        capture = RemotionStillCapture(temp_project_dir / "shots", temp_project_dir, fps=30)
+
+        with patch("subprocess.run", side_effect=self.fake_render) as mock_run:
+            screenshots = capture.capture_beats(sample_beats, scene_start_frame=0, scene_index=1)
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[1].endswith("render-stills.mjs")
+        assert "--concurrency" in cmd
+        assert [s.beat_index for s in screenshots] == [0, 1, 2, 3]
+        assert all(s.verified and s.path.exists() for s in screenshots)
+        assert screenshots[0].path.name == f"scene2_beat1_frame{int(sample_beats[0].mid_seconds * 30)}.png"
+        # The job file is cleaned up
+        assert not list((temp_project_dir / "shots").glob("stills_*.json"))
+
+    def test_render_failure_raises(self, temp_project_dir):
+        """A failing render script raises StillRenderError."""
+        capture = RemotionStillCapture(temp_project_dir / "shots", temp_project_dir)
+
+        with patch("subprocess.run", return_value=MagicMock(returncode=1, stderr="bundle failed")):
+            with pytest.raises(StillRenderError, match="bundle failed"):
+                capture.capture_screenshot(10, "frame.png")
+
+
 class TestRemotionHelpers:
     """Tests for Remotion helper functions."""
 
@@ -376,6 +376,16 @@ TestScene.tsx(15,1): error TS1005: ';' expected.
         assert len(errors) == 1
         assert errors[0].code == "TS1005"
 
+    def test_parse_typescript_ignores_strict_mode_errors(self, verifier):
+        """Test that strict-mode type errors (TS18xxx) aren't syntax errors."""
+        output = '''
+TestScene.tsx(10,5): error TS18048: 'item' is possibly 'undefined'.
+TestScene.tsx(11,5): error TS18046: 'value' is of type 'unknown'.
+TestScene.tsx(15,1): error TS1005: ';' expected.
+'''
+        errors = verifier._parse_typescript_errors(output)
+        assert [e.code for e in errors] == ["TS1005"]
+
     def test_parse_typescript_jsx_errors(self, verifier):
         """Test parsing JSX-related TypeScript errors."""
         output = '''
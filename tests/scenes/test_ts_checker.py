@@ -0,0 +1,141 @@
+"""Tests for the shared TypeScript checker."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.scenes.syntax_verifier import SyntaxVerifier
+from src.scenes.ts_checker import (
+    CHECK_TSCONFIG_NAME,
+    TypeScriptChecker,
+    get_typescript_checker,
+    parse_tsc_output,
+)
+from src.scenes.validator import SceneValidator
+
+TSC_OUTPUT = (
+    "/abs/scenes/HookScene.tsx(10,5): error TS1005: '}' expected.\n"
+    "MainScene.tsx(3,1): error TS2322: Type 'string' is not assignable to type 'number'.\n"
+    "MainScene.tsx(4,1): error TS2307: Cannot find module 'remotion'.\n"
+)
+
+
+def completed(returncode=2, stdout=TSC_OUTPUT):
+    return MagicMock(returncode=returncode, stdout=stdout, stderr="")
+
+
+@pytest.fixture
+def scenes_dir(tmp_path):
+    scenes = tmp_path / "scenes"
+    scenes.mkdir()
+    (scenes / "HookScene.tsx").write_text("export const HookScene = () => null;")
+    (scenes / "MainScene.tsx").write_text("export const MainScene = () => null;")
+    return scenes
+
+
+@pytest.fixture
+def checker(tmp_path):
+    return TypeScriptChecker(remotion_dir=tmp_path / "remotion")
+
+
+class TestParseTscOutput:
+    """Tests for parse_tsc_output."""
+
+    def test_parses_diagnostics(self):
+        diagnostics = parse_tsc_output(TSC_OUTPUT)
+
+        assert [(d.file, d.line, d.column, d.code) for d in diagnostics] == [
+            ("HookScene.tsx", 10, 5, "TS1005"),
+            ("MainScene.tsx", 3, 1, "TS2322"),
+            ("MainScene.tsx", 4, 1, "TS2307"),
+        ]
+
+    def test_ignores_other_lines(self):
+        assert parse_tsc_output("Found 3 errors.\n\nsome noise") == []
+
+
+class TestTypeScriptChecker:
+    """Tests for TypeScriptChecker."""
+
+    def test_unchanged_directory_runs_tsc_once(self, checker, scenes_dir):
+        with patch("subprocess.run", return_value=completed()) as mock_run:
+            first = checker.check(scenes_dir)
+            second = checker.check(scenes_dir)
+
+        assert mock_run.call_count == 1
+        assert second is first
+        assert checker.runs == 1
+
+    def test_edited_file_triggers_recheck(self, checker, scenes_dir):
+        with patch("subprocess.run", return_value=completed()) as mock_run:
+            checker.check(scenes_dir)
+            scene = scenes_dir / "MainScene.tsx"
+            scene.write_text("export const MainScene = () => <div />;")
+            stat = scene.stat()
+            os.utime(scene, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            checker.check(scenes_dir)
+
+        assert mock_run.call_count == 2
+
+    def test_invalidate_forces_recheck(self, checker, scenes_dir):
+        with patch("subprocess.run", return_value=completed()) as mock_run:
+            checker.check(scenes_dir)
+            checker.invalidate(scenes_dir)
+            checker.check(scenes_dir)
+
+        assert mock_run.call_count == 2
+
+    def test_runs_incremental_and_cleans_up_tsconfig(self, checker, scenes_dir):
+        seen = {}
+
+        def fake_run(cmd, **kwargs):
+            tsconfig = Path(cmd[cmd.index("--project") + 1])
+            seen["tsconfig"] = tsconfig.read_text()
+            return completed()
+
+        with patch("subprocess.run", side_effect=fake_run):
+            checker.check(scenes_dir)
+
+        assert '"incremental": true' in seen["tsconfig"]
+        assert ".tsbuildinfo" in seen["tsconfig"]
+        assert not (scenes_dir / CHECK_TSCONFIG_NAME).exists()
+
+    def test_successful_run_has_no_diagnostics(self, checker, scenes_dir):
+        with patch("subprocess.run", return_value=completed(returncode=0, stdout="")):
+            result = checker.check(scenes_dir)
+
+        assert result.diagnostics == []
+
+    def test_timeout_propagates(self, checker, scenes_dir):
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("tsc", 60)):
+            with pytest.raises(subprocess.TimeoutExpired):
+                checker.check(scenes_dir)
+
+    def test_shared_checker_per_remotion_dir(self, tmp_path):
+        assert get_typescript_checker(tmp_path) is get_typescript_checker(tmp_path)
+        assert get_typescript_checker(tmp_path) is not get_typescript_checker(tmp_path / "other")
+
+
+class TestSharedDiagnostics:
+    """SyntaxVerifier and SceneValidator share one tsc run."""
+
+    def test_verifier_and_validator_share_one_run(self, checker, scenes_dir):
+        verifier = SyntaxVerifier(remotion_dir=checker.remotion_dir, checker=checker)
+        validator = SceneValidator(remotion_dir=checker.remotion_dir, checker=checker)
+
+        with patch("subprocess.run", return_value=completed()) as mock_run:
+            syntax_errors = verifier._run_typescript_syntax_check(scenes_dir)
+            type_issues = validator._run_typescript_check(scenes_dir)
+            file_errors = verifier._check_file_syntax(scenes_dir / "HookScene.tsx")
+
+        assert mock_run.call_count == 1
+        # Syntax verifier keeps TS1xxx only
+        assert [e.code for e in syntax_errors] == ["TS1005"]
+        assert [e.code for e in file_errors] == ["TS1005"]
+        # Validator reports real errors but skips module resolution ones
+        messages = [i.message for i in type_issues]
+        assert any("not assignable" in m for m in messages)
+        assert not any("Cannot find module" in m for m in messages)
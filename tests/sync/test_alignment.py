@@ -0,0 +1,206 @@
+"""Tests for narration-to-timestamp forced alignment."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.short.generator import align_caption_words
+from src.sound.models import WordTimestamp
+from src.sound.narration_sync import NarrationSyncAnalyzer
+from src.sync.alignment import NarrationAlignment, align_narration, banded_edit_alignment
+
+
+def timed(words, step=0.5):
+    """Word timestamp dicts with one word every `step` seconds."""
+    return [
+        {"word": word, "start_seconds": i * step, "end_seconds": i * step + step * 0.8}
+        for i, word in enumerate(words)
+    ]
+
+
+def levenshtein(a, b):
+    """Reference full-matrix edit distance."""
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        prev, row = row, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            row[j] = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + (a[i - 1] != b[j - 1]))
+    return row[-1]
+
+
+class TestBandedEditAlignment:
+    """Tests for the banded DP."""
+
+    def test_without_gap_open_is_levenshtein(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            a = np.array([rng.randint(0, 3) for _ in range(rng.randint(0, 25))])
+            b = np.array([rng.randint(0, 3) for _ in range(rng.randint(0, 25))])
+            cost, pairs_a, pairs_b = banded_edit_alignment(a, b, band=64, gap_open=0)
+            assert cost == levenshtein(list(a), list(b))
+            # The traced path accounts for the whole cost
+            substitutions = int(np.sum(a[pairs_a] != b[pairs_b]))
+            assert cost == substitutions + (len(a) - len(pairs_a)) + (len(b) - len(pairs_b))
+
+    def test_pairs_are_monotonic(self):
+        a = np.array([1, 2, 3, 4, 5])
+        b = np.array([1, 3, 4, 9, 5])
+        cost, pairs_a, pairs_b = banded_edit_alignment(a, b)
+        assert cost == 3  # One gap (open + 1) and one substitution
+        assert np.all(np.diff(pairs_a) > 0) and np.all(np.diff(pairs_b) > 0)
+
+    def test_gap_stays_contiguous(self):
+        a = np.array([ord(c) for c in "helloworld"])
+        b = np.array([ord(c) for c in "hello"])
+        cost, pairs_a, _ = banded_edit_alignment(a, b)
+        assert cost == 6
+        assert list(pairs_a) == [0, 1, 2, 3, 4]
+
+    def test_empty_sequence(self):
+        cost, pairs_a, _ = banded_edit_alignment(np.array([1, 2]), np.array([], dtype=int))
+        assert cost == 3
+        assert len(pairs_a) == 0
+
+
+class TestNarrationAlignment:
+    """Tests for NarrationAlignment."""
+
+    def test_split_number_maps_to_one_span(self):
+        narration = "It costs $150,528 per run."
+        alignment = align_narration(narration, timed(["It", "costs", "$150", ",528", "per", "run."]))
+
+        start = narration.index("150")
+        assert alignment.word_range(start, start + len("150,528")) == (2, 3)
+        assert alignment.cost == 0
+
+    def test_repeated_word_resolves_by_position(self):
+        narration = "The model reads. Then the model writes."
+        alignment = align_narration(narration, timed(narration.split()))
+
+        second = narration.index("model", 10)
+        assert alignment.word_range(second, second + 5) == (5, 5)
+        assert alignment.time_span(second, second + 5) == pytest.approx((2.5, 2.9))
+
+    def test_unspoken_span(self):
+        alignment = align_narration("Hello world", timed(["Hello"]))
+        assert alignment.word_range(6, 11) is None
+        assert alignment.time_span(6, 11) is None
+
+    def test_tolerates_transcription_differences(self):
+        narration = "Eighty-three percent of colour models can't scale."
+        words = ["Eighty", "three", "percent", "of", "color", "models", "cannot", "scale"]
+        alignment = align_narration(narration, timed(words))
+
+        start = narration.index("scale")
+        assert alignment.word_range(start, start + 5) == (7, 7)
+
+    def test_accepts_word_timestamp_objects(self):
+        alignment = NarrationAlignment.from_timestamps(
+            "Fast path", [WordTimestamp("Fast", 0.0, 0.3), WordTimestamp("path", 0.4, 0.7)]
+        )
+        assert alignment.time_span(5, 9) == (0.4, 0.7)
+
+    def test_find_phrase(self):
+        alignment = align_narration("Watch the cache. Now watch the disk.", timed([]))
+        assert alignment.find_phrase("watch the disk", "disk") == (31, 35)
+        assert alignment.find_phrase("watch the disk") == (21, 35)
+        assert alignment.find_phrase("watch the disk", "cache") is None
+        assert alignment.find_phrase("missing") is None
+
+    def test_find_phrase_matches_whole_words(self):
+        alignment = align_narration("The building was remodeled. Then the model ran.", timed([]))
+        assert alignment.find_phrase("model") == (37, 42)
+        assert alignment.find_phrase("the model ran", "model") == (37, 42)
+        assert alignment.find_phrase("odel") is None
+
+    def test_narration_words_retokenizes(self):
+        narration = "Latency fell to 3.5 ms, from 150,528."
+        words = ["Latency", "fell", "to", "3", ".5", "ms", ",", "from", "150", ",", "528", "."]
+        merged = align_narration(narration, timed(words)).narration_words()
+
+        assert [w["word"] for w in merged] == ["Latency", "fell", "to", "3.5", "ms,", "from", "150,528."]
+        assert merged[3]["start_seconds"] == 1.5
+        assert merged[3]["end_seconds"] == pytest.approx(4 * 0.5 + 0.4)
+
+    def test_narration_words_keeps_unscripted_words(self):
+        merged = align_narration("Hello world", timed(["Hello", "um", "world"])).narration_words()
+        assert [w["word"] for w in merged] == ["Hello", "um", "world"]
+
+    def test_narration_words_keeps_spoken_words_that_differ(self):
+        spoken = "picture has more than one hundred fifty thousand".split()
+        merged = align_narration("image has over 150,000", timed(spoken)).narration_words()
+        assert [w["word"] for w in merged] == spoken
+
+    def test_narration_words_keeps_speech_over_unrelated_text(self):
+        spoken = "Vision models cut images into patches".split()
+        merged = align_narration("Beat 1 content Beat 2 content", timed(spoken)).narration_words()
+        assert [w["word"] for w in merged] == spoken
+
+    def test_long_narration_stays_aligned(self):
+        rng = random.Random(11)
+        words = [rng.choice(["alpha", "beta", "gamma", "delta"]) for _ in range(600)]
+        narration = " ".join(words)
+        spoken = words[:200] + words[205:]  # Five words skipped by the speaker
+
+        alignment = align_narration(narration, timed(spoken))
+
+        last = narration.rindex(words[-1])
+        assert alignment.word_range(last, len(narration)) == (len(spoken) - 1, len(spoken) - 1)
+
+
+class TestAlignmentConsumers:
+    """Sound sync and shorts captions use the alignment."""
+
+    def test_sound_sync_uses_match_position(self):
+        narration = "This is a problem. Later, another problem appears."
+        timestamps = [
+            WordTimestamp(ts["word"], ts["start_seconds"], ts["end_seconds"])
+            for ts in timed(narration.split(), step=1.0)
+        ]
+
+        start = narration.rindex("problem")
+
+        timestamp = NarrationSyncAnalyzer()._find_timestamp_for_span(
+            start, start + 7, align_narration(narration, timestamps), timestamps
+        )
+
+        assert timestamp.word == "problem"
+        assert timestamp.start_seconds == 6.0
+
+    def test_shorts_captions_follow_narration(self):
+        captions = align_caption_words(timed(["Over", "150", ",528", "tokens"]), "Over 150,528 tokens")
+        assert [c["word"] for c in captions] == ["Over", "150,528", "tokens"]
+
+    def test_shorts_storyboard_ignores_caption_text(self, mock_config):
+        from src.short.generator import ShortGenerator
+        from src.short.models import ShortsBeat, ShortsStoryboard, ShortsVisual, VisualType
+
+        def storyboard():
+            beats = [
+                ShortsBeat(
+                    id=f"beat_{i + 1}", start_seconds=i * 2.0, end_seconds=(i + 1) * 2.0,
+                    visual=ShortsVisual(type=VisualType.TEXT_HIGHLIGHT, primary_text="x"),
+                    caption_text=f"Beat {i + 1} content",
+                )
+                for i in range(2)
+            ]
+            return ShortsStoryboard(id="s", title="t", total_duration_seconds=4.0, beats=beats)
+
+        def captions(result):
+            return [ts["word"] for beat in result.beats for ts in beat.word_timestamps]
+
+        spoken = timed(["Vision", "models", "cut", "150", ",528", "patches"], step=0.6)
+        generator = ShortGenerator(config=mock_config)
+
+        result = generator.update_storyboard_with_timestamps(storyboard(), spoken)
+        assert captions(result) == ["Vision", "models", "cut", "150,528", "patches"]
+
+        result = generator.update_storyboard_with_timestamps(
+            storyboard(), spoken, narration="Vision models cut 150,528 patches."
+        )
+        assert captions(result) == ["Vision", "models", "cut", "150,528", "patches."]
+
+    def test_shorts_captions_without_narration_merge_numbers(self):
+        captions = align_caption_words(timed(["Over", "150", ",528", "tokens"]), "")
+        assert [c["word"] for c in captions] == ["Over", "150,528", "tokens"]
@@ -2,6 +2,8 @@
 
 import pytest
 import json
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 import tempfile
@@ -530,3 +532,121 @@ class TestSyncAnalyzerSaveSyncMap:
             output_path = analyzer.save_sync_map(sync_map)
 
             assert (Path(tmpdir) / "sync").exists()
+
+
+class TestSyncAnalyzerIncremental:
+    """Tests for cache-aware, concurrent analyze_project."""
+
+    SCENES = [("Alpha", "alpha"), ("Beta", "beta"), ("Gamma", "gamma")]
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project = MagicMock()
+        project.root_dir = tmp_path
+        project.id = "test_project"
+        project.load_storyboard.return_value = {
+            "scenes": [
+                {"id": scene_id, "title": title, "narration": f"{title} narration"}
+                for title, scene_id in self.SCENES
+            ]
+        }
+        (tmp_path / "scenes").mkdir()
+        for title, _ in self.SCENES:
+            (tmp_path / "scenes" / f"{title}Scene.tsx").write_text(SAMPLE_SCENE_CODE)
+        (tmp_path / "voiceover").mkdir()
+        self.write_manifest(tmp_path)
+        return project
+
+    def write_manifest(self, root, shift=None):
+        scenes = []
+        for _, scene_id in self.SCENES:
+            offset = 0.25 if scene_id == shift else 0.0
+            scenes.append({
+                "scene_id": scene_id,
+                "duration_seconds": 20.0,
+                "word_timestamps": [
+                    {**ts, "start_seconds": ts["start_seconds"] + offset} for ts in SAMPLE_TIMESTAMPS
+                ],
+            })
+        (root / "voiceover" / "manifest.json").write_text(json.dumps({"scenes": scenes}))
+
+    def make_analyzer(self, project, **kwargs):
+        llm_provider = MagicMock()
+        llm_provider.generate.return_value = SAMPLE_LLM_RESPONSE
+        return SyncAnalyzer(project=project, verbose=False, llm_provider=llm_provider, **kwargs)
+
+    def test_rerun_reuses_unchanged_scenes(self, project):
+        first = self.make_analyzer(project)
+        first.save_sync_map(first.analyze_project())
+        assert first.llm_provider.generate.call_count == 3
+
+        second = self.make_analyzer(project)
+        sync_map = second.analyze_project()
+
+        assert second.llm_provider.generate.call_count == 0
+        assert [s.scene_id for s in sync_map.scenes] == ["alpha", "beta", "gamma"]
+        assert all(len(s.sync_points) == 2 for s in sync_map.scenes)
+
+    def test_rerecorded_scene_is_the_only_one_analyzed(self, project, tmp_path):
+        first = self.make_analyzer(project)
+        first.save_sync_map(first.analyze_project())
+
+        self.write_manifest(tmp_path, shift="beta")
+        second = self.make_analyzer(project)
+        sync_map = second.analyze_project()
+
+        assert second.llm_provider.generate.call_count == 1
+        prompt = second.llm_provider.generate.call_args.kwargs["prompt"]
+        assert "beta" in prompt
+        assert [s.scene_id for s in sync_map.scenes] == ["alpha", "beta", "gamma"]
+
+    def test_cache_survives_deleted_sync_map(self, project):
+        self.make_analyzer(project).analyze_project()  # Not saved
+
+        second = self.make_analyzer(project)
+        second.analyze_project()
+
+        assert second.llm_provider.generate.call_count == 0
+
+    def test_existing_map_edits_are_preserved(self, project):
+        first = self.make_analyzer(project)
+        sync_map = first.analyze_project()
+        sync_map.scenes[0].sync_points[0].offset_frames = -10  # Hand-tuned
+        first.save_sync_map(sync_map)
+
+        reloaded = self.make_analyzer(project).analyze_project()
+
+        assert reloaded.scenes[0].sync_points[0].offset_frames == -10
+
+    def test_force_reanalyzes_everything(self, project):
+        self.make_analyzer(project).analyze_project()
+
+        second = self.make_analyzer(project)
+        second.analyze_project(force=True)
+
+        assert second.llm_provider.generate.call_count == 3
+
+    def test_cache_can_be_disabled(self, project):
+        self.make_analyzer(project, use_cache=False).analyze_project()
+
+        assert not (project.root_dir / ".cache").exists()
+
+    def test_results_keep_storyboard_order(self, project):
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def slow_generate(prompt, system_prompt):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05 if "alpha" in prompt else 0.01)
+            with lock:
+                active["now"] -= 1
+            return SAMPLE_LLM_RESPONSE
+
+        analyzer = self.make_analyzer(project, max_workers=3)
+        analyzer.llm_provider.generate.side_effect = slow_generate
+        sync_map = analyzer.analyze_project()
+
+        assert [s.scene_id for s in sync_map.scenes] == ["alpha", "beta", "gamma"]
+        assert active["peak"] > 1
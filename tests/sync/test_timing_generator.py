@@ -61,6 +61,35 @@ class TestGenerateSceneTiming:
         # 4.4625 * 30 - 3 = ~130 frames
         assert block.timing_constants["numbersAppear"] > 0
 
+    def test_repeated_trigger_word_uses_phrase_position(self):
+        """Test that a repeated trigger word syncs to its phrase's occurrence."""
+        narration = "The cache warms up. Then the cache overflows."
+        timestamps = [
+            {"word": word, "start_seconds": i * 0.5, "end_seconds": i * 0.5 + 0.4}
+            for i, word in enumerate(narration.split())
+        ]
+        sp = SyncPoint(
+            id="overflow",
+            sync_type=SyncPointType.ELEMENT_APPEAR,
+            trigger_phrase="the cache overflows",
+            trigger_word="cache",
+            offset_frames=0,
+        )
+        config = SceneSyncConfig(
+            scene_id="test_scene",
+            scene_title="Test Scene",
+            scene_file="test.tsx",
+            duration_seconds=10.0,
+            sync_points=[sp],
+            narration_text=narration,
+        )
+
+        block = generate_scene_timing(config, timestamps, fps=30)
+
+        # Second "cache" is word 6, spoken at 3.0s
+        assert block.timing_constants["overflow"] == 90
+        assert block.warnings == []
+
     def test_generate_timing_multiple_points(self):
         """Test timing generation with multiple sync points."""
         sp1 = SyncPoint(
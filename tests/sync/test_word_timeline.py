@@ -0,0 +1,131 @@
+"""Tests for the indexed word timeline."""
+
+import random
+import re
+
+import pytest
+
+from src.sync.word_timeline import WordTimeline, normalize_word
+
+TIMESTAMPS = [
+    {"word": "The", "start_seconds": 0.0, "end_seconds": 0.2},
+    {"word": "model", "start_seconds": 0.25, "end_seconds": 0.6},
+    {"word": "predicts", "start_seconds": 0.65, "end_seconds": 1.1},
+    {"word": "the", "start_seconds": 1.15, "end_seconds": 1.3},
+    {"word": "next", "start_seconds": 1.35, "end_seconds": 1.6},
+    {"word": "token.", "start_seconds": 1.65, "end_seconds": 2.0},
+    {"word": "Then", "start_seconds": 2.5, "end_seconds": 2.7},
+    {"word": "the", "start_seconds": 2.75, "end_seconds": 2.9},
+    {"word": "model", "start_seconds": 2.95, "end_seconds": 3.3},
+    {"word": "repeats!", "start_seconds": 3.35, "end_seconds": 3.9},
+]
+
+
+def linear_find(word_timestamps, target, match_mode):
+    """Reference implementation: the original linear scan."""
+    target_clean = re.sub(r"[.,!?;:'\"]+$", "", target.lower().strip())
+    for i, ts in enumerate(word_timestamps):
+        word_clean = re.sub(r"[.,!?;:'\"]+$", "", ts.get("word", "").lower().strip())
+        if match_mode == "exact" and word_clean == target_clean:
+            return i
+        if match_mode == "contains" and (target_clean in word_clean or word_clean in target_clean):
+            return i
+        if match_mode == "starts_with" and word_clean.startswith(target_clean):
+            return i
+    return None
+
+
+class TestNormalizeWord:
+    """Tests for normalize_word."""
+
+    def test_strips_case_space_and_trailing_punctuation(self):
+        assert normalize_word("  Token.\"") == "token"
+
+    def test_keeps_inner_punctuation(self):
+        assert normalize_word("Eighty-three,") == "eighty-three"
+
+
+class TestFindIndex:
+    """Tests for WordTimeline.find_index."""
+
+    @pytest.fixture
+    def timeline(self):
+        return WordTimeline(TIMESTAMPS)
+
+    def test_exact(self, timeline):
+        assert timeline.find_index("token", "exact") == 5
+        assert timeline.find_index("tok", "exact") is None
+
+    def test_contains_either_direction(self, timeline):
+        assert timeline.find_index("predict", "contains") == 2
+        assert timeline.find_index("tokens", "contains") == 5  # "token" is inside "tokens"
+
+    def test_starts_with(self, timeline):
+        assert timeline.find_index("rep", "starts_with") == 9
+
+    def test_fuzzy_prefers_exact(self, timeline):
+        # "The" at 0 is contained in "then", but an exact match wins
+        assert timeline.find_index("then", "fuzzy") == 6
+
+    def test_start_skips_earlier_occurrences(self, timeline):
+        assert timeline.find_index("model", "exact", start=2) == 8
+        assert timeline.find_index("model", "exact", start=9) is None
+
+    def test_unknown_mode(self, timeline):
+        assert timeline.find_index("model", "regex") is None
+
+    def test_empty_timeline(self):
+        timeline = WordTimeline([])
+        assert len(timeline) == 0
+        assert timeline.find_index("anything", "fuzzy") is None
+        assert timeline.index_at_frame(10) == 0
+
+    @pytest.mark.parametrize("match_mode", ["exact", "contains", "starts_with"])
+    def test_matches_linear_scan(self, match_mode):
+        rng = random.Random(7)
+        vocabulary = ["a", "an", "the", "then", "model", "models", "mod", "x", "", "...", "Token!"]
+        for _ in range(200):
+            timestamps = [
+                {"word": rng.choice(vocabulary), "start_seconds": i * 0.3, "end_seconds": i * 0.3 + 0.2}
+                for i in range(rng.randint(0, 12))
+            ]
+            timeline = WordTimeline(timestamps)
+            for target in vocabulary + ["modelling", "he", "?"]:
+                assert timeline.find_index(target, match_mode) == linear_find(timestamps, target, match_mode)
+
+
+class TestFrames:
+    """Tests for frame lookups."""
+
+    @pytest.fixture
+    def timeline(self):
+        return WordTimeline(TIMESTAMPS, fps=30)
+
+    def test_find_frame_start_and_end(self, timeline):
+        assert timeline.find_frame("predicts") == 19
+        assert timeline.find_frame("predicts", use_start=False) == 33
+        assert timeline.find_frame("predicts", offset_frames=-3) == 16
+
+    def test_fps_override(self, timeline):
+        assert timeline.find_frame("predicts", fps=60) == 39
+
+    def test_from_frame_finds_next_occurrence(self, timeline):
+        assert timeline.find_frame("model", "exact") == 7
+        assert timeline.find_frame("model", "exact", from_frame=30) == 88
+
+    def test_cursor_walks_repeated_words(self, timeline):
+        cursor = timeline.cursor()
+        assert cursor.find_frame("the") == 0
+        assert cursor.find_frame("the") == 34
+        assert cursor.find_frame("the") == 82
+        assert cursor.find_frame("the") is None
+        assert cursor.position == 8  # A miss does not move the cursor
+
+    def test_unsorted_timestamps(self):
+        timeline = WordTimeline(list(reversed(TIMESTAMPS)))
+        assert timeline.index_at_frame(100) == 0
+        assert timeline.find_frame("model", "exact", from_frame=50) == 88
+
+    def test_of_reuses_timeline(self, timeline):
+        assert WordTimeline.of(timeline) is timeline
+        assert isinstance(WordTimeline.of(TIMESTAMPS), WordTimeline)
@@ -0,0 +1,240 @@
+"""Tests for the in-process Anthropic API provider, against a local stub server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.config import Config, LLMConfig
+from src.understanding.llm_provider import (
+    AnthropicAPIError,
+    AnthropicAPIProvider,
+    get_llm_provider,
+)
+from src.understanding.response_cache import ResponseCache
+
+
+def message_body(text: str) -> dict:
+    return {
+        "id": "msg_test",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-test",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    }
+
+
+def sse_events(chunks: list[str]) -> bytes:
+    message = message_body("")
+    message["content"] = []
+    events = [
+        ("message_start", {"type": "message_start", "message": message}),
+        (
+            "content_block_start",
+            {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        ),
+    ]
+    for chunk in chunks:
+        events.append(
+            (
+                "content_block_delta",
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": chunk},
+                },
+            )
+        )
+    events += [
+        ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        (
+            "message_delta",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": 5},
+            },
+        ),
+        ("message_stop", {"type": "message_stop"}),
+    ]
+    return "".join(f"event: {name}\ndata: {json.dumps(data)}\n\n" for name, data in events).encode()
+
+
+class StubAnthropic:
+    """Minimal Messages API server recording requests and replaying replies."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.replies: list[str] = []
+        self.fail_next: list[int] = []
+        self.connections: set[int] = set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                body = json.loads(self.rfile.read(length))
+                stub.requests.append(body)
+                stub.connections.add(self.client_address[1])
+
+                if stub.fail_next:
+                    status = stub.fail_next.pop(0)
+                    payload = json.dumps(
+                        {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}}
+                    ).encode()
+                    self.send_response(status)
+                    self.send_header("content-type", "application/json")
+                    self.send_header("content-length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                    return
+
+                text = stub.replies.pop(0) if stub.replies else "ok"
+                if body.get("stream"):
+                    payload = sse_events([text[: len(text) // 2], text[len(text) // 2 :]])
+                    content_type = "text/event-stream"
+                else:
+                    payload = json.dumps(message_body(text)).encode()
+                    content_type = "application/json"
+                self.send_response(200)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubAnthropic()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def provider(stub):
+    config = LLMConfig(provider="anthropic", model="claude-test", base_url=stub.url)
+    return AnthropicAPIProvider(config, api_key="test-key", max_retries=2)
+
+
+class TestAnthropicAPIProvider:
+    """Tests for AnthropicAPIProvider."""
+
+    def test_generate_sends_request(self, stub, provider):
+        stub.replies = ["  Hello there  "]
+
+        result = provider.generate("Say hi", system_prompt="Be brief")
+
+        assert result == "Hello there"
+        request = stub.requests[0]
+        assert request["model"] == "claude-test"
+        assert request["system"] == "Be brief"
+        assert request["messages"] == [{"role": "user", "content": "Say hi"}]
+        assert request["max_tokens"] == 4096
+        assert request["temperature"] == 0.7
+
+    def test_generate_json_parses_markdown_block(self, stub, provider):
+        stub.replies = ['Here you go:\n```json\n{"title": "Test"}\n```']
+
+        assert provider.generate_json("Give JSON") == {"title": "Test"}
+        assert "Respond with valid JSON only" in stub.requests[0]["messages"][0]["content"]
+
+    def test_invalid_json_raises(self, stub, provider):
+        stub.replies = ["not json at all"]
+
+        with pytest.raises(AnthropicAPIError, match="Failed to parse JSON"):
+            provider.generate_json("Give JSON")
+
+    def test_transient_errors_are_retried(self, stub, provider):
+        stub.fail_next = [529, 500]
+        stub.replies = ["recovered"]
+
+        assert provider.generate("Try") == "recovered"
+        assert len(stub.requests) == 3
+
+    def test_exhausted_retries_raise(self, stub, provider):
+        stub.fail_next = [529, 529, 529]
+
+        with pytest.raises(AnthropicAPIError):
+            provider.generate("Try")
+
+    def test_providers_share_pooled_client(self, stub):
+        config = LLMConfig(model="claude-test", base_url=stub.url)
+        first = AnthropicAPIProvider(config, api_key="test-key")
+        second = AnthropicAPIProvider(config, api_key="test-key")
+
+        assert first.client is second.client
+        first.generate("one")
+        second.generate("two")
+        assert len(stub.connections) == 1  # Keep-alive connection reused
+
+    def test_stream_yields_deltas(self, stub, provider):
+        stub.replies = ["streamed text"]
+
+        chunks = list(provider.stream("Stream please"))
+
+        assert len(chunks) == 2
+        assert "".join(chunks) == "streamed text"
+
+    def test_cache_skips_second_request(self, stub, tmp_path):
+        config = LLMConfig(model="claude-test", base_url=stub.url)
+        provider = AnthropicAPIProvider(
+            config, cache=ResponseCache(tmp_path / "llm"), api_key="test-key"
+        )
+        stub.replies = ['{"a": 1}']
+
+        assert provider.generate_json("Cached?") == {"a": 1}
+        assert provider.generate_json("Cached?") == {"a": 1}
+        assert len(stub.requests) == 1
+
+    def test_reported_usage_is_recorded(self, stub, provider, tmp_path):
+        from src.understanding import telemetry
+
+        ledger = telemetry.start_recording(tmp_path)
+        try:
+            provider.generate("Count tokens")
+        finally:
+            telemetry.stop_recording()
+
+        (record,) = telemetry.TelemetryLedger.read(ledger.path)
+        assert (record.input_tokens, record.output_tokens) == (10, 5)
+        assert not record.tokens_estimated
+
+    async def test_async_generate_and_stream(self, stub, provider):
+        stub.replies = ['{"scenes": 3}', "async stream"]
+
+        parsed = await provider.agenerate_json("Async JSON")
+        chunks = [chunk async for chunk in provider.astream("Async stream")]
+
+        assert parsed == {"scenes": 3}
+        assert "".join(chunks) == "async stream"
+
+
+class TestGetLLMProvider:
+    """Provider selection for the anthropic backend."""
+
+    def test_returns_anthropic_provider(self):
+        config = Config()
+        config.llm.provider = "anthropic"
+
+        provider = get_llm_provider(config)
+
+        assert isinstance(provider, AnthropicAPIProvider)
+        assert provider.max_retries == config.llm.max_retries
@@ -10,6 +10,7 @@ from src.audio import (
     ElevenLabsTTS,
     EdgeTTS,
     TTSProvider,
+    TTSRequest,
     TTSResult,
     WordTimestamp,
     get_tts_provider,
@@ -578,6 +579,136 @@ class TestElevenLabsWordTimestamps:
         assert result[0].end_seconds == 0.2
 
 
+class TestTTSBatch:
+    """Tests for the concurrent batch API on TTSProvider."""
+
+    @pytest.fixture
+    def mock_tts(self):
+        config = TTSConfig(provider="mock", max_retries=2)
+        tts = MockTTS(config)
+        tts.RETRY_BACKOFF_SECONDS = 0
+        return tts
+
+    @staticmethod
+    def make_requests(tmp_path, count=5):
+        return [
+            TTSRequest(text=f"Scene {i} text.", output_path=tmp_path / f"s{i}.mp3", scene_id=f"s{i}")
+            for i in range(count)
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_results_in_request_order_with_isolated_failures(
+        self, mock_tts, tmp_path, max_workers
+    ):
+        """Test outcomes keep request order and failures don't affect others."""
+        import time
+
+        original = mock_tts.generate_with_timestamps
+
+        def flaky(text, output_path):
+            # Earlier requests finish last to exercise re-ordering
+            time.sleep(0.01 * (5 - int(Path(output_path).stem[1:])))
+            if "Scene 2" in text:
+                raise ValueError("bad text")
+            return original(text, output_path)
+
+        mock_tts.generate_with_timestamps = flaky
+        requests = self.make_requests(tmp_path)
+        seen = []
+
+        outcomes = mock_tts.generate_batch_with_timestamps(
+            requests, max_workers=max_workers, on_result=lambda idx, _: seen.append(idx)
+        )
+
+        assert sorted(seen) == [0, 1, 2, 3, 4]
+        assert isinstance(outcomes[2], ValueError)
+        for idx in (0, 1, 3, 4):
+            assert outcomes[idx].audio_path == requests[idx].output_path
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_stop_on_error_cancels_pending_requests(self, mock_tts, tmp_path, max_workers):
+        """Test that stop_on_error skips requests that have not started."""
+        import time
+        from concurrent.futures import CancelledError
+
+        original = mock_tts.generate_with_timestamps
+        started = []
+
+        def failing_first(text, output_path):
+            started.append(text)
+            if "Scene 0" in text:
+                raise ValueError("bad text")
+            time.sleep(0.01)
+            return original(text, output_path)
+
+        mock_tts.generate_with_timestamps = failing_first
+        requests = self.make_requests(tmp_path, 20)
+
+        outcomes = mock_tts.generate_batch_with_timestamps(
+            requests, max_workers=max_workers, stop_on_error=True
+        )
+
+        assert isinstance(outcomes[0], ValueError)
+        assert len(started) < len(requests)
+        assert isinstance(outcomes[-1], CancelledError)
+        assert not requests[-1].output_path.exists()
+
+    def test_retries_transient_errors(self, mock_tts, tmp_path):
+        """Test that 429 responses are retried and eventually succeed."""
+        import httpx
+
+        original = mock_tts.generate_with_timestamps
+        calls = {"count": 0}
+
+        def rate_limited_once(text, output_path):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                response = httpx.Response(429, request=httpx.Request("POST", "https://x"))
+                raise httpx.HTTPStatusError("rate limited", request=response.request, response=response)
+            return original(text, output_path)
+
+        mock_tts.generate_with_timestamps = rate_limited_once
+        outcomes = mock_tts.generate_batch_with_timestamps(self.make_requests(tmp_path, 1))
+
+        assert calls["count"] == 2
+        assert isinstance(outcomes[0], TTSResult)
+
+    def test_does_not_retry_permanent_errors(self, mock_tts, tmp_path):
+        """Test that non-transient errors fail immediately."""
+        calls = {"count": 0}
+
+        def broken(text, output_path):
+            calls["count"] += 1
+            raise ValueError("bad request")
+
+        mock_tts.generate_with_timestamps = broken
+        outcomes = mock_tts.generate_batch_with_timestamps(self.make_requests(tmp_path, 1))
+
+        assert calls["count"] == 1
+        assert isinstance(outcomes[0], ValueError)
+
+    def test_rate_limiter_spaces_requests(self):
+        """Test that the rate limiter enforces a minimum interval."""
+        import time
+
+        from src.audio.tts import RateLimiter
+
+        limiter = RateLimiter(requests_per_second=20)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.wait()
+
+        # First call is immediate, the next three wait 50ms each
+        assert time.monotonic() - start >= 0.14
+
+    @patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"})
+    def test_provider_concurrency_defaults(self):
+        """Test provider defaults and config override for concurrency."""
+        assert ElevenLabsTTS(TTSConfig()).MAX_CONCURRENCY < EdgeTTS(TTSConfig()).MAX_CONCURRENCY
+        assert ElevenLabsTTS(TTSConfig())._rate_limiter.interval > 0
+        assert EdgeTTS(TTSConfig(requests_per_second=4))._rate_limiter.interval == 0.25
+
+
 class TestManualVoiceoverProvider:
     """Tests for ManualVoiceoverProvider."""
 
@@ -757,3 +888,45 @@ class TestManualVoiceoverProvider:
         assert result.duration_seconds == 1.0
         assert len(result.word_timestamps) == 2
         assert result.word_timestamps[0].word == "Hello"
+
+    def test_batch_imports_then_transcribes_once(self, config, audio_dir, tmp_path):
+        """Test batch import transcribes all recordings together and caches them."""
+        from src.audio import ManualVoiceoverProvider, TranscriptionCache, TTSRequest
+        from src.audio.transcribe import TranscriptionResult, WhisperTranscriber
+
+        (audio_dir / "scene2_intro.mp3").write_bytes(b"\x01" * 1000)
+        requests = [
+            TTSRequest("Hook", tmp_path / "out" / "scene1_hook.mp3", "scene1_hook"),
+            TTSRequest("Missing", tmp_path / "out" / "scene9.mp3", "scene9"),
+            TTSRequest("Intro", tmp_path / "out" / "scene2_intro.mp3", "scene2_intro"),
+        ]
+
+        def run_batch():
+            transcriber = WhisperTranscriber(cache=TranscriptionCache(tmp_path / "cache"))
+            transcriber._transcribe_file = MagicMock(
+                side_effect=lambda path: TranscriptionResult(
+                    path.stem, [WordTimestamp(path.stem, 0.0, 1.5)], 1.5
+                )
+            )
+            provider = ManualVoiceoverProvider(config, audio_dir=audio_dir)
+            provider._transcriber = transcriber
+            reported = []
+            outcomes = provider.generate_batch_with_timestamps(
+                requests, on_result=lambda idx, outcome: reported.append(idx)
+            )
+            return transcriber, outcomes, reported
+
+        transcriber, outcomes, reported = run_batch()
+
+        assert isinstance(outcomes[0], TTSResult)
+        assert outcomes[0].audio_path == requests[0].output_path
+        assert outcomes[0].word_timestamps[0].word == "scene1_hook"
+        assert isinstance(outcomes[1], FileNotFoundError)
+        assert outcomes[2].duration_seconds == 1.5
+        assert sorted(reported) == [0, 1, 2]
+        assert transcriber._transcribe_file.call_count == 2
+
+        # Unchanged recordings come from the transcript cache
+        transcriber, outcomes, _ = run_batch()
+        assert transcriber._transcribe_file.call_count == 0
+        assert outcomes[2].word_timestamps[0].word == "scene2_intro"
@@ -0,0 +1,244 @@
+"""Tests for runtime budget and deadline tracking."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src import budget
+from src.budget import BudgetExceededError, BudgetTracker, DeadlineExceededError
+from src.config import BudgetConfig, LLMConfig, TTSConfig
+from src.understanding.llm_provider import ClaudeCodeLLMProvider
+from src.video_gen.fal_generator import Duration, FalVideoGenerator
+
+
+@pytest.fixture
+def active(tmp_path):
+    def start(**overrides):
+        return budget.start_tracking(tmp_path, BudgetConfig(**overrides))
+
+    yield start
+    budget.stop_tracking()
+
+
+class TestBudgetTracker:
+    """Tests for BudgetTracker."""
+
+    def test_authorize_within_and_over_cap(self):
+        tracker = BudgetTracker(BudgetConfig(tts_per_video=1.0, on_exceed="abort"))
+        tracker.authorize("tts", 0.6).settle()
+
+        with pytest.raises(BudgetExceededError) as exc:
+            tracker.authorize("tts", 0.6)
+        assert exc.value.category == "tts"
+        assert tracker.spent("tts") == pytest.approx(0.6)
+
+    def test_holds_count_until_settled_or_released(self):
+        tracker = BudgetTracker(BudgetConfig(tts_per_video=1.0, on_exceed="abort"))
+
+        first = tracker.authorize("tts", 0.6)
+        # A concurrent call can't pass the check while the first is in flight
+        with pytest.raises(BudgetExceededError):
+            tracker.authorize("tts", 0.6)
+
+        first.release()
+        tracker.authorize("tts", 0.6).settle(0.5)
+        assert tracker.spent("tts") == pytest.approx(0.5)
+        assert tracker.remaining("tts") == pytest.approx(0.5)
+
+    def test_concurrent_authorize_never_overspends(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracker = BudgetTracker(BudgetConfig(tts_per_video=1.0, on_exceed="abort"))
+
+        def call(_):
+            try:
+                tracker.authorize("tts", 0.3).settle()
+                return True
+            except BudgetExceededError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            succeeded = sum(executor.map(call, range(16)))
+
+        assert succeeded == 3
+        assert tracker.spent("tts") == pytest.approx(0.9)
+
+    def test_total_cap_applies_across_categories(self):
+        tracker = BudgetTracker(BudgetConfig(total_per_video=1.0, on_exceed="abort"))
+        tracker.record("llm", 0.8)
+
+        assert not tracker.fits("tts", 0.5)
+        assert tracker.remaining("tts") == pytest.approx(0.2)
+
+    def test_warn_policy_allows_spend(self, capsys):
+        tracker = BudgetTracker(BudgetConfig(tts_per_video=0.0, on_exceed="warn"))
+
+        tracker.authorize("tts", 1.0)
+
+        assert "exceeds the remaining budget" in capsys.readouterr().out
+
+    def test_degrade_without_alternative_warns_once(self, capsys):
+        tracker = BudgetTracker(BudgetConfig(tts_per_video=0.5))
+
+        tracker.authorize("tts", 1.0).settle()
+        tracker.authorize("tts", 1.0).settle()
+
+        assert capsys.readouterr().out.count("exceeds the remaining budget") == 1
+        assert tracker.spent("tts") == pytest.approx(2.0)
+
+    def test_choose_degrades_to_cheapest_fitting_option(self):
+        tracker = BudgetTracker(BudgetConfig(video_gen_per_video=1.0))
+
+        choice, hold = tracker.choose("video_gen", [("8s", 2.0), ("6s", 1.5), ("4s", 1.0)])
+
+        assert choice == "4s"
+        assert hold.cost_usd == 1.0
+
+    def test_choose_under_abort_refuses_alternatives(self):
+        tracker = BudgetTracker(BudgetConfig(video_gen_per_video=1.0, on_exceed="abort"))
+
+        with pytest.raises(BudgetExceededError):
+            tracker.choose("video_gen", [("8s", 2.0), ("4s", 1.0)])
+
+    def test_spend_persists_within_a_run(self, tmp_path):
+        path = tmp_path / "spend.jsonl"
+        BudgetTracker(BudgetConfig(), spend_path=path, run_id="a").record("video_gen", 2.5, "clip")
+        BudgetTracker(BudgetConfig(), spend_path=path, run_id="a").authorize("llm", 1.25).settle()
+
+        same_run = BudgetTracker(BudgetConfig(), spend_path=path, run_id="a")
+        assert same_run.spent("video_gen") == 2.5
+        assert same_run.spent("llm") == 1.25
+        assert BudgetTracker(BudgetConfig(), spend_path=path, run_id="b").spent() == 0.0
+
+    def test_start_tracking_continues_current_run(self, tmp_path):
+        try:
+            first = budget.start_tracking(tmp_path, BudgetConfig())
+            first.record("tts", 4.0)
+
+            assert budget.start_tracking(tmp_path, BudgetConfig()).spent("tts") == 4.0
+
+            fresh = budget.start_tracking(tmp_path, BudgetConfig(), new_run=True)
+            assert fresh.run_id != first.run_id
+            assert fresh.spent("tts") == 0.0
+            assert budget.current_run_id(tmp_path) == fresh.run_id
+        finally:
+            budget.stop_tracking()
+
+    def test_deadline(self):
+        tracker = BudgetTracker(BudgetConfig(deadline_minutes=1.0))
+        tracker.check_deadline()
+
+        tracker.started_at -= 61
+        with pytest.raises(DeadlineExceededError):
+            tracker.authorize("tts", 0.0)
+
+    def test_forecast_from_director_script(self):
+        tracker = BudgetTracker(BudgetConfig(video_gen_per_video=0.5))
+        script = {
+            "scenes": [
+                {"audio": {"text": "a" * 1000}, "background": {"type": "ai_video"}},
+                {"voiceover": "b" * 1000, "background": {"type": "image"}},
+            ]
+        }
+
+        forecast = tracker.forecast(script, video_model="fal-ai/kling-video/v1.5/pro/text-to-video")
+
+        assert forecast.costs["tts"] == pytest.approx(0.6)
+        assert forecast.costs["video_gen"] == pytest.approx(0.5)  # One 5s clip at $0.10/s
+        assert forecast.costs["llm"] == pytest.approx(2 * budget.LLM_COST_PER_SCENE)
+        assert forecast.within_budget
+
+        assert tracker.forecast(script, tts_provider="edge").costs["tts"] == 0.0
+        tracker.record("video_gen", 0.1)
+        assert "video_gen" in tracker.forecast(script).over
+
+
+class TestProviderIntegration:
+    """Paid providers report into the active tracker."""
+
+    def test_fal_degrades_to_shorter_clip(self, active):
+        active(video_gen_per_video=1.0)
+        generator = FalVideoGenerator(api_key="test")
+
+        options = generator._budget_options("fal-ai/veo3/fast", Duration.LONG, "16:9", False)
+        choice, _ = budget.active_tracker().choose("video_gen", options)
+
+        # $0.25/s: 8s and 6s clips are over $1, the 4s clip fits
+        assert choice == ("fal-ai/veo3/fast", Duration.SHORT)
+
+    def test_fal_degrades_to_cheaper_model(self, active):
+        active(video_gen_per_video=0.6)
+        generator = FalVideoGenerator(api_key="test")
+
+        options = generator._budget_options("fal-ai/veo3/fast", Duration.MEDIUM, "16:9", False)
+
+        choice, _ = budget.active_tracker().choose("video_gen", options)
+
+        assert choice == ("fal-ai/kling-video/v1.5/pro/text-to-video", Duration.FIVE)
+
+    def test_elevenlabs_refused_before_request(self, active):
+        from src.audio.tts import ElevenLabsTTS
+
+        active(tts_per_video=0.01, on_exceed="abort")
+        tts = ElevenLabsTTS(TTSConfig(), api_key="test")
+
+        with patch("httpx.Client") as client:
+            with pytest.raises(BudgetExceededError):
+                tts.generate("x" * 1000, "/tmp/unused.mp3")
+        client.assert_not_called()
+
+    def test_llm_calls_refused_once_budget_spent(self, active):
+        tracker = active(llm_per_video=1.0, on_exceed="abort")
+        tracker.record("llm", 1.0)
+        provider = ClaudeCodeLLMProvider(LLMConfig())
+
+        with patch("subprocess.run") as run:
+            with pytest.raises(BudgetExceededError):
+                provider.generate("prompt")
+        run.assert_not_called()
+
+
+class TestBudgetCommand:
+    """Tests for the budget CLI command."""
+
+    def test_shows_spend_and_forecast(self, tmp_path, capsys):
+        import argparse
+
+        from src.cli.main import cmd_budget
+
+        project_dir = tmp_path / "demo"
+        (project_dir / "script").mkdir(parents=True)
+        (project_dir / "script" / "script.json").write_text(
+            json.dumps({"scenes": [{"voiceover": "Hello world"}]})
+        )
+
+        args = argparse.Namespace(projects_dir=str(tmp_path), project="demo", tts_provider="edge")
+        try:
+            assert cmd_budget(args) == 0
+        finally:
+            budget.stop_tracking()
+
+        output = capsys.readouterr().out
+        assert "Budget for demo" in output
+        assert "Budget forecast (1 scenes)" in output
+
+    def test_reset_starts_new_run(self, tmp_path, capsys):
+        import argparse
+
+        from src.cli.main import cmd_budget
+
+        project_dir = tmp_path / "demo"
+        project_dir.mkdir()
+        budget.BudgetTracker(
+            BudgetConfig(), budget.spend_path(project_dir), budget.start_run(project_dir)
+        ).record("tts", 10.0)
+
+        args = argparse.Namespace(projects_dir=str(tmp_path), project="demo", reset=True)
+        try:
+            assert cmd_budget(args) == 0
+            assert budget.active_tracker().spent("tts") == 0.0
+        finally:
+            budget.stop_tracking()
+
+        assert "Started a new budget run" in capsys.readouterr().out
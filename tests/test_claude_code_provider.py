@@ -1,7 +1,9 @@
 """Tests for ClaudeCodeLLMProvider."""
 
 import json
+import os
 import subprocess
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,6 +16,7 @@ from src.understanding.llm_provider import (
     ClaudeCodeResult,
     get_llm_provider,
 )
+from src.understanding.response_cache import ResponseCache
 
 
 @pytest.fixture
@@ -444,3 +447,213 @@ class TestFactoryFunction:
         provider = get_llm_provider(config)
 
         assert isinstance(provider, ClaudeCodeLLMProvider)
+
+
+class TestResponseCache:
+    """Tests for the on-disk ResponseCache."""
+
+    def test_key_depends_on_all_inputs(self):
+        """Test that model, system prompt, prompt and tools all change the key."""
+        base = ResponseCache.make_key("m", "sys", "prompt", ["Read"])
+        assert base == ResponseCache.make_key("m", "sys", "prompt", ["Read"])
+        assert base != ResponseCache.make_key("other", "sys", "prompt", ["Read"])
+        assert base != ResponseCache.make_key("m", "other", "prompt", ["Read"])
+        assert base != ResponseCache.make_key("m", "sys", "other", ["Read"])
+        assert base != ResponseCache.make_key("m", "sys", "prompt", [])
+
+    def test_key_depends_on_sampling(self):
+        """Test that calls differing only in sampling parameters don't collide."""
+        base = ResponseCache.make_key("m", None, "p", temperature=0.7, max_tokens=4096)
+        assert base != ResponseCache.make_key("m", None, "p", temperature=0.0, max_tokens=4096)
+        assert base != ResponseCache.make_key("m", None, "p", temperature=0.7, max_tokens=1024)
+
+    def test_key_ignores_tool_order(self):
+        """Test that the tool set is order-insensitive."""
+        a = ResponseCache.make_key("m", None, "p", ["Read", "Glob"])
+        b = ResponseCache.make_key("m", None, "p", ["Glob", "Read"])
+        assert a == b
+
+    def test_roundtrip_and_stats(self, tmp_path):
+        """Test set/get and hit/miss accounting."""
+        cache = ResponseCache(tmp_path / "cache")
+        key = ResponseCache.make_key("m", None, "p")
+
+        assert cache.get(key) is None
+        cache.set(key, "hello")
+        assert cache.get(key) == "hello"
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.writes == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_no_directory_until_first_write(self, tmp_path):
+        """Test that constructing the cache has no filesystem side effects."""
+        cache_dir = tmp_path / "cache"
+        ResponseCache(cache_dir)
+        assert not cache_dir.exists()
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test that entries older than max_age are dropped."""
+        cache = ResponseCache(tmp_path, max_age_seconds=0)
+        key = ResponseCache.make_key("m", None, "p")
+        cache.set(key, "stale")
+
+        with patch("src.understanding.response_cache.time.time", return_value=time.time() + 10):
+            assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_evicts_least_recently_used_over_max_entries(self, tmp_path):
+        """Test LRU eviction when the entry limit is exceeded."""
+        cache = ResponseCache(tmp_path, max_entries=2, max_age_seconds=None)
+        keys = [ResponseCache.make_key("m", None, f"p{i}") for i in range(3)]
+
+        cache.set(keys[0], "a")
+        cache.set(keys[1], "b")
+        # Make keys[0] the oldest access, then add a third entry
+        os.utime(tmp_path / f"{keys[0]}.json", (1, 1))
+        cache.set(keys[2], "c")
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == "b"
+        assert cache.get(keys[2]) == "c"
+        assert cache.stats.evictions == 1
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that unreadable entries are treated as misses."""
+        cache = ResponseCache(tmp_path)
+        key = ResponseCache.make_key("m", None, "p")
+        (tmp_path / f"{key}.json").write_text("not json")
+        assert cache.get(key) is None
+
+    def test_from_config_disabled(self):
+        """Test that caching can be disabled via config."""
+        assert ResponseCache.from_config(LLMConfig(cache_enabled=False)) is None
+
+    def test_from_config_uses_cache_dir(self, tmp_path):
+        """Test that the configured cache directory is used."""
+        cache = ResponseCache.from_config(LLMConfig(cache_dir=str(tmp_path)))
+        assert cache.cache_dir == tmp_path
+
+
+class TestProviderCaching:
+    """Tests for response caching in ClaudeCodeLLMProvider."""
+
+    @pytest.fixture
+    def cached_provider(self, llm_config, tmp_path):
+        return ClaudeCodeLLMProvider(
+            llm_config,
+            working_dir=tmp_path,
+            cache=ResponseCache(tmp_path / "cache"),
+        )
+
+    @patch("subprocess.run")
+    def test_generate_hits_cache_on_repeat(self, mock_run, cached_provider):
+        """Test that an identical second call does not run the CLI."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="answer", stderr="")
+
+        assert cached_provider.generate("Hello", system_prompt="sys") == "answer"
+        assert cached_provider.generate("Hello", system_prompt="sys") == "answer"
+
+        mock_run.assert_called_once()
+        assert cached_provider.cache.stats.hits == 1
+
+    @patch("subprocess.run")
+    def test_different_system_prompt_misses(self, mock_run, cached_provider):
+        """Test that changing the system prompt is a cache miss."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="answer", stderr="")
+
+        cached_provider.generate("Hello", system_prompt="a")
+        cached_provider.generate("Hello", system_prompt="b")
+
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_use_cache_false_bypasses_cache(self, mock_run, cached_provider):
+        """Test the per-call opt-out."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="answer", stderr="")
+
+        cached_provider.generate("Hello")
+        cached_provider.generate("Hello", use_cache=False)
+
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_bypass_response_cache(self, mock_run, cached_provider):
+        """Test the process-wide opt-out used by --force / --no-cache."""
+        from src.understanding.llm_provider import bypass_response_cache
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="answer", stderr="")
+        cached_provider.generate("Hello")
+
+        bypass_response_cache()
+        try:
+            cached_provider.generate("Hello")
+        finally:
+            bypass_response_cache(False)
+
+        assert mock_run.call_count == 2
+        assert cached_provider.cache.stats.hits == 0
+
+    @patch("subprocess.run")
+    def test_temperature_is_part_of_the_key(self, mock_run, llm_config, tmp_path):
+        """Test that a different sampling temperature is a cache miss."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="answer", stderr="")
+        cache = ResponseCache(tmp_path / "cache")
+
+        ClaudeCodeLLMProvider(llm_config, working_dir=tmp_path, cache=cache).generate("Hello")
+        cooler = llm_config.model_copy(update={"temperature": 0.0})
+        ClaudeCodeLLMProvider(cooler, working_dir=tmp_path, cache=cache).generate("Hello")
+
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_failures_are_not_cached(self, mock_run, cached_provider):
+        """Test that CLI errors are not written to the cache."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="boom")
+        with pytest.raises(ClaudeCodeError):
+            cached_provider.generate("Hello")
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        assert cached_provider.generate("Hello") == "ok"
+
+    @patch("subprocess.run")
+    def test_generate_json_hits_cache(self, mock_run, cached_provider):
+        """Test that JSON responses are cached and re-parsed."""
+        mock_run.return_value = MagicMock(returncode=0, stdout='{"a": 1}', stderr="")
+
+        assert cached_provider.generate_json("Get data") == {"a": 1}
+        assert cached_provider.generate_json("Get data") == {"a": 1}
+
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_unparseable_json_is_not_cached(self, mock_run, cached_provider):
+        """Test that a response that fails JSON parsing is not cached."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="not json", stderr="")
+        with pytest.raises(ClaudeCodeError):
+            cached_provider.generate_json("Get data")
+
+        assert cached_provider.cache.stats.writes == 0
+
+    @patch("subprocess.run")
+    def test_file_access_is_never_cached(self, mock_run, cached_provider):
+        """Test that generate_with_file_access always runs the CLI."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="done", stderr="")
+
+        cached_provider.generate_with_file_access("Analyze")
+        cached_provider.generate_with_file_access("Analyze")
+
+        assert mock_run.call_count == 2
+
+    def test_factory_attaches_cache(self, tmp_path):
+        """Test that get_llm_provider wires the cache from config."""
+        from src.config import Config
+
+        config = Config(llm=LLMConfig(cache_dir=str(tmp_path)))
+        provider = get_llm_provider(config)
+        assert provider.cache is not None
+        assert provider.cache.cache_dir == tmp_path
+
+        config = Config(llm=LLMConfig(cache_enabled=False))
+        assert get_llm_provider(config).cache is None
@@ -266,6 +266,7 @@ class TestCmdVoiceover:
         args.audio_dir = None
         args.whisper_model = "base"
         args.no_sync = True
+        args.concurrency = None
 
         result = cmd_voiceover(args)
         assert result == 0
@@ -292,6 +293,7 @@ class TestCmdVoiceover:
         args.audio_dir = None
         args.whisper_model = "base"
         args.no_sync = True
+        args.concurrency = None
 
         result = cmd_voiceover(args)
         assert result == 1
@@ -317,6 +319,7 @@ class TestCmdVoiceover:
         args.audio_dir = None
         args.whisper_model = "base"
         args.no_sync = True
+        args.concurrency = None
 
         result = cmd_voiceover(args)
         assert result == 1
@@ -1574,6 +1577,26 @@ class TestMainEntrypoint:
             result = main()
             assert result == 0
 
+    def test_main_force_bypasses_llm_cache(self, tmp_path):
+        """Test that a forced run doesn't get stored LLM responses back."""
+        from src.understanding import llm_provider
+
+        argv = ["cli", "--projects-dir", str(tmp_path), "storyboard", "demo", "--force"]
+        with patch("sys.argv", argv), patch("src.cli.main.cmd_storyboard", return_value=0):
+            assert main() == 0
+
+        assert llm_provider._bypass_cache is True
+
+    def test_main_unforced_keeps_llm_cache(self, tmp_path):
+        """Test that the response cache stays on for ordinary runs."""
+        from src.understanding import llm_provider
+
+        argv = ["cli", "--projects-dir", str(tmp_path), "storyboard", "demo"]
+        with patch("sys.argv", argv), patch("src.cli.main.cmd_storyboard", return_value=0):
+            assert main() == 0
+
+        assert llm_provider._bypass_cache is False
+
     def test_main_unknown_command(self, capsys):
         """Test main with unknown command."""
         with patch("sys.argv", ["cli", "unknown"]):
@@ -0,0 +1,96 @@
+"""Tests for speech-driven music ducking."""
+
+import numpy as np
+import pytest
+
+from src.audio.ducking import (
+    DuckingEnvelope,
+    DuckingRule,
+    merge_spans,
+    speech_spans_from_rms,
+    speech_spans_from_words,
+)
+from src.sound.models import WordTimestamp
+
+RATE = 1000
+
+
+class TestSpeechSpans:
+    """Tests for building speech spans."""
+
+    def test_merge_spans(self):
+        spans = [(3.0, 4.0), (0.0, 1.0), (0.5, 1.5), (1.7, 2.0)]
+        assert merge_spans(spans) == [(0.0, 1.5), (1.7, 2.0), (3.0, 4.0)]
+        assert merge_spans(spans, bridge_seconds=0.3) == [(0.0, 2.0), (3.0, 4.0)]
+
+    def test_from_words_with_offset(self):
+        words = [
+            {"word": "Hello", "start_seconds": 0.0, "end_seconds": 0.4},
+            {"word": "world", "start_seconds": 0.4, "end_seconds": 0.9},
+            WordTimestamp("again", 2.0, 2.5),
+        ]
+        assert speech_spans_from_words(words, offset_seconds=10.0) == [(10.0, 10.9), (12.0, 12.5)]
+
+    def test_from_rms(self):
+        t = np.arange(3 * RATE) / RATE
+        voice = np.where((t >= 1.0) & (t < 2.0), np.sin(2 * np.pi * 50 * t), 0.001)
+
+        spans = speech_spans_from_rms(voice, RATE, offset_seconds=5.0)
+
+        assert spans == [pytest.approx((6.0, 7.0), abs=0.02)]
+
+    def test_from_rms_silence(self):
+        assert speech_spans_from_rms(np.zeros(RATE), RATE) == []
+
+
+class TestDuckingEnvelope:
+    """Tests for the ducking gain curve."""
+
+    RULE = DuckingRule(depth_db=-20.0, attack_seconds=0.1, release_seconds=0.5, hold_seconds=0.0)
+
+    def test_shape(self):
+        envelope = DuckingEnvelope([(4.0, 5.0)], self.RULE, RATE)
+
+        gain = envelope.gain(0, 10 * RATE)
+
+        assert gain[3000] == pytest.approx(1.0)
+        assert gain[3950] == pytest.approx(0.55)  # Halfway through attack
+        assert gain[4500] == pytest.approx(0.1)
+        assert gain[5250] == pytest.approx(0.55)  # Halfway through release
+        assert gain[6000] == pytest.approx(1.0)
+
+    def test_hold_bridges_short_pauses(self):
+        rule = DuckingRule(depth_db=-20.0, hold_seconds=0.3)
+        spans = [(1.0, 2.0), (2.2, 3.0)]
+
+        assert DuckingEnvelope(spans, rule, RATE).gain(2100, 1)[0] == pytest.approx(0.1)
+        assert DuckingEnvelope(spans, self.RULE, RATE).gain(2100, 1)[0] > 0.1
+
+    def test_overlapping_ramps_take_deepest(self):
+        envelope = DuckingEnvelope([(1.0, 1.2), (1.5, 2.0)], self.RULE, RATE)
+        # Release of the first span and attack of the second overlap
+        assert envelope.gain(1450, 1)[0] == pytest.approx(0.55)
+
+    def test_blocks_match_whole_track(self):
+        envelope = DuckingEnvelope([(0.5, 1.0), (1.2, 1.4), (2.5, 2.6)], DuckingRule(), RATE)
+        whole = envelope.gain(0, 3 * RATE)
+        blocks = np.concatenate([envelope.gain(start, 77) for start in range(0, 3 * RATE, 77)])
+        np.testing.assert_array_equal(blocks[: 3 * RATE], whole)
+
+    def test_no_speech_is_unity(self):
+        np.testing.assert_array_equal(DuckingEnvelope([], sample_rate=RATE).gain(0, 10), np.ones(10))
+
+    def test_apply_multichannel(self):
+        envelope = DuckingEnvelope([(0.0, 1.0)], self.RULE, RATE)
+        audio = np.ones((2 * RATE, 2))
+
+        ducked = envelope.apply(audio)
+
+        assert ducked.shape == audio.shape
+        assert ducked[100] == pytest.approx([0.1, 0.1])
+        assert ducked[-1] == pytest.approx([1.0, 1.0])
+
+    def test_rule_round_trip(self):
+        rule = DuckingRule(depth_db=-9.0, attack_seconds=0.2)
+        assert DuckingRule.from_dict(rule.to_dict()) == rule
+        assert DuckingRule.from_dict({}) == DuckingRule()
@@ -0,0 +1,176 @@
+"""Tests for per-call LLM telemetry."""
+
+import argparse
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import LLMConfig
+from src.understanding import telemetry
+from src.understanding.llm_provider import ClaudeCodeError, ClaudeCodeLLMProvider
+from src.understanding.telemetry import (
+    LLMCallRecord,
+    TelemetryLedger,
+    estimate_cost,
+    ledger_path,
+    percentile,
+    summarize,
+    track_call,
+)
+
+
+@pytest.fixture
+def recording(tmp_path):
+    ledger = telemetry.start_recording(tmp_path, stage="script")
+    yield ledger
+    telemetry.stop_recording()
+
+
+def make_record(stage="scenes", component="SceneGenerator", duration=1.0, **overrides):
+    values = dict(
+        timestamp="2026-01-01T00:00:00",
+        provider="claude-code",
+        model="claude-sonnet-4-20250514",
+        method="generate",
+        component=component,
+        stage=stage,
+        duration_s=duration,
+        prompt_chars=400,
+        response_chars=40,
+        input_tokens=100,
+        output_tokens=10,
+        tokens_estimated=True,
+        cost_usd=0.01,
+    )
+    values.update(overrides)
+    return LLMCallRecord(**values)
+
+
+class ScriptWriter:
+    """Stand-in pipeline component calling the provider."""
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def write(self):
+        return self.llm.generate("Write a script", system_prompt="You are a writer")
+
+
+class TestTrackCall:
+    """Tests for track_call and the provider instrumentation."""
+
+    def test_no_ledger_records_nothing(self, tmp_path):
+        with track_call("claude-code", "m", "generate", "prompt") as call:
+            call.response = "ok"
+
+        assert not ledger_path(tmp_path).exists()
+
+    def test_provider_call_is_recorded_with_component_and_stage(self, recording):
+        provider = ClaudeCodeLLMProvider(LLMConfig())
+        completed = MagicMock(returncode=0, stdout="A short script.", stderr="")
+
+        with patch("subprocess.run", return_value=completed):
+            with telemetry.stage("narration"):
+                ScriptWriter(provider).write()
+            ScriptWriter(provider).write()
+
+        first, second = TelemetryLedger.read(recording.path)
+        assert first.component == "ScriptWriter"
+        assert first.stage == "narration"
+        assert second.stage == "script"  # Falls back to the recording default
+        assert first.method == "generate"
+        assert first.prompt_chars == len("You are a writer" + "Write a script")
+        assert first.response_chars == len("A short script.")
+        assert first.tokens_estimated
+        assert first.cost_usd > 0
+        assert first.success
+
+    def test_failed_call_is_recorded(self, recording):
+        provider = ClaudeCodeLLMProvider(LLMConfig())
+        failed = MagicMock(returncode=1, stdout="", stderr="boom")
+
+        with patch("subprocess.run", return_value=failed):
+            with pytest.raises(ClaudeCodeError):
+                provider.generate("prompt")
+
+        (record,) = TelemetryLedger.read(recording.path)
+        assert not record.success
+        assert "boom" in record.error
+
+    def test_reported_usage_overrides_estimate(self, recording):
+        with track_call("anthropic", "claude-opus-4", "generate", "p") as call:
+            call.response = "r"
+            call.input_tokens, call.output_tokens = 1000, 500
+
+        (record,) = TelemetryLedger.read(recording.path)
+        assert not record.tokens_estimated
+        assert record.cost_usd == pytest.approx(estimate_cost("claude-opus-4", 1000, 500))
+
+    def test_cached_calls_cost_nothing(self, recording):
+        with track_call("claude-code", "claude-sonnet-4", "generate", "p") as call:
+            call.response, call.cached = "r", True
+
+        (record,) = TelemetryLedger.read(recording.path)
+        assert record.cached
+        assert record.cost_usd == 0.0
+
+
+class TestSummarize:
+    """Tests for summarize and percentile."""
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 21)]
+        assert percentile(values, 50) == 10.0
+        assert percentile(values, 95) == 19.0
+        assert percentile([], 95) == 0.0
+
+    def test_groups_by_stage_and_component(self):
+        records = [
+            make_record("scenes", "SceneGenerator", 10.0),
+            make_record("scenes", "SceneGenerator", 30.0),
+            make_record("script", "ScriptGenerator", 5.0),
+            make_record("script", "ScriptGenerator", 0.0, cached=True, cost_usd=0.0),
+        ]
+
+        summary = summarize(records)
+
+        assert list(summary.by_stage) == ["scenes", "script"]  # Largest total first
+        assert summary.by_stage["scenes"].calls == 2
+        assert summary.by_stage["scenes"].p95_s == 30.0
+        assert summary.by_stage["script"].p50_s == 5.0  # Cache hit excluded
+        assert summary.by_component["ScriptGenerator"].cached == 1
+        assert summary.total.cost_usd == pytest.approx(0.03)
+
+    def test_read_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "llm_calls.jsonl"
+        path.write_text(json.dumps(make_record().to_dict()) + "\nnot json\n\n")
+
+        assert len(TelemetryLedger.read(path)) == 1
+
+
+class TestStatsCommand:
+    """Tests for the stats CLI command."""
+
+    def test_prints_stage_breakdown(self, tmp_path, capsys):
+        from src.cli.main import cmd_stats
+
+        project_dir = tmp_path / "demo"
+        ledger = TelemetryLedger(ledger_path(project_dir))
+        ledger.append(make_record("scenes", "SceneGenerator", 12.0))
+        ledger.append(make_record("narration", "NarrationGenerator", 3.0))
+
+        args = argparse.Namespace(projects_dir=str(tmp_path), project="demo", by_component=True)
+        assert cmd_stats(args) == 0
+
+        output = capsys.readouterr().out
+        assert "LLM calls for demo: 2" in output
+        assert "scenes" in output
+        assert "NarrationGenerator" in output
+        assert "LLM budget" in output
+
+    def test_missing_project(self, tmp_path):
+        from src.cli.main import cmd_stats
+
+        args = argparse.Namespace(projects_dir=str(tmp_path), project="nope", by_component=True)
+        assert cmd_stats(args) == 1
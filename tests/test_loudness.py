@@ -0,0 +1,201 @@
+"""Tests for EBU R128 loudness measurement and normalization."""
+
+import json
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.audio.loudness import (
+    LoudnessAnalyzer,
+    LoudnessCache,
+    LoudnessMeasurement,
+    LoudnessMeter,
+    LoudnessTargets,
+    measure_file,
+    measure_loudness,
+    normalize_loudness,
+)
+from src.audio.mixdown import MixdownPlan
+
+RATE = 48000
+
+
+def sine(seconds: float, level: float = 1.0, freq: float = 997.0, rate: int = RATE) -> np.ndarray:
+    t = np.arange(round(seconds * rate)) / rate
+    return level * np.sin(2 * np.pi * freq * t)
+
+
+def write_wav(path: Path, samples: np.ndarray, rate: int = RATE) -> Path:
+    """Write float samples, (n,) or (n, channels), as a 16-bit WAV."""
+    samples = samples if samples.ndim > 1 else samples[:, None]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes((samples * 32767).astype("<i2").tobytes())
+    return path
+
+
+class TestMeasurement:
+    """Tests for the BS.1770 meter."""
+
+    def test_reference_sine(self):
+        # A 0 dBFS 997 Hz sine in one channel reads -3.01 LUFS
+        assert measure_loudness(sine(5.0), RATE).integrated_lufs == pytest.approx(-3.01, abs=0.01)
+
+    def test_stereo_sums_channels(self):
+        tone = sine(5.0, 0.5)
+        mono = measure_loudness(tone, RATE).integrated_lufs
+        stereo = measure_loudness(np.stack([tone, tone], axis=1), RATE).integrated_lufs
+        assert stereo - mono == pytest.approx(3.01, abs=0.01)
+
+    def test_other_sample_rates(self):
+        measurement = measure_loudness(sine(5.0, 0.1, rate=44100), 44100)
+        assert measurement.integrated_lufs == pytest.approx(-23.01, abs=0.05)
+        assert measurement.sample_rate == 44100
+
+    def test_relative_gate_ignores_quiet_passages(self):
+        loud = sine(4.0, 0.5)
+        with_silence = np.concatenate([loud, sine(20.0, 0.0005)])
+        assert measure_loudness(with_silence, RATE).integrated_lufs == pytest.approx(
+            measure_loudness(loud, RATE).integrated_lufs, abs=0.2
+        )
+
+    def test_silence(self):
+        measurement = measure_loudness(np.zeros(RATE), RATE)
+        assert measurement.integrated_lufs is None
+        assert measurement.true_peak_dbtp is None
+        assert measurement.gain_db(-16.0) == 0.0
+
+    def test_shorter_than_one_block(self):
+        assert measure_loudness(sine(0.1), RATE).integrated_lufs == pytest.approx(-3.01, abs=0.1)
+
+    def test_true_peak_exceeds_sample_peak(self):
+        # Quarter-rate sine sampled 45 degrees off its peaks
+        t = np.arange(RATE) / RATE
+        tone = 0.5 * np.sin(2 * np.pi * RATE / 4 * t + np.pi / 4)
+
+        true_peak = measure_loudness(tone, RATE).true_peak_dbtp
+
+        assert 20 * np.log10(np.abs(tone).max()) < true_peak - 2.5
+        assert true_peak == pytest.approx(20 * np.log10(0.5), abs=0.2)
+
+    def test_streaming_matches_whole(self):
+        rng = np.random.default_rng(0)
+        audio = rng.normal(0, 0.1, (3 * RATE, 2)) * np.linspace(0, 1, 3 * RATE)[:, None]
+
+        meter = LoudnessMeter(RATE, 2)
+        for start in range(0, len(audio), 7777):
+            meter.process(audio[start:start + 7777])
+
+        whole = measure_loudness(audio, RATE)
+        streamed = meter.result()
+        assert streamed.integrated_lufs == pytest.approx(whole.integrated_lufs, abs=1e-9)
+        assert streamed.true_peak_dbtp == pytest.approx(whole.true_peak_dbtp, abs=1e-6)
+
+    def test_measure_file_keeps_native_format(self, tmp_path):
+        path = write_wav(tmp_path / "tone.wav", sine(2.0, 0.25, rate=22050), rate=22050)
+
+        measurement = measure_file(path, block_size=1000)
+
+        assert measurement.sample_rate == 22050
+        assert measurement.channels == 1
+        assert measurement.duration_seconds == pytest.approx(2.0)
+        assert measurement.integrated_lufs == pytest.approx(-15.05, abs=0.05)
+
+    def test_round_trip(self):
+        measurement = LoudnessMeasurement(-16.2, -1.5, 3.0, RATE, 2)
+        assert LoudnessMeasurement.from_dict(measurement.to_dict()) == measurement
+
+
+class TestNormalization:
+    """Tests for loudness normalization."""
+
+    def test_reaches_target(self):
+        normalized = normalize_loudness(sine(3.0, 0.01), RATE, -18.0)
+        assert measure_loudness(normalized, RATE).integrated_lufs == pytest.approx(-18.0, abs=0.01)
+
+    def test_true_peak_ceiling_limits_gain(self):
+        # A sparse click is quiet but peaky: the ceiling wins over the target
+        clicks = np.zeros(2 * RATE)
+        clicks[::RATE // 2] = 0.1
+
+        normalized = normalize_loudness(clicks, RATE, -16.0, ceiling_dbtp=-1.0)
+
+        measurement = measure_loudness(normalized, RATE)
+        assert measurement.true_peak_dbtp == pytest.approx(-1.0, abs=0.01)
+        assert measurement.integrated_lufs < -16.0
+
+
+class TestProjectAnalysis:
+    """Tests for the project report, cache and mixdown gains."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        write_wav(tmp_path / "voiceover" / "intro.wav", sine(2.0, 0.05))
+        write_wav(tmp_path / "sfx" / "ping.wav", sine(0.5, 0.5))
+        write_wav(tmp_path / "music" / "bed.wav", sine(3.0, 0.2, freq=220.0))
+        (tmp_path / "sfx" / "notes.txt").write_text("not audio")
+        return tmp_path
+
+    def test_report_gains_reach_targets(self, project, tmp_path):
+        targets = LoudnessTargets()
+        report = LoudnessAnalyzer(cache_dir=tmp_path / "cache").analyze_project(project)
+
+        assert [(e.path, e.kind) for e in report.entries] == [
+            ("voiceover/intro.wav", "voiceover"),
+            ("sfx/ping.wav", "sfx"),
+            ("music/bed.wav", "music"),
+        ]
+        for entry in report.entries:
+            corrected = entry.measurement.integrated_lufs + entry.gain_db
+            assert corrected == pytest.approx(targets.for_kind(entry.kind), abs=0.01)
+
+        assert report.gain_for(project / "voiceover" / "intro.wav") == pytest.approx(
+            10 ** (report.entries[0].gain_db / 20)
+        )
+        assert report.gain_for(project / "voiceover" / "other.wav") == 1.0
+
+        saved = json.loads(report.save().read_text())
+        assert len(saved["entries"]) == 3
+        assert saved["targets"]["sfx_lufs"] == targets.sfx_lufs
+
+    def test_cache_skips_unchanged_files(self, project, tmp_path):
+        cache_dir = tmp_path / "cache"
+        first = LoudnessAnalyzer(cache_dir=cache_dir)
+        before = first.analyze_project(project)
+        assert (first.cache.hits, first.cache.misses) == (0, 3)
+
+        write_wav(project / "sfx" / "ping.wav", sine(0.5, 0.25))
+        second = LoudnessAnalyzer(cache_dir=cache_dir)
+        after = second.analyze_project(project)
+
+        assert (second.cache.hits, second.cache.misses) == (2, 1)
+        assert after.entries[1].measurement.integrated_lufs == pytest.approx(
+            before.entries[1].measurement.integrated_lufs - 6.02, abs=0.01
+        )
+        assert LoudnessCache(cache_dir).get(LoudnessCache.make_key("unknown")) is None
+
+    def test_undecodable_file_is_reported(self, project, tmp_path):
+        (project / "music" / "broken.wav").write_bytes(b"RIFF....WAVEjunk")
+
+        report = LoudnessAnalyzer(use_cache=False).analyze_project(project)
+
+        broken = next(e for e in report.entries if e.path == "music/broken.wav")
+        assert broken.error is not None or broken.measurement.integrated_lufs is None
+        assert report.gain_for(project / "music" / "broken.wav") == 1.0
+
+    def test_mixdown_applies_gains(self, project, tmp_path):
+        storyboard = {
+            "video": {"fps": 30},
+            "scenes": [{"audio_file": "intro.wav", "audio_duration_seconds": 2.0}],
+        }
+        report = LoudnessAnalyzer(cache_dir=tmp_path / "cache").analyze_project(project)
+
+        plan = MixdownPlan.from_storyboard(storyboard, project, loudness=report)
+
+        assert plan.clips[0].gain == pytest.approx(report.gain_for(project / "voiceover" / "intro.wav"))
+        assert plan.signature() != MixdownPlan.from_storyboard(storyboard, project).signature()
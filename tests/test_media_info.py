@@ -0,0 +1,181 @@
+"""Tests for header-based media metadata and its cache."""
+
+import os
+import struct
+import wave
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.media_info import (
+    MEDIA_INFO_CACHE,
+    MediaInfoError,
+    get_media_duration,
+    probe_media,
+    read_headers,
+)
+
+# MPEG-1 layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames of 1152 samples
+MP3_FRAME_V1 = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+# MPEG-2 layer III, 48 kbps, 24 kHz, mono (as EdgeTTS writes): 144-byte frames of 576 samples
+MP3_FRAME_V2_MONO = bytes([0xFF, 0xF3, 0x64, 0xC0]) + b"\x00" * 140
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    MEDIA_INFO_CACHE.clear()
+    yield
+    MEDIA_INFO_CACHE.clear()
+
+
+def write_wav(path: Path, frames: int, rate: int = 44100, channels: int = 1, width: int = 2) -> Path:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(width)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00" * frames * channels * width)
+    return path
+
+
+def id3v2(payload_size: int) -> bytes:
+    syncsafe = bytes((payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + syncsafe + b"\x00" * payload_size
+
+
+def box(box_type: bytes, body: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(body)) + box_type + body
+
+
+def mp4(mvhd_body: bytes, moov_last: bool = True) -> bytes:
+    ftyp = box(b"ftyp", b"isom\x00\x00\x02\x00isomiso2")
+    mdat = box(b"mdat", b"\x00" * 1000)
+    moov = box(b"moov", box(b"mvhd", mvhd_body) + box(b"trak", b"\x00" * 16))
+    return ftyp + (mdat + moov if moov_last else moov + mdat)
+
+
+class TestHeaders:
+    """Tests for the container header parsers."""
+
+    def test_wav(self, tmp_path):
+        info = read_headers(write_wav(tmp_path / "a.wav", 22050, rate=44100, channels=2))
+        assert info.duration_seconds == pytest.approx(0.5)
+        assert (info.sample_rate, info.channels, info.source) == (44100, 2, "wav")
+
+    def test_wav_24_bit(self, tmp_path):
+        info = read_headers(write_wav(tmp_path / "a.wav", 48000, rate=48000, width=3))
+        assert info.duration_seconds == pytest.approx(1.0)
+
+    def test_wav_with_streamed_data_size(self, tmp_path):
+        path = write_wav(tmp_path / "a.wav", 16000, rate=16000)
+        data = bytearray(path.read_bytes())
+        offset = data.index(b"data") + 4
+        data[offset:offset + 4] = b"\xff\xff\xff\xff"
+        path.write_bytes(bytes(data))
+
+        assert read_headers(path).duration_seconds == pytest.approx(1.0)
+
+    def test_cbr_mp3(self, tmp_path):
+        path = tmp_path / "voice.mp3"
+        path.write_bytes(id3v2(300) + MP3_FRAME_V2_MONO * 125)
+
+        info = read_headers(path)
+
+        assert info.duration_seconds == pytest.approx(125 * 576 / 24000)
+        assert (info.sample_rate, info.channels, info.source) == (24000, 1, "mp3")
+
+    def test_cbr_mp3_ignores_id3v1(self, tmp_path):
+        path = tmp_path / "music.mp3"
+        path.write_bytes(MP3_FRAME_V1 * 100 + b"TAG" + b"\x00" * 125)
+
+        assert read_headers(path).duration_seconds == pytest.approx(100 * 417 * 8 / 128000)
+
+    def test_vbr_mp3_uses_xing_frame_count(self, tmp_path):
+        xing = bytearray(MP3_FRAME_V1)
+        xing[36:48] = b"Xing" + struct.pack(">II", 1, 2500)
+        path = tmp_path / "vbr.mp3"
+        path.write_bytes(bytes(xing) + MP3_FRAME_V1 * 10)
+
+        assert read_headers(path).duration_seconds == pytest.approx(2500 * 1152 / 44100)
+
+    @pytest.mark.parametrize("moov_last", [True, False])
+    def test_mp4(self, tmp_path, moov_last):
+        mvhd = struct.pack(">B3xIIII", 0, 0, 0, 1000, 12345) + b"\x00" * 80
+        path = tmp_path / "video.mp4"
+        path.write_bytes(mp4(mvhd, moov_last))
+
+        info = read_headers(path)
+
+        assert info.duration_seconds == pytest.approx(12.345)
+        assert info.source == "mp4"
+
+    def test_mp4_version_1_header(self, tmp_path):
+        mvhd = struct.pack(">B3xQQIQ", 1, 0, 0, 30000, 30000 * 90) + b"\x00" * 80
+        path = tmp_path / "video.mov"
+        path.write_bytes(mp4(mvhd))
+
+        assert read_headers(path).duration_seconds == pytest.approx(90.0)
+
+    def test_unrecognized(self, tmp_path):
+        path = tmp_path / "notes.mp3"
+        path.write_bytes(b"not an audio file" * 10)
+        assert read_headers(path) is None
+
+
+class TestProbeMedia:
+    """Tests for probe_media, its ffprobe fallback and cache."""
+
+    def test_headers_avoid_ffprobe(self, tmp_path):
+        path = write_wav(tmp_path / "a.wav", 44100)
+
+        with patch("subprocess.run") as mock_run:
+            assert get_media_duration(path) == pytest.approx(1.0)
+            mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_falls_back_to_ffprobe(self, mock_run, tmp_path):
+        path = tmp_path / "clip.ogg"
+        path.write_bytes(b"OggS" + b"\x00" * 100)
+        mock_run.return_value = MagicMock(returncode=0, stdout="7.25\n")
+
+        info = probe_media(path)
+
+        assert info.duration_seconds == 7.25
+        assert info.source == "ffprobe"
+        assert mock_run.call_args.args[0][0] == "ffprobe"
+
+    @patch("subprocess.run")
+    def test_failure(self, mock_run, tmp_path):
+        path = tmp_path / "clip.ogg"
+        path.write_bytes(b"\x00" * 100)
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+
+        with pytest.raises(MediaInfoError):
+            probe_media(path)
+        assert get_media_duration(path, default=-1.0) == -1.0
+        assert len(MEDIA_INFO_CACHE) == 0  # Failures aren't cached
+
+    def test_cache_keyed_by_size_and_mtime(self, tmp_path):
+        path = write_wav(tmp_path / "a.wav", 44100)
+
+        assert probe_media(path).duration_seconds == pytest.approx(1.0)
+        assert probe_media(path).duration_seconds == pytest.approx(1.0)
+        assert (MEDIA_INFO_CACHE.hits, MEDIA_INFO_CACHE.misses) == (1, 1)
+
+        write_wav(path, 88200)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert probe_media(path).duration_seconds == pytest.approx(2.0)
+        assert MEDIA_INFO_CACHE.misses == 2
+
+    def test_cache_is_bounded(self, tmp_path):
+        from src.media_info import MediaInfo, MediaInfoCache
+
+        cache = MediaInfoCache(max_entries=2)
+        for i in range(3):
+            cache.put((str(i), 0, 0), MediaInfo(float(i)))
+
+        assert len(cache) == 2
+        assert cache.get(("0", 0, 0)) is None
+        assert cache.get(("2", 0, 0)).duration_seconds == 2.0
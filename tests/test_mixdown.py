@@ -0,0 +1,314 @@
+"""Tests for the streaming audio mixdown engine."""
+
+import json
+import math
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.audio.ducking import DuckingEnvelope, DuckingRule
+from src.audio.mixdown import (
+    MIXDOWN_PATH,
+    MixClip,
+    MixdownEngine,
+    MixdownPlan,
+    MusicEnvelope,
+    mix_storyboard,
+    open_source,
+    storyboard_speech_spans,
+)
+
+RATE = 44100
+FPS = 30
+
+
+def write_wav(path: Path, samples: np.ndarray, channels: int = 1, rate: int = RATE) -> Path:
+    """Write float samples in [-1, 1] as a 16-bit WAV."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes((samples * 32767).astype("<i2").tobytes())
+    return path
+
+
+def read_wav(path: Path) -> np.ndarray:
+    """Read a 16-bit stereo WAV as float (n, 2)."""
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getnchannels() == 2
+        assert wav.getframerate() == RATE
+        raw = wav.readframes(wav.getnframes())
+    return np.frombuffer(raw, dtype="<i2").reshape(-1, 2).astype(np.float64) / 32767
+
+
+def constant(seconds: float, level: float) -> np.ndarray:
+    return np.full(round(seconds * RATE), level)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Two scenes with WAV voiceovers, one SFX cue and no music."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    write_wav(tmp_path / "voiceover" / "a.wav", constant(1.0, 0.5))
+    write_wav(tmp_path / "voiceover" / "b.wav", constant(0.5, 0.25))
+    write_wav(tmp_path / "sfx" / "ui_pop.wav", constant(0.5, 1.0))
+
+    storyboard = {
+        "video": {"fps": FPS},
+        "audio": {"voiceover_dir": "voiceover", "buffer_between_scenes_seconds": 0.5},
+        "scenes": [
+            {
+                "id": "a",
+                "audio_file": "a.wav",
+                "audio_duration_seconds": 1.0,
+                "sfx_cues": [{"sound": "ui_pop", "frame": 60, "volume": 0.2, "duration_frames": 6}],
+            },
+            {
+                "id": "b",
+                "audio_file": "b.wav",
+                "audio_duration_seconds": 0.5,
+                "visual_padding_seconds": 0.2,
+            },
+        ],
+    }
+    storyboard_path = tmp_path / "storyboard" / "storyboard.json"
+    storyboard_path.parent.mkdir()
+    storyboard_path.write_text(json.dumps(storyboard))
+    return tmp_path
+
+
+def frames_to_samples(frames: int) -> int:
+    return round(frames * RATE / FPS)
+
+
+class TestMixdownPlan:
+    """Tests for laying out a storyboard."""
+
+    def test_matches_remotion_timing(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+        plan = MixdownPlan.from_storyboard(storyboard, project)
+
+        voiceover_a, cue, voiceover_b = plan.clips
+        assert voiceover_a.start == 0
+        assert voiceover_a.length == frames_to_samples(30 + 15)
+        assert cue.start == frames_to_samples(60)
+        assert cue.length == frames_to_samples(6)
+        assert cue.gain == pytest.approx(0.2)
+        # Scene b starts after ceil((1.0 + 0.5) * 30) frames
+        assert voiceover_b.start == frames_to_samples(45)
+        assert plan.total_samples == frames_to_samples(45 + math.ceil((0.5 + 0.5 + 0.2) * FPS))
+
+    def test_missing_files_are_reported(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+        storyboard["scenes"][1]["sfx_cues"] = [{"sound": "nope", "frame": 0}]
+
+        plan = MixdownPlan.from_storyboard(storyboard, project)
+
+        assert plan.missing == [str(project / "sfx" / "nope.wav")]
+        assert len(plan.clips) == 3
+
+    def test_signature_tracks_inputs(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+        before = MixdownPlan.from_storyboard(storyboard, project).signature()
+        assert MixdownPlan.from_storyboard(storyboard, project).signature() == before
+
+        storyboard["scenes"][0]["sfx_cues"][0]["volume"] = 0.3
+        assert MixdownPlan.from_storyboard(storyboard, project).signature() != before
+
+
+class TestMixdownEngine:
+    """Tests for block rendering."""
+
+    def test_renders_voiceover_and_sfx(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+        plan = MixdownPlan.from_storyboard(storyboard, project)
+
+        result = MixdownEngine().render(plan, project / "out.wav")
+        mix = read_wav(result.output_path)
+
+        assert len(mix) == plan.total_samples
+        assert mix[1000] == pytest.approx([0.5, 0.5], abs=1e-3)  # Mono voiceover on both channels
+        assert mix[RATE + 100] == pytest.approx([0, 0], abs=1e-3)  # Buffer after voiceover
+        cue_start = frames_to_samples(60)
+        assert mix[cue_start + 10] == pytest.approx([0.2, 0.2], abs=1e-3)
+        assert mix[cue_start + frames_to_samples(6) + 10] == pytest.approx([0, 0], abs=1e-3)
+        scene_b = frames_to_samples(45)
+        assert mix[scene_b + 10] == pytest.approx([0.25, 0.25], abs=1e-3)
+        assert result.peak == pytest.approx(0.5, abs=1e-3)
+        assert result.clipped_samples == 0
+
+    def test_output_does_not_depend_on_block_size(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+        plan = MixdownPlan.from_storyboard(storyboard, project)
+
+        MixdownEngine(block_size=997).render(plan, project / "small.wav")
+        MixdownEngine(block_size=1 << 16).render(plan, project / "large.wav")
+
+        np.testing.assert_array_equal(read_wav(project / "small.wav"), read_wav(project / "large.wav"))
+
+    def test_clipping_is_counted(self, tmp_path):
+        loud = write_wav(tmp_path / "loud.wav", constant(0.1, 0.8))
+        plan = MixdownPlan(
+            total_samples=round(0.1 * RATE),
+            clips=[MixClip(loud, start=0), MixClip(loud, start=0)],
+        )
+
+        result = MixdownEngine().render(plan, tmp_path / "out.wav")
+
+        assert result.peak == pytest.approx(1.6, abs=1e-3)
+        assert result.clipped_samples == plan.total_samples * 2
+        assert read_wav(result.output_path).max() == pytest.approx(1.0, abs=1e-3)
+
+    def test_loop_restarts_source(self, tmp_path):
+        ramp = write_wav(tmp_path / "ramp.wav", np.linspace(0, 0.5, 100, endpoint=False))
+        plan = MixdownPlan(total_samples=250, clips=[MixClip(ramp, start=0, loop=True)])
+
+        mix = read_wav(MixdownEngine(block_size=64).render(plan, tmp_path / "out.wav").output_path)
+
+        np.testing.assert_allclose(mix[:100, 0], mix[100:200, 0])
+        np.testing.assert_allclose(mix[200:250, 0], mix[:50, 0])
+
+    def test_reads_stereo_and_24_bit_wav(self, tmp_path):
+        path = tmp_path / "stereo24.wav"
+        left, right = 0.25, -0.5
+        frames = np.array([[left, right]] * 10)
+        packed = (frames * (1 << 23)).astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(3)
+            wav.setframerate(RATE)
+            wav.writeframes(packed.tobytes())
+
+        source = open_source(path)
+        data = source.read(100)
+        source.close()
+
+        assert data.shape == (10, 2)
+        np.testing.assert_allclose(data, frames, atol=1e-6)
+
+
+class TestMusicEnvelope:
+    """Tests for music fades and ducking."""
+
+    def test_fades_match_player(self):
+        total = 10 * RATE
+        envelope = MusicEnvelope(0.3, total)
+
+        gain = envelope.gain(0, total)
+
+        assert gain[0] == 0
+        assert gain[RATE] == pytest.approx(0.3 * (1 - 0.5 ** 3), abs=1e-4)  # Halfway through fade-in
+        assert gain[5 * RATE] == pytest.approx(0.3)
+        assert gain[total - round(1.5 * RATE)] == pytest.approx(0.3 * (1 - 0.5 ** 3), abs=1e-4)
+        assert gain[-1] == pytest.approx(0, abs=1e-4)
+
+    def test_ducking_multiplies_fades(self):
+        total = 10 * RATE
+        ducking = DuckingEnvelope([(4.0, 5.0)], DuckingRule(depth_db=-20.0), RATE)
+        envelope = MusicEnvelope(0.5, total, ducking=ducking)
+
+        gain = envelope.gain(0, total)
+
+        assert gain[3 * RATE] == pytest.approx(0.5)
+        assert gain[round(4.5 * RATE)] == pytest.approx(0.05, abs=1e-4)
+
+
+class TestStoryboardSpeechSpans:
+    """Tests for locating narration on the video timeline."""
+
+    def test_uses_manifest_words_at_scene_offsets(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+        manifest = {"scenes": [
+            {"scene_id": "b", "word_timestamps": [
+                {"word": "hi", "start_seconds": 0.1, "end_seconds": 0.3},
+            ]},
+        ]}
+
+        spans = storyboard_speech_spans(storyboard, project, manifest)
+
+        # Scene a has no words: its voiceover is loud throughout (RMS)
+        assert spans[0] == pytest.approx((0.0, 1.0), abs=0.02)
+        # Scene b starts at frame 45
+        assert spans[1] == pytest.approx((1.6, 1.8))
+
+    def test_falls_back_to_whole_voiceover(self, project):
+        storyboard = json.loads((project / "storyboard" / "storyboard.json").read_text())
+
+        spans = storyboard_speech_spans(storyboard)
+
+        assert spans == [(0.0, 1.0), (1.5, 2.0)]
+
+
+class TestMixStoryboard:
+    """Tests for the project-level entry point."""
+
+    def test_records_stem_and_reuses_it(self, project):
+        storyboard_path = project / "storyboard" / "storyboard.json"
+
+        result = mix_storyboard(project)
+
+        assert result.output_path == project / MIXDOWN_PATH
+        assert not result.up_to_date
+        mixdown = json.loads(storyboard_path.read_text())["audio"]["mixdown"]
+        assert mixdown["path"] == MIXDOWN_PATH
+        assert mix_storyboard(project).up_to_date
+        assert (project / "audio" / "loudness_report.json").exists()
+
+        storyboard = json.loads(storyboard_path.read_text())
+        storyboard["scenes"][0]["sfx_cues"] = []
+        storyboard_path.write_text(json.dumps(storyboard))
+        assert not mix_storyboard(project).up_to_date
+
+    def test_keeps_recorded_normalize_setting(self, project):
+        storyboard_path = project / "storyboard" / "storyboard.json"
+
+        mix_storyboard(project, normalize=False)
+
+        assert json.loads(storyboard_path.read_text())["audio"]["mixdown"]["normalize"] is False
+        # A later re-mix (e.g. from render) doesn't silently turn it back on
+        assert mix_storyboard(project).up_to_date
+        assert not (project / "audio" / "loudness_report.json").exists()
+
+        mix_storyboard(project, normalize=True)
+        assert json.loads(storyboard_path.read_text())["audio"]["mixdown"]["normalize"] is True
+
+    def test_music_volume_applies_after_loudness_correction(self, project):
+        write_wav(project / "music" / "background.wav", constant(0.5, 0.5))
+        storyboard_path = project / "storyboard" / "storyboard.json"
+        storyboard = json.loads(storyboard_path.read_text())
+        storyboard["scenes"][0]["audio_file"] = "missing.wav"  # Leave only music in scene a
+        storyboard["audio"]["background_music"] = {"path": "music/background.wav", "volume": 0.4}
+        storyboard_path.write_text(json.dumps(storyboard))
+
+        result = mix_storyboard(project, update_storyboard=False)
+        mix = read_wav(result.output_path)
+
+        report = json.loads((project / "audio" / "loudness_report.json").read_text())
+        gain_db = next(e["gain_db"] for e in report["entries"] if e["path"] == "music/background.wav")
+        fade_in = 1 - (1 - (20 / FPS) / 2.0) ** 3
+        expected = 0.5 * 10 ** (gain_db / 20) * 0.4 * fade_in
+        assert mix[frames_to_samples(20), 0] == pytest.approx(expected, abs=1e-3)
+
+    def test_music_is_mixed_with_ducking(self, project):
+        write_wav(project / "music" / "background.wav", constant(0.5, 0.5))
+        storyboard_path = project / "storyboard" / "storyboard.json"
+        storyboard = json.loads(storyboard_path.read_text())
+        storyboard["scenes"][0]["audio_file"] = "missing.wav"  # Leave only music in scene a
+        storyboard["audio"]["background_music"] = {
+            "path": "music/background.wav",
+            "volume": 0.4,
+            "ducking": {"depth_db": -6.0},
+        }
+        storyboard_path.write_text(json.dumps(storyboard))
+
+        result = mix_storyboard(project, update_storyboard=False, normalize=False)
+        mix = read_wav(result.output_path)
+
+        fade_in = 1 - (1 - (20 / FPS) / 2.0) ** 3
+        ducked = 0.5 * 0.4 * fade_in * 10 ** (-6 / 20)
+        assert result.missing == [str(project / "voiceover" / "missing.wav")]
+        assert mix[frames_to_samples(20), 0] == pytest.approx(ducked, abs=1e-3)
+        assert "mixdown" not in json.loads(storyboard_path.read_text())["audio"]
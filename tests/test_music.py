@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch, Mock
 import pytest
 import numpy as np
 
+from src.audio.ducking import DuckingRule
 from src.music import MusicGenerator, MusicConfig, MusicGenerationResult
 from src.music.generator import (
     get_music_prompt,
@@ -17,6 +18,8 @@ from src.music.generator import (
     generate_for_short,
     _update_storyboard_with_music,
     _update_shorts_storyboard_with_music,
+    short_music_is_stale,
+    speech_spans_signature,
     MUSIC_STYLE_PRESETS,
     SHORTS_STYLE_PRESETS,
 )
@@ -36,6 +39,7 @@ class TestMusicConfig:
         assert config.volume == 0.3
         assert config.device == "auto"
         assert "ambient" in config.style.lower()
+        assert config.ducking.depth_db < 0
 
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -319,6 +323,96 @@ class TestGenerateForProject:
             assert (project_dir / "music").exists()
 
 
+class TestMusicDucking:
+    """Tests for ducking generated music under narration."""
+
+    def test_generate_ducks_under_speech(self):
+        generator = MusicGenerator(MusicConfig(sample_rate=1000))
+        generator.generate_segment = MagicMock(return_value=(np.ones(10_000), 1000))
+        generator._save_audio = MagicMock()
+
+        result = generator.generate(Path("/tmp/music.mp3"), "tech", target_duration=10, speech_spans=[(4.0, 6.0)])
+
+        assert result.success is True
+        gain = generator._save_audio.call_args.kwargs["gain"]
+        assert gain[1000] == pytest.approx(1.0)
+        assert gain[5000] == pytest.approx(10 ** (generator.config.ducking.depth_db / 20))
+
+    def test_generate_without_ducking(self):
+        generator = MusicGenerator(MusicConfig(sample_rate=1000, ducking=None))
+        generator.generate_segment = MagicMock(return_value=(np.ones(10_000), 1000))
+        generator._save_audio = MagicMock()
+
+        generator.generate(Path("/tmp/music.mp3"), "tech", target_duration=10, speech_spans=[(4.0, 6.0)])
+
+        assert generator._save_audio.call_args.kwargs["gain"] is None
+
+    @patch("src.music.generator.MusicGenerator")
+    def test_project_ducking_left_to_mixdown(self, mock_generator_class, tmp_path):
+        (tmp_path / "storyboard").mkdir()
+        (tmp_path / "storyboard" / "storyboard.json").write_text(json.dumps({"scenes": []}))
+        mock_generator_class.return_value.generate.return_value = MusicGenerationResult(success=True)
+
+        generate_for_project(tmp_path, "Test", target_duration=10)
+
+        # The file stays at constant volume; the mixdown ducks it at mix time
+        assert mock_generator_class.return_value.generate.call_args.kwargs.get("speech_spans") is None
+        storyboard = json.loads((tmp_path / "storyboard" / "storyboard.json").read_text())
+        assert storyboard["audio"]["background_music"]["ducking"] == DuckingRule().to_dict()
+
+    @patch("src.music.generator.MusicGenerator")
+    def test_no_duck(self, mock_generator_class, tmp_path):
+        (tmp_path / "storyboard").mkdir()
+        (tmp_path / "storyboard" / "storyboard.json").write_text(json.dumps({"scenes": []}))
+        mock_generator_class.return_value.generate.return_value = MusicGenerationResult(success=True)
+
+        generate_for_project(tmp_path, "Test", target_duration=10, duck=False)
+
+        storyboard = json.loads((tmp_path / "storyboard" / "storyboard.json").read_text())
+        assert "ducking" not in storyboard["audio"]["background_music"]
+
+    @patch("src.music.generator.MusicGenerator")
+    def test_short_records_ducked_narration(self, mock_generator_class, tmp_path):
+        variant_dir = tmp_path / "short" / "default"
+        (variant_dir / "storyboard").mkdir(parents=True)
+        (variant_dir / "voiceover").mkdir(parents=True)
+        (variant_dir / "storyboard" / "shorts_storyboard.json").write_text(
+            json.dumps({"beats": [], "total_duration_seconds": 10})
+        )
+        manifest_path = variant_dir / "voiceover" / "short_voiceover_manifest.json"
+        manifest_path.write_text(json.dumps({"word_timestamps": [
+            {"word": "Hi", "start_seconds": 0.5, "end_seconds": 0.8},
+        ]}))
+        mock_generator_class.return_value.generate.return_value = MusicGenerationResult(success=True)
+
+        generate_for_short(tmp_path, "Test")
+
+        spans = mock_generator_class.return_value.generate.call_args.kwargs["speech_spans"]
+        assert spans == [(0.5, 0.8)]
+        storyboard = json.loads((variant_dir / "storyboard" / "shorts_storyboard.json").read_text())
+        assert storyboard["audio"]["background_music"]["ducked_for"] == speech_spans_signature(spans)
+        assert short_music_is_stale(tmp_path) is False
+
+        # Re-recording the voiceover makes the baked-in ducking stale
+        manifest_path.write_text(json.dumps({"word_timestamps": [
+            {"word": "Hello", "start_seconds": 1.0, "end_seconds": 1.6},
+        ]}))
+        assert short_music_is_stale(tmp_path) is True
+
+    @patch("src.music.generator.MusicGenerator")
+    def test_short_no_duck_is_never_stale(self, mock_generator_class, tmp_path):
+        variant_dir = tmp_path / "short" / "default"
+        (variant_dir / "storyboard").mkdir(parents=True)
+        (variant_dir / "storyboard" / "shorts_storyboard.json").write_text(json.dumps({"beats": []}))
+        mock_generator_class.return_value.generate.return_value = MusicGenerationResult(success=True)
+
+        generate_for_short(tmp_path, "Test", duck=False)
+
+        storyboard = json.loads((variant_dir / "storyboard" / "shorts_storyboard.json").read_text())
+        assert "ducked_for" not in storyboard["audio"]["background_music"]
+        assert short_music_is_stale(tmp_path) is False
+
+
 class TestMusicGeneratorIntegration:
     """Integration tests for MusicGenerator (requires actual model).
 
@@ -0,0 +1,181 @@
+"""Tests for the incremental pipeline DAG runner."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.pipeline.dag import DAGRunner, RunLedger, Stage, hash_inputs
+
+
+class ToyPipeline:
+    """narration -> (scenes, voiceover) -> storyboard, backed by text files."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.calls: list[str] = []
+        self.barrier: threading.Barrier | None = None
+        self.fail: set[str] = set()
+        (root / "source.txt").write_text("topic")
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.txt"
+
+    def step(self, name: str, inputs: list[str]):
+        def run() -> int:
+            self.calls.append(name)
+            if name in self.fail:
+                return 3
+            if self.barrier and name in ("scenes", "voiceover"):
+                self.barrier.wait()
+            content = "+".join(self.path(i).read_text() for i in inputs)
+            self.path(name).write_text(f"{name}({content})")
+            return 0
+
+        return run
+
+    def stages(self) -> list[Stage]:
+        specs = [
+            ("narration", [], ["source"]),
+            ("scenes", ["narration"], ["narration"]),
+            ("voiceover", ["narration"], ["narration"]),
+            ("storyboard", ["scenes", "voiceover"], ["scenes", "voiceover"]),
+        ]
+        return [
+            Stage(
+                name=name,
+                run=self.step(name, inputs),
+                deps=deps,
+                inputs=[self.path(i) for i in inputs],
+                outputs_exist=lambda name=name: self.path(name).exists(),
+            )
+            for name, deps, inputs in specs
+        ]
+
+    def run(self, force: bool = False):
+        self.calls = []
+        ledger = RunLedger(self.root / "pipeline" / "ledger.json")
+        return DAGRunner(self.stages(), ledger, self.root, force=force).run()
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    return ToyPipeline(tmp_path)
+
+
+class TestHashInputs:
+    """Tests for hash_inputs."""
+
+    def test_changes_with_content(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_text("one")
+        before = hash_inputs([f], tmp_path)
+        f.write_text("two")
+        assert hash_inputs([f], tmp_path) != before
+
+    def test_directory_and_missing_paths(self, tmp_path):
+        d = tmp_path / "scenes"
+        missing = hash_inputs([d], tmp_path)
+        d.mkdir()
+        (d / "A.tsx").write_text("a")
+        with_file = hash_inputs([d], tmp_path)
+        (d / "B.tsx").write_text("b")
+        assert len({missing, with_file, hash_inputs([d], tmp_path)}) == 3
+
+    def test_params_affect_hash(self, tmp_path):
+        assert hash_inputs([], tmp_path, {"resolution": "720p"}) != hash_inputs(
+            [], tmp_path, {"resolution": "4k"}
+        )
+
+
+class TestDAGRunner:
+    """Tests for DAGRunner."""
+
+    def test_first_run_runs_everything_then_skips(self, pipeline):
+        first = pipeline.run()
+        assert first.success
+        assert sorted(first.ran) == ["narration", "scenes", "storyboard", "voiceover"]
+
+        second = pipeline.run()
+        assert second.ran == []
+        assert pipeline.calls == []
+        assert len(second.skipped) == 4
+
+    def test_edited_intermediate_output_reruns_only_dependents(self, pipeline):
+        pipeline.run()
+        pipeline.path("scenes").write_text("hand-edited scenes")
+
+        result = pipeline.run()
+
+        assert result.ran == ["storyboard"]
+        assert "hand-edited scenes" in pipeline.path("storyboard").read_text()
+
+    def test_edited_source_reruns_affected_subset(self, pipeline):
+        pipeline.run()
+        (pipeline.root / "source.txt").write_text("new topic")
+
+        result = pipeline.run()
+
+        assert sorted(result.ran) == ["narration", "scenes", "storyboard", "voiceover"]
+
+    def test_independent_branches_run_concurrently(self, pipeline):
+        # Both branches must be inside run() at once to pass the barrier
+        pipeline.barrier = threading.Barrier(2, timeout=5)
+
+        result = pipeline.run()
+
+        assert result.success
+        assert not pipeline.barrier.broken
+
+    def test_failure_stops_dependents(self, pipeline):
+        pipeline.fail = {"voiceover"}
+
+        result = pipeline.run()
+
+        assert result.failed == "voiceover"
+        assert result.returncode == 3
+        assert "storyboard" not in pipeline.calls
+        assert not pipeline.path("storyboard").exists()
+
+    def test_failed_stage_is_retried(self, pipeline):
+        pipeline.fail = {"voiceover"}
+        pipeline.run()
+        pipeline.fail = set()
+
+        result = pipeline.run()
+
+        assert sorted(result.ran) == ["storyboard", "voiceover"]
+
+    def test_existing_outputs_without_ledger_are_adopted(self, pipeline):
+        for name in ("narration", "scenes", "voiceover", "storyboard"):
+            pipeline.path(name).write_text("pre-existing")
+        decisions = {}
+        runner = DAGRunner(
+            pipeline.stages(),
+            RunLedger(pipeline.root / "pipeline" / "ledger.json"),
+            pipeline.root,
+            on_decision=lambda stage, reason: decisions.__setitem__(stage.name, reason),
+        )
+
+        result = runner.run()
+
+        assert result.ran == []
+        assert set(decisions.values()) == {"adopted"}
+        assert pipeline.run().ran == []
+
+    def test_force_reruns_everything(self, pipeline):
+        pipeline.run()
+
+        result = pipeline.run(force=True)
+
+        assert sorted(result.ran) == ["narration", "scenes", "storyboard", "voiceover"]
+
+    def test_dependencies_outside_selection_are_satisfied(self, pipeline):
+        pipeline.run()
+        pipeline.path("narration").write_text("edited narration")
+        stages = [s for s in pipeline.stages() if s.name != "narration"]
+        ledger = RunLedger(pipeline.root / "pipeline" / "ledger.json")
+
+        result = DAGRunner(stages, ledger, pipeline.root).run()
+
+        assert sorted(result.ran) == ["scenes", "storyboard", "voiceover"]
@@ -1247,3 +1247,90 @@ export const ContextScene = () => {
         # Should emphasize what TO change
         assert "ONLY UPDATE" in SYNC_SCENE_PROMPT
         assert "Frame numbers" in SYNC_SCENE_PROMPT or "timing" in SYNC_SCENE_PROMPT.lower()
+
+
+class TestConcurrentSceneGeneration:
+    """Tests for parallel generate_all_scenes."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path):
+        project_dir = tmp_path / "test-project"
+        (project_dir / "script").mkdir(parents=True)
+        script = {
+            "title": "Test",
+            "scenes": [
+                {"scene_id": f"s{i}", "title": f"Scene Number {i}", "voiceover": "x"}
+                for i in range(1, 7)
+            ],
+        }
+        (project_dir / "script" / "script.json").write_text(json.dumps(script))
+        return project_dir
+
+    @staticmethod
+    def fake_generate_scene(scene, scene_number, scenes_dir, example_scene, word_timestamps=None):
+        import time
+
+        # Later scenes finish first to exercise re-ordering
+        time.sleep(0.01 * (7 - scene_number))
+        if scene_number == 3:
+            raise RuntimeError("boom")
+        name = f"Scene{scene_number}"
+        return {
+            "scene_number": scene_number,
+            "title": scene["title"],
+            "component_name": name,
+            "filename": f"{name}.tsx",
+            "path": str(scenes_dir / f"{name}.tsx"),
+            "scene_type": "explanation",
+            "scene_key": f"scene_{scene_number}",
+        }
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_results_in_script_order_with_isolated_failures(self, project_dir, max_workers):
+        """Test ordering and per-scene failure isolation for any worker count."""
+        generator = SceneGenerator(skip_validation=True, max_workers=max_workers)
+        generator._generate_scene = self.fake_generate_scene
+
+        results = generator.generate_all_scenes(project_dir=project_dir, force=True)
+
+        assert [s["scene_number"] for s in results["scenes"]] == [1, 2, 4, 5, 6]
+        assert len(results["errors"]) == 1
+        assert results["errors"][0]["scene_number"] == 3
+        assert "boom" in results["errors"][0]["error"]
+
+        index = (project_dir / "scenes" / "index.ts").read_text()
+        positions = [index.index(f"scene_{n}: Scene{n}") for n in (1, 2, 4, 5, 6)]
+        assert positions == sorted(positions)
+
+    def test_runs_scenes_concurrently(self, project_dir):
+        """Test that scenes overlap in time when max_workers > 1."""
+        import threading
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def tracking_generate(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                import time
+
+                time.sleep(0.05)
+                return self.fake_generate_scene(*args, **kwargs)
+            finally:
+                with lock:
+                    active -= 1
+
+        generator = SceneGenerator(skip_validation=True, max_workers=3)
+        generator._generate_scene = tracking_generate
+        generator.generate_all_scenes(project_dir=project_dir, force=True)
+
+        assert 1 < peak <= 3
+
+    def test_max_workers_defaults(self):
+        """Test default and explicit worker counts."""
+        assert SceneGenerator().max_workers == SceneGenerator.DEFAULT_MAX_WORKERS
+        assert SceneGenerator(max_workers=1).max_workers == 1
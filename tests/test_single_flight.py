@@ -0,0 +1,131 @@
+"""Tests for coalescing identical in-flight LLM requests."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import LLMConfig
+from src.understanding import telemetry
+from src.understanding.llm_provider import ClaudeCodeLLMProvider
+from src.understanding.single_flight import SingleFlight, llm_requests
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_identical_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do, "key", slow) for _ in range(4)]
+            wait_for(lambda: flight.stats.coalesced == 3)
+            release.set()
+            outcomes = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert [result for result, _ in outcomes] == ["result"] * 4
+        assert sorted(shared for _, shared in outcomes) == [False, True, True, True]
+        assert flight.stats.to_dict() == {"executed": 1, "coalesced": 3, "calls": 4}
+        assert flight.in_flight() == 0
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+
+        flight.do("key", lambda: 1)
+        result, shared = flight.do("key", lambda: 2)
+
+        assert (result, shared) == (2, False)
+        assert flight.stats.executed == 2
+
+    def test_different_keys_run_independently(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: "A") == ("A", False)
+        assert flight.do("b", lambda: "B") == ("B", False)
+
+    def test_exception_reaches_every_waiter(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.do, "key", failing) for _ in range(3)]
+            wait_for(lambda: flight.stats.coalesced == 2)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match="boom"):
+                    future.result()
+
+        # A failed call is not remembered
+        assert flight.do("key", lambda: "ok") == ("ok", False)
+
+
+class TestProviderCoalescing:
+    """Identical concurrent provider calls make one CLI call."""
+
+    def run_concurrently(self, provider, workers=4):
+        release = threading.Event()
+        runs = []
+        coalesced_before = llm_requests.stats.coalesced
+
+        def fake_run(cmd, **kwargs):
+            runs.append(cmd)
+            release.wait(5)
+            return MagicMock(returncode=0, stdout='{"ok": true}', stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(provider.generate_json, "Same prompt", "Same system")
+                    for _ in range(workers)
+                ]
+                if provider.config.coalesce_requests:
+                    wait_for(lambda: llm_requests.stats.coalesced - coalesced_before == workers - 1)
+                else:
+                    wait_for(lambda: len(runs) == workers)
+                release.set()
+                results = [f.result() for f in futures]
+        return runs, results
+
+    def test_identical_requests_make_one_cli_call(self, tmp_path):
+        provider = ClaudeCodeLLMProvider(LLMConfig())
+        ledger = telemetry.start_recording(tmp_path)
+        try:
+            runs, results = self.run_concurrently(provider)
+        finally:
+            telemetry.stop_recording()
+
+        assert len(runs) == 1
+        assert results == [{"ok": True}] * 4
+
+        records = telemetry.TelemetryLedger.read(ledger.path)
+        assert sum(r.coalesced for r in records) == 3
+        assert sum(r.cost_usd > 0 for r in records) == 1  # Only the leader paid
+
+    def test_coalescing_can_be_disabled(self):
+        provider = ClaudeCodeLLMProvider(LLMConfig(coalesce_requests=False))
+
+        runs, _ = self.run_concurrently(provider, workers=2)
+
+        assert len(runs) == 2
@@ -68,6 +68,24 @@ class TestSoundLibrary:
             for name in generated:
                 assert (sfx_dir / f"{name}.wav").exists()
 
+    def test_library_generate_all_uses_cache(self):
+        """Test that a second library reuses cached sounds."""
+        from src.sound.library import SoundLibrary
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            SoundLibrary(Path(tmpdir) / "a", cache_dir=cache_dir).generate_all()
+
+            library = SoundLibrary(Path(tmpdir) / "b", cache_dir=cache_dir)
+            generated = library.generate_all()
+
+            assert len(generated) == 17
+            assert library.cache.hits == 17
+            assert library.cache.misses == 0
+            assert (Path(tmpdir) / "b" / "ui_pop.wav").read_bytes() == (
+                Path(tmpdir) / "a" / "ui_pop.wav"
+            ).read_bytes()
+
     def test_library_sound_exists(self):
         """Test checking if a sound file exists."""
         from src.sound.library import SoundLibrary
@@ -197,3 +197,133 @@ class TestGetTranscriber:
             )
             assert transcriber.model_name == "medium"
             assert transcriber.device == "cpu"
+
+
+def _fake_segment(text, start, end):
+    words = [MagicMock(word=f" {text}", start=start, end=end)]
+    return MagicMock(text=text, end=end, words=words)
+
+
+@pytest.fixture
+def fake_faster_whisper():
+    """A faster_whisper module whose model and pipeline return one segment."""
+    from src.audio.transcribe import clear_models
+
+    module = MagicMock()
+    info = MagicMock(language="en")
+    module.WhisperModel.return_value.transcribe.side_effect = (
+        lambda path, **kwargs: ([_fake_segment(Path(path).stem, 0.0, 1.0)], info)
+    )
+    module.BatchedInferencePipeline.return_value.transcribe.side_effect = (
+        lambda path, **kwargs: ([_fake_segment(Path(path).stem, 0.0, 2.0)], info)
+    )
+    clear_models()
+    with patch.dict("sys.modules", {"faster_whisper": module}):
+        yield module
+    clear_models()
+
+
+class TestSharedModels:
+    """Tests for the process-wide model registry."""
+
+    def test_model_loaded_once_per_key(self, fake_faster_whisper):
+        first = FasterWhisperTranscriber(device="cpu")
+        second = FasterWhisperTranscriber(device="cpu")
+
+        assert first._load_model() is second._load_model()
+        fake_faster_whisper.WhisperModel.assert_called_once()
+
+        FasterWhisperTranscriber(model="small", device="cpu")._load_model()
+        assert fake_faster_whisper.WhisperModel.call_count == 2
+
+
+class TestTranscriptionCache:
+    """Tests for the transcript cache."""
+
+    def test_round_trip(self, tmp_path):
+        from src.audio.transcribe import TranscriptionCache
+
+        cache = TranscriptionCache(tmp_path)
+        result = TranscriptionResult("Hi there", [WordTimestamp("Hi", 0.0, 0.2)], 0.5, "en")
+        key = TranscriptionCache.make_key("abc", "whisper:base", "en")
+
+        assert cache.get(key) is None
+        cache.put(key, result)
+
+        assert cache.get(key) == result
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_content_model_and_language(self):
+        from src.audio.transcribe import TranscriptionCache
+
+        keys = {
+            TranscriptionCache.make_key("abc", "whisper:base", "en"),
+            TranscriptionCache.make_key("abd", "whisper:base", "en"),
+            TranscriptionCache.make_key("abc", "whisper:small", "en"),
+            TranscriptionCache.make_key("abc", "whisper:base", "de"),
+        }
+        assert len(keys) == 4
+
+
+class TestTranscribeMany:
+    """Tests for batch transcription."""
+
+    @pytest.fixture
+    def recordings(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"scene{i}.mp3"
+            path.write_bytes(bytes([i]) * 100)
+            paths.append(path)
+        return paths
+
+    def test_batched_pipeline_on_worker_pool(self, fake_faster_whisper, recordings):
+        transcriber = FasterWhisperTranscriber(device="cpu", num_workers=2, batch_size=4)
+        reported = []
+
+        results = transcriber.transcribe_many(
+            recordings, on_result=lambda idx, outcome: reported.append(idx)
+        )
+
+        assert [r.text for r in results] == ["scene0", "scene1", "scene2"]
+        assert results[0].duration_seconds == 2.0
+        assert sorted(reported) == [0, 1, 2]
+        pipeline = fake_faster_whisper.BatchedInferencePipeline.return_value
+        assert pipeline.transcribe.call_count == 3
+        assert pipeline.transcribe.call_args.kwargs["batch_size"] == 4
+        # Pipelines carry per-transcription state; only the model is shared
+        assert fake_faster_whisper.BatchedInferencePipeline.call_count == 3
+        fake_faster_whisper.WhisperModel.assert_called_once()
+
+    def test_cache_skips_unchanged_files(self, fake_faster_whisper, recordings, tmp_path):
+        from src.audio.transcribe import TranscriptionCache
+
+        cache = TranscriptionCache(tmp_path / "cache")
+        FasterWhisperTranscriber(device="cpu", cache=cache).transcribe_many(recordings)
+
+        recordings[1].write_bytes(b"re-recorded")
+        pipeline = fake_faster_whisper.BatchedInferencePipeline.return_value
+        pipeline.transcribe.reset_mock()
+
+        rerun = TranscriptionCache(tmp_path / "cache")
+        results = FasterWhisperTranscriber(device="cpu", cache=rerun).transcribe_many(recordings)
+
+        assert [r.text for r in results] == ["scene0", "scene1", "scene2"]
+        assert (rerun.hits, rerun.misses) == (2, 1)
+        assert pipeline.transcribe.call_count == 1
+
+    def test_failures_are_isolated(self, recordings):
+        transcriber = WhisperTranscriber()
+
+        def fake_transcribe(path):
+            if path.stem == "scene1":
+                raise RuntimeError("decode failed")
+            return TranscriptionResult(path.stem, [], 1.0)
+
+        with patch.object(transcriber, "_transcribe_file", side_effect=fake_transcribe):
+            results = transcriber.transcribe_many(recordings + [recordings[0].parent / "missing.mp3"])
+
+        assert results[0].text == "scene0"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].text == "scene2"
+        assert isinstance(results[3], FileNotFoundError)